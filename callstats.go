@@ -0,0 +1,242 @@
+package lang
+
+import (
+	"context"
+	"fmt"
+	"io"
+	"sort"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	"google.golang.org/grpc"
+)
+
+// upper bound of each latency bucket, last bucket holds everything slower
+var latencyBuckets = []time.Duration{
+	10 * time.Microsecond,
+	25 * time.Microsecond,
+	50 * time.Microsecond,
+	100 * time.Microsecond,
+	250 * time.Microsecond,
+	500 * time.Microsecond,
+	time.Millisecond,
+	2500 * time.Microsecond,
+	5 * time.Millisecond,
+	10 * time.Millisecond,
+	25 * time.Millisecond,
+	50 * time.Millisecond,
+	100 * time.Millisecond,
+	time.Second,
+}
+
+// LatencyBuckets are upper bounds of each histogram bucket.  Histograms have
+// one more bucket for everything slower.
+func LatencyBuckets() []time.Duration {
+	return append([]time.Duration(nil), latencyBuckets...)
+}
+
+// Histogram of call latencies.  Safe to record from many goroutines.  For
+// streams, latency is how long stream was open.
+type Histogram struct {
+	count   int64
+	total   int64
+	opened  int64
+	buckets [15]int64
+}
+
+func (h *Histogram) open() {
+	atomic.AddInt64(&h.opened, 1)
+}
+
+func (h *Histogram) record(d time.Duration) {
+	atomic.AddInt64(&h.count, 1)
+	atomic.AddInt64(&h.total, int64(d))
+	i := sort.Search(len(latencyBuckets), func(i int) bool {
+		return d <= latencyBuckets[i]
+	})
+	atomic.AddInt64(&h.buckets[i], 1)
+}
+
+// Count of calls, or streams that have ended
+func (h *Histogram) Count() int64 {
+	return atomic.LoadInt64(&h.count)
+}
+
+// Opened is number of streams opened, 0 for unary calls.  Opened minus Count
+// is streams still open.
+func (h *Histogram) Opened() int64 {
+	return atomic.LoadInt64(&h.opened)
+}
+
+// Buckets are number of calls in each of LatencyBuckets plus one for
+// everything slower
+func (h *Histogram) Buckets() []int64 {
+	counts := make([]int64, len(h.buckets))
+	for i := range h.buckets {
+		counts[i] = atomic.LoadInt64(&h.buckets[i])
+	}
+	return counts
+}
+
+func (h *Histogram) Mean() time.Duration {
+	count := h.Count()
+	if count == 0 {
+		return 0
+	}
+	return time.Duration(atomic.LoadInt64(&h.total) / count)
+}
+
+// Percentile is the upper bound of the bucket p percent of calls fall in
+func (h *Histogram) Percentile(p float64) time.Duration {
+	count := h.Count()
+	if count == 0 {
+		return 0
+	}
+	want := int64(float64(count) * p / 100)
+	var seen int64
+	for i := range h.buckets {
+		seen += atomic.LoadInt64(&h.buckets[i])
+		if seen > want {
+			if i < len(latencyBuckets) {
+				return latencyBuckets[i]
+			}
+			break
+		}
+	}
+	return latencyBuckets[len(latencyBuckets)-1]
+}
+
+// CallStats keeps a latency histogram of each method Go calls on X.  Useful
+// for catching changes that add calls or slow down X callbacks.
+type CallStats struct {
+	lock    sync.RWMutex
+	methods map[string]*Histogram
+}
+
+func newCallStats() *CallStats {
+	return &CallStats{
+		methods: make(map[string]*Histogram),
+	}
+}
+
+func (s *CallStats) histogram(method string) *Histogram {
+	s.lock.RLock()
+	h, found := s.methods[method]
+	s.lock.RUnlock()
+	if found {
+		return h
+	}
+	s.lock.Lock()
+	defer s.lock.Unlock()
+	if h, found = s.methods[method]; !found {
+		h = &Histogram{}
+		s.methods[method] = h
+	}
+	return h
+}
+
+// Methods returns histogram by service and method e.g. "XNode/XField"
+func (s *CallStats) Methods() map[string]*Histogram {
+	s.lock.RLock()
+	defer s.lock.RUnlock()
+	copy := make(map[string]*Histogram, len(s.methods))
+	for k, v := range s.methods {
+		copy[k] = v
+	}
+	return copy
+}
+
+// Reset drops all recorded calls
+func (s *CallStats) Reset() {
+	s.lock.Lock()
+	defer s.lock.Unlock()
+	s.methods = make(map[string]*Histogram)
+}
+
+// Dump writes a table of calls, mean and percentiles for each method
+func (s *CallStats) Dump(w io.Writer) {
+	methods := s.Methods()
+	names := make([]string, 0, len(methods))
+	for name := range methods {
+		names = append(names, name)
+	}
+	sort.Strings(names)
+	fmt.Fprintf(w, "%-32s %10s %10s %10s %10s %10s\n", "method", "calls", "open", "mean", "p50", "p99")
+	for _, name := range names {
+		h := methods[name]
+		open := ""
+		if h.Opened() > 0 {
+			open = fmt.Sprint(h.Opened() - h.Count())
+		}
+		fmt.Fprintf(w, "%-32s %10d %10s %10s %10s %10s\n", name, h.Count(), open, h.Mean(), h.Percentile(50), h.Percentile(99))
+	}
+}
+
+func (s *CallStats) intercept(ctx context.Context, method string, req, reply interface{}, cc *grpc.ClientConn, invoker grpc.UnaryInvoker, opts ...grpc.CallOption) error {
+	t0 := time.Now()
+	err := invoker(ctx, method, req, reply, cc, opts...)
+	s.histogram(methodName(method)).record(time.Since(t0))
+	return err
+}
+
+func (s *CallStats) serverIntercept(ctx context.Context, req interface{}, info *grpc.UnaryServerInfo, handler grpc.UnaryHandler) (interface{}, error) {
+	t0 := time.Now()
+	resp, err := handler(ctx, req)
+	s.histogram(methodName(info.FullMethod)).record(time.Since(t0))
+	return resp, err
+}
+
+// streamIntercept counts streams Go opens to X, like notifications, and
+// records how long each was open once it ends
+func (s *CallStats) streamIntercept(ctx context.Context, desc *grpc.StreamDesc, cc *grpc.ClientConn, method string, streamer grpc.Streamer, opts ...grpc.CallOption) (grpc.ClientStream, error) {
+	h := s.histogram(methodName(method))
+	h.open()
+	t0 := time.Now()
+	stream, err := streamer(ctx, desc, cc, method, opts...)
+	if err != nil {
+		h.record(time.Since(t0))
+		return nil, err
+	}
+	return &timedClientStream{ClientStream: stream, serverStreams: desc.ServerStreams, h: h, t0: t0}, nil
+}
+
+func (s *CallStats) streamServerIntercept(srv interface{}, ss grpc.ServerStream, info *grpc.StreamServerInfo, handler grpc.StreamHandler) error {
+	h := s.histogram(methodName(info.FullMethod))
+	h.open()
+	t0 := time.Now()
+	err := handler(srv, ss)
+	h.record(time.Since(t0))
+	return err
+}
+
+// timedClientStream records duration when last message is received.  Streams
+// abandoned without reading to the end are counted as opened only.
+type timedClientStream struct {
+	grpc.ClientStream
+	serverStreams bool
+	h             *Histogram
+	t0            time.Time
+	once          sync.Once
+}
+
+func (s *timedClientStream) RecvMsg(m interface{}) error {
+	err := s.ClientStream.RecvMsg(m)
+	// only one response when only client streams
+	if err != nil || !s.serverStreams {
+		s.once.Do(func() {
+			s.h.record(time.Since(s.t0))
+		})
+	}
+	return err
+}
+
+// methodName drops package from gRPC method e.g. "/pb.Node/Find" is "Node/Find"
+func methodName(fullMethod string) string {
+	name := strings.TrimPrefix(fullMethod, "/")
+	if dot := strings.Index(name, "."); dot >= 0 && dot < strings.Index(name, "/") {
+		name = name[dot+1:]
+	}
+	return name
+}
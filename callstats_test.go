@@ -0,0 +1,43 @@
+package lang
+
+import (
+	"testing"
+	"time"
+
+	"github.com/freeconf/yang/fc"
+	"google.golang.org/grpc"
+)
+
+func TestHistogram(t *testing.T) {
+	var h Histogram
+	for i := 0; i < 98; i++ {
+		h.record(20 * time.Microsecond)
+	}
+	h.record(3 * time.Millisecond)
+	h.record(2 * time.Second)
+	fc.AssertEqual(t, int64(100), h.Count())
+	fc.AssertEqual(t, 25*time.Microsecond, h.Percentile(50))
+	fc.AssertEqual(t, 5*time.Millisecond, h.Percentile(98.5))
+	fc.AssertEqual(t, time.Second, h.Percentile(100))
+	buckets := h.Buckets()
+	fc.AssertEqual(t, len(LatencyBuckets())+1, len(buckets))
+	fc.AssertEqual(t, int64(98), buckets[1])
+	fc.AssertEqual(t, int64(1), buckets[len(buckets)-1])
+}
+
+func TestStreamStats(t *testing.T) {
+	s := newCallStats()
+	info := &grpc.StreamServerInfo{FullMethod: "/pb.Node/Notification"}
+	err := s.streamServerIntercept(nil, nil, info, func(srv interface{}, ss grpc.ServerStream) error {
+		fc.AssertEqual(t, int64(1), s.Methods()["Node/Notification"].Opened())
+		fc.AssertEqual(t, int64(0), s.Methods()["Node/Notification"].Count())
+		return nil
+	})
+	fc.RequireEqual(t, nil, err)
+	fc.AssertEqual(t, int64(1), s.Methods()["Node/Notification"].Count())
+}
+
+func TestMethodName(t *testing.T) {
+	fc.AssertEqual(t, "Node/Find", methodName("/pb.Node/Find"))
+	fc.AssertEqual(t, "XNode/XField", methodName("/pb.XNode/XField"))
+}
@@ -0,0 +1,171 @@
+package lang
+
+import (
+	"bytes"
+	"fmt"
+	"io"
+	"net/http"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	"github.com/freeconf/lang/pb"
+)
+
+// clientTransport is what one RESTCONF client device talks HTTP thru.  Each
+// device gets its own connection pool sized by X and GET responses are cached
+// for paths that X asked to cache.  Cached responses with an ETag or
+// Last-Modified header are revalidated with a conditional GET once they expire
+// so unchanged data is not sent again.
+//
+// Devices never share options or cached responses even when they talk to the
+// same server.
+type clientTransport struct {
+	transport *http.Transport
+	ttls      []*pb.ClientCache
+	stats     *DriverStats
+	lock      sync.Mutex
+	cache     map[string]*cachedResponse
+}
+
+type cachedResponse struct {
+	status  int
+	header  http.Header
+	body    []byte
+	expires time.Time
+}
+
+// newClientTransport applies connection and cache options from X on a copy
+// of base
+func newClientTransport(base *http.Transport, req *pb.ClientRequest, stats *DriverStats) *clientTransport {
+	transport := base.Clone()
+	if req.PoolSize > 0 {
+		transport.MaxIdleConnsPerHost = int(req.PoolSize)
+		if transport.MaxIdleConns > 0 && transport.MaxIdleConns < transport.MaxIdleConnsPerHost {
+			transport.MaxIdleConns = transport.MaxIdleConnsPerHost
+		}
+	}
+	if req.IdleTimeoutMs > 0 {
+		transport.IdleConnTimeout = time.Duration(req.IdleTimeoutMs) * time.Millisecond
+	}
+	transport.DisableKeepAlives = req.NoKeepAlive
+	return &clientTransport{
+		transport: transport,
+		ttls:      req.Cache,
+		stats:     stats,
+		cache:     make(map[string]*cachedResponse),
+	}
+}
+
+// defaultClientTransport is copied for each device, it is never changed
+func defaultClientTransport() *http.Transport {
+	if base, valid := http.DefaultTransport.(*http.Transport); valid {
+		return base
+	}
+	return &http.Transport{}
+}
+
+// ttl of longest matching path prefix, 0 when not cached
+func (t *clientTransport) ttl(path string) time.Duration {
+	var ttl time.Duration
+	longest := -1
+	for _, c := range t.ttls {
+		if strings.HasPrefix(path, c.Path) && len(c.Path) > longest {
+			longest = len(c.Path)
+			ttl = time.Duration(c.TtlMs) * time.Millisecond
+		}
+	}
+	return ttl
+}
+
+func (t *clientTransport) RoundTrip(req *http.Request) (*http.Response, error) {
+	key := req.URL.String()
+	if req.Method != "GET" {
+		// whatever was written could be in any cached response
+		t.invalidate()
+		return t.transport.RoundTrip(req)
+	}
+	ttl := t.ttl(req.URL.Path)
+	if ttl <= 0 || strings.Contains(req.Header.Get("Accept"), "text/event-stream") {
+		return t.transport.RoundTrip(req)
+	}
+
+	t.lock.Lock()
+	cached := t.cache[key]
+	t.lock.Unlock()
+	if cached != nil {
+		if time.Now().Before(cached.expires) {
+			atomic.AddInt64(&t.stats.ClientCacheHits, 1)
+			return cached.response(req), nil
+		}
+		req = revalidate(req, cached)
+	}
+	resp, err := t.transport.RoundTrip(req)
+	if err != nil {
+		return nil, err
+	}
+	if cached != nil && resp.StatusCode == http.StatusNotModified {
+		resp.Body.Close()
+		atomic.AddInt64(&t.stats.ClientCacheRevalidated, 1)
+		t.lock.Lock()
+		cached.expires = time.Now().Add(ttl)
+		t.lock.Unlock()
+		return cached.response(req), nil
+	}
+	atomic.AddInt64(&t.stats.ClientCacheMisses, 1)
+	if resp.StatusCode != http.StatusOK {
+		return resp, nil
+	}
+	body, err := io.ReadAll(resp.Body)
+	resp.Body.Close()
+	if err != nil {
+		return nil, err
+	}
+	fresh := &cachedResponse{
+		status:  resp.StatusCode,
+		header:  resp.Header.Clone(),
+		body:    body,
+		expires: time.Now().Add(ttl),
+	}
+	t.lock.Lock()
+	t.cache[key] = fresh
+	t.lock.Unlock()
+	return fresh.response(req), nil
+}
+
+func revalidate(req *http.Request, cached *cachedResponse) *http.Request {
+	etag := cached.header.Get("ETag")
+	modified := cached.header.Get("Last-Modified")
+	if etag == "" && modified == "" {
+		return req
+	}
+	conditional := req.Clone(req.Context())
+	if etag != "" {
+		conditional.Header.Set("If-None-Match", etag)
+	}
+	if modified != "" {
+		conditional.Header.Set("If-Modified-Since", modified)
+	}
+	return conditional
+}
+
+func (t *clientTransport) invalidate() {
+	t.lock.Lock()
+	defer t.lock.Unlock()
+	t.cache = make(map[string]*cachedResponse)
+}
+
+func (c *cachedResponse) response(req *http.Request) *http.Response {
+	return &http.Response{
+		Status:        fmt.Sprintf("%d %s", c.status, http.StatusText(c.status)),
+		StatusCode:    c.status,
+		Proto:         "HTTP/1.1",
+		ProtoMajor:    1,
+		ProtoMinor:    1,
+		Header:        c.header.Clone(),
+		Body:          io.NopCloser(bytes.NewReader(c.body)),
+		ContentLength: int64(len(c.body)),
+		Request:       req,
+	}
+}
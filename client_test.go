@@ -0,0 +1,77 @@
+package lang
+
+import (
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/freeconf/lang/pb"
+	"github.com/freeconf/yang/fc"
+)
+
+func TestClientCache(t *testing.T) {
+	requests := 0
+	srv := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests++
+		if r.Header.Get("If-None-Match") == `"v1"` {
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+		w.Header().Set("ETag", `"v1"`)
+		w.Write([]byte(`{"x":1}`))
+	}))
+	defer srv.Close()
+
+	var stats DriverStats
+	req := &pb.ClientRequest{
+		Address:  srv.URL + "/restconf",
+		PoolSize: 4,
+		Cache:    []*pb.ClientCache{{Path: "/restconf/data/x:", TtlMs: 60000}},
+	}
+	tr := newClientTransport(defaultClientTransport(), req, &stats)
+	c := &http.Client{Transport: tr}
+	get := func(c *http.Client, path string) string {
+		resp, err := c.Get(srv.URL + path)
+		fc.RequireEqual(t, nil, err)
+		defer resp.Body.Close()
+		fc.AssertEqual(t, 200, resp.StatusCode)
+		body, _ := io.ReadAll(resp.Body)
+		return string(body)
+	}
+
+	fc.AssertEqual(t, `{"x":1}`, get(c, "/restconf/data/x:"))
+	fc.AssertEqual(t, `{"x":1}`, get(c, "/restconf/data/x:"))
+	fc.AssertEqual(t, 1, requests)
+	fc.AssertEqual(t, int64(1), atomic.LoadInt64(&stats.ClientCacheHits))
+
+	// expired copies are revalidated
+	for _, cached := range tr.cache {
+		cached.expires = time.Now().Add(-time.Second)
+	}
+	fc.AssertEqual(t, `{"x":1}`, get(c, "/restconf/data/x:"))
+	fc.AssertEqual(t, 2, requests)
+	fc.AssertEqual(t, int64(1), atomic.LoadInt64(&stats.ClientCacheRevalidated))
+
+	// paths not listed are not cached
+	get(c, "/restconf/data/y:")
+	get(c, "/restconf/data/y:")
+	fc.AssertEqual(t, 4, requests)
+
+	// writes drop everything from that server
+	resp, err := c.Post(srv.URL+"/restconf/data/x:", "application/json", nil)
+	fc.RequireEqual(t, nil, err)
+	resp.Body.Close()
+	fc.AssertEqual(t, 0, len(tr.cache))
+
+	// another device to same server has its own options and nothing is
+	// installed in default transport
+	uncached := &http.Client{Transport: newClientTransport(defaultClientTransport(), &pb.ClientRequest{}, &stats)}
+	get(c, "/restconf/data/x:")
+	get(uncached, "/restconf/data/x:")
+	fc.AssertEqual(t, 7, requests)
+	_, replaced := http.DefaultTransport.(*clientTransport)
+	fc.AssertEqual(t, false, replaced)
+}
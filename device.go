@@ -3,6 +3,7 @@ package lang
 import (
 	"context"
 	"io"
+	"net/http"
 
 	"github.com/freeconf/lang/pb"
 	"github.com/freeconf/restconf/client"
@@ -53,9 +54,14 @@ func (s *DeviceService) ApplyStartupConfig(ctx context.Context, req *pb.ApplySta
 
 func (s *DeviceService) Client(ctx context.Context, req *pb.ClientRequest) (*pb.ClientResponse, error) {
 	ypath := resolveOpener(s.d.handles, req.YpathHnd)
-	proto := client.ProtocolHandler(ypath)
-	dev, err := proto(req.Address)
+	tr := newClientTransport(defaultClientTransport(), req, &s.d.Stats)
+	factory := client.Client{
+		YangPath:   ypath,
+		HttpClient: &http.Client{Transport: tr},
+	}
+	dev, err := factory.NewDevice(req.Address)
 	if err != nil {
+		tr.transport.CloseIdleConnections()
 		return nil, err
 	}
 	resp := pb.ClientResponse{
@@ -21,17 +21,55 @@ type Driver struct {
 	handles     *HandlePool
 	xclientAddr string
 	Stats       DriverStats
+
+	// latency of each call into X
+	XCalls *CallStats
+
+	// latency of each call X makes into Go
+	GCalls *CallStats
+
+	notifications *notifyFanout
+	readCaches    *readCaches
+	tracer        *tracer
 }
 
+// DriverStats counters are updated from many goroutines so read and write them
+// with sync/atomic
 type DriverStats struct {
-	OpenNotifications int
+	// streams open to X, one per distinct notification regardless of
+	// how many subscribers there are in Go
+	OpenNotifications int64
+
+	// Go subscribers sharing those streams
+	NotificationSubscribers int64
+
+	// reads of X data served from a copy in Go vs. read from X
+	ReadCacheHits   int64
+	ReadCacheMisses int64
+
+	// GETs from RESTCONF client devices served from cache, revalidated with
+	// server or fetched
+	ClientCacheHits        int64
+	ClientCacheRevalidated int64
+	ClientCacheMisses      int64
+
+	// GETs to RESTCONF servers answered from cache, answered with 304 Not
+	// Modified or passed on to server
+	ResponseCacheHits        int64
+	ResponseCacheNotModified int64
+	ResponseCacheMisses      int64
 }
 
 func NewDriver(gServerAddr string, xClientAddr string) (*Driver, error) {
 	d := &Driver{
 		handles:     newHandlePool(),
 		xclientAddr: xClientAddr,
+		XCalls:      newCallStats(),
+		GCalls:      newCallStats(),
+		tracer:      newTracer(),
 	}
+	d.notifications = newNotifyFanout(&d.Stats)
+	d.readCaches = newReadCaches(&d.Stats)
 	// "" only useful for testing
 	if xClientAddr != "" {
 		if err := d.createXClient(xClientAddr); err != nil {
@@ -55,7 +93,10 @@ func (d *Driver) createGServer(addr string) error {
 		return fmt.Errorf("listen error. %s. %w", addr, err)
 	}
 	fc.Debug.Printf("started server on %s", addr)
-	d.gserver = grpc.NewServer()
+	d.gserver = grpc.NewServer(
+		grpc.ChainUnaryInterceptor(d.GCalls.serverIntercept, d.tracer.serverIntercept),
+		grpc.ChainStreamInterceptor(d.GCalls.streamServerIntercept),
+	)
 	pb.RegisterParserServer(d.gserver, &ParserService{d: d})
 	pb.RegisterHandlesServer(d.gserver, &HandleService{d: d})
 	pb.RegisterNodeServer(d.gserver, &NodeService{d: d})
@@ -63,6 +104,7 @@ func (d *Driver) createGServer(addr string) error {
 	pb.RegisterDeviceServer(d.gserver, &DeviceService{d: d})
 	pb.RegisterProtoServer(d.gserver, &ProtoService{d: d})
 	pb.RegisterFileSystemServer(d.gserver, &FileSystemService{d: d})
+	pb.RegisterStatsServer(d.gserver, &StatsService{d: d})
 	return nil
 }
 
@@ -76,6 +118,8 @@ func (s *Driver) createXClient(addr string) error {
 		grpc.WithTransportCredentials(credentials),
 		grpc.WithBlock(),
 		grpc.WithContextDialer(dialer),
+		grpc.WithChainUnaryInterceptor(s.XCalls.intercept, s.tracer.clientIntercept),
+		grpc.WithChainStreamInterceptor(s.XCalls.streamIntercept),
 	}
 	channel, err := grpc.Dial(addr, options...)
 	if err != nil {
@@ -6,6 +6,7 @@ import (
 	"errors"
 	"io"
 	"os"
+	"sync"
 
 	"github.com/freeconf/lang/pb"
 )
@@ -38,17 +39,33 @@ func (fs *FileSystemService) ReaderInit(ctx context.Context, req *pb.ReaderInitR
 }
 
 func (fs *FileSystemService) ReaderStream(srv pb.FileSystem_ReaderStreamServer) error {
+	var rdr *streamReader
 	for {
 		data, err := srv.Recv()
+		if err == io.EOF {
+			break
+		}
 		if err != nil {
+			if rdr != nil {
+				rdr.eof()
+			}
 			return err
 		}
 		if data == nil {
 			break
 		}
-		rdr := fs.d.handles.Require(data.StreamHnd).(*streamReader)
+		if rdr == nil {
+			rdr = fs.d.handles.Require(data.StreamHnd).(*streamReader)
+			defer fs.d.handles.Release(data.StreamHnd)
+		}
 		rdr.chunks <- data.Chunk
 	}
+	// X closing its side of the stream is the end of the data. Go reader keeps
+	// a reference to stream so handle is released (see defer above) and X does
+	// the same
+	if rdr != nil {
+		rdr.eof()
+	}
 	return srv.SendAndClose(&pb.ReaderStreamResponse{})
 }
 
@@ -73,48 +90,115 @@ func (fs *FileSystemService) WriterInit(ctx context.Context, req *pb.WriterInitR
 
 func (fs *FileSystemService) WriterStream(req *pb.WriterStreamRequest, srv pb.FileSystem_WriterStreamServer) error {
 	stream := fs.d.handles.Require(req.StreamHnd).(*streamWriter)
-	for chunk := range stream.chunks {
+	// X forgets handle when stream ends so we do too
+	defer fs.d.handles.Release(req.StreamHnd)
+	for {
+		chunk, more := stream.next()
+		if !more {
+			return nil
+		}
 		if err := srv.Send(&pb.WriterStreamData{Chunk: chunk}); err != nil {
+			stream.abort()
 			return err
 		}
 	}
-	return nil
 }
 
 func (fs *FileSystemService) CloseStream(ctx context.Context, req *pb.CloseStreamRequest) (*pb.CloseStreamResponse, error) {
 	var err error
-	if obj := fs.d.handles.Get(req.StreamHnd); obj != nil {
-		err = obj.(io.Closer).Close()
+	obj := fs.d.handles.Get(req.StreamHnd)
+	if closer, valid := obj.(io.Closer); valid {
+		err = closer.Close()
+	}
+	switch obj.(type) {
+	case *streamReader, *streamWriter:
+		// released when their stream ends
+	default:
+		fs.d.handles.Release(req.StreamHnd)
 	}
 	return &pb.CloseStreamResponse{}, err
 }
 
+// Largest chunk sent to X, just under the default max GRPC message size of 4MB
+const maxStreamChunk = (4 * 1024 * 1024) - 1024
+
+// streamWriter collects writes and hands X whatever has accumulated each time
+// the previous chunk has been sent.  Writers like the JSON encoder make many
+// tiny writes and sending each one as a message would be very slow yet data
+// is never held back waiting for more to arrive.
 type streamWriter struct {
-	chunks chan []byte
+	lock    sync.Mutex
+	changed *sync.Cond
+	buf     []byte
+	closed  bool
 }
 
 func newRemoteWriter() *streamWriter {
-	return &streamWriter{
-		chunks: make(chan []byte),
-	}
+	w := &streamWriter{}
+	w.changed = sync.NewCond(&w.lock)
+	return w
 }
 
 func (r *streamWriter) Write(p []byte) (int, error) {
-	if len(p) == 0 {
-		return 0, nil
+	r.lock.Lock()
+	defer r.lock.Unlock()
+	// hold up writer when X is not keeping up
+	for len(r.buf) >= maxStreamChunk && !r.closed {
+		r.changed.Wait()
+	}
+	if r.closed {
+		return 0, io.ErrClosedPipe
 	}
-	r.chunks <- p
+	r.buf = append(r.buf, p...)
+	r.changed.Broadcast()
 	return len(p), nil
 }
 
+// next waits for data and returns false once closed and there is nothing left
+func (r *streamWriter) next() ([]byte, bool) {
+	r.lock.Lock()
+	defer r.lock.Unlock()
+	for len(r.buf) == 0 && !r.closed {
+		r.changed.Wait()
+	}
+	if len(r.buf) == 0 {
+		return nil, false
+	}
+	n := len(r.buf)
+	if n > maxStreamChunk {
+		n = maxStreamChunk
+	}
+	// capped so future appends cannot write into chunk being sent
+	chunk := r.buf[:n:n]
+	if n == len(r.buf) {
+		r.buf = nil
+	} else {
+		r.buf = r.buf[n:]
+	}
+	r.changed.Broadcast()
+	return chunk, true
+}
+
+func (r *streamWriter) abort() {
+	r.lock.Lock()
+	defer r.lock.Unlock()
+	r.closed = true
+	r.buf = nil
+	r.changed.Broadcast()
+}
+
 func (r *streamWriter) Close() error {
-	close(r.chunks)
+	r.lock.Lock()
+	defer r.lock.Unlock()
+	r.closed = true
+	r.changed.Broadcast()
 	return nil
 }
 
 type streamReader struct {
 	chunks   chan []byte
 	remainer []byte
+	done     sync.Once
 }
 
 func newStreamReader() *streamReader {
@@ -135,7 +219,14 @@ func (r *streamReader) Read(p []byte) (int, error) {
 	return len, nil
 }
 
+// eof is safe to call more than once
+func (r *streamReader) eof() {
+	r.done.Do(func() {
+		close(r.chunks)
+	})
+}
+
 func (r *streamReader) Close() error {
-	r.chunks <- nil
+	r.eof()
 	return nil
 }
@@ -0,0 +1,45 @@
+package lang
+
+import (
+	"bytes"
+	"io"
+	"testing"
+
+	"github.com/freeconf/yang/fc"
+)
+
+func TestStreamWriterChunks(t *testing.T) {
+	w := newRemoteWriter()
+
+	// small writes are combined until X is ready for them
+	for i := 0; i < 10; i++ {
+		w.Write([]byte("x"))
+	}
+	chunk, more := w.next()
+	fc.AssertEqual(t, true, more)
+	fc.AssertEqual(t, 10, len(chunk))
+
+	// but never more than a message can hold
+	w.Write(make([]byte, maxStreamChunk+1))
+	fc.AssertEqual(t, nil, w.Close())
+	chunk, _ = w.next()
+	fc.AssertEqual(t, maxStreamChunk, len(chunk))
+	chunk, _ = w.next()
+	fc.AssertEqual(t, 1, len(chunk))
+	_, more = w.next()
+	fc.AssertEqual(t, false, more)
+}
+
+func TestStreamReaderEOF(t *testing.T) {
+	r := newStreamReader()
+	go func() {
+		r.chunks <- []byte("hello ")
+		r.chunks <- []byte("world")
+		r.eof()
+	}()
+	var buf bytes.Buffer
+	_, err := io.Copy(&buf, r)
+	fc.AssertEqual(t, nil, err)
+	fc.AssertEqual(t, "hello world", buf.String())
+	fc.AssertEqual(t, nil, r.Close())
+}
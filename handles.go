@@ -3,18 +3,45 @@ package lang
 import (
 	"context"
 	"fmt"
+	"os"
+	"runtime"
+	"sort"
+	"strings"
 	"sync"
 
 	"github.com/freeconf/lang/pb"
+	"github.com/freeconf/yang/node"
 )
 
 // ObjectPool keeps track of golang objects and the destructor that is association with
 // the C counterpart that was passed to caller.
+//
+// Lookups are the bulk of calls, every request from X resolves at least one
+// handle, so objects and handles are sync.Maps that are read without taking
+// lock.  lock only serializes changes.
 type HandlePool struct {
-	objects map[uint64]any
-	handles map[any]uint64
+	objects sync.Map // uint64 -> any
+	handles sync.Map // any -> uint64
+	count   int
 	counter uint64
-	lock    sync.RWMutex
+	lock    sync.Mutex
+
+	// handles released together when object they were created under is
+	// released e.g. all selections of one operation.  Only open scopes have
+	// an entry so a released scope is never recreated by a late handle.
+	scopes map[any][]uint64
+
+	// where each handle was created, only kept while trackSites is on
+	// because finding caller is not cheap
+	trackSites bool
+	sites      map[uint64]string
+}
+
+// HandleCount is number of live handles of a type created from the same place
+type HandleCount struct {
+	Type  string
+	Site  string
+	Count int
 }
 
 type RemoteObject interface {
@@ -27,15 +54,95 @@ type HandleService struct {
 }
 
 func (s *HandleService) Release(ctx context.Context, in *pb.ReleaseRequest) (*pb.ReleaseResponse, error) {
+	if b, isBrowser := s.d.handles.Get(in.Hnd).(*node.Browser); isBrowser {
+		s.d.readCaches.remove(b)
+	}
 	s.d.handles.Release(in.Hnd)
 	return &pb.ReleaseResponse{}, nil
 }
 
+func (s *HandleService) Audit(ctx context.Context, in *pb.HandleAuditRequest) (*pb.HandleAuditResponse, error) {
+	if in.TrackSites {
+		s.d.handles.TrackSites(true)
+	}
+	var mem runtime.MemStats
+	runtime.ReadMemStats(&mem)
+	resp := pb.HandleAuditResponse{
+		HeapAlloc:   mem.HeapAlloc,
+		HeapObjects: mem.HeapObjects,
+		Goroutines:  int64(runtime.NumGoroutine()),
+	}
+	for _, c := range s.d.handles.Audit() {
+		resp.Handles = append(resp.Handles, &pb.HandleCount{
+			Type:  c.Type,
+			Site:  c.Site,
+			Count: int64(c.Count),
+		})
+	}
+	return &resp, nil
+}
+
 func newHandlePool() *HandlePool {
 	return &HandlePool{
-		objects: make(map[uint64]any),
-		handles: make(map[any]uint64),
-		counter: 100,
+		sites:      make(map[uint64]string),
+		scopes:     make(map[any][]uint64),
+		trackSites: os.Getenv("FC_LANG_TRACK_HANDLES") == "1",
+		counter:    100,
+	}
+}
+
+// TrackSites starts or stops recording where handles are created.  Only
+// handles created while on have a site in Audit.
+func (p *HandlePool) TrackSites(on bool) {
+	p.lock.Lock()
+	defer p.lock.Unlock()
+	p.trackSites = on
+	if !on {
+		p.sites = make(map[uint64]string)
+	}
+}
+
+// Audit counts live handles by type and creation site, most first.  Handles
+// that only ever grow in count between two audits are likely leaks.
+func (p *HandlePool) Audit() []HandleCount {
+	p.lock.Lock()
+	defer p.lock.Unlock()
+	counts := make(map[HandleCount]int)
+	p.objects.Range(func(hnd any, obj any) bool {
+		counts[HandleCount{Type: fmt.Sprintf("%T", obj), Site: p.sites[hnd.(uint64)]}]++
+		return true
+	})
+	audit := make([]HandleCount, 0, len(counts))
+	for c, count := range counts {
+		c.Count = count
+		audit = append(audit, c)
+	}
+	sort.Slice(audit, func(i, j int) bool {
+		if audit[i].Count != audit[j].Count {
+			return audit[i].Count > audit[j].Count
+		}
+		return audit[i].Type+audit[i].Site < audit[j].Type+audit[j].Site
+	})
+	return audit
+}
+
+func (p *HandlePool) recordSite(hnd uint64) {
+	if !p.trackSites {
+		return
+	}
+	pcs := make([]uintptr, 8)
+	n := runtime.Callers(3, pcs)
+	frames := runtime.CallersFrames(pcs[:n])
+	for {
+		f, more := frames.Next()
+		// first caller that isn't just a helper that resolves handles
+		if !strings.Contains(f.Function, "HandlePool") && !strings.HasSuffix(f.Function, ".resolveSelection") && !strings.HasSuffix(f.Function, ".ownSelection") {
+			p.sites[hnd] = fmt.Sprintf("%s %s:%d", f.Function, f.File, f.Line)
+			return
+		}
+		if !more {
+			return
+		}
 	}
 }
 
@@ -47,9 +154,7 @@ func (p *HandlePool) Reserve() uint64 {
 }
 
 func (p *HandlePool) Require(handle uint64) any {
-	p.lock.Lock()
-	defer p.lock.Unlock()
-	x, found := p.objects[handle]
+	x, found := p.objects.Load(handle)
 	if !found {
 		panic(fmt.Sprintf("attempting to reference handle %d that was not found", handle))
 	}
@@ -57,41 +162,119 @@ func (p *HandlePool) Require(handle uint64) any {
 }
 
 func (p *HandlePool) Get(handle uint64) any {
-	p.lock.Lock()
-	defer p.lock.Unlock()
-	return p.objects[handle]
+	x, _ := p.objects.Load(handle)
+	return x
 }
 
 // Hnd returns current handle if there is one, otherwise adds this object to the pool
 // and returns the new handle
 func (p *HandlePool) Hnd(obj any) uint64 {
+	return p.ScopedHnd(obj, nil)
+}
+
+// OwnedHnd is Hnd for objects X releases on its own and also opens a scope
+// so handles created under obj are released with it.  See ScopedHnd.
+func (p *HandlePool) OwnedHnd(obj any) uint64 {
+	hnd := p.Hnd(obj)
 	p.lock.Lock()
 	defer p.lock.Unlock()
+	if _, open := p.scopes[obj]; !open {
+		p.scopes[obj] = []uint64{}
+	}
+	return hnd
+}
 
+// ScopedHnd is Hnd but new handles are also added to the nearest open scope
+// found by following parentOf from obj so they can all be released by
+// ReleaseScope.  When there is no open scope, the top most object opens one.
+// parentOf is only called when a new handle is needed and returns nil at top.
+func (p *HandlePool) ScopedHnd(obj any, parentOf func(any) any) uint64 {
 	// The go object is really just a handle to an object in x lang then return
 	// that handle
 	if rhnd, isRemote := obj.(RemoteObject); isRemote {
 		return rhnd.GetRemoteHandle()
 	}
 
-	hnd, found := p.handles[obj]
-	if !found {
-		hnd = p.NextHnd()
-		p.handles[obj] = hnd
-		p.objects[hnd] = obj
+	// most calls are for objects X already has
+	if hnd, found := p.handles.Load(obj); found {
+		return hnd.(uint64)
+	}
+
+	p.lock.Lock()
+	defer p.lock.Unlock()
+	if hnd, found := p.handles.Load(obj); found {
+		return hnd.(uint64)
+	}
+	hnd := p.NextHnd()
+	p.record(obj, hnd)
+	if parentOf != nil {
+		scope := p.scopeOf(obj, parentOf)
+		p.scopes[scope] = append(p.scopes[scope], hnd)
 	}
 	return hnd
 }
 
+// scopeOf is nearest open scope at or above obj, caller holds lock
+func (p *HandlePool) scopeOf(obj any, parentOf func(any) any) any {
+	for {
+		if _, open := p.scopes[obj]; open {
+			return obj
+		}
+		parent := parentOf(obj)
+		if parent == nil {
+			return obj
+		}
+		obj = parent
+	}
+}
+
+// AddToScope has handle released with the nearest open scope of obj instead
+// of on its own
+func (p *HandlePool) AddToScope(obj any, parentOf func(any) any, hnd uint64) {
+	p.lock.Lock()
+	defer p.lock.Unlock()
+	scope := p.scopeOf(obj, parentOf)
+	p.scopes[scope] = append(p.scopes[scope], hnd)
+}
+
+// ScopeHnds are the handles currently in scope
+func (p *HandlePool) ScopeHnds(scope any) []uint64 {
+	p.lock.Lock()
+	defer p.lock.Unlock()
+	return append([]uint64(nil), p.scopes[scope]...)
+}
+
+// ReleaseScope releases all handles created in scope in one go and returns
+// them.  Handles already released on their own are skipped.
+func (p *HandlePool) ReleaseScope(scope any) []uint64 {
+	p.lock.Lock()
+	defer p.lock.Unlock()
+	hnds := p.scopes[scope]
+	delete(p.scopes, scope)
+	released := hnds[:0]
+	for _, hnd := range hnds {
+		if p.release(hnd) {
+			released = append(released, hnd)
+		}
+	}
+	return released
+}
+
 func (p *HandlePool) Put(x any) uint64 {
 	p.lock.Lock()
 	defer p.lock.Unlock()
 	hnd := p.NextHnd()
-	p.objects[hnd] = x
-	p.handles[x] = hnd
+	p.record(x, hnd)
 	return hnd
 }
 
+// Count of objects currently held for X
+func (p *HandlePool) Count() int {
+	p.lock.Lock()
+	defer p.lock.Unlock()
+	return p.count
+}
+
 func (p *HandlePool) NextHnd() uint64 {
 	next := p.counter
 	p.counter = p.counter + 1
@@ -101,15 +284,30 @@ func (p *HandlePool) NextHnd() uint64 {
 func (p *HandlePool) Record(x any, hnd uint64) {
 	p.lock.Lock()
 	defer p.lock.Unlock()
-	p.objects[hnd] = x
-	p.handles[x] = hnd
+	p.record(x, hnd)
+}
+
+func (p *HandlePool) record(x any, hnd uint64) {
+	if _, replaced := p.objects.Load(hnd); !replaced {
+		p.count++
+	}
+	p.objects.Store(hnd, x)
+	p.handles.Store(x, hnd)
+	p.recordSite(hnd)
 }
 
 func (p *HandlePool) Release(handle uint64) {
 	p.lock.Lock()
 	defer p.lock.Unlock()
-	if obj, found := p.objects[handle]; found {
-		delete(p.objects, handle)
-		delete(p.handles, obj)
+	p.release(handle)
+}
+
+func (p *HandlePool) release(handle uint64) bool {
+	obj, found := p.objects.LoadAndDelete(handle)
+	if found {
+		p.count--
+		p.handles.Delete(obj)
+		delete(p.sites, handle)
 	}
+	return found
 }
@@ -0,0 +1,95 @@
+package lang
+
+import (
+	"context"
+	"testing"
+
+	"github.com/freeconf/lang/pb"
+	"github.com/freeconf/yang/fc"
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/nodeutil"
+	"github.com/freeconf/yang/parser"
+)
+
+type auditA struct{ n int }
+type auditB struct{ n int }
+
+func TestHandleAudit(t *testing.T) {
+	p := newHandlePool()
+	p.Put(&auditA{0})
+	p.TrackSites(true)
+	var hnd uint64
+	for i := 1; i <= 2; i++ {
+		hnd = p.Put(&auditA{i})
+	}
+	p.Hnd(&auditB{})
+	audit := p.Audit()
+	fc.RequireEqual(t, 3, len(audit))
+	fc.AssertEqual(t, "*lang.auditA", audit[0].Type)
+	fc.AssertEqual(t, 2, audit[0].Count)
+	fc.AssertEqual(t, true, audit[0].Site != "")
+	fc.AssertEqual(t, "*lang.auditA", audit[1].Type)
+	fc.AssertEqual(t, "", audit[1].Site)
+	fc.AssertEqual(t, "*lang.auditB", audit[2].Type)
+
+	p.Release(hnd)
+	fc.AssertEqual(t, 2, len(p.sites))
+	p.TrackSites(false)
+	fc.AssertEqual(t, 0, len(p.sites))
+}
+
+func TestHandleScope(t *testing.T) {
+	p := newHandlePool()
+	root := &auditA{0}
+	owned := &auditA{3}
+	parents := map[any]any{}
+	parentOf := func(obj any) any { return parents[obj] }
+	rootHnd := p.ScopedHnd(root, parentOf)
+	a := &auditA{1}
+	parents[a] = root
+	aHnd := p.ScopedHnd(a, parentOf)
+	b := &auditA{2}
+	parents[b] = a
+	bHnd := p.ScopedHnd(b, parentOf)
+	fc.AssertEqual(t, aHnd, p.ScopedHnd(a, parentOf))
+	other := p.Hnd(&auditB{})
+	fc.AssertEqual(t, []uint64{rootHnd, aHnd, bHnd}, p.ScopeHnds(root))
+
+	// handles under an owned object go to its scope, not root's
+	parents[owned] = b
+	ownedHnd := p.OwnedHnd(owned)
+	c := &auditA{4}
+	parents[c] = owned
+	cHnd := p.ScopedHnd(c, parentOf)
+	fc.AssertEqual(t, []uint64{cHnd}, p.ScopeHnds(owned))
+
+	p.Release(aHnd)
+	fc.AssertEqual(t, []uint64{rootHnd, bHnd}, p.ReleaseScope(root))
+	fc.AssertEqual(t, 3, p.Count())
+	fc.AssertEqual(t, true, p.Get(other) != nil)
+	fc.AssertEqual(t, 0, len(p.ReleaseScope(root)))
+
+	// walking under owned object after root is gone does not bring back
+	// root's scope
+	d := &auditA{5}
+	parents[d] = c
+	dHnd := p.ScopedHnd(d, parentOf)
+	fc.AssertEqual(t, 0, len(p.ScopeHnds(root)))
+	p.Release(ownedHnd)
+	fc.AssertEqual(t, []uint64{cHnd, dHnd}, p.ReleaseScope(owned))
+	fc.AssertEqual(t, 1, p.Count())
+	_, rootOpen := p.scopes[root]
+	fc.AssertEqual(t, false, rootOpen)
+}
+
+func TestReleaseBrowserReadCache(t *testing.T) {
+	d := &Driver{handles: newHandlePool(), readCaches: newReadCaches(&DriverStats{})}
+	s := &HandleService{d: d}
+	m, err := parser.LoadModuleFromString(nil, `module x { container a { leaf b { type string; } } }`)
+	fc.RequireEqual(t, nil, err)
+	b := node.NewBrowser(m, nodeutil.ReadJSON(`{}`))
+	d.readCaches.enable(b, []string{"a"}, 0)
+	_, err = s.Release(context.Background(), &pb.ReleaseRequest{Hnd: d.handles.Put(b)})
+	fc.RequireEqual(t, nil, err)
+	fc.AssertEqual(t, 0, len(d.readCaches.caches))
+}
@@ -3,6 +3,7 @@ package lang
 import (
 	"context"
 	"fmt"
+	"time"
 
 	"github.com/freeconf/lang/pb"
 	"github.com/freeconf/yang/meta"
@@ -30,37 +31,178 @@ func (s *NodeService) NewBrowser(ctx context.Context, in *pb.NewBrowserRequest)
 	return &pb.NewBrowserResponse{BrowserHnd: browserHnd}, nil
 }
 
+func (s *NodeService) BrowserReadCache(ctx context.Context, in *pb.BrowserReadCacheRequest) (*pb.BrowserReadCacheResponse, error) {
+	b := s.d.handles.Require(in.BrowserHnd).(*node.Browser)
+	s.d.readCaches.enable(b, in.Paths, time.Duration(in.MaxAgeMs)*time.Millisecond)
+	return &pb.BrowserReadCacheResponse{}, nil
+}
+
+func (s *NodeService) BrowserInvalidate(ctx context.Context, in *pb.BrowserInvalidateRequest) (*pb.BrowserInvalidateResponse, error) {
+	b := s.d.handles.Require(in.BrowserHnd).(*node.Browser)
+	if c := s.d.readCaches.get(b); c != nil {
+		c.invalidate(in.Path)
+	}
+	s.d.readCaches.changed()
+	return &pb.BrowserInvalidateResponse{}, nil
+}
+
 func (s *NodeService) BrowserRoot(ctx context.Context, in *pb.BrowserRootRequest) (*pb.BrowserRootResponse, error) {
 	b := s.d.handles.Require(in.BrowserHnd).(*node.Browser)
-	root := b.Root()
+	root := s.d.tracer.root(ctx, b)
 	var resp pb.BrowserRootResponse
-	resp.SelHnd = resolveSelection(s.d, root)
+	resp.SelHnd = ownSelection(s.d, root)
 	return &resp, nil
 }
 
 func (s NodeService) ReleaseSelection(ctx context.Context, in *pb.ReleaseSelectionRequest) (*pb.ReleaseSelectionResponse, error) {
-	sel := s.d.handles.Require(in.SelHnd).(*node.Selection)
+	found := s.d.handles.Get(in.SelHnd)
+	if found == nil {
+		// already released with root selection it was under
+		return &pb.ReleaseSelectionResponse{}, nil
+	}
+	sel := found.(*node.Selection)
+	defer s.d.tracer.traceSelection(ctx, sel)()
 	sel.Release()
-	return &pb.ReleaseSelectionResponse{}, nil
+	// after release as X may be called back with this handle while releasing
+	s.d.handles.Release(in.SelHnd)
+	var resp pb.ReleaseSelectionResponse
+	resp.ReleasedHnds = s.d.handles.ReleaseScope(sel)
+	return &resp, nil
 }
 
 func (s NodeService) Find(ctx context.Context, in *pb.FindRequest) (*pb.FindResponse, error) {
 	sel := s.d.handles.Require(in.SelHnd).(*node.Selection)
+	defer s.d.tracer.traceSelection(ctx, sel)()
 	found, err := sel.Find(in.Path)
 	if err != nil {
 		return nil, err
 	}
 	var resp pb.FindResponse
 	if found != nil {
-		resp.SelHnd = resolveSelection(s.d, found)
+		resp.SelHnd = ownSelection(s.d, found)
 	}
 	return &resp, err
 }
 
+func (s NodeService) Get(ctx context.Context, in *pb.GetRequest) (*pb.GetResponse, error) {
+	sel := s.d.handles.Require(in.SelHnd).(*node.Selection)
+	defer s.d.tracer.traceSelection(ctx, sel)()
+	target := sel
+	if u := treeUrl(in.Path, in.Depth, in.Fields); u != "" {
+		found, err := sel.Find(u)
+		if err != nil || found == nil {
+			return &pb.GetResponse{}, err
+		}
+		defer found.Release()
+		target = found
+	}
+	tree, err := readTree(target)
+	if err != nil {
+		return nil, err
+	}
+	return &pb.GetResponse{Tree: tree}, nil
+}
+
+// Batch runs selection operations in order so X can make many of them in
+// one round trip.  Steps can use selections found by earlier steps.
+func (s *NodeService) Batch(ctx context.Context, in *pb.BatchRequest) (*pb.BatchResponse, error) {
+	resp := &pb.BatchResponse{Results: make([]*pb.BatchResult, len(in.Steps))}
+	failed := false
+	for i, step := range in.Steps {
+		result := &pb.BatchResult{}
+		resp.Results[i] = result
+		if failed && in.StopOnError {
+			result.Skipped = true
+			continue
+		}
+		if err := s.batchStep(ctx, step, resp.Results[:i], result); err != nil {
+			result.Error = err.Error()
+			failed = true
+		}
+	}
+	return resp, nil
+}
+
+func (s *NodeService) batchStep(ctx context.Context, step *pb.BatchStep, prev []*pb.BatchResult, result *pb.BatchResult) error {
+	var selHnd uint64
+	if step.SelStep > 0 {
+		if int(step.SelStep) > len(prev) {
+			return fmt.Errorf("step %d is not before this step", step.SelStep)
+		}
+		from := prev[step.SelStep-1]
+		if from.SelHnd == 0 {
+			return fmt.Errorf("step %d has no selection", step.SelStep)
+		}
+		selHnd = from.SelHnd
+	}
+	// earlier steps can release selections later steps use and a released
+	// handle would panic in the service call
+	target := func(reqHnd *uint64) error {
+		if selHnd != 0 {
+			*reqHnd = selHnd
+		}
+		if s.d.handles.Get(*reqHnd) == nil {
+			return fmt.Errorf("selection %d was released", *reqHnd)
+		}
+		return nil
+	}
+	switch op := step.Op.(type) {
+	case *pb.BatchStep_Find:
+		if err := target(&op.Find.SelHnd); err != nil {
+			return err
+		}
+		found, err := s.Find(ctx, op.Find)
+		if err != nil {
+			return err
+		}
+		result.SelHnd = found.SelHnd
+	case *pb.BatchStep_Edit:
+		if err := target(&op.Edit.SelHnd); err != nil {
+			return err
+		}
+		_, err := s.SelectionEdit(ctx, op.Edit)
+		return err
+	case *pb.BatchStep_Action:
+		if err := target(&op.Action.SelHnd); err != nil {
+			return err
+		}
+		output, err := s.Action(ctx, op.Action)
+		if err != nil {
+			return err
+		}
+		result.SelHnd = output.OutputSelHnd
+	case *pb.BatchStep_Get:
+		if err := target(&op.Get.SelHnd); err != nil {
+			return err
+		}
+		got, err := s.Get(ctx, op.Get)
+		if err != nil {
+			return err
+		}
+		result.Tree = got.Tree
+	case *pb.BatchStep_Release:
+		// releasing twice is harmless so not checked
+		if selHnd != 0 {
+			op.Release.SelHnd = selHnd
+		}
+		released, err := s.ReleaseSelection(ctx, op.Release)
+		if err != nil {
+			return err
+		}
+		result.ReleasedHnds = released.ReleasedHnds
+	default:
+		return fmt.Errorf("unknown batch step %T", step.Op)
+	}
+	return nil
+}
+
 func (s *NodeService) SelectionEdit(ctx context.Context, in *pb.SelectionEditRequest) (*pb.SelectionEditResponse, error) {
 	sel := s.d.handles.Require(in.SelHnd).(*node.Selection)
+	defer s.d.tracer.traceSelection(ctx, sel)()
 	var n node.Node
-	if in.NodeHnd != 0 {
+	if in.Tree != nil {
+		n = &treeReader{tree: in.Tree}
+	} else if in.NodeHnd != 0 {
 		n = s.d.handles.Require(in.NodeHnd).(node.Node)
 	}
 	var err error
@@ -88,12 +230,27 @@ func (s *NodeService) SelectionEdit(ctx context.Context, in *pb.SelectionEditReq
 		if err != nil {
 			sel.Release()
 		}
+	case pb.SelectionEditOp_CLEAR_FIELD:
+		err = clearField(sel, in.Field)
 	}
 	return &pb.SelectionEditResponse{}, err
 }
 
+// clearField removes a single leaf so X does not have to replace everything
+// around a leaf it no longer has
+func clearField(sel *node.Selection, ident string) error {
+	if defs, valid := sel.Path.Meta.(meta.HasDataDefinitions); valid {
+		for _, def := range defs.DataDefinitions() {
+			if leaf, isLeaf := def.(meta.Leafable); isLeaf && def.Ident() == ident {
+				return sel.ClearField(leaf)
+			}
+		}
+	}
+	return fmt.Errorf("%s has no leaf %s", sel.Path.String(), ident)
+}
+
 func (s *NodeService) NewNode(ctx context.Context, in *pb.NewNodeRequest) (*pb.NewNodeResponse, error) {
-	n := &xnode{d: s.d}
+	n := &xnode{d: s.d, noopHooks: pb.NodeHook(in.NoopHooks)}
 	n.nodeHnd = s.d.handles.Put(n)
 	return &pb.NewNodeResponse{NodeHnd: n.nodeHnd}, nil
 }
@@ -104,20 +261,40 @@ func (s *NodeService) Action(ctx context.Context, in *pb.ActionRequest) (*pb.Act
 		input = s.d.handles.Require(in.InputNodeHnd).(node.Node)
 	}
 	sel := s.d.handles.Require(in.SelHnd).(*node.Selection)
+	defer s.d.tracer.traceSelection(ctx, sel)()
 	output, err := sel.Action(input)
 	if err != nil {
 		return nil, err
 	}
 	var resp pb.ActionResponse
 	if output != nil {
-		resp.OutputSelHnd = resolveSelection(s.d, output)
+		resp.OutputSelHnd = ownSelection(s.d, output)
 	}
 	return &resp, nil
 }
 
+// resolveSelection gives X a handle to selection that lives until the
+// nearest selection above it that X owns, or the root selection of the
+// operation, is released.  A walk thru a large tree hands X a selection for
+// every container and list item so releasing them one by one would cost X a
+// call each.
 func resolveSelection(d *Driver, sel *node.Selection) uint64 {
-	hnd := d.handles.Hnd(sel)
-	return hnd
+	return d.handles.ScopedHnd(sel, selectionParent)
+}
+
+// ownSelection gives X a handle to selection X asked for with BrowserRoot,
+// Find or Action.  X releases these on its own so they are not released with
+// the root they were found under and selections walked under them are
+// released with them, not with a root that may already be gone.
+func ownSelection(d *Driver, sel *node.Selection) uint64 {
+	return d.handles.OwnedHnd(sel)
+}
+
+func selectionParent(obj any) any {
+	if parent := obj.(*node.Selection).Parent; parent != nil {
+		return parent
+	}
+	return nil
 }
 
 func (s *NodeService) GetSelection(ctx context.Context, in *pb.GetSelectionRequest) (*pb.GetSelectionResponse, error) {
@@ -190,6 +367,12 @@ func (s *NodeService) GetModule(ctx context.Context, in *pb.GetModuleRequest) (*
 func (s *NodeService) Notification(in *pb.NotificationRequest, srv pb.Node_NotificationServer) error {
 	closed := false
 	sel := s.d.handles.Require(in.SelHnd).(*node.Selection)
+	if in.Filter != "" {
+		// copy so filter does not stick to selection for other uses
+		filtered := *sel
+		filtered.Context = WithNotifyFilter(sel.Context, in.Filter)
+		sel = &filtered
+	}
 	closer, err := sel.Notifications(func(n node.Notification) {
 		resp := pb.NotificationResponse{
 			SelHnd: resolveSelection(s.d, n.Event),
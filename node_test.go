@@ -0,0 +1,76 @@
+package lang
+
+import (
+	"context"
+	"fmt"
+	"testing"
+
+	"github.com/freeconf/lang/pb"
+	"github.com/freeconf/yang/fc"
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/nodeutil"
+	"github.com/freeconf/yang/parser"
+)
+
+func TestBatch(t *testing.T) {
+	mstr := `module x {
+		list d {
+			key e;
+			leaf e {
+				type string;
+			}
+		}
+	}`
+	m, err := parser.LoadModuleFromString(nil, mstr)
+	fc.RequireEqual(t, nil, err)
+	d := &Driver{handles: newHandlePool()}
+	s := &NodeService{d: d}
+	data := nodeutil.ReadJSON(`{"d":[{"e":"one"},{"e":"two"}]}`)
+	rootHnd := resolveSelection(d, node.NewBrowser(m, data).Root())
+	goneHnd := d.handles.Hnd(node.NewBrowser(m, data).Root())
+	d.handles.Release(goneHnd)
+	req := &pb.BatchRequest{Steps: []*pb.BatchStep{
+		{Op: &pb.BatchStep_Find{Find: &pb.FindRequest{SelHnd: rootHnd, Path: "d=two"}}},
+		{SelStep: 1, Op: &pb.BatchStep_Get{Get: &pb.GetRequest{}}},
+		{SelStep: 1, Op: &pb.BatchStep_Release{Release: &pb.ReleaseSelectionRequest{}}},
+		{Op: &pb.BatchStep_Find{Find: &pb.FindRequest{SelHnd: rootHnd, Path: "d=three"}}},
+		{SelStep: 4, Op: &pb.BatchStep_Get{Get: &pb.GetRequest{}}},
+		{Op: &pb.BatchStep_Get{Get: &pb.GetRequest{SelHnd: rootHnd, Path: "d=one"}}},
+		{SelStep: 1, Op: &pb.BatchStep_Get{Get: &pb.GetRequest{}}},
+		{Op: &pb.BatchStep_Find{Find: &pb.FindRequest{SelHnd: goneHnd, Path: "d=one"}}},
+	}}
+	resp, err := s.Batch(context.Background(), req)
+	fc.RequireEqual(t, nil, err)
+	fc.RequireEqual(t, 8, len(resp.Results))
+	fc.AssertEqual(t, true, resp.Results[0].SelHnd != 0)
+	fc.AssertEqual(t, "two", resp.Results[1].Tree.Fields[0].Tree.Val.Value.GetStringVal())
+	fc.AssertEqual(t, "", resp.Results[2].Error)
+	fc.AssertEqual(t, uint64(0), resp.Results[3].SelHnd)
+	fc.AssertEqual(t, "step 4 has no selection", resp.Results[4].Error)
+	fc.AssertEqual(t, "one", resp.Results[5].Tree.Fields[0].Tree.Val.Value.GetStringVal())
+	fc.AssertEqual(t, fmt.Sprintf("selection %d was released", resp.Results[0].SelHnd), resp.Results[6].Error)
+	fc.AssertEqual(t, fmt.Sprintf("selection %d was released", goneHnd), resp.Results[7].Error)
+
+	req.StopOnError = true
+	resp, err = s.Batch(context.Background(), req)
+	fc.RequireEqual(t, nil, err)
+	fc.AssertEqual(t, true, resp.Results[5].Skipped)
+}
+
+func TestFoundSelectionOutlivesRoot(t *testing.T) {
+	m, err := parser.LoadModuleFromString(nil, `module x { container a { leaf b { type string; } } }`)
+	fc.RequireEqual(t, nil, err)
+	d := &Driver{handles: newHandlePool(), readCaches: newReadCaches(&DriverStats{})}
+	s := &NodeService{d: d}
+	b := node.NewBrowser(m, nodeutil.ReadJSON(`{"a":{"b":"hi"}}`))
+	root, err := s.BrowserRoot(context.Background(), &pb.BrowserRootRequest{BrowserHnd: d.handles.Put(b)})
+	fc.RequireEqual(t, nil, err)
+	found, err := s.Find(context.Background(), &pb.FindRequest{SelHnd: root.SelHnd, Path: "a"})
+	fc.RequireEqual(t, nil, err)
+	released, err := s.ReleaseSelection(context.Background(), &pb.ReleaseSelectionRequest{SelHnd: root.SelHnd})
+	fc.RequireEqual(t, nil, err)
+	fc.AssertEqual(t, 0, len(released.ReleasedHnds))
+	got, err := s.Get(context.Background(), &pb.GetRequest{SelHnd: found.SelHnd})
+	fc.RequireEqual(t, nil, err)
+	fc.AssertEqual(t, "hi", got.Tree.Fields[0].Tree.Val.Value.GetStringVal())
+}
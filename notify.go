@@ -0,0 +1,220 @@
+package lang
+
+import (
+	"container/list"
+	"context"
+	"fmt"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/nodeutil"
+)
+
+// notifyFanout ensures there is only one notification stream open to X for each
+// distinct notification no matter how many Go subscribers (RESTCONF clients,
+// gNMI subscriptions, ...) are listening. Without this the X implementation would
+// register, build and encode each event once per subscriber.
+type notifyFanout struct {
+	lock   sync.Mutex
+	topics map[string]*notifyTopic
+	stats  *DriverStats
+}
+
+type notifyTopic struct {
+	fanout *notifyFanout
+	key    string
+	subs   *list.List
+	closer node.NotifyCloser
+	err    error
+	ready  chan struct{} // closed once X stream is open or failed to open
+
+	// X is told about filter but events are checked here too as producers
+	// are not required to
+	filter *eventFilter
+}
+
+type notifyOpener func(r node.NotifyRequest, t *notifyTopic) (node.NotifyCloser, error)
+
+func newNotifyFanout(stats *DriverStats) *notifyFanout {
+	return &notifyFanout{
+		topics: make(map[string]*notifyTopic),
+		stats:  stats,
+	}
+}
+
+type notifyFilterKey struct{}
+
+// WithNotifyFilter attaches a subscriber's filter (e.g. from RESTCONF or gNMI
+// subscription) to the context of a selection so it is handed to X producers
+// when subscribing to notifications.  Producers can then avoid building events
+// that would only be thrown away.  Filter is a path with predicates like
+// interface[name='eth0']/drops>10 and events not matching it are never
+// delivered even if producer sends them.
+func WithNotifyFilter(ctx context.Context, filter string) context.Context {
+	return context.WithValue(ctx, notifyFilterKey{}, filter)
+}
+
+func notifyFilter(ctx context.Context) string {
+	if ctx == nil {
+		return ""
+	}
+	filter, _ := ctx.Value(notifyFilterKey{}).(string)
+	return filter
+}
+
+func notifyKey(r node.NotifyRequest) string {
+	// browser distinguishes two unrelated trees that happen to share a path and
+	// subscribers with different filters cannot share events
+	return fmt.Sprintf("%p:%s?%s", r.Selection.Browser, r.Selection.Path.String(), notifyFilter(r.Selection.Context))
+}
+
+func (f *notifyFanout) subscribe(r node.NotifyRequest, open notifyOpener) (node.NotifyCloser, error) {
+	key := notifyKey(r)
+	filter, err := compileEventFilter(notifyFilter(r.Selection.Context))
+	if err != nil {
+		return nil, err
+	}
+	f.lock.Lock()
+	t, found := f.topics[key]
+	if !found {
+		// others subscribing while X stream is opening wait on this topic
+		t = &notifyTopic{
+			fanout: f,
+			key:    key,
+			subs:   list.New(),
+			ready:  make(chan struct{}),
+			filter: filter,
+		}
+		f.topics[key] = t
+	}
+	e := t.subs.PushBack(r)
+	atomic.AddInt64(&f.stats.NotificationSubscribers, 1)
+	f.lock.Unlock()
+
+	if !found {
+		// opening talks to X so do not hold lock
+		closer, err := open(r, t)
+		f.lock.Lock()
+		t.closer = closer
+		t.err = err
+		if err != nil {
+			f.remove(t)
+		}
+		f.lock.Unlock()
+		close(t.ready)
+	} else {
+		<-t.ready
+	}
+	if t.err != nil {
+		f.lock.Lock()
+		t.leave(e)
+		f.lock.Unlock()
+		return nil, t.err
+	}
+	return func() error {
+		return t.unsubscribe(e)
+	}, nil
+}
+
+// remove stops new subscribers from joining topic, caller holds lock
+func (f *notifyFanout) remove(t *notifyTopic) {
+	if f.topics[t.key] == t {
+		delete(f.topics, t.key)
+	}
+}
+
+// leave removes subscriber, caller holds lock
+func (t *notifyTopic) leave(e *list.Element) bool {
+	if e.Value == nil {
+		// already unsubscribed
+		return false
+	}
+	t.subs.Remove(e)
+	e.Value = nil
+	atomic.AddInt64(&t.fanout.stats.NotificationSubscribers, -1)
+	return true
+}
+
+func (t *notifyTopic) unsubscribe(e *list.Element) error {
+	f := t.fanout
+	f.lock.Lock()
+	if !t.leave(e) {
+		f.lock.Unlock()
+		return nil
+	}
+	var closer node.NotifyCloser
+	if t.subs.Len() == 0 {
+		f.remove(t)
+		closer = t.closer
+	}
+	f.lock.Unlock()
+
+	// closing talks to X so do not hold lock
+	if closer != nil {
+		return closer()
+	}
+	return nil
+}
+
+// dead is for when X stream has ended on its own. Existing subscribers were
+// sent the error and new subscribers get a new stream.
+func (t *notifyTopic) dead(err error) {
+	t.fail(err)
+	t.ended()
+}
+
+func (t *notifyTopic) ended() {
+	t.fanout.lock.Lock()
+	t.fanout.remove(t)
+	t.fanout.lock.Unlock()
+}
+
+func (t *notifyTopic) subscribers() []node.NotifyRequest {
+	t.fanout.lock.Lock()
+	defer t.fanout.lock.Unlock()
+	subs := make([]node.NotifyRequest, 0, t.subs.Len())
+	for e := t.subs.Front(); e != nil; e = e.Next() {
+		subs = append(subs, e.Value.(node.NotifyRequest))
+	}
+	return subs
+}
+
+func (t *notifyTopic) publish(n node.Node, when time.Time) {
+	subs := t.subscribers()
+	if len(subs) == 0 {
+		return
+	}
+	if len(subs) == 1 && t.filter == nil {
+		subs[0].SendWhen(n, when)
+		return
+	}
+
+	// read event from X once and give each subscriber their own copy otherwise
+	// every subscriber would walk the event in X
+	var snapshot string
+	var err error
+	if t.filter != nil {
+		var wanted bool
+		wanted, snapshot, err = t.filter.matches(subs[0].Selection.Split(n))
+		if err == nil && !wanted {
+			return
+		}
+	} else {
+		snapshot, err = nodeutil.WriteJSON(subs[0].Selection.Split(n))
+	}
+	if err != nil {
+		t.fail(err)
+		return
+	}
+	for _, r := range subs {
+		r.SendWhen(nodeutil.ReadJSON(snapshot), when)
+	}
+}
+
+func (t *notifyTopic) fail(err error) {
+	for _, r := range t.subscribers() {
+		r.Send(node.ErrorNode{Err: err})
+	}
+}
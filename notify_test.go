@@ -0,0 +1,68 @@
+package lang
+
+import (
+	"errors"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"github.com/freeconf/yang/fc"
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/nodeutil"
+	"github.com/freeconf/yang/parser"
+)
+
+func TestNotifyFanout(t *testing.T) {
+	m, err := parser.LoadModuleFromString(nil, `module x { leaf a { type string; } }`)
+	fc.RequireEqual(t, nil, err)
+	reqA := node.NotifyRequest{Selection: node.NewBrowser(m, nodeutil.ReadJSON(`{}`)).Root()}
+	reqB := node.NotifyRequest{Selection: node.NewBrowser(m, nodeutil.ReadJSON(`{}`)).Root()}
+	var stats DriverStats
+	f := newNotifyFanout(&stats)
+
+	// slow X subscribe does not hold up other topics and subscribers to the
+	// same topic share its stream once it is open
+	opens := 0
+	release := make(chan struct{})
+	slow := func(r node.NotifyRequest, t *notifyTopic) (node.NotifyCloser, error) {
+		opens++
+		<-release
+		return func() error { return nil }, nil
+	}
+	fast := func(r node.NotifyRequest, t *notifyTopic) (node.NotifyCloser, error) {
+		return func() error { return nil }, nil
+	}
+	done := make(chan node.NotifyCloser, 2)
+	for i := 0; i < 2; i++ {
+		go func() {
+			closer, err := f.subscribe(reqA, slow)
+			fc.AssertEqual(t, nil, err)
+			done <- closer
+		}()
+	}
+	closerB, err := f.subscribe(reqB, fast)
+	fc.RequireEqual(t, nil, err)
+	fc.AssertEqual(t, nil, closerB())
+	time.Sleep(10 * time.Millisecond)
+	close(release)
+	closer1, closer2 := <-done, <-done
+	fc.AssertEqual(t, 1, opens)
+	fc.AssertEqual(t, int64(2), atomic.LoadInt64(&stats.NotificationSubscribers))
+
+	// stream that died is not reused
+	f.topics[notifyKey(reqA)].ended()
+	_, err = f.subscribe(reqA, slow)
+	fc.AssertEqual(t, nil, err)
+	fc.AssertEqual(t, 2, opens)
+	fc.AssertEqual(t, nil, closer1())
+	fc.AssertEqual(t, nil, closer2())
+	fc.AssertEqual(t, 1, len(f.topics))
+
+	// failed open is not kept either
+	_, err = f.subscribe(reqB, func(r node.NotifyRequest, t *notifyTopic) (node.NotifyCloser, error) {
+		return nil, errors.New("no")
+	})
+	fc.AssertEqual(t, "no", err.Error())
+	fc.AssertEqual(t, 1, len(f.topics))
+	fc.AssertEqual(t, int64(1), atomic.LoadInt64(&stats.NotificationSubscribers))
+}
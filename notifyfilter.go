@@ -0,0 +1,371 @@
+package lang
+
+import (
+	"encoding/json"
+	"fmt"
+	"regexp"
+	"strconv"
+	"strings"
+
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/nodeutil"
+)
+
+// eventFilter is a subscriber's filter compiled so events can be checked in
+// Go no matter if producer in X checked them or not.  Same syntax as X's
+// filters: RESTCONF/gNMI style paths relative to the notification with
+// predicates on list items, compared to literals and joined with 'and', 'or'
+// and parens
+//
+//	/if:interface[name=eth0]/stats/drops>10 or up!='true'
+type eventFilter struct {
+	expr  string
+	match filterPredicate
+}
+
+// filterPredicate is evaluated on event decoded from JSON
+type filterPredicate func(data any) bool
+
+type filterStep struct {
+	ident      string
+	predicates []filterPredicate
+}
+
+func compileEventFilter(expr string) (*eventFilter, error) {
+	if strings.TrimSpace(expr) == "" {
+		return nil, nil
+	}
+	p, err := newFilterParser(expr)
+	if err != nil {
+		return nil, err
+	}
+	match, err := p.parse()
+	if err != nil {
+		return nil, err
+	}
+	return &eventFilter{expr: expr, match: match}, nil
+}
+
+// matches reads event once and checks it against filter.  Event is returned as
+// JSON so it does not have to be read again to send it.
+func (f *eventFilter) matches(event *node.Selection) (bool, string, error) {
+	snapshot, err := nodeutil.WriteJSON(event)
+	if err != nil {
+		return false, "", err
+	}
+	var data any
+	if err := json.Unmarshal([]byte(snapshot), &data); err != nil {
+		return false, "", err
+	}
+	return f.match(data), snapshot, nil
+}
+
+var filterToken = regexp.MustCompile(`^\s*(?:('[^']*'|"[^"]*")|(!=|<=|>=|=|<|>|\(|\)|\[|\]|/)|([^\s'"!=<>()\[\]/]+))`)
+
+const (
+	filterStr = iota + 1
+	filterOp
+	filterWord
+)
+
+type filterTok struct {
+	kind int
+	val  string
+}
+
+type filterParser struct {
+	expr   string
+	tokens []filterTok
+	pos    int
+}
+
+func newFilterParser(expr string) (*filterParser, error) {
+	p := &filterParser{expr: expr}
+	rest := expr
+	for strings.TrimSpace(rest) != "" {
+		m := filterToken.FindStringSubmatch(rest)
+		if m == nil {
+			return nil, fmt.Errorf("invalid filter '%s' at position %d", expr, len(expr)-len(rest))
+		}
+		rest = rest[len(m[0]):]
+		for kind := filterStr; kind <= filterWord; kind++ {
+			if m[kind] != "" {
+				p.tokens = append(p.tokens, filterTok{kind: kind, val: m[kind]})
+				break
+			}
+		}
+	}
+	return p, nil
+}
+
+func (p *filterParser) parse() (filterPredicate, error) {
+	f, err := p.parseOr()
+	if err != nil {
+		return nil, err
+	}
+	if p.pos < len(p.tokens) {
+		return nil, fmt.Errorf("invalid filter '%s', unexpected '%s'", p.expr, p.tokens[p.pos].val)
+	}
+	return f, nil
+}
+
+func (p *filterParser) peek() filterTok {
+	if p.pos < len(p.tokens) {
+		return p.tokens[p.pos]
+	}
+	return filterTok{}
+}
+
+func (p *filterParser) next() (filterTok, error) {
+	t := p.peek()
+	if t.kind == 0 {
+		return t, fmt.Errorf("invalid filter '%s', unexpected end", p.expr)
+	}
+	p.pos++
+	return t, nil
+}
+
+func (p *filterParser) parseOr() (filterPredicate, error) {
+	terms, err := p.parseJoined("or", p.parseAnd)
+	if err != nil || len(terms) == 1 {
+		return firstPredicate(terms), err
+	}
+	return func(data any) bool {
+		for _, t := range terms {
+			if t(data) {
+				return true
+			}
+		}
+		return false
+	}, nil
+}
+
+func (p *filterParser) parseAnd() (filterPredicate, error) {
+	terms, err := p.parseJoined("and", p.parseTerm)
+	if err != nil || len(terms) == 1 {
+		return firstPredicate(terms), err
+	}
+	return func(data any) bool {
+		for _, t := range terms {
+			if !t(data) {
+				return false
+			}
+		}
+		return true
+	}, nil
+}
+
+func firstPredicate(terms []filterPredicate) filterPredicate {
+	if len(terms) == 0 {
+		return nil
+	}
+	return terms[0]
+}
+
+func (p *filterParser) parseJoined(word string, parseTerm func() (filterPredicate, error)) ([]filterPredicate, error) {
+	var terms []filterPredicate
+	for {
+		t, err := parseTerm()
+		if err != nil {
+			return nil, err
+		}
+		terms = append(terms, t)
+		if p.peek() != (filterTok{kind: filterWord, val: word}) {
+			return terms, nil
+		}
+		p.pos++
+	}
+}
+
+func (p *filterParser) expect(val string) error {
+	t, err := p.next()
+	if err != nil {
+		return err
+	}
+	if t.kind != filterOp || t.val != val {
+		return fmt.Errorf("invalid filter '%s', missing '%s'", p.expr, val)
+	}
+	return nil
+}
+
+func (p *filterParser) parseTerm() (filterPredicate, error) {
+	if p.peek() == (filterTok{kind: filterOp, val: "("}) {
+		p.pos++
+		f, err := p.parseOr()
+		if err != nil {
+			return nil, err
+		}
+		return f, p.expect(")")
+	}
+	path, err := p.parsePath()
+	if err != nil {
+		return nil, err
+	}
+	op := p.peek()
+	compare, isCompare := filterOps[op.val]
+	if op.kind != filterOp || !isCompare {
+		return func(data any) bool {
+			return len(filterValues(data, path)) > 0
+		}, nil
+	}
+	p.pos++
+	lit, err := p.next()
+	if err != nil {
+		return nil, err
+	}
+	var expected any
+	switch lit.kind {
+	case filterStr:
+		expected = lit.val[1 : len(lit.val)-1]
+	case filterWord:
+		if n, err := strconv.ParseFloat(lit.val, 64); err == nil {
+			expected = n
+		} else {
+			expected = lit.val
+		}
+	default:
+		return nil, fmt.Errorf("invalid filter '%s', expected value after '%s'", p.expr, op.val)
+	}
+	return func(data any) bool {
+		for _, v := range filterValues(data, path) {
+			if actual := filterCoerce(v, expected); actual != nil && compare(actual, expected) {
+				return true
+			}
+		}
+		return false
+	}, nil
+}
+
+func (p *filterParser) parsePath() ([]filterStep, error) {
+	if p.peek() == (filterTok{kind: filterOp, val: "/"}) {
+		p.pos++
+	}
+	var path []filterStep
+	for {
+		t, err := p.next()
+		if err != nil {
+			return nil, err
+		}
+		if t.kind != filterWord {
+			return nil, fmt.Errorf("invalid filter '%s', unexpected '%s'", p.expr, t.val)
+		}
+		step := filterStep{ident: filterStripPrefix(t.val)}
+		for p.peek() == (filterTok{kind: filterOp, val: "["}) {
+			p.pos++
+			pred, err := p.parseOr()
+			if err != nil {
+				return nil, err
+			}
+			if err := p.expect("]"); err != nil {
+				return nil, err
+			}
+			step.predicates = append(step.predicates, pred)
+		}
+		path = append(path, step)
+		if p.peek() != (filterTok{kind: filterOp, val: "/"}) {
+			return path, nil
+		}
+		p.pos++
+	}
+}
+
+func filterStripPrefix(ident string) string {
+	if colon := strings.IndexRune(ident, ':'); colon >= 0 {
+		return ident[colon+1:]
+	}
+	return ident
+}
+
+var filterOps = map[string]func(a any, b any) bool{
+	"=":  func(a any, b any) bool { return filterCompare(a, b) == 0 },
+	"!=": func(a any, b any) bool { return filterCompare(a, b) != 0 },
+	"<":  func(a any, b any) bool { return filterCompare(a, b) < 0 },
+	"<=": func(a any, b any) bool { return filterCompare(a, b) <= 0 },
+	">":  func(a any, b any) bool { return filterCompare(a, b) > 0 },
+	">=": func(a any, b any) bool { return filterCompare(a, b) >= 0 },
+}
+
+// filterCompare of two values already coerced to the same type
+func filterCompare(a any, b any) int {
+	if x, isNum := a.(float64); isNum {
+		y := b.(float64)
+		switch {
+		case x < y:
+			return -1
+		case x > y:
+			return 1
+		}
+		return 0
+	}
+	return strings.Compare(a.(string), b.(string))
+}
+
+func filterValues(data any, path []filterStep) []any {
+	candidates := []any{data}
+	for _, step := range path {
+		var found []any
+		for _, c := range candidates {
+			v := filterGet(c, step.ident)
+			if v == nil {
+				continue
+			}
+			items, isList := v.([]any)
+			if !isList {
+				items = []any{v}
+			}
+			for _, item := range items {
+				if filterAll(step.predicates, item) {
+					found = append(found, item)
+				}
+			}
+		}
+		candidates = found
+	}
+	return candidates
+}
+
+func filterAll(predicates []filterPredicate, item any) bool {
+	for _, p := range predicates {
+		if !p(item) {
+			return false
+		}
+	}
+	return true
+}
+
+func filterGet(obj any, ident string) any {
+	m, isMap := obj.(map[string]any)
+	if !isMap {
+		return nil
+	}
+	for k, v := range m {
+		if filterStripPrefix(k) == ident {
+			return v
+		}
+	}
+	return nil
+}
+
+// filterCoerce converts event value to type of literal, nil if it cannot be
+func filterCoerce(v any, expected any) any {
+	if _, isNum := expected.(float64); isNum {
+		switch x := v.(type) {
+		case float64:
+			return x
+		case string:
+			if n, err := strconv.ParseFloat(x, 64); err == nil {
+				return n
+			}
+		}
+		return nil
+	}
+	switch x := v.(type) {
+	case bool:
+		return strconv.FormatBool(x)
+	case float64:
+		return strconv.FormatFloat(x, 'f', -1, 64)
+	case string:
+		return x
+	}
+	return nil
+}
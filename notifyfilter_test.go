@@ -0,0 +1,48 @@
+package lang
+
+import (
+	"testing"
+
+	"github.com/freeconf/yang/fc"
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/nodeutil"
+	"github.com/freeconf/yang/parser"
+)
+
+func TestEventFilter(t *testing.T) {
+	mstr := `module x {
+		list interface {
+			key name;
+			leaf name {
+				type string;
+			}
+			leaf drops {
+				type int32;
+			}
+		}
+	}`
+	m, err := parser.LoadModuleFromString(nil, mstr)
+	fc.RequireEqual(t, nil, err)
+	event := node.NewBrowser(m, nodeutil.ReadJSON(`{"interface":[{"name":"eth1","drops":50},{"name":"eth0","drops":11}]}`)).Root()
+	tests := []struct {
+		expr     string
+		expected bool
+	}{
+		{"interface[name=eth0]/drops>10", true},
+		{"/x:interface[name='eth0']/drops>20", false},
+		{"interface[name=eth2] or interface/drops=50", true},
+		{"interface[name=eth0][drops<5]", false},
+		{"missing", false},
+	}
+	for _, test := range tests {
+		f, err := compileEventFilter(test.expr)
+		fc.RequireEqual(t, nil, err)
+		actual, _, err := f.matches(event)
+		fc.RequireEqual(t, nil, err)
+		fc.AssertEqual(t, test.expected, actual)
+	}
+	for _, bad := range []string{"a = ", "(a='b'", "a[b='c'"} {
+		_, err := compileEventFilter(bad)
+		fc.AssertEqual(t, true, err != nil)
+	}
+}
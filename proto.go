@@ -2,11 +2,13 @@ package lang
 
 import (
 	"context"
+	"time"
 
 	"github.com/freeconf/gnmi"
 	"github.com/freeconf/lang/pb"
 	"github.com/freeconf/restconf"
 	"github.com/freeconf/restconf/device"
+	"github.com/freeconf/restconf/web"
 )
 
 type ProtoService struct {
@@ -17,6 +19,12 @@ type ProtoService struct {
 func (s *ProtoService) RestconfServer(ctx context.Context, req *pb.RestconfServerRequest) (*pb.RestconfServerResponse, error) {
 	d := s.d.handles.Require(req.DeviceHnd).(*device.Local)
 	server := restconf.NewServer(d)
+	if req.CacheResponses {
+		// web server is set before config is applied so web options from
+		// config go to the server that answers thru the cache
+		maxAge := time.Duration(req.CacheMaxAgeMs) * time.Millisecond
+		server.Web = web.NewServer(newResponseCache(server, s.d.readCaches, &s.d.Stats, maxAge))
+	}
 	resp := pb.RestconfServerResponse{
 		ServerHnd: s.d.handles.Put(server),
 	}
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Throughput of streams between python and Go.  Each case moves a generated JSON
+document thru the Go JSON reader/writer with one end being a python stream and
+the other a Go file so python stream handling is what is measured.
+
+    cd python && PYTHONPATH=. python3 bench/bench_fs.py --mb 50
+"""
+import argparse
+import io
+import os
+import tempfile
+import time
+import freeconf.pb.fc_pb2
+import freeconf.pb.fs_pb2
+import freeconf.handles
+from freeconf import driver, parser, node, source, nodeutil
+
+YANG = """
+module bench {
+    list item {
+        key id;
+        leaf id {
+            type int32;
+        }
+        leaf payload {
+            type string;
+        }
+    }
+}
+"""
+
+def gen_doc(mb):
+    payload = "x" * 1000
+    n = int(mb * 1024 * 1024 / (len(payload) + 30))
+    items = ",".join(f'{{"id":{i},"payload":"{payload}"}}' for i in range(n))
+    return f'{{"item":[{items}]}}'.encode('utf-8')
+
+def read_from(drv, schema, rdr, dest):
+    src = nodeutil.json_read_io(rdr, driver=drv)
+    b = node.Browser(schema, src, driver=drv)
+    root = b.root()
+    root.upsert_into(nodeutil.json_write_file(dest, driver=drv))
+    root.release()
+
+def write_to(drv, schema, src_fname, wtr):
+    src = nodeutil.json_read_file(src_fname, driver=drv)
+    b = node.Browser(schema, src, driver=drv)
+    root = b.root()
+    stream = drv.fs.new_wtr_io(wtr)
+    req = freeconf.pb.fc_pb2.JSONWtrRequest(streamHnd=stream.hnd)
+    resp = drv.g_nodeutil.JSONWtr(req)
+    root.upsert_into(freeconf.handles.RemoteRef(drv, resp.nodeHnd))
+    drv.g_fs.CloseStream(freeconf.pb.fs_pb2.CloseStreamRequest(streamHnd=stream.hnd))
+    stream.wait()
+    root.release()
+
+def report(name, nbytes, secs):
+    print(f"{name:<20} {nbytes / (1024 * 1024) / secs:8.1f} MB/s  ({secs:.3f}s)")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--mb", type=float, default=10)
+    args = ap.parse_args()
+
+    drv = driver.Driver()
+    drv.load()
+    schema = parser.load_module_str(source.any(driver=drv), YANG, driver=drv)
+    doc = gen_doc(args.mb)
+    with tempfile.TemporaryDirectory() as tmp:
+        src_fname = os.path.join(tmp, "src.json")
+        with open(src_fname, "wb") as f:
+            f.write(doc)
+        dest = os.path.join(tmp, "dest.json")
+
+        t0 = time.perf_counter()
+        read_from(drv, schema, io.BytesIO(doc), dest)
+        report("read BytesIO", len(doc), time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        with open(src_fname, "rb") as f:
+            read_from(drv, schema, f, dest)
+        report("read file", len(doc), time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        out = io.BytesIO()
+        write_to(drv, schema, src_fname, out)
+        report("write BytesIO", out.tell(), time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        with open(dest, "wb") as f:
+            write_to(drv, schema, src_fname, f)
+            nbytes = f.tell()
+        report("write file", nbytes, time.perf_counter() - t0)
+    drv.unload()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Python JSON writer (json_write_local) vs having Go walk python nodes
+(json_write_str) for the same python backed data.
+
+    cd python && PYTHONPATH=. python3 bench/bench_json.py --rows 10000
+"""
+import argparse
+import time
+from freeconf import driver, parser, node, nodeutil
+
+YANG = """
+module bench {
+    container info {
+        leaf name {
+            type string;
+        }
+        leaf enabled {
+            type boolean;
+        }
+    }
+    list item {
+        key id;
+        leaf id {
+            type int32;
+        }
+        leaf label {
+            type string;
+        }
+        leaf weight {
+            type decimal64 {
+                fraction-digits 2;
+            }
+        }
+    }
+}
+"""
+
+def gen_data(rows):
+    return {
+        "info": {"name": "bench", "enabled": True},
+        "item": [{"id": i, "label": f"item {i}", "weight": i * 0.25} for i in range(rows)],
+    }
+
+def timeit(f, repeat):
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = f()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best == None else min(best, elapsed)
+    return best, result
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=10000)
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    drv = driver.Driver()
+    drv.load()
+    schema = parser.load_module_str(None, YANG, driver=drv)
+    b = node.Browser(schema, nodeutil.Node(gen_data(args.rows)), driver=drv)
+    root = b.root()
+
+    go_secs, go_json = timeit(lambda: nodeutil.json_write_str(root, driver=drv), args.repeat)
+    py_secs, py_json = timeit(lambda: nodeutil.json_write_local(root), args.repeat)
+    if go_json != py_json:
+        raise Exception("python and Go JSON differ")
+
+    print(f"rows={args.rows} bytes={len(go_json)}")
+    print(f"json_write_str   {go_secs:8.3f}s")
+    print(f"json_write_local {py_secs:8.3f}s  ({go_secs / py_secs:.1f}x)")
+    root.release()
+    drv.unload()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Synthetic YANG models and matching data for benchmarks.  Sizes are parameters
+so the same shapes can be scaled up or down.
+"""
+
+def wide_yang(n_leafs):
+    """ one container with many leafs """
+    leafs = "\n".join(f"""
+        leaf f{i} {{
+            type int32;
+        }}""" for i in range(n_leafs))
+    return f"""
+module wide {{
+    container wide {{
+        {leafs}
+    }}
+    rpc ping {{
+        input {{
+            leaf msg {{
+                type string;
+            }}
+        }}
+        output {{
+            leaf msg {{
+                type string;
+            }}
+        }}
+    }}
+    notification event {{
+        leaf n {{
+            type int32;
+        }}
+    }}
+}}
+"""
+
+def wide_data(n_leafs):
+    return {"wide": {f"f{i}": i for i in range(n_leafs)}}
+
+
+def deep_yang(depth):
+    """ containers nested depth deep with one leaf at each level """
+    inner = ""
+    for i in reversed(range(depth)):
+        inner = f"""
+    container c{i} {{
+        leaf v {{
+            type int32;
+        }}{inner}
+    }}"""
+    return f"""
+module deep {{{inner}
+}}
+"""
+
+def deep_data(depth):
+    data = {}
+    for i in reversed(range(depth)):
+        child = {"v": i}
+        child.update(data)
+        data = {f"c{i}": child}
+    return data
+
+
+LIST_YANG = """
+module biglist {
+    list row {
+        key id;
+        leaf id {
+            type int32;
+        }
+        leaf name {
+            type string;
+        }
+        leaf enabled {
+            type boolean;
+        }
+        leaf weight {
+            type decimal64 {
+                fraction-digits 2;
+            }
+        }
+    }
+    leaf-list tag {
+        type string;
+    }
+}
+"""
+
+def list_data(rows):
+    return {
+        "row": [{"id": i, "name": f"row {i}", "enabled": i % 2 == 0, "weight": i * 0.25} for i in range(rows)],
+    }
+
+def leaf_list_data(n):
+    return {"tag": [f"tag{i}" for i in range(n)]}
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Soak test that repeats a read, edit and notification cycle many times and
+fails if memory or handle counts on either side keep growing.  Python memory
+is from tracemalloc, Go memory from the Go heap.
+
+    cd python && PYTHONPATH=. python3 bench/soak.py --cycles 1000000
+
+Run with FC_LANG_TRACK_HANDLES=1 to see where leaked handles were created.
+"""
+import argparse
+import sys
+import threading
+import time
+import tracemalloc
+from freeconf import driver, parser, node, nodeutil
+import models
+
+
+class Soak():
+
+    def __init__(self, drv, args):
+        self.drv = drv
+        self.args = args
+        m = parser.load_module_str(None, models.wide_yang(args.leafs), driver=drv)
+        self.data = models.wide_data(args.leafs)
+        self.requests = []
+        def on_notify(n, r):
+            self.requests.append(r)
+            return lambda: None
+        self.b = node.Browser(m, nodeutil.Node(self.data, on_notify=on_notify), driver=drv)
+        self.received = threading.Semaphore(0)
+        self.sub_root = self.b.root()
+        self.event = self.sub_root.find("event")
+        self.closer = self.event.notification(lambda msg: self.received.release())
+        while len(self.requests) == 0:
+            time.sleep(0.001)
+
+    def cycle(self, i):
+        root = self.b.root()
+        wide = root.find("wide")
+        nodeutil.json_write_str(wide, driver=self.drv)
+        wide.upsert_from(nodeutil.Node({"f0": i % 1000}))
+        wide.release()
+        root.release()
+        self.requests[0].send(nodeutil.Node({"n": i % 1000}))
+        self.received.acquire()
+
+    def close(self):
+        self.closer()
+        self.event.release()
+        self.sub_root.release()
+
+
+def sample(drv):
+    audit = drv.audit_handles()
+    return {
+        "py_mem": tracemalloc.get_traced_memory()[0],
+        "go_mem": audit["go"]["heap_alloc"],
+        "go_handles": sum(c[2] for c in audit["go"]["handles"]),
+        "py_handles": sum(c[2] for c in audit["python"]["handles"]),
+        "goroutines": audit["go"]["goroutines"],
+    }
+
+
+def report_growth(drv):
+    audit = drv.audit_handles()
+    for side in ("go", "python"):
+        for t, site, count in audit[side]["handles"][:5]:
+            print(f"  {side:6} {count:8} {t} {site}", file=sys.stderr)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cycles", type=int, default=1000000)
+    ap.add_argument("--leafs", type=int, default=20, help="leafs read and written each cycle")
+    ap.add_argument("--warmup", type=int, default=1000, help="cycles before baseline is taken")
+    ap.add_argument("--every", type=int, default=10000, help="cycles between samples")
+    ap.add_argument("--max-growth-mb", type=float, default=10, help="allowed memory growth on each side")
+    ap.add_argument("--max-handle-growth", type=int, default=10)
+    args = ap.parse_args()
+
+    tracemalloc.start()
+    drv = driver.Driver()
+    drv.load()
+    failed = []
+    try:
+        soak = Soak(drv, args)
+        for i in range(args.warmup):
+            soak.cycle(i)
+        base = sample(drv)
+        t0 = time.perf_counter()
+        for i in range(args.cycles):
+            soak.cycle(i)
+            if (i + 1) % args.every == 0 or i + 1 == args.cycles:
+                s = sample(drv)
+                rate = (i + 1) / (time.perf_counter() - t0)
+                print(f"{i+1:10} cycles {rate:8.0f}/sec  py {s['py_mem']/1e6:8.1f}MB  go {s['go_mem']/1e6:8.1f}MB  "
+                      f"handles py {s['py_handles']:6} go {s['go_handles']:6}  goroutines {s['goroutines']}", file=sys.stderr)
+        soak.close()
+        end = sample(drv)
+        for k in ("py_mem", "go_mem"):
+            growth = (end[k] - base[k]) / 1e6
+            if growth > args.max_growth_mb:
+                failed.append(f"{k} grew {growth:.1f}MB")
+        for k in ("py_handles", "go_handles", "goroutines"):
+            growth = end[k] - base[k]
+            if growth > args.max_handle_growth:
+                failed.append(f"{k} grew by {growth}")
+        if failed:
+            report_growth(drv)
+    finally:
+        drv.unload()
+    if failed:
+        print("FAIL " + ", ".join(failed), file=sys.stderr)
+        sys.exit(1)
+    print("PASS", file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
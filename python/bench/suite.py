@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Benchmarks of common operations across the python/Go bridge on synthetic
+models (see models.py).  Each case reports calls/sec, items/sec where an op
+touches many fields or rows and p50/p99 latency of a single call.
+
+    cd python && PYTHONPATH=. python3 bench/suite.py --out results.json
+    cd python && PYTHONPATH=. python3 bench/suite.py --compare results.json
+
+--compare runs again and prints the change against an earlier results file.
+"""
+import argparse
+import json
+import platform
+import sys
+import threading
+import time
+from freeconf import driver, parser, node, nodeutil
+import models
+
+CASES = []
+
+def case(name):
+    """ register setup function that returns (op, items per op, cleanup) """
+    def register(setup):
+        CASES.append((name, setup))
+        return setup
+    return register
+
+
+class Env():
+
+    def __init__(self, drv, args):
+        self.drv = drv
+        self.args = args
+        self.wide = parser.load_module_str(None, models.wide_yang(args.leafs), driver=drv)
+        self.deep = parser.load_module_str(None, models.deep_yang(args.depth), driver=drv)
+        self.biglist = parser.load_module_str(None, models.LIST_YANG, driver=drv)
+
+    def browser(self, module, data, **kwargs):
+        return node.Browser(module, nodeutil.Node(data, **kwargs), driver=self.drv)
+
+
+@case("module_load")
+def module_load(env):
+    yang = models.wide_yang(env.args.leafs)
+    return lambda: parser.load_module_str(None, yang, driver=env.drv), 1, None
+
+
+@case("container_read")
+def container_read(env):
+    """ every leaf of one container as one JSON document """
+    root = env.browser(env.wide, models.wide_data(env.args.leafs)).root()
+    wide = root.find("wide")
+    def op():
+        nodeutil.json_write_str(wide, driver=env.drv)
+    def cleanup():
+        wide.release()
+        root.release()
+    return op, env.args.leafs, cleanup
+
+
+@case("field_read")
+def field_read(env):
+    """ one leaf per call, cycling thru all of them """
+    root = env.browser(env.wide, models.wide_data(env.args.leafs)).root()
+    wide = root.find("wide")
+    fields = [[f"f{i}"] for i in range(env.args.leafs)]
+    next_field = [0]
+    def op():
+        wide.get(fields=fields[next_field[0]])
+        next_field[0] = (next_field[0] + 1) % len(fields)
+    def cleanup():
+        wide.release()
+        root.release()
+    return op, 1, cleanup
+
+
+@case("deep_read")
+def deep_read(env):
+    root = env.browser(env.deep, models.deep_data(env.args.depth)).root()
+    return lambda: nodeutil.json_write_str(root, driver=env.drv), env.args.depth, root.release
+
+
+@case("list_iterate")
+def list_iterate(env):
+    root = env.browser(env.biglist, models.list_data(env.args.rows)).root()
+    return lambda: nodeutil.json_write_str(root, driver=env.drv), env.args.rows, root.release
+
+
+@case("leaf_list_read")
+def leaf_list_read(env):
+    root = env.browser(env.biglist, models.leaf_list_data(env.args.rows)).root()
+    return lambda: nodeutil.json_write_str(root, driver=env.drv), env.args.rows, root.release
+
+
+@case("upsert_from")
+def upsert_from(env):
+    root = env.browser(env.biglist, {}).root()
+    data = models.list_data(env.args.rows)
+    return lambda: root.upsert_from(nodeutil.Node(data)), env.args.rows, root.release
+
+
+@case("upsert_into")
+def upsert_into(env):
+    root = env.browser(env.biglist, models.list_data(env.args.rows)).root()
+    return lambda: root.upsert_into(nodeutil.Node({})), env.args.rows, root.release
+
+
+@case("json_read")
+def json_read(env):
+    root = env.browser(env.biglist, {}).root()
+    doc = json.dumps(models.list_data(env.args.rows))
+    return lambda: root.upsert_from(nodeutil.json_read_str(doc, driver=env.drv)), env.args.rows, root.release
+
+
+@case("json_write")
+def json_write(env):
+    root = env.browser(env.biglist, models.list_data(env.args.rows)).root()
+    return lambda: nodeutil.json_write_str(root, driver=env.drv), env.args.rows, root.release
+
+
+@case("json_write_local")
+def json_write_local(env):
+    root = env.browser(env.biglist, models.list_data(env.args.rows)).root()
+    return lambda: nodeutil.json_write_local(root), env.args.rows, root.release
+
+
+@case("action")
+def action(env):
+    def on_action(n, r):
+        return nodeutil.Node({"msg": "pong"})
+    root = env.browser(env.wide, models.wide_data(1), on_action=on_action).root()
+    ping = root.find("ping")
+    def op():
+        ping.action(nodeutil.Node({"msg": "ping"})).release()
+    def cleanup():
+        ping.release()
+        root.release()
+    return op, 1, cleanup
+
+
+@case("notification")
+def notification(env):
+    """ latency from python sending event to python subscriber receiving it """
+    requests = []
+    def on_notify(n, r):
+        requests.append(r)
+        return lambda: None
+    root = env.browser(env.wide, models.wide_data(1), on_notify=on_notify).root()
+    event = root.find("event")
+    received = threading.Semaphore(0)
+    closer = event.notification(lambda msg: received.release())
+    while len(requests) == 0:
+        time.sleep(0.001)
+    def op():
+        requests[0].send(nodeutil.Node({"n": 1}))
+        received.acquire()
+    def cleanup():
+        closer()
+        event.release()
+        root.release()
+    return op, 1, cleanup
+
+
+def percentile(sorted_secs, p):
+    i = min(len(sorted_secs) - 1, int(len(sorted_secs) * p / 100))
+    return sorted_secs[i]
+
+def run_case(env, setup):
+    op, items, cleanup = setup(env)
+    try:
+        for _ in range(env.args.warmup):
+            op()
+        latencies = []
+        start = time.perf_counter()
+        while len(latencies) < env.args.min_ops or time.perf_counter() - start < env.args.min_time:
+            t0 = time.perf_counter()
+            op()
+            latencies.append(time.perf_counter() - t0)
+            if len(latencies) >= env.args.max_ops:
+                break
+        total = sum(latencies)
+    finally:
+        if cleanup:
+            cleanup()
+    latencies.sort()
+    return {
+        "ops": len(latencies),
+        "ops_per_sec": len(latencies) / total,
+        "items_per_sec": len(latencies) * items / total,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+    }
+
+def compare(results, baseline):
+    print(f"{'case':16} {'ops/sec':>12} {'was':>12} {'change':>8} {'p99 ms':>10} {'was':>10}")
+    for name, r in results.items():
+        prev = baseline.get(name)
+        if prev == None:
+            print(f"{name:16} {r['ops_per_sec']:12.1f} {'-':>12}")
+            continue
+        change = (r['ops_per_sec'] - prev['ops_per_sec']) / prev['ops_per_sec'] * 100
+        print(f"{name:16} {r['ops_per_sec']:12.1f} {prev['ops_per_sec']:12.1f} {change:+7.1f}% {r['p99_ms']:10.3f} {prev['p99_ms']:10.3f}")
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--leafs", type=int, default=200, help="leafs in wide container")
+    ap.add_argument("--depth", type=int, default=50, help="levels in deep tree")
+    ap.add_argument("--rows", type=int, default=1000, help="rows in big list and leaf-list")
+    ap.add_argument("--warmup", type=int, default=3)
+    ap.add_argument("--min-ops", type=int, default=10)
+    ap.add_argument("--max-ops", type=int, default=10000)
+    ap.add_argument("--min-time", type=float, default=1.0, help="seconds to run each case")
+    ap.add_argument("--case", action="append", help="only run these cases")
+    ap.add_argument("--out", help="write results to this JSON file")
+    ap.add_argument("--compare", help="earlier results JSON file to compare against")
+    args = ap.parse_args()
+
+    drv = driver.Driver()
+    drv.load()
+    try:
+        env = Env(drv, args)
+        results = {}
+        for name, setup in CASES:
+            if args.case and name not in args.case:
+                continue
+            results[name] = run_case(env, setup)
+            r = results[name]
+            print(f"{name:16} {r['ops_per_sec']:10.1f} ops/sec {r['items_per_sec']:12.1f} items/sec  p50 {r['p50_ms']:8.3f}ms  p99 {r['p99_ms']:8.3f}ms", file=sys.stderr)
+    finally:
+        drv.unload()
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f)["results"])
+    if args.out:
+        doc = {
+            "when": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "params": {"leafs": args.leafs, "depth": args.depth, "rows": args.rows},
+            "results": results,
+        }
+        with open(args.out, "w") as f:
+            json.dump(doc, f, indent=2)
+
+if __name__ == '__main__':
+    main()
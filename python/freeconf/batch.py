@@ -0,0 +1,133 @@
+import freeconf.pb.fc_pb2
+import freeconf.driver
+import freeconf.node
+
+class Step():
+    """
+    Operation queued in a Batch. After Batch.run has the result of that
+    operation.  Steps from find and action can be used in place of a selection
+    in later steps of same batch.
+    """
+
+    def __init__(self, batch, index):
+        self.batch = batch
+        self.index = index
+        self.result = None
+
+    @property
+    def error(self):
+        if self.result.skipped:
+            return "skipped"
+        return self.result.error or None
+
+    @property
+    def sel(self):
+        """ selection found or returned from action, None if there was none """
+        if self.result.selHnd == 0:
+            return None
+        return freeconf.node.Selection.resolve(self.batch.driver, self.result.selHnd)
+
+    @property
+    def value(self):
+        """ data read by get as python dicts, lists and values """
+        if not self.result.HasField('tree'):
+            return None
+        return freeconf.node.decode_tree(self.result.tree)
+
+
+class Batch():
+    """
+    Queue of selection operations sent to Go in one call.  Each method takes a
+    Selection or an earlier Step and returns its own Step.
+
+        b = batch.Batch()
+        for name in names:
+            p = b.find(root, f"p={name}")
+            b.upsert_from_value(p, {"b": 1})
+            b.release(p)
+        b.run()
+
+    :param stop_on_error: skip remaining steps after first error, otherwise only
+        steps using the selection of a failed step fail
+    """
+
+    def __init__(self, driver=None, stop_on_error=False):
+        self.driver = driver if driver else freeconf.driver.shared_instance()
+        self.stop_on_error = stop_on_error
+        self.steps = []
+        self.pb_steps = []
+
+    def find(self, sel, path):
+        return self.add(sel, find=freeconf.pb.fc_pb2.FindRequest(path=path))
+
+    def get(self, sel, path=None, depth=None, fields=None):
+        req = freeconf.pb.fc_pb2.GetRequest(path=path, depth=depth, fields=fields)
+        return self.add(sel, get=req)
+
+    def action(self, sel, input_node=None):
+        input_hnd = 0
+        if input_node:
+            input_hnd = freeconf.node.ensure_node_hnd(self.driver, input_node)
+        return self.add(sel, action=freeconf.pb.fc_pb2.ActionRequest(inputNodeHnd=input_hnd))
+
+    def release(self, sel):
+        return self.add(sel, release=freeconf.pb.fc_pb2.ReleaseSelectionRequest())
+
+    def upsert_from(self, sel, n):
+        return self.edit(sel, freeconf.pb.fc_pb2.UPSERT_FROM, n=n)
+
+    def upsert_from_value(self, sel, v):
+        return self.edit(sel, freeconf.pb.fc_pb2.UPSERT_FROM, v=v)
+
+    def insert_from_value(self, sel, v):
+        return self.edit(sel, freeconf.pb.fc_pb2.INSERT_FROM, v=v)
+
+    def replace_from_value(self, sel, v):
+        return self.edit(sel, freeconf.pb.fc_pb2.REPLACE_FROM, v=v)
+
+    def delete(self, sel):
+        return self.edit(sel, freeconf.pb.fc_pb2.DELETE)
+
+    def edit(self, sel, op, n=None, v=None):
+        """
+        :param n: node to edit from
+        :param v: python data to edit from instead of a node
+        """
+        req = freeconf.pb.fc_pb2.SelectionEditRequest(op=op)
+        if v != None:
+            req.tree.CopyFrom(freeconf.node.encode_tree(v))
+        elif n != None:
+            req.nodeHnd = freeconf.node.ensure_node_hnd(self.driver, n)
+        return self.add(sel, edit=req)
+
+    def add(self, sel, **op):
+        req = next(iter(op.values()))
+        if isinstance(sel, Step):
+            if sel.batch is not self:
+                raise Exception("step is from another batch")
+            pb_step = freeconf.pb.fc_pb2.BatchStep(selStep=sel.index + 1, **op)
+        else:
+            req.selHnd = sel.hnd
+            pb_step = freeconf.pb.fc_pb2.BatchStep(**op)
+        step = Step(self, len(self.steps))
+        self.steps.append(step)
+        self.pb_steps.append(pb_step)
+        return step
+
+    def run(self):
+        """ send queued steps to Go and fill in their results """
+        req = freeconf.pb.fc_pb2.BatchRequest(steps=self.pb_steps, stopOnError=self.stop_on_error)
+        resp = self.driver.g_nodes.Batch(req)
+        for step, pb_step, result in zip(self.steps, self.pb_steps, resp.results):
+            step.result = result
+            if pb_step.HasField('release') and not step.error:
+                self.forget_released(pb_step, result)
+        return self.steps
+
+    def forget_released(self, pb_step, result):
+        if pb_step.selStep > 0:
+            sel_hnd = self.steps[pb_step.selStep - 1].result.selHnd
+        else:
+            sel_hnd = pb_step.release.selHnd
+        self.driver.obj_strong.forget_hnd(sel_hnd)
+        freeconf.node.forget_scope(self.driver, result.releasedHnds)
@@ -1,6 +1,11 @@
+import json
+import urllib.parse
+from concurrent import futures
 import freeconf.pb.fc_pb2
 import freeconf.handles
 import freeconf.driver
+import freeconf.fs
+import freeconf.nodeutil
 
 class Device():
 
@@ -12,6 +17,7 @@ class Device():
             self.hnd = resp.deviceHnd
         else:
             self.hnd = hnd_id
+        self.last_startup_config = None
 
     def add_browser(self, browser):
         req = freeconf.pb.fc_pb2.DeviceAddBrowserRequest(deviceHnd=self.hnd, browserHnd=browser.hnd)
@@ -22,23 +28,147 @@ class Device():
         resp = self.driver.g_device.DeviceGetBrowser(req)
         return freeconf.node.Browser.resolve(self.driver, resp.browserHnd)
 
-    def apply_startup_config_file(self, configFile):
+    def apply_startup_config_file(self, configFile, incremental=False):
+        """
+        :param incremental: only apply what changed since last incremental apply
+            and return list of nodeutil.Change. See apply_startup_config_changes
+        """
+        if incremental:
+            with open(configFile, "rb") as f:
+                return self.apply_startup_config_changes(f.read())
         self.__apply_startup_config_stream(self.driver.fs.new_rdr_file(configFile))
 
-    def apply_startup_config_str(self, str):
+    def apply_startup_config_str(self, str, incremental=False):
+        if incremental:
+            return self.apply_startup_config_changes(str)
         self.__apply_startup_config_stream(self.driver.fs.new_rdr_str(str))
 
-    def apply_startup_config_io(self, rdr):
+    def apply_startup_config_io(self, rdr, incremental=False):
+        if incremental:
+            return self.apply_startup_config_changes(rdr.read())
         self.__apply_startup_config_stream(self.driver.fs.new_rdr_io(rdr))
 
+    def apply_startup_config_changes(self, config):
+        """
+        Compare config against the last config applied this way and apply only
+        the differences so handlers for unchanged data are not called.  First
+        call applies everything and so does the first call after a full apply.
+        Leafs removed from a container cause just that container to be
+        replaced, leafs removed from top of a module are cleared one by one.
+
+        :param config: JSON str/bytes or dict keyed by module name
+        :return: list of nodeutil.Change, paths are prefixed with module name
+        """
+        if isinstance(config, (str, bytes, bytearray)):
+            config = json.loads(config)
+        config = freeconf.nodeutil.strip_module_prefix(config)
+        if self.last_startup_config == None:
+            self.apply_startup_config_str(json.dumps(config))
+            self.last_startup_config = config
+            return [freeconf.nodeutil.Change(freeconf.nodeutil.CREATED, module) for module in config.keys()]
+        changes = []
+        for module in list(self.last_startup_config.keys()) + [m for m in config.keys() if m not in self.last_startup_config]:
+            b = self.get_browser(module)
+            d = freeconf.nodeutil.diff(b.module, self.last_startup_config.get(module), config.get(module))
+            if len(d.changes) == 0:
+                continue
+            root = b.root()
+            try:
+                for path in d.deletes:
+                    sel = root.find(path)
+                    if sel != None:
+                        sel.delete()
+                        sel.release()
+                for path, content in d.replaces:
+                    sel = root.find(path)
+                    if sel != None:
+                        sel.replace_from(freeconf.nodeutil.json_read_local(content))
+                        sel.release()
+                for _, ident in d.clears:
+                    root.clear_field(ident)
+                if d.patch:
+                    root.upsert_from(freeconf.nodeutil.json_read_local(d.patch))
+            finally:
+                root.release()
+            changes.extend(freeconf.nodeutil.Change(c.op, f"{module}:{c.path}") for c in d.changes)
+        self.last_startup_config = config
+        return changes
+
     def __apply_startup_config_stream(self, stream):
+        # config applied now is unknown so next incremental apply cannot diff
+        self.last_startup_config = None
         req = freeconf.pb.fc_pb2.ApplyStartupConfigRequest(deviceHnd=self.hnd, streamHnd=stream.hnd)
-        self.driver.g_device.ApplyStartupConfig(req)
+        try:
+            self.driver.g_device.ApplyStartupConfig(req)
+        finally:
+            if isinstance(stream, freeconf.fs.StreamRef):
+                stream.release()
 
     @classmethod
-    def client(cls, ypath, address, driver=None):
+    def client(cls, ypath, address, driver=None, pool_size=0, idle_timeout=None, keep_alive=True, cache=None):
+        """
+        :param pool_size: idle connections kept open to server for reuse
+        :param idle_timeout: seconds an idle connection is kept open
+        :param keep_alive: False to close connection after each request
+        :param cache: dict of path prefix relative to address to seconds a GET
+            response is reused e.g. {"data/car:": 5}.  Expired responses are
+            revalidated with the server when it sent an ETag or Last-Modified.
+            Any edit thru this device clears its cache.
+        """
         d = driver if driver else freeconf.driver.shared_instance()
-        req = freeconf.pb.fc_pb2.ClientRequest(ypathHnd=ypath.hnd, address=address)
+        base = urllib.parse.urlparse(address).path.rstrip('/')
+        caches = []
+        if cache:
+            for path, ttl in cache.items():
+                prefix = base + '/' + path.lstrip('/')
+                caches.append(freeconf.pb.fc_pb2.ClientCache(path=prefix, ttlMs=int(ttl * 1000)))
+        req = freeconf.pb.fc_pb2.ClientRequest(
+            ypathHnd=ypath.hnd,
+            address=address,
+            poolSize=pool_size,
+            idleTimeoutMs=int(idle_timeout * 1000) if idle_timeout else 0,
+            noKeepAlive=not keep_alive,
+            cache=caches)
         resp = d.g_device.Client(req)
         return Device(ypath, resp.deviceHnd, driver=d)
 
+
+def fan_out(devices, fn, max_workers=16):
+    """
+    Call fn(device) for each device concurrently, useful when polling many
+    client devices.
+
+    :return: results in same order as devices.  If fn raises for a device the
+        exception is returned in its place so one unreachable device does not
+        lose the results from the rest.
+    """
+    def call(dev):
+        try:
+            return fn(dev)
+        except Exception as e:
+            return e
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(call, devices))
+
+
+def read_all(devices, module, path="", max_workers=16):
+    """
+    Read same data as JSON from many devices concurrently.
+
+    :return: JSON strings or exceptions in same order as devices
+    """
+    def read(dev):
+        root = dev.get_browser(module).root()
+        try:
+            sel = root.find(path) if path else root
+            if sel == None:
+                return None
+            try:
+                return freeconf.nodeutil.json_write_str(sel, driver=dev.driver)
+            finally:
+                if sel != root:
+                    sel.release()
+        finally:
+            root.release()
+    return fan_out(devices, read, max_workers)
+
@@ -1,7 +1,10 @@
 import os
 import os.path
+import sys
 import time
 import subprocess
+import asyncio
+import threading
 import grpc
 import freeconf.pb.fc_pb2_grpc
 import freeconf.pb.fc_pb2
@@ -11,6 +14,9 @@ import freeconf.pb.fs_pb2_grpc
 import freeconf.pb.fs_pb2
 import freeconf.node
 import freeconf.fs
+import freeconf.notify
+import freeconf.stats
+import freeconf.tracing
 import freeconf
 import weakref
 import platform
@@ -104,8 +110,24 @@ def path_to_exe(verbose=False):
 # and a server in python and each side creating clients to respective servers.
 class Driver():
 
-    def __init__(self, sock_file=None, x_sock_file=None):
+    def __init__(self, sock_file=None, x_sock_file=None, max_workers=10, max_notification_streams=1000,
+                 notification_options=None, io_workers=2):
+        """
+        :param max_workers: threads serving request/response callbacks from Go like
+            XChild or XField
+        :param max_notification_streams: limit on concurrent notification
+            subscriptions from Go.  These are served on an event loop and do not
+            consume callback threads.
+        :param notification_options: default freeconf.notify.NotificationOptions for
+            each subscription. Producers can override with NotificationRequest.set_options
+        :param io_workers: threads doing blocking reads and writes for python streams
+            like json_read_io.  Streams themselves share the event loop.
+        """
         self.g_proc = None
+        self.max_workers = max_workers
+        self.max_notification_streams = max_notification_streams
+        self.io_workers = io_workers
+        self.notification_options = notification_options if notification_options else freeconf.notify.NotificationOptions()
         cwd = os.getcwd()
         self.sock_file = sock_file if sock_file else f'{cwd}/fc-lang.sock'
         self.x_sock_file = x_sock_file if x_sock_file else f'{cwd}/fc-x.sock'
@@ -121,6 +143,8 @@ class Driver():
 
         self.obj_strong = HandlePool(self, False) # objects that have an explicit release/destroy
         self.obj_weak = HandlePool(self, True) # objects that should disapear on their own
+        self.x_calls = freeconf.stats.CallStats() # python serving calls from Go
+        self.tracer = freeconf.tracing.Tracer(freeconf.tracing.exporter_from_env())
 
         self.start_x_server(test_harness)
         if test_harness is None:
@@ -149,7 +173,9 @@ class Driver():
     
 
     def create_g_client(self):
-        self.g_channel = grpc.insecure_channel(f'unix://{self.sock_file}')
+        self.g_channel = grpc.intercept_channel(
+            grpc.insecure_channel(f'unix://{self.sock_file}'),
+            freeconf.tracing.ClientInterceptor(self.tracer))
         self.g_handles = freeconf.pb.fc_pb2_grpc.HandlesStub(self.g_channel)
         self.g_parser = freeconf.pb.fc_pb2_grpc.ParserStub(self.g_channel)
         self.g_nodes = freeconf.pb.fc_pb2_grpc.NodeStub(self.g_channel)
@@ -157,21 +183,68 @@ class Driver():
         self.g_device = freeconf.pb.fc_pb2_grpc.DeviceStub(self.g_channel)
         self.g_proto = freeconf.pb.fc_pb2_grpc.ProtoStub(self.g_channel)
         self.g_fs = freeconf.pb.fs_pb2_grpc.FileSystemStub(self.g_channel)
-        self.fs = freeconf.fs.FileSystemServicer(self)
+        self.g_stats = freeconf.pb.fc_pb2_grpc.StatsStub(self.g_channel)
+        self.fs = freeconf.fs.FileSystemServicer(self, self.io_workers)
 
     def start_x_server(self, test_harness=None):
-        self.x_server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-        self.x_node_service = freeconf.node.XNodeServicer(self)        
+        # Server runs on its own event loop so notification streams can wait on
+        # events w/o holding a thread.  All other handlers are regular functions and
+        # grpc runs those in the worker pool.
+        self.x_loop = asyncio.new_event_loop()
+        self.x_loop_thread = threading.Thread(target=self.x_loop.run_forever, name="fc-x-loop", daemon=True)
+        self.x_loop_thread.start()
+        self.run_in_x_loop(self.start_x_server_async(test_harness))
+
+    async def start_x_server_async(self, test_harness):
+        self.x_server = grpc.aio.server(migration_thread_pool=futures.ThreadPoolExecutor(max_workers=self.max_workers))
+        self.x_node_service = freeconf.node.XNodeServicer(self)
+        freeconf.stats.time_calls(self.x_node_service, "XNode", self.x_calls)
+        freeconf.tracing.trace_calls(self.x_node_service, "XNode", self.tracer)
         freeconf.pb.fc_x_pb2_grpc.add_XNodeServicer_to_server(self.x_node_service, self.x_server)
         if test_harness:
             freeconf.pb.fc_test_pb2_grpc.add_TestHarnessServicer_to_server(test_harness, self.x_server)
         self.x_server.add_insecure_port(f'unix://{self.x_sock_file}')
-        self.x_server.start()
+        await self.x_server.start()
+
+    def notification_metrics(self):
+        """ list of (path, freeconf.notify.SubscriptionMetrics) for each open subscription """
+        subs = list(self.x_node_service.subscriptions.values())
+        return [(sub.path.str() if sub.path else None, sub.metrics) for sub in subs]
+
+    def audit_handles(self, track_sites=False):
+        """
+        Live handles on both sides by type and, when tracking sites, where they
+        were created.  Handles that keep growing between audits are leaks.
+
+        :param track_sites: record creation site of handles from now on on both
+           sides.  Can also be turned on from start with FC_LANG_TRACK_HANDLES=1
+        """
+        return freeconf.stats.audit_handles(self, track_sites)
+
+    def stats(self, reset=False):
+        """
+        Overhead of the bridge: call counts and latencies in each direction and
+        handles held on each side.  See freeconf.stats.browser to serve these
+        as YANG data.
+
+        :param reset: clear call stats after reading them
+        """
+        return freeconf.stats.driver_stats(self, reset)
+
+    def run_in_x_loop(self, coroutine):
+        """ run a coroutine on the x server's event loop and wait for the result """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.x_loop).result()
+
+    def stop_x_server(self):
+        self.run_in_x_loop(self.x_server.stop(1))
+        self.x_loop.call_soon_threadsafe(self.x_loop.stop)
+        self.x_loop_thread.join()
 
     def unload(self):
         self.obj_weak.release()
         self.obj_strong.release()
-        self.x_server.stop(1).wait()
+        self.fs.pump.stop()
+        self.stop_x_server()
         self.g_proc.terminate()
         self.g_proc.wait()
         self.g_proc = None
@@ -185,6 +258,13 @@ class HandlePool:
             self.handles = weakref.WeakValueDictionary() # objects that should disapear on their own
         else:
             self.handles = {}
+        # where each handle was created, only kept while track_sites is on
+        # because walking the stack is not cheap
+        self.track_sites = os.environ.get('FC_LANG_TRACK_HANDLES') == '1'
+        self.sites = {}
+        # owners of strong handles beyond the first, see handles.StrongRef
+        self.refs = {}
+        self.lock = threading.Lock()
 
     def lookup_hnd(self, id):
         return self.handles.get(id, None)
@@ -199,18 +279,71 @@ class HandlePool:
         if id == 0:
             raise Exception("0 id not valid")
         self.handles[id] = obj
+        if self.track_sites:
+            self.sites[id] = creation_site()
         if self.weak:
             weakref.finalize(obj, self.release_hnd, id)
         return id
 
     def release_hnd(self, id):
         if self.handles != None:
+            self.sites.pop(id, None)
+            self.driver.g_handles.Release(freeconf.pb.fc_pb2.ReleaseRequest(hnd=id))
+
+    def forget_hnd(self, id):
+        """ drop our reference only, for when Go has already released its side """
+        if self.handles != None:
+            self.handles.pop(id, None)
+            self.sites.pop(id, None)
+            self.refs.pop(id, None)
+
+    def retain_hnd(self, id):
+        with self.lock:
+            self.refs[id] = self.refs.get(id, 1) + 1
+
+    def unref_hnd(self, id, free=None):
+        """
+        drop one owner, last one releases handle on both sides
+
+        :param free: called instead of releasing Go handle directly
+        """
+        with self.lock:
+            n = self.refs.pop(id, 1) - 1
+            if n > 0:
+                self.refs[id] = n
+                return
+            if self.handles == None or self.handles.pop(id, None) == None:
+                # already released
+                return
+            self.sites.pop(id, None)
+        if free != None:
+            free()
+        else:
             self.driver.g_handles.Release(freeconf.pb.fc_pb2.ReleaseRequest(hnd=id))
 
+    def audit(self):
+        """ :return: {(type name, creation site): count} of live handles """
+        counts = {}
+        for id, obj in list(self.handles.items()):
+            k = (type(obj).__name__, self.sites.get(id, ""))
+            counts[k] = counts.get(k, 0) + 1
+        return counts
+
     def release(self):
         self.handles = None
 
 
+def creation_site():
+    """ first caller outside of freeconf package e.g. "app.py:12 in main" """
+    pkg_dir = os.path.dirname(__file__)
+    frame = sys._getframe(1)
+    while frame != None and frame.f_code.co_filename.startswith(pkg_dir):
+        frame = frame.f_back
+    if frame == None:
+        return ""
+    return f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_name}"
+
+
 # Ensure fc-lang is terminated when this python process is terminated
 # see
 #  https://stackoverflow.com/questions/19447603/how-to-kill-a-python-child-process-created-with-subprocess-check-output-when-t/19448096#19448096
@@ -1,15 +1,21 @@
 import io
+import asyncio
+import grpc
+import freeconf.pb.fs_pb2
 import freeconf.pb.fs_pb2_grpc
-import traceback
-import threading
+import freeconf.handles
+from concurrent import futures
 
-# 2048 is likely low, and should be tested, only limitation is max GRPC message size
-BUFF_SIZE = 2048
+# Chunks start small so small documents are not penalized and double on each
+# read up to just under the default max GRPC message size of 4MB
+MIN_CHUNK_SIZE = 16 * 1024
+MAX_CHUNK_SIZE = (4 * 1024 * 1024) - 1024
 
 class FileSystemServicer():
 
-    def __init__(self, driver):
+    def __init__(self, driver, io_workers=2):
         self.driver = driver
+        self.pump = StreamPump(driver, io_workers)
 
     def new_rdr_str(self, s):
         b = bytes(s, 'utf-8')
@@ -32,16 +38,57 @@ class FileSystemServicer():
         resp = self.driver.g_fs.WriterInit(req)
         return StreamWriter(self.driver, resp.streamHnd, wtr)
 
+    def new_wtr_chunks(self):
+        req = freeconf.pb.fs_pb2.WriterInitRequest(stream=True)
+        resp = self.driver.g_fs.WriterInit(req)
+        return ChunkStream(self.driver, resp.streamHnd)
+
     def new_wtr_file(self, fname):
         req = freeconf.pb.fs_pb2.WriterInitRequest(fname=fname)
         resp = self.driver.g_fs.WriterInit(req)
         return StreamRef(self.driver, resp.streamHnd)        
 
-class StreamRef():
+class StreamRef(freeconf.handles.StrongRef):
+    """ file or in-memory stream read or written entirely in Go """
+    __slots__ = ()
 
-    def __init__(self, driver, streamHnd):
-        self.hnd = streamHnd
-        driver.obj_strong.store_hnd(streamHnd, self)
+    def release(self):
+        """ last owner closes stream in Go, which releases it there too """
+        self.driver.obj_strong.unref_hnd(self.hnd, self.close_stream)
+
+    def close_stream(self):
+        self.driver.g_fs.CloseStream(freeconf.pb.fs_pb2.CloseStreamRequest(streamHnd=self.hnd))
+
+    close = release
+
+
+class StreamPump():
+    """
+    Moves data for every python stream.  Streams are coroutines on the x server's
+    event loop instead of a thread each and blocking reads and writes on the
+    python side go to a small, fixed set of I/O threads.
+    """
+
+    def __init__(self, driver, io_workers=2):
+        self.loop = driver.x_loop
+        self.io = futures.ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="fc-io")
+        self.g_fs = driver.run_in_x_loop(self.connect(driver.sock_file))
+
+    async def connect(self, sock_file):
+        # aio stubs are bound to the loop the channel was created on
+        self.channel = grpc.aio.insecure_channel(f'unix://{sock_file}')
+        return freeconf.pb.fs_pb2_grpc.FileSystemStub(self.channel)
+
+    def start(self, coroutine):
+        """ :return: concurrent.futures.Future of the coroutine """
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def io_call(self, f, *args):
+        return asyncio.get_running_loop().run_in_executor(self.io, f, *args)
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.channel.close(), self.loop).result()
+        self.io.shutdown()
 
 
 class StreamReader():
@@ -52,27 +99,50 @@ class StreamReader():
         self.delegate_rdr = delegate_rdr
         self.keep_running = True
         driver.obj_strong.store_hnd(streamHnd, self)
-        self.t = threading.Thread(target=self.run)
-        self.t.start()
-
-    def run(self):
-        self.driver.g_fs.ReaderStream(self.readall())
-    
-    def readall(self):
+        # readinto lets us reuse one buffer instead of allocating one per read, the
+        # chunk is still copied out of it into the protobuf message.  Buffer grows
+        # with chunk size so small documents only ever need a small one.
+        self.use_readinto = hasattr(self.delegate_rdr, 'readinto')
+        self.view = None
+        self.done = driver.fs.pump.start(self.run())
+
+    async def run(self):
+        try:
+            await self.driver.fs.pump.g_fs.ReaderStream(self.readall())
+        finally:
+            # Go releases its handle when stream ends
+            self.driver.obj_strong.forget_hnd(self.hnd)
+
+    async def readall(self):
+        size = MIN_CHUNK_SIZE
         while self.keep_running:
-            # should block
-            chunk = self.delegate_rdr.read(BUFF_SIZE)
+            chunk = await self.driver.fs.pump.io_call(self.read_chunk, size)
             if chunk == None or len(chunk) == 0:
                 return
-            yield freeconf.pb.fs_pb2.ReaderStreamData(streamHnd=self.streamHnd, chunk=chunk)
-    
+            yield freeconf.pb.fs_pb2.ReaderStreamData(streamHnd=self.hnd, chunk=chunk)
+            size = min(size * 2, MAX_CHUNK_SIZE)
+
+    def read_chunk(self, size):
+        # should block
+        if self.use_readinto:
+            if self.view == None or len(self.view) < size:
+                self.view = memoryview(bytearray(size))
+            n = self.delegate_rdr.readinto(self.view[:size])
+            if n == None or n == 0:
+                return None
+            return bytes(self.view[:n])
+        chunk = self.delegate_rdr.read(size)
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        return chunk
+
     def close(self):
         self.keep_running = False
         self.delegate_rdr.close()
 
     def close_and_wait(self):
         self.close()
-        self.t.join()
+        self.done.result()
 
 class StreamWriter():
 
@@ -82,16 +152,66 @@ class StreamWriter():
         self.driver = driver
         self.keep_running = True
         driver.obj_strong.store_hnd(streamHnd, self)
-        self.t = threading.Thread(target=self.run)
-        self.t.start()
+        self.done = driver.fs.pump.start(self.run())
+
+    async def run(self):
+        pump = self.driver.fs.pump
+        try:
+            chunks = pump.g_fs.WriterStream(freeconf.pb.fs_pb2.WriterStreamRequest(streamHnd=self.hnd))
+            async for data in chunks:
+                await pump.io_call(write_fully, self.delegate_wtr, data.chunk)
+        finally:
+            # Go releases its handle when stream ends
+            self.driver.obj_strong.forget_hnd(self.hnd)
 
-    def run(self):
-        chunks = self.driver.g_fs.WriterStream(freeconf.pb.fs_pb2.WriterStreamRequest(streamHnd=self.hnd))
-        for data in chunks:
-            n = self.delegate_wtr.write(data.chunk)
-            if n != len(data.chunk):
-                raise Exception(f"partial write not supported. requested {len(data.chunk)}, wrote {n} bytes")
+    def wait(self):
+        self.done.result()
 
 
-    def wait(self):
-        self.t.join()
\ No newline at end of file
+class ChunkStream():
+    """
+    Data Go writes to stream, pulled by caller from their own thread.  Nothing
+    is read ahead so a slow caller holds back Go's writer without tying up any
+    of the pump's I/O workers.
+    """
+
+    def __init__(self, driver, streamHnd):
+        self.hnd = streamHnd
+        self.pump = driver.fs.pump
+        self.call = self.pump.start(self.open()).result()
+
+    async def open(self):
+        # aio call has to be created on the loop it is read on
+        return self.pump.g_fs.WriterStream(freeconf.pb.fs_pb2.WriterStreamRequest(streamHnd=self.hnd))
+
+    async def next_chunk(self):
+        data = await self.call.read()
+        if data == grpc.aio.EOF:
+            return None
+        return data.chunk
+
+    def __iter__(self):
+        while True:
+            chunk = self.pump.start(self.next_chunk()).result()
+            if chunk == None:
+                return
+            yield chunk
+
+    def cancel(self):
+        """ Go's writes fail from here on, Go releases stream when it sees that """
+        self.pump.loop.call_soon_threadsafe(self.call.cancel)
+
+
+def write_fully(wtr, chunk):
+    n = wtr.write(chunk)
+    if n == None or n == len(chunk):
+        # None is from writers that block until all is written
+        return
+    remaining = memoryview(chunk)[n:]
+    while len(remaining) > 0:
+        n = wtr.write(remaining)
+        if n == None:
+            return
+        if n == 0:
+            raise Exception(f"could not write remaining {len(remaining)} bytes")
+        remaining = remaining[n:]
\ No newline at end of file
@@ -1,10 +1,37 @@
 import freeconf.pb.fc_pb2
 
-# For handles that never are used in python except to be passed back to
-# go.  
-class RemoteRef():
+class StrongRef():
+    """
+    Object held in driver's strong handle pool until released.  Reference
+    counted so an object shared by several owners is released in Go when the
+    last one releases it.  Also a context manager:
+
+        with nodeutil.json_read_str(cfg) as n:
+            root.upsert_from(n)
+    """
+    __slots__ = ("driver", "hnd")
 
     def __init__(self, driver, id):
+        self.driver = driver
         self.hnd = id
         driver.obj_strong.store_hnd(id, self)
 
+    def retain(self):
+        """ add an owner, each owner calls release once """
+        self.driver.obj_strong.retain_hnd(self.hnd)
+        return self
+
+    def release(self):
+        self.driver.obj_strong.unref_hnd(self.hnd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.release()
+
+
+# For handles that never are used in python except to be passed back to
+# go.
+class RemoteRef(StrongRef):
+    __slots__ = ()
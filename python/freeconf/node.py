@@ -1,4 +1,4 @@
-import queue
+import asyncio
 import grpc
 import threading
 import freeconf.pb.fc_pb2
@@ -10,9 +10,16 @@ import freeconf.meta
 import freeconf.val
 import freeconf.parser
 import freeconf.driver
+import freeconf.notify
 import traceback
 import time
 
+# hooks a node can say do nothing so Go skips calling them, see noop_hooks
+HOOK_CONTEXT = freeconf.pb.fc_pb2.HOOK_CONTEXT
+HOOK_RELEASE = freeconf.pb.fc_pb2.HOOK_RELEASE
+HOOK_BEGIN_EDIT = freeconf.pb.fc_pb2.HOOK_BEGIN_EDIT
+HOOK_END_EDIT = freeconf.pb.fc_pb2.HOOK_END_EDIT
+
 class Selection():
 
     def __init__(self, driver, hnd_id, node, path, browser, inside_list=False):
@@ -49,8 +56,12 @@ class Selection():
         return outputSel
 
 
-    def notification(self, callback):
-        req = freeconf.pb.fc_pb2.NotificationRequest(selHnd=self.hnd)
+    def notification(self, callback, filter=None):
+        """
+        :param filter: optional expression (see freeconf.notify.Filter) handed to the
+            producer so events nobody wants are never built
+        """
+        req = freeconf.pb.fc_pb2.NotificationRequest(selHnd=self.hnd, filter=filter)
         stream = self.driver.g_nodes.Notification(req)
         def rdr():
             try:
@@ -118,10 +129,32 @@ class Selection():
         req = freeconf.pb.fc_pb2.SelectionEditRequest(op=freeconf.pb.fc_pb2.REPLACE_FROM, selHnd=self.hnd, nodeHnd=node_hnd)        
         self.driver.g_nodes.SelectionEdit(req)
 
+    def upsert_from_value(self, v):
+        """
+        Like upsert_from but data is python dicts, lists and values sent along
+        with request so Go does not call back into python to read it.
+        """
+        self.edit_value(freeconf.pb.fc_pb2.UPSERT_FROM, v)
+
+    def insert_from_value(self, v):
+        self.edit_value(freeconf.pb.fc_pb2.INSERT_FROM, v)
+
+    def replace_from_value(self, v):
+        self.edit_value(freeconf.pb.fc_pb2.REPLACE_FROM, v)
+
+    def edit_value(self, op, v):
+        req = freeconf.pb.fc_pb2.SelectionEditRequest(op=op, selHnd=self.hnd, tree=encode_tree(v))
+        self.driver.g_nodes.SelectionEdit(req)
+
     def delete(self):
         req = freeconf.pb.fc_pb2.SelectionEditRequest(op=freeconf.pb.fc_pb2.DELETE, selHnd=self.hnd)
         self.driver.g_nodes.SelectionEdit(req)
 
+    def clear_field(self, ident):
+        """ remove just one leaf from this selection """
+        req = freeconf.pb.fc_pb2.SelectionEditRequest(op=freeconf.pb.fc_pb2.CLEAR_FIELD, selHnd=self.hnd, field=ident)
+        self.driver.g_nodes.SelectionEdit(req)
+
     def find(self, path):
         req = freeconf.pb.fc_pb2.FindRequest(selHnd=self.hnd, path=path)
         resp = self.driver.g_nodes.Find(req)
@@ -129,9 +162,33 @@ class Selection():
             return None
         return Selection.resolve(self.driver, resp.selHnd)
 
+    def get(self, path=None, depth=None, fields=None):
+        """
+        Read everything under this selection in one call as python dicts, lists
+        and values.  Returns None if path is not found.
+
+        :param path: optional path relative to this selection
+        :param depth: optional number of levels to read
+        :param fields: optional list of paths to read, all others are skipped
+        """
+        req = freeconf.pb.fc_pb2.GetRequest(selHnd=self.hnd, path=path, depth=depth, fields=fields)
+        resp = self.driver.g_nodes.Get(req)
+        if not resp.HasField('tree'):
+            return None
+        return decode_tree(resp.tree)
+
     def release(self):
+        """
+        Selections from Browser.root, find and action are yours to release and
+        stay valid until you do, even after the root they came from is
+        released.  Selections handed to node callbacks during an operation are
+        released along with the nearest of these they were under, or the root
+        of that operation, so do not keep them.
+        """
         req = freeconf.pb.fc_pb2.ReleaseSelectionRequest(selHnd=self.hnd)
-        self.driver.g_nodes.ReleaseSelection(req)
+        resp = self.driver.g_nodes.ReleaseSelection(req)
+        self.driver.obj_strong.forget_hnd(self.hnd)
+        forget_scope(self.driver, resp.releasedHnds)
 
 
 def resolve_node_hnd(driver, hnd, is_remote):
@@ -145,13 +202,68 @@ def resolve_node_hnd(driver, hnd, is_remote):
 
     return n
 
+def decode_tree(t):
+    """ python dicts, lists and values from proto Tree """
+    if t.HasField('val'):
+        return freeconf.val.proto_native(t.val)
+    if t.isList:
+        return [decode_tree(item) for item in t.items]
+    return {f.ident: decode_tree(f.tree) for f in t.fields}
+
+def encode_tree(v):
+    """
+    proto Tree of python dicts, lists and values.  Go converts values to the
+    type of each leaf so formats here only need to be close.
+    """
+    if isinstance(v, dict):
+        fields = []
+        for ident, x in v.items():
+            if x != None:
+                fields.append(freeconf.pb.fc_pb2.TreeField(ident=ident, tree=encode_tree(x)))
+        return freeconf.pb.fc_pb2.Tree(fields=fields)
+    if isinstance(v, (list, tuple)) and len(v) > 0 and isinstance(v[0], dict):
+        return freeconf.pb.fc_pb2.Tree(isList=True, items=[encode_tree(x) for x in v])
+    return freeconf.pb.fc_pb2.Tree(val=freeconf.val.proto_encode(tree_val(v)))
+
+def tree_val(v):
+    # ints as int64 so large numbers fit, Go narrows them to leaf's type
+    if type(v) is int:
+        return freeconf.val.Val(v, freeconf.val.Format.INT64)
+    if type(v) in (list, tuple) and len(v) > 0 and type(v[0]) is int:
+        return freeconf.val.Val(list(v), freeconf.val.Format.INT64_LIST)
+    if type(v) is tuple:
+        return freeconf.val.Val(list(v))
+    return freeconf.val.Val(v)
+
+def forget_scope(driver, hnds):
+    """ Go released these selections and nodes of one operation together """
+    for hnd in hnds:
+        obj = driver.obj_strong.lookup_hnd(hnd)
+        driver.obj_strong.forget_hnd(hnd)
+        if obj != None and not isinstance(obj, Selection):
+            # node may be reused, Go will be asked to register it again
+            obj.hnd = 0
+
+def noop_hooks(n):
+    """
+    HOOK_* bits of hooks node does nothing in. Nodes say so by implementing
+    noop_hooks(), otherwise every hook is called.  This is read once, when the
+    node is first handed to Go, so callbacks set on a node after that for
+    hooks it said were no-ops are never called.
+    """
+    f = getattr(n, "noop_hooks", None)
+    if f == None:
+        return 0
+    return f()
+
 def ensure_node_hnd(driver, n):
     if n == None:
         # nil node
         return None
     if not n.hnd:
         # unregistered local node about to be registered with go
-        resp = driver.g_nodes.NewNode(freeconf.pb.fc_pb2.NewNodeRequest())
+        req = freeconf.pb.fc_pb2.NewNodeRequest(noopHooks=noop_hooks(n))
+        resp = driver.g_nodes.NewNode(req)
         n.hnd = driver.obj_strong.store_hnd(resp.nodeHnd, n)
     return n.hnd
 
@@ -181,6 +293,29 @@ class Browser():
         resp = self.driver.g_nodes.BrowserRoot(g_req)
         return Selection.resolve(self.driver, resp.selHnd)
 
+    def read_cache(self, paths, max_age=None):
+        """
+        Keep a copy in Go of read-mostly containers so reads like RESTCONF GETs
+        do not call into python each time.  Copies are dropped when an edit thru
+        Go ends or when invalidate is called.  Changes made directly to python
+        objects are not seen until then.
+
+        :param paths: schema paths of containers e.g. ["engine", "tires/stats"],
+            empty list turns off cache
+        :param max_age: optional seconds a copy is used before reading again
+        """
+        max_age_ms = int(max_age * 1000) if max_age else 0
+        req = freeconf.pb.fc_pb2.BrowserReadCacheRequest(browserHnd=self.hnd, paths=paths, maxAgeMs=max_age_ms)
+        self.driver.g_nodes.BrowserReadCache(req)
+
+    def invalidate(self, path=""):
+        """
+        :param path: data path e.g. "tires=1/stats" to drop copies at, under or
+            containing or "" for all
+        """
+        req = freeconf.pb.fc_pb2.BrowserInvalidateRequest(browserHnd=self.hnd, path=path)
+        self.driver.g_nodes.BrowserInvalidate(req)
+
     @classmethod
     def resolve(cls, driver, hnd_id):
         b = driver.obj_weak.lookup_hnd(hnd_id)
@@ -233,28 +368,56 @@ class FieldRequest():
 
 class NotificationRequest():
 
-    def __init__(self, sel, meta, queue):
+    def __init__(self, sel, meta, queue, filter=None):
         self.sel = sel
         self.meta = meta
         self.queue = queue
+        self.filter = filter
+
+    def wants(self, data):
+        """
+        Check event data against subscriber's filter before going to the trouble
+        of building the event node.
+
+        :param data: dict of event data keyed by yang identifiers
+        """
+        return self.filter == None or self.filter.matches(data)
 
     def send(self, node):
+        # events built from dicts are checked here in case producer did not ask first
+        if self.filter != None and isinstance(getattr(node, 'object', None), dict):
+            if not self.filter.matches(node.object):
+                return
         self.queue.put(node)
 
+    def set_options(self, options):
+        """
+        Control what happens when subscriber is not keeping up with events sent.
+
+        :param options: freeconf.notify.NotificationOptions
+        """
+        self.queue.set_options(options)
+
+    @property
+    def metrics(self):
+        """ freeconf.notify.SubscriptionMetrics for this subscription """
+        return self.queue.metrics
+
 
 class NodeRequest():
 
-    def __init__(self, sel, new=False, delete=False):
+    def __init__(self, sel, new=False, delete=False, edit_root=False):
         self.sel = sel
         self.new = new
         self.delete = delete
+        self.edit_root = edit_root
 
 class XNodeServicer(freeconf.pb.fc_x_pb2_grpc.XNodeServicer):
     """Bridge between python node navigation and go node navigation"""
 
     def __init__(self, driver):
         self.driver = driver
-        self.cancel_backchannels = {}
+        self.subscriptions = {}
 
     def XContext(self, g_req, context):
         try:
@@ -269,12 +432,19 @@ class XNodeServicer(freeconf.pb.fc_x_pb2_grpc.XNodeServicer):
         try:
             sel = Selection.resolve(self.driver, g_req.selHnd)
             self.driver.obj_weak.release_hnd(sel.node.hnd)
+            if not g_req.root:
+                # Go never asks for node of a child selection again. Root's node
+                # is kept as browser hands it out again for next root selection.
+                self.driver.obj_strong.forget_hnd(sel.node.hnd)
             sel.node.release(sel)
 
             # this ensures that if python still retains a reference to node and
             # reuses it, Go will ask for the node again and restore it in it's handle pool
             sel.node.hnd = 0  
 
+            # root of an operation, Go has released every selection under it
+            forget_scope(self.driver, g_req.scopeHnds)
+
             return freeconf.pb.fc_x_pb2.XReleaseResponse()
         except Exception as error:
             print(traceback.format_exc())
@@ -380,37 +550,44 @@ class XNodeServicer(freeconf.pb.fc_x_pb2_grpc.XNodeServicer):
         return freeconf.pb.fc_x_pb2.XNodeSourceResponse(nodeHnd=node_hnd)
 
     def XNotificationCancelBackchannel(self, g_req, context):
-        callback = self.cancel_backchannels.pop(g_req.cancelBackchannelHnd, None)
-        if callback != None:
-            callback()
+        sub = self.subscriptions.get(g_req.cancelBackchannelHnd, None)
+        if sub != None:
+            sub.close()
         return freeconf.pb.fc_x_pb2.XNotificationCancelBackchannelResponse()
 
-    def XNotification(self, g_req, context):
-        q = queue.Queue()
-        sel = Selection.resolve(self.driver, g_req.selHnd)
-        meta = sel.path.meta
-        closer = sel.node.notify(NotificationRequest(sel, meta, q))
-        def stream_closed():
-            q.put(None)
-        context.add_callback(stream_closed)
-
-        # BUG: this doesn't always get called and subsequently the while loop
-        # below does not exit.  I believe there is a bug in python grpc and waiting
-        # to see if async io implementation fixes this.
-        self.cancel_backchannels[g_req.cancelBackchannelHnd] = stream_closed
-
+    async def XNotification(self, g_req, context):
+        # Runs on the x server's event loop, not in the worker pool, so open
+        # subscriptions never starve callbacks like XField of threads.
+        if len(self.subscriptions) >= self.driver.max_notification_streams:
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                f'reached limit of {self.driver.max_notification_streams} notification streams')
+        loop = asyncio.get_running_loop()
+        sub = freeconf.notify.Subscription(loop, self.driver.notification_options)
+        self.subscriptions[g_req.cancelBackchannelHnd] = sub
+        context.add_done_callback(lambda _: sub.close())
+        closer = None
         try:
+            # anything that might block goes to the default executor to keep the loop free
+            sel = await loop.run_in_executor(None, Selection.resolve, self.driver, g_req.selHnd)
+            sub.path = sel.path
+            meta = sel.path.meta
+            filter = freeconf.notify.compile_filter(g_req.filter)
+            req = NotificationRequest(sel, meta, sub, filter)
+            closer = await loop.run_in_executor(None, sub.call_notify, sel.node.notify, req)
             while True:
-                node = q.get()
+                node = await sub.get()
                 if node == None:
                     break
-                node_hnd = ensure_node_hnd(self.driver, node)
+                node_hnd = await loop.run_in_executor(None, ensure_node_hnd, self.driver, node)
                 yield freeconf.pb.fc_x_pb2.XNotificationResponse(nodeHnd=node_hnd)
-                q.task_done()
+        except Exception:
+            print(traceback.format_exc())
+            raise
         finally:
-            self.cancel_backchannels.pop(g_req.cancelBackchannelHnd, None)
-            closer()
-        return None
+            # reached on normal close, backchannel cancel and when Go drops the stream
+            self.subscriptions.pop(g_req.cancelBackchannelHnd, None)
+            if closer != None:
+                closer()
     
     def XBeginEdit(self, g_req, context):
         sel = Selection.resolve(self.driver, g_req.selHnd)
@@ -3,3 +3,10 @@ from .basic import *
 from .json import *
 from .trace import *
 from .node import *
+from .notify import *
+from .local import *
+from .json_wtr import *
+from .json_rdr import *
+from .edit import *
+from .diff import *
+from .profile import *
@@ -1,3 +1,5 @@
+from freeconf import node
+
 class Basic():
 
     def __init__(self, on_context=None, on_release=None, on_child=None, on_next=None,                 
@@ -14,6 +16,19 @@ class Basic():
         self.on_begin_edit = on_begin_edit
         self.on_end_edit = on_end_edit
 
+    def noop_hooks(self):
+        cls = type(self)
+        hooks = 0
+        if self.on_context == None and cls.context is Basic.context:
+            hooks |= node.HOOK_CONTEXT
+        if self.on_release == None and cls.release is Basic.release:
+            hooks |= node.HOOK_RELEASE
+        if self.on_begin_edit == None and cls.begin_edit is Basic.begin_edit:
+            hooks |= node.HOOK_BEGIN_EDIT
+        if self.on_end_edit == None and cls.end_edit is Basic.end_edit:
+            hooks |= node.HOOK_END_EDIT
+        return hooks
+
     def context(self, sel):
         if self.on_context != None:
             return self.on_context(sel)
@@ -0,0 +1,142 @@
+import urllib.parse
+from freeconf import meta
+
+# kinds of change
+CREATED = "create"
+UPDATED = "update"
+DELETED = "delete"
+
+
+class Change():
+
+    def __init__(self, op, path):
+        self.op = op
+        self.path = path
+
+    def __eq__(self, other):
+        return isinstance(other, Change) and self.op == other.op and self.path == other.path
+
+    def __repr__(self):
+        return f"{self.op} {self.path}"
+
+
+class Diff():
+    """
+    Difference between two JSON-like documents for the same schema.  Lists are
+    compared by key so reordering rows is not a change.
+
+    :ivar changes: list of Change
+    :ivar patch: document with only what was created or updated.  List rows
+        carry their keys so they can be located.  Empty when nothing to upsert.
+    :ivar deletes: paths of containers and list rows to delete
+    :ivar replaces: (path, document) of containers and list rows that lost
+        leafs.  These are replaced in full so they are left out of patch and
+        nothing under them is in deletes or replaces.
+    :ivar clears: (path, ident) of leafs removed from the top of the document
+        where replacing would mean replacing everything
+    """
+
+    def __init__(self, m, old, new, path=""):
+        self.path = path
+        self.changes = []
+        self.deletes = []
+        self.replaces = []
+        self.clears = []
+        self.patch = self.diff_container(m, old if old else {}, new if new else {}, path)
+
+    def diff_container(self, m, old, new, path):
+        patch = {}
+        removed_leafs = []
+        for ident in list(old.keys()) + [k for k in new.keys() if k not in old]:
+            ddef = meta.get_def(m, ident)
+            child_path = join_path(path, ident)
+            if ident not in new:
+                self.changes.append(Change(DELETED, child_path))
+                if isinstance(ddef, (meta.Container, meta.List)):
+                    self.deletes.append(child_path)
+                else:
+                    removed_leafs.append(ident)
+            elif ident not in old:
+                self.changes.append(Change(CREATED, child_path))
+                patch[ident] = new[ident]
+            elif isinstance(ddef, meta.Container):
+                sub = self.diff_container(ddef, old[ident], new[ident], child_path)
+                if sub:
+                    patch[ident] = sub
+            elif isinstance(ddef, meta.List):
+                rows = self.diff_list(ddef, old[ident], new[ident], child_path)
+                if rows:
+                    patch[ident] = rows
+            elif old[ident] != new[ident]:
+                self.changes.append(Change(UPDATED, child_path))
+                patch[ident] = new[ident]
+        if removed_leafs and path == self.path:
+            self.clears.extend((path, ident) for ident in removed_leafs)
+        elif removed_leafs:
+            self.drop_under(path)
+            self.replaces.append((path, new))
+            return {}
+        return patch
+
+    def drop_under(self, path):
+        prefix = path + "/"
+        self.deletes = [p for p in self.deletes if not p.startswith(prefix)]
+        self.replaces = [r for r in self.replaces if not r[0].startswith(prefix)]
+
+    def diff_list(self, m, old, new, path):
+        if len(m.key) == 0:
+            # no way to match rows so any difference replaces whole list
+            if old != new:
+                self.changes.append(Change(UPDATED, path))
+                self.deletes.append(path)
+                return new
+            return []
+        old_rows = {row_key(m, row): row for row in old}
+        rows = []
+        for row in new:
+            key = row_key(m, row)
+            row_path = join_key(path, key)
+            if key not in old_rows:
+                self.changes.append(Change(CREATED, row_path))
+                rows.append(row)
+                continue
+            sub = self.diff_container(m, old_rows.pop(key), row, row_path)
+            if sub:
+                for k in m.key:
+                    sub[k] = row[k]
+                rows.append(sub)
+        for key in old_rows.keys():
+            row_path = join_key(path, key)
+            self.changes.append(Change(DELETED, row_path))
+            self.deletes.append(row_path)
+        return rows
+
+
+def row_key(m, row):
+    return tuple(format_key(row.get(k)) for k in m.key)
+
+
+def format_key(v):
+    if isinstance(v, bool):
+        return 'true' if v else 'false'
+    return str(v)
+
+
+def join_key(path, key):
+    # escape chars that separate keys and path segments
+    return path + "=" + ','.join(urllib.parse.quote(k, safe='') for k in key)
+
+
+def join_path(path, ident):
+    if path == "":
+        return ident
+    return f"{path}/{ident}"
+
+
+def diff(m, old, new):
+    """
+    :param m: module or other schema definition both documents are for
+    :param old: previous document as dict, module prefixes removed
+    :param new: new document as dict, module prefixes removed
+    """
+    return Diff(m, old, new)
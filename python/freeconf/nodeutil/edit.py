@@ -0,0 +1,113 @@
+from freeconf import meta, node
+from freeconf.nodeutil.local import LocalSelection, walk_defs
+
+# Edit strategies, same meaning as in Go
+
+# create or update whatever is there
+UPSERT = "upsert"
+
+# error if list item already exists
+INSERT = "insert"
+
+# error if container or list item does not already exist
+UPDATE = "update"
+
+
+class Editor():
+    """
+    Copies data from one python node to another without going thru Go.  Useful
+    for bulk loads like json_read_local into nodeutil.Node targets.  Follows Go's
+    editor: begin_edit/end_edit bracket every container and list item with
+    edit root flagged on outermost one.
+    """
+
+    def __init__(self, strategy=UPSERT):
+        if strategy not in (UPSERT, INSERT, UPDATE):
+            raise Exception(f"unrecognized edit strategy '{strategy}'")
+        self.strategy = strategy
+
+    def edit(self, to_sel, from_node):
+        to_sel = LocalSelection.of(to_sel)
+        from_sel = LocalSelection(from_node, to_sel.path, to_sel.inside_list)
+        m = to_sel.path.meta
+        if isinstance(m, meta.List) and not to_sel.inside_list:
+            self.edit_list(to_sel, from_sel, True)
+        else:
+            self.edit_container(to_sel, from_sel, False, True)
+
+    def edit_container(self, to_sel, from_sel, new, edit_root=False):
+        r = node.NodeRequest(to_sel, new=new, edit_root=edit_root)
+        to_sel.node.begin_edit(r)
+        for m, v in walk_defs(from_sel, from_sel.path.meta.definitions):
+            if isinstance(m, (meta.Container, meta.List)):
+                self.edit_child(to_sel, m, v)
+                v.release()
+            else:
+                fr = node.FieldRequest(to_sel, m, True, False)
+                to_sel.node.field(fr, v)
+        to_sel.node.end_edit(r)
+
+    def edit_child(self, to_sel, m, from_child):
+        to_child = to_sel.child(m)
+        new = False
+        if to_child == None:
+            if self.strategy == UPDATE:
+                raise Exception(f"{to_sel.path.str()}/{m.ident} not found")
+            r = node.ChildRequest(to_sel, m, True, False)
+            n = to_sel.node.child(r)
+            if n == None:
+                raise Exception(f"could not create {to_sel.path.str()}/{m.ident}")
+            to_child = to_sel.split(n, meta.Path(to_sel.path, m))
+            new = True
+        if isinstance(m, meta.List):
+            self.edit_list(to_child, from_child, new)
+        else:
+            self.edit_container(to_child, from_child, new)
+        to_child.release()
+
+    def edit_list(self, to_list, from_list, new):
+        m = from_list.path.meta
+        row = 0
+        while True:
+            from_item = from_list.row(row)
+            if from_item == None:
+                break
+            key = from_item.path.key
+            to_item = None
+            if not new and key != None:
+                r = node.ListRequest(to_list, m, False, False, 0, True, key)
+                resp = to_list.node.next(r)
+                if resp != None and resp[0] != None:
+                    if self.strategy == INSERT:
+                        raise Exception(f"{to_list.path.str()} item already exists")
+                    to_item = to_list.split(resp[0], meta.Path(to_list.path.parent, m, key), inside_list=True)
+            item_new = False
+            if to_item == None:
+                if self.strategy == UPDATE:
+                    raise Exception(f"{to_list.path.str()} item not found")
+                r = node.ListRequest(to_list, m, True, False, row, row == 0, key)
+                resp = to_list.node.next(r)
+                if resp == None or resp[0] == None:
+                    raise Exception(f"could not create item in {to_list.path.str()}")
+                to_item = to_list.split(resp[0], meta.Path(to_list.path.parent, m, key), inside_list=True)
+                item_new = True
+            self.edit_container(to_item, from_item, item_new)
+            to_item.release()
+            from_item.release()
+            row += 1
+
+
+def upsert_local(sel, from_node):
+    """
+    Like sel.upsert_from(from_node) but entirely in python. Both the selection's
+    node and from_node must be python nodes.
+
+    :param sel: node.Selection or nodeutil.LocalSelection
+    """
+    Editor(UPSERT).edit(sel, from_node)
+
+def insert_local(sel, from_node):
+    Editor(INSERT).edit(sel, from_node)
+
+def update_local(sel, from_node):
+    Editor(UPDATE).edit(sel, from_node)
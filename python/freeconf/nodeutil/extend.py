@@ -1,3 +1,5 @@
+from freeconf import node
+
 class Extend():
 
     def __init__(self, base, on_child=None, on_field=None, on_action=None, on_notify=None, 
@@ -14,6 +16,20 @@ class Extend():
         self.on_release = on_release
         self.on_context = on_context
 
+    def noop_hooks(self):
+        # context and release fall thru to base, edits do not
+        cls = type(self)
+        hooks = node.noop_hooks(self.base) & (node.HOOK_CONTEXT | node.HOOK_RELEASE)
+        if self.on_context or cls.context is not Extend.context:
+            hooks &= ~node.HOOK_CONTEXT
+        if self.on_release or cls.release is not Extend.release:
+            hooks &= ~node.HOOK_RELEASE
+        if not self.on_begin_edit and cls.begin_edit is Extend.begin_edit:
+            hooks |= node.HOOK_BEGIN_EDIT
+        if not self.on_end_edit and cls.end_edit is Extend.end_edit:
+            hooks |= node.HOOK_END_EDIT
+        return hooks
+
     def context(self, sel):
         if self.on_context:
             return self.on_context(self.base, sel)
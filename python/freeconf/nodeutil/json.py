@@ -5,6 +5,9 @@ import freeconf.pb.fs_pb2
 import freeconf.node
 import freeconf.meta
 import freeconf.driver
+import freeconf.fs
+from freeconf.nodeutil.local import LocalSelection
+from freeconf.nodeutil.json_wtr import JSONWtr
 
 def json_read_file(fname, driver=None):
     d = driver if driver else freeconf.driver.shared_instance()
@@ -21,6 +24,9 @@ def json_read_io(rdr, driver=None):
 def __json_read(stream, driver):
     req = freeconf.pb.fc_pb2.JSONRdrRequest(streamHnd=stream.hnd)
     resp = driver.g_nodeutil.JSONRdr(req)
+    if isinstance(stream, freeconf.fs.StreamRef):
+        # reader has decoded everything already
+        stream.release()
     return freeconf.handles.RemoteRef(driver, resp.nodeHnd)
 
 
@@ -28,17 +34,25 @@ def json_write_file(fname, driver=None):
     d = driver if driver else freeconf.driver.shared_instance()    
     return __json_write(d.fs.new_wtr_file(fname), d)
 
-def json_write_io(wtr, driver=None):
+def json_write_io(wtr, driver=None, progress=None):
+    """
+    :param progress: optional function called with total bytes written so far
+        each time data is written to wtr
+    """
     d = driver if driver else freeconf.driver.shared_instance()    
+    if progress != None:
+        wtr = ProgressWtr(wtr, progress)
     return __json_write(d.fs.new_wtr_io(wtr), d)
 
 def json_write_str(sel, driver=None):
     d = driver if driver else freeconf.driver.shared_instance()    
     wtr = io.BytesIO()
     stream = d.fs.new_wtr_io(wtr)
-    n = __json_write(stream, d)
-    sel.upsert_into(n)
+    with __json_write(stream, d) as n:
+        sel.upsert_into(n)
     d.g_fs.CloseStream(freeconf.pb.fs_pb2.CloseStreamRequest(streamHnd=stream.hnd))
+    # last chunk is only flushed on close so wait for it to land
+    stream.wait()
     wtr.seek(0)
     return wtr.read().decode('UTF-8')
 
@@ -46,3 +60,65 @@ def __json_write(stream, driver):
     req = freeconf.pb.fc_pb2.JSONWtrRequest(streamHnd=stream.hnd)
     resp = driver.g_nodeutil.JSONWtr(req)
     return freeconf.handles.RemoteRef(driver, resp.nodeHnd)
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+def json_iter(sel, chunk_size=DEFAULT_CHUNK_SIZE, driver=None):
+    """
+    Yields JSON of selection as bytes in chunks of about chunk_size while the
+    walk is still going so very large documents never have to be held in memory.
+    Stopping early is allowed.
+
+    :param sel: node.Selection or nodeutil.LocalSelection. Local selections are
+        encoded in python w/o Go.
+    """
+    if isinstance(sel, LocalSelection):
+        yield from _rechunk((s.encode('utf-8') for s in JSONWtr().iter(sel)), chunk_size)
+        return
+    d = driver if driver else freeconf.driver.shared_instance()
+    chunks = d.fs.new_wtr_chunks()
+    n = __json_write(chunks, d)
+    req = freeconf.pb.fc_pb2.SelectionEditRequest(op=freeconf.pb.fc_pb2.UPSERT_INTO, selHnd=sel.hnd, nodeHnd=n.hnd)
+    # walk runs in Go while we read, no thread of our own needed
+    walk = d.g_nodes.SelectionEdit.future(req)
+    def walked(_):
+        # writer only ends stream on close
+        d.g_fs.CloseStream(freeconf.pb.fs_pb2.CloseStreamRequest(streamHnd=chunks.hnd))
+        n.release()
+    walk.add_done_callback(walked)
+    finished = False
+    try:
+        yield from _rechunk(chunks, chunk_size)
+        finished = True
+    finally:
+        if not finished:
+            # caller stopped early, Go's walk fails on next write instead of
+            # finishing with nobody reading
+            chunks.cancel()
+    walk.result()
+
+
+def _rechunk(pieces, chunk_size):
+    buf = bytearray()
+    for piece in pieces:
+        buf += piece
+        while len(buf) >= chunk_size:
+            yield bytes(buf[:chunk_size])
+            del buf[:chunk_size]
+    if len(buf) > 0:
+        yield bytes(buf)
+
+
+class ProgressWtr():
+
+    def __init__(self, wtr, progress):
+        self.wtr = wtr
+        self.progress = progress
+        self.total = 0
+
+    def write(self, b):
+        n = self.wtr.write(b)
+        self.total += len(b) if n == None else n
+        self.progress(self.total)
+        return n
@@ -0,0 +1,65 @@
+import json
+from freeconf import val
+from freeconf.nodeutil.node import Node
+
+def json_read_local(src):
+    """
+    Parse JSON in python and return a python node over the result.  Unlike
+    json_read_str there is no round trip to Go, so editing python nodes from it
+    with upsert_local never leaves python.
+
+    :param src: str, bytes, dict already decoded or readable object
+    """
+    if hasattr(src, 'read'):
+        src = src.read()
+    if isinstance(src, (str, bytes, bytearray)):
+        data = json.loads(src)
+    else:
+        data = src
+    return Node(strip_module_prefix(data), on_read=coerce_json_value)
+
+
+def strip_module_prefix(data):
+    """ RFC 7951 allows module qualified names like "car:speed" """
+    if isinstance(data, dict):
+        stripped = {}
+        for k, v in data.items():
+            colon = k.find(':')
+            if colon >= 0:
+                k = k[colon + 1:]
+            stripped[k] = strip_module_prefix(v)
+        return stripped
+    if isinstance(data, list):
+        return [strip_module_prefix(x) for x in data]
+    return data
+
+
+_INTS = set([
+    val.Format.INT8, val.Format.INT16, val.Format.INT32, val.Format.INT64,
+    val.Format.UINT8, val.Format.UINT16, val.Format.UINT32, val.Format.UINT64,
+])
+
+def coerce_json_value(n, m, v):
+    """
+    JSON types are not always the yang type (e.g. RFC 7951 encodes 64-bit
+    numbers as strings) so convert to what python nodes expect.
+    """
+    if v == None:
+        return None
+    t = getattr(m, 'type', None)
+    if t == None:
+        return v
+    if isinstance(v, list):
+        if t.format == val.Format.EMPTY:
+            return True
+        return [_coerce(t.format & ~1024, x) for x in v]
+    return _coerce(t.format, v)
+
+def _coerce(format, v):
+    if format in _INTS and isinstance(v, str):
+        return int(v)
+    if format == val.Format.DECIMAL64 and not isinstance(v, float):
+        return float(v)
+    if format == val.Format.BOOL and isinstance(v, str):
+        return v == 'true'
+    return v
@@ -0,0 +1,148 @@
+import base64
+import decimal
+import io
+from freeconf import meta, val
+from freeconf.nodeutil.local import LocalSelection, walk_defs
+
+class JSONWtr():
+    """
+    RFC 7951 JSON encoder that walks python nodes directly against the schema
+    instead of having Go call back into python for every container, row and
+    leaf.  Output is meant to be identical to Go's nodeutil.JSONWtr.
+    """
+
+    def __init__(self, config_only=False):
+        self.config_only = config_only
+
+    def write_str(self, sel):
+        buf = io.StringIO()
+        for chunk in self.iter(sel):
+            buf.write(chunk)
+        return buf.getvalue()
+
+    def iter(self, sel):
+        """ yields pieces of the document as walk proceeds """
+        sel = LocalSelection.of(sel)
+        m = sel.path.meta
+        if isinstance(m, meta.List) and not sel.inside_list:
+            yield '{'
+            yield from self.write_list(m, sel)
+            yield '}'
+        else:
+            yield from self.write_container(sel)
+
+    def write_container(self, sel):
+        yield '{'
+        first = True
+        for m, v in walk_defs(sel, sel.path.meta.definitions, self.config_only):
+            if not first:
+                yield ','
+            first = False
+            if isinstance(m, meta.List):
+                yield from self.write_list(m, v)
+                v.release()
+            elif isinstance(m, meta.Container):
+                yield encode_string(m.ident)
+                yield ':'
+                yield from self.write_container(v)
+                v.release()
+            else:
+                yield encode_string(m.ident)
+                yield ':'
+                yield encode_value(v)
+        yield '}'
+
+    def write_list(self, m, list_sel):
+        yield encode_string(m.ident)
+        yield ':['
+        row = 0
+        while True:
+            item = list_sel.row(row)
+            if item == None:
+                break
+            if row > 0:
+                yield ','
+            yield from self.write_container(item)
+            item.release()
+            row += 1
+        yield ']'
+
+
+def json_write_local(sel, config_only=False):
+    """
+    Same result as json_write_str but runs entirely in python so only works
+    when selection's node is a python node (e.g. nodeutil.Node).
+
+    :param sel: node.Selection or nodeutil.LocalSelection
+    :param config_only: equivalent of ?content=config
+    """
+    return JSONWtr(config_only).write_str(sel)
+
+
+_ESCAPES = {
+    '"': '\\"',
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+    # Go escapes these for safe embedding in HTML and javascript
+    '<': '\\u003c',
+    '>': '\\u003e',
+    '&': '\\u0026',
+    '\u2028': '\\u2028',
+    '\u2029': '\\u2029',
+}
+for _c in range(0x20):
+    _ESCAPES.setdefault(chr(_c), f'\\u{_c:04x}')
+_NEEDS_ESCAPE = str.maketrans(_ESCAPES)
+
+
+def encode_string(s):
+    return '"' + s.translate(_NEEDS_ESCAPE) + '"'
+
+
+def encode_number(v):
+    if isinstance(v, float):
+        # Go writes shortest form that round trips and never uses exponents
+        s = format(decimal.Decimal(repr(v)), 'f')
+        if '.' in s:
+            s = s.rstrip('0').rstrip('.')
+        return s
+    return str(int(v))
+
+
+def encode_scalar(format, v, label=None):
+    f = format & ~1024
+    if f == val.Format.BOOL:
+        return 'true' if v else 'false'
+    if f == val.Format.ENUM:
+        return encode_string(label if label != None else str(v))
+    if f == val.Format.DECIMAL64:
+        return encode_number(float(v))
+    if f in _INT_FORMATS:
+        return encode_number(v)
+    if f == val.Format.EMPTY:
+        return '[null]'
+    if f == val.Format.BINARY:
+        if isinstance(v, (bytes, bytearray)):
+            v = base64.b64encode(v).decode('ascii')
+        return encode_string(v)
+    if f == val.Format.BITS and isinstance(v, (list, tuple)):
+        return encode_string(' '.join(v))
+    return encode_string(str(v))
+
+_INT_FORMATS = set([
+    val.Format.INT8, val.Format.INT16, val.Format.INT32, val.Format.INT64,
+    val.Format.UINT8, val.Format.UINT16, val.Format.UINT32, val.Format.UINT64,
+])
+
+
+def encode_value(v):
+    if v.format >= 1024:
+        labels = getattr(v, 'label', None)
+        items = []
+        for i, x in enumerate(v.v):
+            label = labels[i] if isinstance(labels, (list, tuple)) else None
+            items.append(encode_scalar(v.format, x, label))
+        return '[' + ','.join(items) + ']'
+    return encode_scalar(v.format, v.v, getattr(v, 'label', None))
@@ -0,0 +1,93 @@
+from freeconf import meta, node
+
+class LocalSelection():
+    """
+    Stand-in for node.Selection when walking a python node entirely in python. Has
+    the parts of a selection nodes rely on (node, path, inside_list) but no handle
+    in Go so there is no round trip when navigating.
+    """
+
+    def __init__(self, node, path, inside_list=False, parent=None):
+        self.node = node
+        self.path = path
+        self.inside_list = inside_list
+        self.parent = parent
+        self.driver = None
+        self.browser = None
+        self.hnd = None
+
+    @classmethod
+    def root(cls, module, n):
+        return LocalSelection(n, meta.Path(None, module))
+
+    @classmethod
+    def of(cls, sel):
+        """ local selection from a Go backed selection whose node is in python """
+        if not is_local_node(sel.node):
+            raise Exception(f"node at {sel.path.str()} is not a python node")
+        if isinstance(sel, LocalSelection):
+            return sel
+        return LocalSelection(sel.node, sel.path, sel.inside_list)
+
+    def child(self, m):
+        r = node.ChildRequest(self, m, False, False)
+        child = self.node.child(r)
+        if child == None:
+            return None
+        return self.split(child, meta.Path(self.path, m))
+
+    def first(self):
+        return self.row(0)
+
+    def row(self, row):
+        """ row'th list item or None when there are no more """
+        r = node.ListRequest(self, self.path.meta, False, False, row, row == 0, None)
+        resp = self.node.next(r)
+        if resp == None:
+            return None
+        child, key = resp
+        if child == None:
+            return None
+        return self.split(child, meta.Path(self.path.parent, self.path.meta, key), inside_list=True)
+
+    def field(self, m):
+        r = node.FieldRequest(self, m, False, False)
+        return self.node.field(r, None)
+
+    def choose(self, choice):
+        return self.node.choose(self, choice)
+
+    def split(self, n, path, inside_list=False):
+        child = LocalSelection(n, path, inside_list, self)
+        child.node.context(child)
+        return child
+
+    def release(self):
+        self.node.release(self)
+
+
+def is_local_node(n):
+    return n != None and hasattr(n, 'child') and hasattr(n, 'field')
+
+
+def walk_defs(sel, defs, config_only=False):
+    """
+    Yields (meta, value) for each data definition in schema order where value is a
+    LocalSelection for containers and lists and a val.Val for leafs. Missing data
+    is skipped and choices are resolved thru the node.
+    """
+    for m in defs:
+        if config_only and getattr(m, "config", None) == False:
+            continue
+        if isinstance(m, meta.Choice):
+            choice_case = sel.choose(m)
+            if choice_case != None:
+                yield from walk_defs(sel, choice_case.definitions, config_only)
+        elif isinstance(m, (meta.Container, meta.List)):
+            child = sel.child(m)
+            if child != None:
+                yield m, child
+        elif isinstance(m, (meta.Leaf, meta.LeafList)):
+            v = sel.field(m)
+            if v != None:
+                yield m, v
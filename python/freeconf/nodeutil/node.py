@@ -88,6 +88,19 @@ class Node():
         else:
             self.new_container_handler()
 
+    def noop_hooks(self):
+        cls = type(self)
+        hooks = 0
+        if cls.context is Node.context:
+            hooks |= node.HOOK_CONTEXT
+        if self.on_release == None and cls.release is Node.release:
+            hooks |= node.HOOK_RELEASE
+        if self.on_begin_edit == None and cls.begin_edit is Node.begin_edit:
+            hooks |= node.HOOK_BEGIN_EDIT
+        if self.on_end_edit == None and cls.end_edit is Node.end_edit:
+            hooks |= node.HOOK_END_EDIT
+        return hooks
+
     def context(self, sel):
         pass 
 
@@ -257,7 +270,7 @@ class Node():
         pass
         
     def end_edit(self, r):
-        if self.on_begin_edit != None:
+        if self.on_end_edit != None:
             self.on_end_edit(self, r)
 
     def do_end_edit(self, r):
@@ -0,0 +1,16 @@
+from freeconf.nodeutil.node import Node, NodeOptions
+
+def send_event(r, data, options=NodeOptions()):
+    """
+    Send dict as a notification event unless subscriber's filter would reject it.
+    Producers with expensive events should call r.wants(data) with just the
+    fields the filter uses (see r.filter.paths) before building the rest.
+
+    :param r: NotificationRequest
+    :param data: event as dict
+    :return: True if event was sent
+    """
+    if not r.wants(data):
+        return False
+    r.send(Node(data, options=options))
+    return True
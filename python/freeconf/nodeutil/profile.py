@@ -0,0 +1,164 @@
+import threading
+import time
+
+CHILD = 0
+NEXT = 1
+FIELD = 2
+ACTION = 3
+EDIT = 4
+NOTIFY = 5
+CHOOSE = 6
+OPS = ["child", "next", "field", "action", "edit", "notify", "choose"]
+
+
+class PathStats():
+    """
+    Counters for one schema path.  Each list is indexed by operation (CHILD,
+    NEXT, ...) and times are in nanoseconds.
+    """
+
+    def __init__(self, ident, parent=None):
+        self.ident = ident
+        self.parent = parent
+        self.children = {}
+        self.calls = [0] * len(OPS)
+        self.total = [0] * len(OPS)
+        self.self_time = [0] * len(OPS)
+
+    def child(self, ident):
+        c = self.children.get(ident)
+        if c == None:
+            c = PathStats(ident, self)
+            self.children[ident] = c
+        return c
+
+    def frames(self):
+        frames = []
+        p = self
+        while p != None:
+            if p.ident != None:
+                frames.append(p.ident)
+            p = p.parent
+        frames.reverse()
+        return frames
+
+    def walk(self):
+        yield self
+        for c in self.children.values():
+            yield from c.walk()
+
+
+class Profiler():
+    """
+    Counters shared by all Profile nodes under one root.  Counting is not
+    locked so concurrent calls can occasionally lose a count; good enough to
+    see where time goes at a fraction of the cost of Trace.
+
+    :param name: label of the root frame, e.g. module name
+    """
+
+    def __init__(self, name=None, clock=time.perf_counter_ns):
+        self.root = PathStats(name)
+        self.clock = clock
+        self.local = threading.local()
+
+    def timed(self, stats, op, f, *args):
+        local = self.local
+        outer = getattr(local, "inner", 0)
+        local.inner = 0
+        t0 = self.clock()
+        try:
+            return f(*args)
+        finally:
+            elapsed = self.clock() - t0
+            stats.calls[op] += 1
+            stats.total[op] += elapsed
+            stats.self_time[op] += elapsed - local.inner
+            local.inner = outer + elapsed
+
+    def reset(self):
+        self.root = PathStats(self.root.ident)
+
+    def report(self):
+        """
+        :return: list of (path, op, calls, total_ns, self_ns) slowest self time
+            first
+        """
+        rows = []
+        for stats in self.root.walk():
+            path = "/".join(stats.frames())
+            for op, calls in enumerate(stats.calls):
+                if calls > 0:
+                    rows.append((path, OPS[op], calls, stats.total[op], stats.self_time[op]))
+        rows.sort(key=lambda row: row[4], reverse=True)
+        return rows
+
+    def write_collapsed(self, out):
+        """
+        Write self time in microseconds in collapsed stack format, one line per
+        path and operation e.g. "car;engine;speed;field 1520". Feed to
+        flamegraph.pl or speedscope.
+        """
+        for stats in self.root.walk():
+            frames = stats.frames()
+            for op, calls in enumerate(stats.calls):
+                if calls > 0:
+                    stack = ";".join(frames + [OPS[op]])
+                    out.write(f"{stack} {stats.self_time[op] // 1000}\n")
+
+
+class Profile():
+    """
+    Wrap a node to count calls and time spent in it and everything under it by
+    schema path and operation.  Unlike Trace nothing is formatted while running.
+
+        p = nodeutil.Profile(manage(app), name="car")
+        ... serve requests ...
+        p.profiler.write_collapsed(open("car.folded", "w"))
+    """
+
+    def __init__(self, target, profiler=None, name=None, stats=None):
+        self.hnd = 0
+        self.target = target
+        self.profiler = profiler if profiler else Profiler(name)
+        self.stats = stats if stats else self.profiler.root
+
+    def wrap(self, n, stats):
+        if n == None:
+            return None
+        return Profile(n, self.profiler, stats=stats)
+
+    def context(self, sel):
+        return self.target.context(sel)
+
+    def release(self, sel):
+        return self.target.release(sel)
+
+    def child(self, r):
+        stats = self.stats.child(r.meta.ident)
+        return self.wrap(self.profiler.timed(stats, CHILD, self.target.child, r), stats)
+
+    def next(self, r):
+        resp = self.profiler.timed(self.stats, NEXT, self.target.next, r)
+        if resp == None:
+            return None, None
+        n, key = resp
+        return self.wrap(n, self.stats), key
+
+    def field(self, r, write_val):
+        return self.profiler.timed(self.stats.child(r.meta.ident), FIELD, self.target.field, r, write_val)
+
+    def choose(self, sel, choice):
+        return self.profiler.timed(self.stats.child(choice.ident), CHOOSE, self.target.choose, sel, choice)
+
+    def action(self, r):
+        return self.profiler.timed(self.stats.child(r.meta.ident), ACTION, self.target.action, r)
+
+    def notify(self, r):
+        return self.profiler.timed(self.stats.child(r.meta.ident), NOTIFY, self.target.notify, r)
+
+    def begin_edit(self, r):
+        return self.profiler.timed(self.stats, EDIT, self.target.begin_edit, r)
+
+    def end_edit(self, r):
+        return self.profiler.timed(self.stats, EDIT, self.target.end_edit, r)
@@ -1,30 +1,86 @@
 # Wrap a node with a trace and see all data into and out of node structure without
-# changing operation. 
+# changing operation.
 #
 # This follows FreeCONF Go's nodeutil/trace.go and must match same output format
 # to be consistent but output format is used in unit tests
+#
+# Each event is a small tuple record that is only formatted as text when written.
+# Written straight away to out or, for running in production, kept in a
+# TraceBuffer and formatted later by a TraceWriter.
+import itertools
+import random
+import threading
+import weakref
+
+# how record value is formatted
+_RAW = 0
+_VAL = 1
+_VALS = 2
+_META = 3
+_IDENT = 4
+_NEXT = 5
+
+
 class Trace():
+    """
+    :param out: text stream each event is written to as it happens
+    :param buffer: TraceBuffer to record events into instead of out
+    :param sample: fraction of top level operations to trace e.g. 0.01.  Decided
+        once per operation on the root selection so an operation is traced in
+        full or not at all.  Calls that are not sampled go straight to target
+        without wrapping anything under them.
+    """
 
-    def __init__(self, target, out, level=0):
+    def __init__(self, target, out=None, level=0, buffer=None, sample=1.0, top=True):
         self.hnd = 0
         self.target = target
         self.out = out
-        self.write = out.write
         self.level = level
+        self.buffer = buffer
+        self.sample = sample
+        self.top = top
+        # whether to skip each operation, keyed by root selection
+        self.skips = weakref.WeakKeyDictionary()
+        self.skips_lock = threading.Lock()
+        if buffer != None:
+            self.emit = buffer.add
+        else:
+            self.write = out.write
+            self.emit = self.write_record
+
+    def skip(self, sel):
+        if not self.top or self.sample >= 1.0:
+            return False
+        with self.skips_lock:
+            skip = self.skips.get(sel)
+            if skip == None:
+                skip = random.random() >= self.sample
+                self.skips[sel] = skip
+        return skip
+
+    def wrap(self, n, level):
+        return Trace(n, self.out, level=level, buffer=self.buffer, top=False)
 
     def context(self, sel):
-        self.trace(self.level, 'context', "")
+        if not self.skip(sel):
+            self.trace(self.level, 'context', "")
 
     def release(self, sel):
-        self.trace(self.level, 'release', "")
+        if not self.skip(sel):
+            self.trace(self.level, 'release', "")
+        if self.top:
+            with self.skips_lock:
+                self.skips.pop(sel, None)
 
     def next(self, r):
+        if self.skip(r.sel):
+            return self.target.next(r)
         if r.new:
-            self.trace(self.level, f'next.new[{r.row}]', self.ident_str(r.meta, r.key))
+            self.emit((self.level, _NEXT, 'next.new', (r.row, r.meta, r.key)))
         elif r.delete:
-            self.trace(self.level, f'next.delete[{r.row}]', self.ident_str(r.meta, r.key))
+            self.emit((self.level, _NEXT, 'next.delete', (r.row, r.meta, r.key)))
         else:
-            self.trace(self.level, f'next.read[{r.row}]', self.ident_str(r.meta, r.key))
+            self.emit((self.level, _NEXT, 'next.read', (r.row, r.meta, r.key)))
         next, key = self.target.next(r)
         found = next != None
         self.trace(self.level+1, "found", found)
@@ -32,34 +88,36 @@ class Trace():
             self.trace_vals(self.level+1, "response.key", key)
         if not found:
             return None, None
-        return Trace(next, self.out, level=self.level+1), key
+        return self.wrap(next, self.level+1), key
 
 
     def meta_str(self, meta):
-        if hasattr(meta, 'ident'):
-            return meta.ident
-        return str(type(meta))
+        return _meta_str(meta)
 
     def child(self, r):
+        if self.skip(r.sel):
+            return self.target.child(r)
         if r.new:
-            self.trace(self.level, "child.new", self.meta_str(r.meta))
+            self.emit((self.level, _META, "child.new", r.meta))
         elif r.delete:
-            self.trace(self.level, "child.delete", self.meta_str(r.meta))
+            self.emit((self.level, _META, "child.delete", r.meta))
         else:
-            self.trace(self.level, "child.read", self.meta_str(r.meta))
+            self.emit((self.level, _META, "child.read", r.meta))
         child = self.target.child(r)
         found = child != None
         self.trace(self.level+1, "found", found)
         if not found:
             return None
-        return Trace(child, self.out, level=self.level+1)
+        return self.wrap(child, self.level+1)
 
 
     def field(self, r, write_val):
+        if self.skip(r.sel):
+            return self.target.field(r, write_val)
         if r.write:
             self.trace(self.level, "field.write", r.meta.ident)
             if r.clear:
-                self.trace(self.level+1, "clear", "true") 
+                self.trace(self.level+1, "clear", "true")
             else:
                 self.trace_val(self.level+1, "val", write_val)
             self.target.field(r, write_val)
@@ -71,43 +129,53 @@ class Trace():
 
 
     def begin_edit(self, r):
-        self.trace(self.level, f"edit.begin", self.path_str(r.sel.path))
+        if self.skip(r.sel):
+            return self.target.begin_edit(r)
+        self.emit((self.level, _IDENT, "edit.begin", (r.sel.path.meta, r.sel.path.key)))
         if r.new:
-            self.trace(self.level+1, "new", "true") 
+            self.trace(self.level+1, "new", "true")
         if r.delete:
             self.trace(self.level+1, "delete", r.delete)
         return self.target.begin_edit(r)
 
 
     def end_edit(self, r):
-        self.trace(self.level, "edit.end", self.path_str(r.sel.path))
+        if self.skip(r.sel):
+            return self.target.end_edit(r)
+        self.emit((self.level, _IDENT, "edit.end", (r.sel.path.meta, r.sel.path.key)))
         if r.new:
-            self.trace(self.level+1, "new", "true") 
+            self.trace(self.level+1, "new", "true")
         if r.delete:
             self.trace(self.level+1, "delete", r.delete)
         return self.target.end_edit(r)
-    
+
     def action(self, r):
+        if self.skip(r.sel):
+            return self.target.action(r)
         self.trace(self.level, "action", r.meta.ident)
         if r.input is None:
             self.trace(self.level+1, "input", "<nil>")
         else:
             self.trace(self.level+1, "input", "true")
-            
+
         output = self.target.action(r)
         if output is None:
             self.trace(self.level+1, "output", "<nil>")
         else:
             self.trace(self.level+1, "output", "true")
         return output
-    
+
 
     def notify(self, r):
+        if self.skip(r.sel):
+            return self.target.notify(r)
         self.trace(self.level, "notify", r.meta.ident)
         return self.target.notify(r)
 
 
     def choose(self, sel, choice):
+        if self.skip(sel):
+            return self.target.choose(sel, choice)
         self.trace(self.level, "choose", choice.ident)
         choosen = self.target.choose(sel, choice)
         if choosen is None:
@@ -117,39 +185,155 @@ class Trace():
 
         return choosen
 
+    def write_record(self, rec):
+        self.write(format_record(rec))
+
     def trace(self, level, key, val):
-        if val == None:
-            val_str = "<nil>"
-        elif isinstance(val, bool):
-            val_str = "true" if val else "false"
-        else:
-            val_str = str(val)
-        self.out.write(f'{"    "*level}{key}: {val_str}\n')
+        self.emit((level, _RAW, key, val))
 
 
     def trace_vals(self, level, key, vals):
-        if vals is None:
-            self.trace(level, key, None)
-        else:
-            for i, val in enumerate(vals):
-                self.trace_val(level, f'{key}[{i}]', val)
+        self.emit((level, _VALS, key, vals))
 
 
     def trace_val(self, level, key, val):
-        if val == None:
-            self.trace(level, key, None)
-        else:
-            self.trace(level, key, f'{val.format.name.lower()}({val.v})')
+        self.emit((level, _VAL, key, val))
 
 
     def path_str(self, p):
-        return self.ident_str(p.meta, p.key)
+        return _ident_str(p.meta, p.key)
 
 
     def ident_str(self, meta, keys):
-        if keys != None and len(keys) > 0:
-            strs = []
-            for key in keys:
-                strs.append(str(key.v))
-            return f'{self.meta_str(meta)}={",".join(strs)}'
-        return self.meta_str(meta)
+        return _ident_str(meta, keys)
+
+
+def format_record(rec):
+    """ text lines of a trace record, same format as Go's nodeutil.Trace """
+    level, kind, key, val = rec
+    if kind == _RAW:
+        return _format_line(level, key, val)
+    if kind == _VAL:
+        return _format_val(level, key, val)
+    if kind == _VALS:
+        if val is None:
+            return _format_line(level, key, None)
+        return "".join(_format_val(level, f'{key}[{i}]', v) for i, v in enumerate(val))
+    if kind == _META:
+        return _format_line(level, key, _meta_str(val))
+    if kind == _IDENT:
+        return _format_line(level, key, _ident_str(*val))
+    if kind == _NEXT:
+        row, meta, keys = val
+        return _format_line(level, f'{key}[{row}]', _ident_str(meta, keys))
+    raise ValueError(f"unknown trace record kind {kind}")
+
+
+def _format_line(level, key, val):
+    if val == None:
+        val_str = "<nil>"
+    elif isinstance(val, bool):
+        val_str = "true" if val else "false"
+    else:
+        val_str = str(val)
+    return f'{"    "*level}{key}: {val_str}\n'
+
+
+def _format_val(level, key, val):
+    if val == None:
+        return _format_line(level, key, None)
+    return _format_line(level, key, f'{val.format.name.lower()}({val.v})')
+
+
+def _meta_str(meta):
+    if hasattr(meta, 'ident'):
+        return meta.ident
+    return str(type(meta))
+
+
+def _ident_str(meta, keys):
+    if keys != None and len(keys) > 0:
+        strs = []
+        for key in keys:
+            strs.append(str(key.v))
+        return f'{_meta_str(meta)}={",".join(strs)}'
+    return _meta_str(meta)
+
+
+class TraceBuffer():
+    """
+    Fixed size ring of trace records.  Adding takes no lock, each record gets
+    a slot from an atomic counter and oldest records are overwritten when
+    reader falls behind.
+
+    :param size: number of records kept
+    """
+
+    def __init__(self, size=65536):
+        self.size = size
+        self.records = [None] * size
+        self.seq = itertools.count()
+        self.read_seq = 0
+        self.dropped = 0
+
+    def add(self, rec):
+        i = next(self.seq)
+        self.records[i % self.size] = (i, rec)
+
+    def drain(self):
+        """ records added since last drain, oldest first. Only one reader. """
+        recs = []
+        i = self.read_seq
+        while True:
+            slot = self.records[i % self.size]
+            if slot == None or slot[0] < i:
+                break
+            if slot[0] > i:
+                # overwritten before we got to it
+                self.dropped += slot[0] - self.size + 1 - i
+                i = slot[0] - self.size + 1
+                continue
+            recs.append(slot[1])
+            i += 1
+        self.read_seq = i
+        return recs
+
+
+def decode_trace(recs, out):
+    """ write records in text trace format """
+    for rec in recs:
+        out.write(format_record(rec))
+
+
+class TraceWriter():
+    """
+    Background thread that formats records from a TraceBuffer into out
+    every interval seconds so tracing costs little on the calling thread.
+
+        buf = nodeutil.TraceBuffer()
+        n = nodeutil.Trace(manage(app), buffer=buf, sample=0.01)
+        w = nodeutil.TraceWriter(buf, open("app.trace", "w"))
+        ...
+        w.stop()
+    """
+
+    def __init__(self, buffer, out, interval=1.0):
+        self.buffer = buffer
+        self.out = out
+        self.interval = interval
+        self.stopping = threading.Event()
+        self.thread = threading.Thread(target=self.run, name="fc-trace-writer", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        while not self.stopping.wait(self.interval):
+            self.flush()
+        self.flush()
+
+    def flush(self):
+        decode_trace(self.buffer.drain(), self.out)
+        self.out.flush()
+
+    def stop(self):
+        self.stopping.set()
+        self.thread.join()
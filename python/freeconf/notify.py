@@ -0,0 +1,398 @@
+import asyncio
+import collections
+import operator
+import re
+import threading
+import time
+
+# Queue policies for when a subscriber cannot keep up with a producer
+
+# producer waits for room in queue
+BLOCK = "block"
+
+# oldest event is discarded to make room
+DROP_OLDEST = "drop-oldest"
+
+# only the latest event for a given key is kept, see NotificationOptions.coalesce_key
+COALESCE = "coalesce"
+
+
+class NotificationOptions():
+
+    def __init__(self, max_queue=1000, policy=BLOCK, coalesce_key=None, block_timeout=1.0):
+        """
+        :param max_queue: most events held for a subscriber before policy applies
+        :param policy: BLOCK, DROP_OLDEST or COALESCE
+        :param coalesce_key: function given the event node and returns the key
+            (e.g. list key) to coalesce events on. When not given with COALESCE
+            policy only the latest event is kept.
+        :param block_timeout: seconds a producer is blocked with BLOCK policy
+            before the event is dropped and counted in metrics. None waits
+            forever.  Producers sending from inside notify() or on the event
+            loop are never blocked as nothing could make room.
+        """
+        if policy not in (BLOCK, DROP_OLDEST, COALESCE):
+            raise Exception(f"unrecognized notification queue policy '{policy}'")
+        if max_queue < 1:
+            raise Exception("max_queue must be at least 1")
+        self.max_queue = max_queue
+        self.policy = policy
+        self.coalesce_key = coalesce_key
+        self.block_timeout = block_timeout
+
+
+class SubscriptionMetrics():
+    """
+    Counters for a single subscription.  Latency is seconds from when producer
+    sent event to when it was handed to gRPC stream.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.max_depth = 0
+        self.sent = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.latency_last = 0.0
+        self.latency_max = 0.0
+        self.latency_total = 0.0
+
+    def latency_avg(self):
+        if self.delivered == 0:
+            return 0.0
+        return self.latency_total / self.delivered
+
+    def to_dict(self):
+        return {
+            "depth": self.depth,
+            "max-depth": self.max_depth,
+            "sent": self.sent,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "latency-last": self.latency_last,
+            "latency-max": self.latency_max,
+            "latency-avg": self.latency_avg(),
+        }
+
+
+class Subscription():
+    """
+    Carries events from a python notification producer to the gRPC stream that
+    delivers them to Go.  Producers can send from any thread, the stream waits for
+    events on the x server's event loop and so does not hold a worker thread for the
+    life of the subscription.
+
+    Queue is bounded and what happens when it is full is controlled by
+    NotificationOptions.
+    """
+
+    def __init__(self, loop, options=None):
+        self.loop = loop
+        self.options = options if options else NotificationOptions()
+        self.metrics = SubscriptionMetrics()
+        self.lock = threading.Condition()
+        self.pending = collections.OrderedDict() # key -> (node, time sent)
+        self.next_id = 0
+        self.wakeup = asyncio.Event()
+        self.closed = False
+        self.path = None
+        self.notify_thread = None
+
+    def call_notify(self, notify, req):
+        """ call producer's notify, events it sends before returning cannot wait """
+        self.notify_thread = threading.get_ident()
+        try:
+            return notify(req)
+        finally:
+            self.notify_thread = None
+
+    def can_wait(self):
+        if threading.get_ident() == self.notify_thread:
+            return False
+        try:
+            return asyncio.get_running_loop() is not self.loop
+        except RuntimeError:
+            return True
+
+    def set_options(self, options):
+        with self.lock:
+            self.options = options
+            self.lock.notify_all()
+
+    def put(self, node):
+        with self.lock:
+            if self.closed:
+                return
+            self.metrics.sent += 1
+            opts = self.options
+            if opts.policy == COALESCE:
+                key = ('k', opts.coalesce_key(node) if opts.coalesce_key else None)
+                if key in self.pending:
+                    # keeps its place in line but with latest event
+                    self.pending[key] = (node, self.pending[key][1])
+                    self.metrics.coalesced += 1
+                    return
+            else:
+                key = ('n', self.next_id)
+                self.next_id += 1
+            if len(self.pending) >= opts.max_queue:
+                if opts.policy == BLOCK:
+                    has_room = False
+                    if self.can_wait():
+                        has_room = self.lock.wait_for(
+                            lambda: self.closed or len(self.pending) < self.options.max_queue,
+                            opts.block_timeout)
+                    if self.closed:
+                        return
+                    if not has_room:
+                        self.metrics.dropped += 1
+                        return
+                else:
+                    self.pending.popitem(last=False)
+                    self.metrics.dropped += 1
+            self.pending[key] = (node, time.monotonic())
+            self.metrics.depth = len(self.pending)
+            self.metrics.max_depth = max(self.metrics.max_depth, self.metrics.depth)
+        self.call_in_loop(self.wakeup.set)
+
+    def close(self):
+        """ safe to call from any thread and more than once """
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.lock.notify_all()
+        self.call_in_loop(self.wakeup.set)
+
+    async def get(self):
+        """ next event or None when subscription was closed """
+        while True:
+            with self.lock:
+                if len(self.pending) > 0:
+                    _, (node, sent) = self.pending.popitem(last=False)
+                    self.lock.notify()
+                    latency = time.monotonic() - sent
+                    m = self.metrics
+                    m.depth = len(self.pending)
+                    m.delivered += 1
+                    m.latency_last = latency
+                    m.latency_max = max(m.latency_max, latency)
+                    m.latency_total += latency
+                    return node
+                if self.closed:
+                    return None
+                self.wakeup.clear()
+            await self.wakeup.wait()
+
+    def call_in_loop(self, f, *args):
+        try:
+            self.loop.call_soon_threadsafe(f, *args)
+        except RuntimeError:
+            # loop is stopped because driver was unloaded, nothing left to deliver to
+            pass
+
+
+class Filter():
+    """
+    Compiled subscriber filter so producers can cheaply decide if anyone wants an
+    event before building it.  Filters are RESTCONF/gNMI style paths relative to
+    the notification with predicates on list items, compared to literals and
+    joined with 'and', 'or' and parens
+
+        interface[name='eth0']/stats/drops>10
+        /if:interface[name=eth0] and (stats/drops>10 or up!='true')
+
+    A path without a comparison is true when the leaf is present.  Go applies
+    the same filter to whatever events producers send.
+    """
+
+    def __init__(self, expr):
+        self.expr = expr
+        self.paths = []
+        p = _FilterParser(expr, self.paths)
+        self.predicate = p.parse()
+
+    def matches(self, data):
+        """
+        :param data: event as dict where keys are yang identifiers with or without
+            module prefix. Lists match if any item matches.
+        """
+        return self.predicate(data)
+
+    def __str__(self):
+        return self.expr
+
+
+def compile_filter(expr):
+    """ None or empty expression means no filter """
+    if expr == None or expr.strip() == "":
+        return None
+    return Filter(expr)
+
+
+_FILTER_TOKEN = re.compile(r"\s*(?:(?P<str>'[^']*'|\"[^\"]*\")|(?P<op>!=|<=|>=|=|<|>|\(|\)|\[|\]|/)|(?P<word>[^\s'\"!=<>()\[\]/]+))")
+
+
+class _FilterParser():
+
+    def __init__(self, expr, paths):
+        self.expr = expr
+        self.paths = paths
+        self.tokens = []
+        pos = 0
+        while pos < len(expr):
+            m = _FILTER_TOKEN.match(expr, pos)
+            if m == None:
+                if expr[pos:].strip() == "":
+                    break
+                raise Exception(f"invalid filter '{expr}' at position {pos}")
+            pos = m.end()
+            self.tokens.append((m.lastgroup, m.group(m.lastgroup)))
+        self.pos = 0
+
+    def parse(self):
+        f = self.parse_or([])
+        if self.pos < len(self.tokens):
+            raise Exception(f"invalid filter '{self.expr}', unexpected '{self.tokens[self.pos][1]}'")
+        return f
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+        return (None, None)
+
+    def next(self):
+        t = self.peek()
+        if t[0] == None:
+            raise Exception(f"invalid filter '{self.expr}', unexpected end")
+        self.pos += 1
+        return t
+
+    def parse_or(self, parent):
+        terms = [self.parse_and(parent)]
+        while self.peek() == ('word', 'or'):
+            self.next()
+            terms.append(self.parse_and(parent))
+        if len(terms) == 1:
+            return terms[0]
+        return lambda data: any(t(data) for t in terms)
+
+    def parse_and(self, parent):
+        terms = [self.parse_term(parent)]
+        while self.peek() == ('word', 'and'):
+            self.next()
+            terms.append(self.parse_term(parent))
+        if len(terms) == 1:
+            return terms[0]
+        return lambda data: all(t(data) for t in terms)
+
+    def parse_term(self, parent):
+        if self.peek() == ('op', '('):
+            self.next()
+            f = self.parse_or(parent)
+            if self.next() != ('op', ')'):
+                raise Exception(f"invalid filter '{self.expr}', missing ')'")
+            return f
+        path = self.parse_path(parent)
+        kind, op = self.peek()
+        if kind != 'op' or op not in _FILTER_OPS:
+            return lambda data: len(_filter_values(data, path)) > 0
+        self.next()
+        kind, literal = self.next()
+        if kind == 'str':
+            expected = literal[1:-1]
+        elif kind == 'word':
+            try:
+                expected = float(literal)
+            except ValueError:
+                expected = literal
+        else:
+            raise Exception(f"invalid filter '{self.expr}', expected value after '{op}'")
+        compare = _FILTER_OPS[op]
+        def predicate(data):
+            for v in _filter_values(data, path):
+                actual = _filter_coerce(v, expected)
+                if actual != None and compare(actual, expected):
+                    return True
+            return False
+        return predicate
+
+    def parse_path(self, parent):
+        """ list of (ident, predicates) e.g. a/b[c='x'][d=1] """
+        if self.peek() == ('op', '/'):
+            self.next()
+        path = []
+        while True:
+            kind, tok = self.next()
+            if kind != 'word':
+                raise Exception(f"invalid filter '{self.expr}', unexpected '{tok}'")
+            ident = _strip_prefix(tok)
+            predicates = []
+            while self.peek() == ('op', '['):
+                self.next()
+                idents = parent + [seg[0] for seg in path] + [ident]
+                predicates.append(self.parse_or(idents))
+                if self.next() != ('op', ']'):
+                    raise Exception(f"invalid filter '{self.expr}', missing ']'")
+            path.append((ident, predicates))
+            if self.peek() != ('op', '/'):
+                break
+            self.next()
+        self.paths.append(parent + [seg[0] for seg in path])
+        return path
+
+
+_FILTER_OPS = {
+    '=': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+def _strip_prefix(ident):
+    colon = ident.find(':')
+    if colon >= 0:
+        return ident[colon + 1:]
+    return ident
+
+
+def _filter_values(data, path):
+    candidates = [data]
+    for ident, predicates in path:
+        found = []
+        for c in candidates:
+            v = _filter_get(c, ident)
+            if v == None:
+                continue
+            for item in (v if isinstance(v, (list, tuple)) else [v]):
+                if all(p(item) for p in predicates):
+                    found.append(item)
+        candidates = found
+    return candidates
+
+
+def _filter_get(obj, ident):
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if _strip_prefix(k) == ident:
+                return v
+        return obj.get(ident.replace('-', '_'))
+    return getattr(obj, ident.replace('-', '_'), None)
+
+
+def _filter_coerce(v, expected):
+    if isinstance(expected, float):
+        if isinstance(v, bool):
+            return None
+        try:
+            return float(v)
+        except (TypeError, ValueError):
+            return None
+    if isinstance(v, bool):
+        return 'true' if v else 'false'
+    return str(v)
@@ -48,11 +48,11 @@ def load_module_str(ypath, module_str, driver=None):
     :param module_str: contents of YANG definition
     """
     d = driver if driver else freeconf.driver.shared_instance()
-    stream = d.fs.new_rdr_str(module_str)
-    req = freeconf.pb.fc_pb2.LoadModuleRequest(streamHnd=stream.hnd)
-    if ypath:
-        req.sourceHnd = ypath.hnd
-    resp = d.g_parser.LoadModule(req)
+    with d.fs.new_rdr_str(module_str) as stream:
+        req = freeconf.pb.fc_pb2.LoadModuleRequest(streamHnd=stream.hnd)
+        if ypath:
+            req.sourceHnd = ypath.hnd
+        resp = d.g_parser.LoadModule(req)
     m = freeconf.meta_decoder.Decoder().decode(resp.module)
     m.hnd = d.obj_weak.store_hnd(resp.moduleHnd, m)
     return m
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: freeconf/pb/common.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'freeconf/pb/common.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from freeconf.pb import val_pb2 as freeconf_dot_pb_dot_val__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x18\x66reeconf/pb/common.proto\x12\x02pb\x1a\x15\x66reeconf/pb/val.proto\"<\n\x04Path\x12\x11\n\tmoduleHnd\x18\x01 \x01(\x04\x12!\n\x08segments\x18\x02 \x03(\x0b\x32\x0f.pb.PathSegment\"Y\n\x0bPathSegment\x12\x11\n\tmetaIdent\x18\x01 \x01(\t\x12\x14\n\x03key\x18\x02 \x03(\x0b\x32\x07.pb.Val\x12!\n\x04type\x18\x03 \x01(\x0e\x32\x13.pb.PathSegmentType*Y\n\x0fPathSegmentType\x12\x0c\n\x08\x44\x41TA_DEF\x10\x00\x12\x07\n\x03RPC\x10\x02\x12\r\n\tRPC_INPUT\x10\x03\x12\x0e\n\nRPC_OUTPUT\x10\x04\x12\x10\n\x0cNOTIFICATION\x10\x05\x42\x06Z\x04./pbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'freeconf.pb.common_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z\004./pb'
+  _globals['_PATHSEGMENTTYPE']._serialized_start=208
+  _globals['_PATHSEGMENTTYPE']._serialized_end=297
+  _globals['_PATH']._serialized_start=55
+  _globals['_PATH']._serialized_end=115
+  _globals['_PATHSEGMENT']._serialized_start=117
+  _globals['_PATHSEGMENT']._serialized_end=206
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,40 @@
+from freeconf.pb import val_pb2 as _val_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class PathSegmentType(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    DATA_DEF: _ClassVar[PathSegmentType]
+    RPC: _ClassVar[PathSegmentType]
+    RPC_INPUT: _ClassVar[PathSegmentType]
+    RPC_OUTPUT: _ClassVar[PathSegmentType]
+    NOTIFICATION: _ClassVar[PathSegmentType]
+DATA_DEF: PathSegmentType
+RPC: PathSegmentType
+RPC_INPUT: PathSegmentType
+RPC_OUTPUT: PathSegmentType
+NOTIFICATION: PathSegmentType
+
+class Path(_message.Message):
+    __slots__ = ("moduleHnd", "segments")
+    MODULEHND_FIELD_NUMBER: _ClassVar[int]
+    SEGMENTS_FIELD_NUMBER: _ClassVar[int]
+    moduleHnd: int
+    segments: _containers.RepeatedCompositeFieldContainer[PathSegment]
+    def __init__(self, moduleHnd: _Optional[int] = ..., segments: _Optional[_Iterable[_Union[PathSegment, _Mapping]]] = ...) -> None: ...
+
+class PathSegment(_message.Message):
+    __slots__ = ("metaIdent", "key", "type")
+    METAIDENT_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    metaIdent: str
+    key: _containers.RepeatedCompositeFieldContainer[_val_pb2.Val]
+    type: PathSegmentType
+    def __init__(self, metaIdent: _Optional[str] = ..., key: _Optional[_Iterable[_Union[_val_pb2.Val, _Mapping]]] = ..., type: _Optional[_Union[PathSegmentType, str]] = ...) -> None: ...
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: freeconf/pb/fc.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'freeconf/pb/fc.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from freeconf.pb import meta_pb2 as freeconf_dot_pb_dot_meta__pb2
+from freeconf.pb import common_pb2 as freeconf_dot_pb_dot_common__pb2
+from freeconf.pb import val_pb2 as freeconf_dot_pb_dot_val__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x66reeconf/pb/fc.proto\x12\x02pb\x1a\x16\x66reeconf/pb/meta.proto\x1a\x18\x66reeconf/pb/common.proto\x1a\x15\x66reeconf/pb/val.proto\"d\n\rSourceRequest\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\x19\n\x11yangInternalYpath\x18\x02 \x01(\x08\x12\x1d\n\x15restconfInternalYpath\x18\x03 \x01(\x08\x12\x0b\n\x03\x61ny\x18\x04 \x03(\x04\"#\n\x0eSourceResponse\x12\x11\n\tsourceHnd\x18\x01 \x01(\x04\"U\n\x11LoadModuleRequest\x12\x11\n\tsourceHnd\x18\x01 \x01(\x04\x12\x0e\n\x04name\x18\x02 \x01(\tH\x00\x12\x13\n\tstreamHnd\x18\x03 \x01(\x04H\x00\x42\x08\n\x06module\"C\n\x12LoadModuleResponse\x12\x1a\n\x06module\x18\x01 \x01(\x0b\x32\n.pb.Module\x12\x11\n\tmoduleHnd\x18\x02 \x01(\x04\"\x11\n\x0fReleaseResponse\"\x1d\n\x0eReleaseRequest\x12\x0b\n\x03hnd\x18\x01 \x01(\x04\"(\n\x12HandleAuditRequest\x12\x12\n\ntrackSites\x18\x01 \x01(\x08\"s\n\x13HandleAuditResponse\x12 \n\x07handles\x18\x01 \x03(\x0b\x32\x0f.pb.HandleCount\x12\x11\n\theapAlloc\x18\x02 \x01(\x04\x12\x13\n\x0bheapObjects\x18\x03 \x01(\x04\x12\x12\n\ngoroutines\x18\x04 \x01(\x03\"8\n\x0bHandleCount\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0c\n\x04site\x18\x02 \x01(\t\x12\r\n\x05\x63ount\x18\x03 \x01(\x03\"7\n\x11NewBrowserRequest\x12\x11\n\tmoduleHnd\x18\x01 \x01(\x04\x12\x0f\n\x07nodeHnd\x18\x03 \x01(\x04\"(\n\x12NewBrowserResponse\x12\x12\n\nbrowserHnd\x18\x01 \x01(\x04\")\n\x17ReleaseSelectionRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\"0\n\x18ReleaseSelectionResponse\x12\x14\n\x0creleasedHnds\x18\x01 \x03(\x04\"\x7f\n\x14SelectionEditRequest\x12\x1f\n\x02op\x18\x01 \x01(\x0e\x32\x13.pb.SelectionEditOp\x12\x0e\n\x06selHnd\x18\x02 \x01(\x04\x12\x0f\n\x07nodeHnd\x18\x03 \x01(\x04\x12\x16\n\x04tree\x18\x04 \x01(\x0b\x32\x08.pb.Tree\x12\r\n\x05\x66ield\x18\x05 \x01(\t\"\x17\n\x15SelectionEditResponse\"N\n\x17\x42rowserReadCacheRequest\x12\x12\n\nbrowserHnd\x18\x01 \x01(\x04\x12\r\n\x05paths\x18\x02 \x03(\t\x12\x10\n\x08maxAgeMs\x18\x03 \x01(\x03\"\x1a\n\x18\x42rowserReadCacheResponse\"<\n\x18\x42rowserInvalidateRequest\x12\x12\n\nbrowserHnd\x18\x01 \x01(\x04\x12\x0c\n\x04path\x18\x02 \x01(\t\"\x1b\n\x19\x42rowserInvalidateResponse\"(\n\x12\x42rowserRootRequest\x12\x12\n\nbrowserHnd\x18\x01 \x01(\x04\"%\n\x13\x42rowserRootResponse\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\"#\n\x0eNewNodeRequest\x12\x11\n\tnoopHooks\x18\x01 \x01(\r\"\"\n\x0fNewNodeResponse\x12\x0f\n\x07nodeHnd\x18\x01 \x01(\x04\"+\n\x0b\x46indRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x0c\n\x04path\x18\x02 \x01(\t\"\x1e\n\x0c\x46indResponse\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\"I\n\nGetRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x0c\n\x04path\x18\x02 \x01(\t\x12\r\n\x05\x64\x65pth\x18\x03 \x01(\x05\x12\x0e\n\x06\x66ields\x18\x04 \x03(\t\"%\n\x0bGetResponse\x12\x16\n\x04tree\x18\x01 \x01(\x0b\x32\x08.pb.Tree\"A\n\x0c\x42\x61tchRequest\x12\x1c\n\x05steps\x18\x01 \x03(\x0b\x32\r.pb.BatchStep\x12\x13\n\x0bstopOnError\x18\x02 \x01(\x08\"\xe1\x01\n\tBatchStep\x12\x0f\n\x07selStep\x18\x01 \x01(\r\x12\x1f\n\x04\x66ind\x18\x02 \x01(\x0b\x32\x0f.pb.FindRequestH\x00\x12(\n\x04\x65\x64it\x18\x03 \x01(\x0b\x32\x18.pb.SelectionEditRequestH\x00\x12#\n\x06\x61\x63tion\x18\x04 \x01(\x0b\x32\x11.pb.ActionRequestH\x00\x12\x1d\n\x03get\x18\x05 \x01(\x0b\x32\x0e.pb.GetRequestH\x00\x12.\n\x07release\x18\x06 \x01(\x0b\x32\x1b.pb.ReleaseSelectionRequestH\x00\x42\x04\n\x02op\"1\n\rBatchResponse\x12 \n\x07results\x18\x01 \x03(\x0b\x32\x0f.pb.BatchResult\"k\n\x0b\x42\x61tchResult\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x16\n\x04tree\x18\x02 \x01(\x0b\x32\x08.pb.Tree\x12\x14\n\x0creleasedHnds\x18\x03 \x03(\x04\x12\r\n\x05\x65rror\x18\x04 \x01(\t\x12\x0f\n\x07skipped\x18\x05 \x01(\x08\"d\n\x04Tree\x12\x14\n\x03val\x18\x01 \x01(\x0b\x32\x07.pb.Val\x12\x1d\n\x06\x66ields\x18\x02 \x03(\x0b\x32\r.pb.TreeField\x12\x0e\n\x06isList\x18\x03 \x01(\x08\x12\x17\n\x05items\x18\x04 \x03(\x0b\x32\x08.pb.Tree\"2\n\tTreeField\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x16\n\x04tree\x18\x02 \x01(\x0b\x32\x08.pb.Tree\"5\n\rActionRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x14\n\x0cinputNodeHnd\x18\x02 \x01(\x04\"&\n\x0e\x41\x63tionResponse\x12\x14\n\x0coutputSelHnd\x18\x01 \x01(\x04\"\'\n\x11GetBrowserRequest\x12\x12\n\nbrowserHnd\x18\x01 \x01(\x04\"\'\n\x12GetBrowserResponse\x12\x11\n\tmoduleHnd\x18\x01 \x01(\x04\"%\n\x10GetModuleRequest\x12\x11\n\tmoduleHnd\x18\x01 \x01(\x04\"/\n\x11GetModuleResponse\x12\x1a\n\x06module\x18\x01 \x01(\x0b\x32\n.pb.Module\"%\n\x13GetSelectionRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\"{\n\x14GetSelectionResponse\x12\x0f\n\x07nodeHnd\x18\x01 \x01(\x04\x12\x12\n\nremoteNode\x18\x02 \x01(\x08\x12\x12\n\nbrowserHnd\x18\x03 \x01(\x04\x12\x12\n\ninsideList\x18\x04 \x01(\x08\x12\x16\n\x04path\x18\x05 \x01(\x0b\x32\x08.pb.Path\"5\n\x13NotificationRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x0e\n\x06\x66ilter\x18\x02 \x01(\t\"4\n\x14NotificationResponse\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x0c\n\x04when\x18\x02 \x01(\x03\"\x90\x01\n\rClientRequest\x12\x10\n\x08ypathHnd\x18\x01 \x01(\x04\x12\x0f\n\x07\x61\x64\x64ress\x18\x02 \x01(\t\x12\x10\n\x08poolSize\x18\x03 \x01(\x05\x12\x15\n\ridleTimeoutMs\x18\x04 \x01(\x03\x12\x13\n\x0bnoKeepAlive\x18\x05 \x01(\x08\x12\x1e\n\x05\x63\x61\x63he\x18\x06 \x03(\x0b\x32\x0f.pb.ClientCache\"*\n\x0b\x43lientCache\x12\x0c\n\x04path\x18\x01 \x01(\t\x12\r\n\x05ttlMs\x18\x02 \x01(\x03\"#\n\x0e\x43lientResponse\x12\x11\n\tdeviceHnd\x18\x01 \x01(\x04\"-\n\x10NewDeviceRequest\x12\x19\n\x11yangPathSourceHnd\x18\x01 \x01(\x04\"&\n\x11NewDeviceResponse\x12\x11\n\tdeviceHnd\x18\x01 \x01(\x04\"@\n\x17\x44\x65viceAddBrowserRequest\x12\x11\n\tdeviceHnd\x18\x01 \x01(\x04\x12\x12\n\nbrowserHnd\x18\x02 \x01(\x04\"\x1a\n\x18\x44\x65viceAddBrowserResponse\"A\n\x17\x44\x65viceGetBrowserRequest\x12\x11\n\tdeviceHnd\x18\x01 \x01(\x04\x12\x13\n\x0bmoduleIdent\x18\x02 \x01(\t\".\n\x18\x44\x65viceGetBrowserResponse\x12\x12\n\nbrowserHnd\x18\x01 \x01(\x04\"A\n\x19\x41pplyStartupConfigRequest\x12\x11\n\tdeviceHnd\x18\x01 \x01(\x04\x12\x11\n\tstreamHnd\x18\x02 \x01(\x04\"\x1c\n\x1a\x41pplyStartupConfigResponse\"\x1d\n\x0cStatsRequest\x12\r\n\x05reset\x18\x01 \x01(\x08\"\x8f\x03\n\rStatsResponse\x12\x1b\n\x05\x63\x61lls\x18\x01 \x03(\x0b\x32\x0c.pb.CallStat\x12\x1c\n\x06xCalls\x18\x02 \x03(\x0b\x32\x0c.pb.CallStat\x12\x0f\n\x07handles\x18\x03 \x01(\x03\x12\x19\n\x11openNotifications\x18\x04 \x01(\x03\x12\x1f\n\x17notificationSubscribers\x18\x05 \x01(\x03\x12\x15\n\rreadCacheHits\x18\x06 \x01(\x03\x12\x17\n\x0freadCacheMisses\x18\x07 \x01(\x03\x12\x17\n\x0f\x63lientCacheHits\x18\x08 \x01(\x03\x12\x1e\n\x16\x63lientCacheRevalidated\x18\t \x01(\x03\x12\x19\n\x11\x63lientCacheMisses\x18\n \x01(\x03\x12\x19\n\x11responseCacheHits\x18\x0b \x01(\x03\x12 \n\x18responseCacheNotModified\x18\x0c \x01(\x03\x12\x1b\n\x13responseCacheMisses\x18\r \x01(\x03\x12\x18\n\x10latencyBucketsNs\x18\x0e \x03(\x03\"x\n\x08\x43\x61llStat\x12\x0e\n\x06method\x18\x01 \x01(\t\x12\r\n\x05\x63ount\x18\x02 \x01(\x03\x12\x0e\n\x06meanNs\x18\x03 \x01(\x03\x12\r\n\x05p50Ns\x18\x04 \x01(\x03\x12\r\n\x05p99Ns\x18\x05 \x01(\x03\x12\x0e\n\x06opened\x18\x06 \x01(\x03\x12\x0f\n\x07\x62uckets\x18\x07 \x03(\x03\"#\n\x0eJSONRdrRequest\x12\x11\n\tstreamHnd\x18\x01 \x01(\x04\"\"\n\x0fJSONRdrResponse\x12\x0f\n\x07nodeHnd\x18\x01 \x01(\x04\"#\n\x0eJSONWtrRequest\x12\x11\n\tstreamHnd\x18\x01 \x01(\x04\"\"\n\x0fJSONWtrResponse\x12\x0f\n\x07nodeHnd\x18\x01 \x01(\x04\"Y\n\x15RestconfServerRequest\x12\x11\n\tdeviceHnd\x18\x01 \x01(\x04\x12\x16\n\x0e\x63\x61\x63heResponses\x18\x02 \x01(\x08\x12\x15\n\rcacheMaxAgeMs\x18\x03 \x01(\x03\"+\n\x16RestconfServerResponse\x12\x11\n\tserverHnd\x18\x01 \x01(\x04\"&\n\x11GnmiServerRequest\x12\x11\n\tdeviceHnd\x18\x01 \x01(\x04\"\'\n\x12GnmiServerResponse\x12\x11\n\tserverHnd\x18\x01 \x01(\x04*\xe2\x01\n\x0fSelectionEditOp\x12\x0f\n\x0bUPSERT_INTO\x10\x00\x12\x0f\n\x0bUPSERT_FROM\x10\x01\x12\x0f\n\x0bINSERT_INTO\x10\x02\x12\x0f\n\x0bINSERT_FROM\x10\x03\x12\x1c\n\x18UPSERT_INTO_SET_DEFAULTS\x10\x04\x12\x1c\n\x18UPSERT_FROM_SET_DEFAULTS\x10\x05\x12\x0f\n\x0bUPDATE_INTO\x10\x06\x12\x0f\n\x0bUPDATE_FROM\x10\x07\x12\x10\n\x0cREPLACE_FROM\x10\x08\x12\n\n\x06\x44\x45LETE\x10\t\x12\x0f\n\x0b\x43LEAR_FIELD\x10\n*e\n\x08NodeHook\x12\r\n\tHOOK_NONE\x10\x00\x12\x10\n\x0cHOOK_CONTEXT\x10\x01\x12\x10\n\x0cHOOK_RELEASE\x10\x02\x12\x13\n\x0fHOOK_BEGIN_EDIT\x10\x04\x12\x11\n\rHOOK_END_EDIT\x10\x08\x32z\n\x06Parser\x12\x31\n\x06Source\x12\x11.pb.SourceRequest\x1a\x12.pb.SourceResponse\"\x00\x12=\n\nLoadModule\x12\x15.pb.LoadModuleRequest\x1a\x16.pb.LoadModuleResponse\"\x00\x32{\n\x07Handles\x12\x34\n\x07Release\x12\x12.pb.ReleaseRequest\x1a\x13.pb.ReleaseResponse\"\x00\x12:\n\x05\x41udit\x12\x16.pb.HandleAuditRequest\x1a\x17.pb.HandleAuditResponse\"\x00\x32\xbc\x07\n\x04Node\x12=\n\nNewBrowser\x12\x15.pb.NewBrowserRequest\x1a\x16.pb.NewBrowserResponse\"\x00\x12@\n\x0b\x42rowserRoot\x12\x16.pb.BrowserRootRequest\x1a\x17.pb.BrowserRootResponse\"\x00\x12\x46\n\rSelectionEdit\x12\x18.pb.SelectionEditRequest\x1a\x19.pb.SelectionEditResponse\"\x00\x12\x31\n\x06\x41\x63tion\x12\x11.pb.ActionRequest\x1a\x12.pb.ActionResponse\"\x00\x12\x45\n\x0cNotification\x12\x17.pb.NotificationRequest\x1a\x18.pb.NotificationResponse\"\x00\x30\x01\x12+\n\x04\x46ind\x12\x0f.pb.FindRequest\x1a\x10.pb.FindResponse\"\x00\x12(\n\x03Get\x12\x0e.pb.GetRequest\x1a\x0f.pb.GetResponse\"\x00\x12.\n\x05\x42\x61tch\x12\x10.pb.BatchRequest\x1a\x11.pb.BatchResponse\"\x00\x12\x34\n\x07NewNode\x12\x12.pb.NewNodeRequest\x1a\x13.pb.NewNodeResponse\"\x00\x12=\n\nGetBrowser\x12\x15.pb.GetBrowserRequest\x1a\x16.pb.GetBrowserResponse\"\x00\x12:\n\tGetModule\x12\x14.pb.GetModuleRequest\x1a\x15.pb.GetModuleResponse\"\x00\x12\x43\n\x0cGetSelection\x12\x17.pb.GetSelectionRequest\x1a\x18.pb.GetSelectionResponse\"\x00\x12O\n\x10ReleaseSelection\x12\x1b.pb.ReleaseSelectionRequest\x1a\x1c.pb.ReleaseSelectionResponse\"\x00\x12O\n\x10\x42rowserReadCache\x12\x1b.pb.BrowserReadCacheRequest\x1a\x1c.pb.BrowserReadCacheResponse\"\x00\x12R\n\x11\x42rowserInvalidate\x12\x1c.pb.BrowserInvalidateRequest\x1a\x1d.pb.BrowserInvalidateResponse\"\x00\x32\xf0\x02\n\x06\x44\x65vice\x12:\n\tNewDevice\x12\x14.pb.NewDeviceRequest\x1a\x15.pb.NewDeviceResponse\"\x00\x12O\n\x10\x44\x65viceAddBrowser\x12\x1b.pb.DeviceAddBrowserRequest\x1a\x1c.pb.DeviceAddBrowserResponse\"\x00\x12O\n\x10\x44\x65viceGetBrowser\x12\x1b.pb.DeviceGetBrowserRequest\x1a\x1c.pb.DeviceGetBrowserResponse\"\x00\x12U\n\x12\x41pplyStartupConfig\x12\x1d.pb.ApplyStartupConfigRequest\x1a\x1e.pb.ApplyStartupConfigResponse\"\x00\x12\x31\n\x06\x43lient\x12\x11.pb.ClientRequest\x1a\x12.pb.ClientResponse\"\x00\x32\x37\n\x05Stats\x12.\n\x05Stats\x12\x10.pb.StatsRequest\x1a\x11.pb.StatsResponse\"\x00\x32v\n\x08NodeUtil\x12\x34\n\x07JSONRdr\x12\x12.pb.JSONRdrRequest\x1a\x13.pb.JSONRdrResponse\"\x00\x12\x34\n\x07JSONWtr\x12\x12.pb.JSONWtrRequest\x1a\x13.pb.JSONWtrResponse\"\x00\x32\x91\x01\n\x05Proto\x12I\n\x0eRestconfServer\x12\x19.pb.RestconfServerRequest\x1a\x1a.pb.RestconfServerResponse\"\x00\x12=\n\nGnmiServer\x12\x15.pb.GnmiServerRequest\x1a\x16.pb.GnmiServerResponse\"\x00\x42\x06Z\x04./pbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'freeconf.pb.fc_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z\004./pb'
+  _globals['_SELECTIONEDITOP']._serialized_start=4240
+  _globals['_SELECTIONEDITOP']._serialized_end=4466
+  _globals['_NODEHOOK']._serialized_start=4468
+  _globals['_NODEHOOK']._serialized_end=4569
+  _globals['_SOURCEREQUEST']._serialized_start=101
+  _globals['_SOURCEREQUEST']._serialized_end=201
+  _globals['_SOURCERESPONSE']._serialized_start=203
+  _globals['_SOURCERESPONSE']._serialized_end=238
+  _globals['_LOADMODULEREQUEST']._serialized_start=240
+  _globals['_LOADMODULEREQUEST']._serialized_end=325
+  _globals['_LOADMODULERESPONSE']._serialized_start=327
+  _globals['_LOADMODULERESPONSE']._serialized_end=394
+  _globals['_RELEASERESPONSE']._serialized_start=396
+  _globals['_RELEASERESPONSE']._serialized_end=413
+  _globals['_RELEASEREQUEST']._serialized_start=415
+  _globals['_RELEASEREQUEST']._serialized_end=444
+  _globals['_HANDLEAUDITREQUEST']._serialized_start=446
+  _globals['_HANDLEAUDITREQUEST']._serialized_end=486
+  _globals['_HANDLEAUDITRESPONSE']._serialized_start=488
+  _globals['_HANDLEAUDITRESPONSE']._serialized_end=603
+  _globals['_HANDLECOUNT']._serialized_start=605
+  _globals['_HANDLECOUNT']._serialized_end=661
+  _globals['_NEWBROWSERREQUEST']._serialized_start=663
+  _globals['_NEWBROWSERREQUEST']._serialized_end=718
+  _globals['_NEWBROWSERRESPONSE']._serialized_start=720
+  _globals['_NEWBROWSERRESPONSE']._serialized_end=760
+  _globals['_RELEASESELECTIONREQUEST']._serialized_start=762
+  _globals['_RELEASESELECTIONREQUEST']._serialized_end=803
+  _globals['_RELEASESELECTIONRESPONSE']._serialized_start=805
+  _globals['_RELEASESELECTIONRESPONSE']._serialized_end=853
+  _globals['_SELECTIONEDITREQUEST']._serialized_start=855
+  _globals['_SELECTIONEDITREQUEST']._serialized_end=982
+  _globals['_SELECTIONEDITRESPONSE']._serialized_start=984
+  _globals['_SELECTIONEDITRESPONSE']._serialized_end=1007
+  _globals['_BROWSERREADCACHEREQUEST']._serialized_start=1009
+  _globals['_BROWSERREADCACHEREQUEST']._serialized_end=1087
+  _globals['_BROWSERREADCACHERESPONSE']._serialized_start=1089
+  _globals['_BROWSERREADCACHERESPONSE']._serialized_end=1115
+  _globals['_BROWSERINVALIDATEREQUEST']._serialized_start=1117
+  _globals['_BROWSERINVALIDATEREQUEST']._serialized_end=1177
+  _globals['_BROWSERINVALIDATERESPONSE']._serialized_start=1179
+  _globals['_BROWSERINVALIDATERESPONSE']._serialized_end=1206
+  _globals['_BROWSERROOTREQUEST']._serialized_start=1208
+  _globals['_BROWSERROOTREQUEST']._serialized_end=1248
+  _globals['_BROWSERROOTRESPONSE']._serialized_start=1250
+  _globals['_BROWSERROOTRESPONSE']._serialized_end=1287
+  _globals['_NEWNODEREQUEST']._serialized_start=1289
+  _globals['_NEWNODEREQUEST']._serialized_end=1324
+  _globals['_NEWNODERESPONSE']._serialized_start=1326
+  _globals['_NEWNODERESPONSE']._serialized_end=1360
+  _globals['_FINDREQUEST']._serialized_start=1362
+  _globals['_FINDREQUEST']._serialized_end=1405
+  _globals['_FINDRESPONSE']._serialized_start=1407
+  _globals['_FINDRESPONSE']._serialized_end=1437
+  _globals['_GETREQUEST']._serialized_start=1439
+  _globals['_GETREQUEST']._serialized_end=1512
+  _globals['_GETRESPONSE']._serialized_start=1514
+  _globals['_GETRESPONSE']._serialized_end=1551
+  _globals['_BATCHREQUEST']._serialized_start=1553
+  _globals['_BATCHREQUEST']._serialized_end=1618
+  _globals['_BATCHSTEP']._serialized_start=1621
+  _globals['_BATCHSTEP']._serialized_end=1846
+  _globals['_BATCHRESPONSE']._serialized_start=1848
+  _globals['_BATCHRESPONSE']._serialized_end=1897
+  _globals['_BATCHRESULT']._serialized_start=1899
+  _globals['_BATCHRESULT']._serialized_end=2006
+  _globals['_TREE']._serialized_start=2008
+  _globals['_TREE']._serialized_end=2108
+  _globals['_TREEFIELD']._serialized_start=2110
+  _globals['_TREEFIELD']._serialized_end=2160
+  _globals['_ACTIONREQUEST']._serialized_start=2162
+  _globals['_ACTIONREQUEST']._serialized_end=2215
+  _globals['_ACTIONRESPONSE']._serialized_start=2217
+  _globals['_ACTIONRESPONSE']._serialized_end=2255
+  _globals['_GETBROWSERREQUEST']._serialized_start=2257
+  _globals['_GETBROWSERREQUEST']._serialized_end=2296
+  _globals['_GETBROWSERRESPONSE']._serialized_start=2298
+  _globals['_GETBROWSERRESPONSE']._serialized_end=2337
+  _globals['_GETMODULEREQUEST']._serialized_start=2339
+  _globals['_GETMODULEREQUEST']._serialized_end=2376
+  _globals['_GETMODULERESPONSE']._serialized_start=2378
+  _globals['_GETMODULERESPONSE']._serialized_end=2425
+  _globals['_GETSELECTIONREQUEST']._serialized_start=2427
+  _globals['_GETSELECTIONREQUEST']._serialized_end=2464
+  _globals['_GETSELECTIONRESPONSE']._serialized_start=2466
+  _globals['_GETSELECTIONRESPONSE']._serialized_end=2589
+  _globals['_NOTIFICATIONREQUEST']._serialized_start=2591
+  _globals['_NOTIFICATIONREQUEST']._serialized_end=2644
+  _globals['_NOTIFICATIONRESPONSE']._serialized_start=2646
+  _globals['_NOTIFICATIONRESPONSE']._serialized_end=2698
+  _globals['_CLIENTREQUEST']._serialized_start=2701
+  _globals['_CLIENTREQUEST']._serialized_end=2845
+  _globals['_CLIENTCACHE']._serialized_start=2847
+  _globals['_CLIENTCACHE']._serialized_end=2889
+  _globals['_CLIENTRESPONSE']._serialized_start=2891
+  _globals['_CLIENTRESPONSE']._serialized_end=2926
+  _globals['_NEWDEVICEREQUEST']._serialized_start=2928
+  _globals['_NEWDEVICEREQUEST']._serialized_end=2973
+  _globals['_NEWDEVICERESPONSE']._serialized_start=2975
+  _globals['_NEWDEVICERESPONSE']._serialized_end=3013
+  _globals['_DEVICEADDBROWSERREQUEST']._serialized_start=3015
+  _globals['_DEVICEADDBROWSERREQUEST']._serialized_end=3079
+  _globals['_DEVICEADDBROWSERRESPONSE']._serialized_start=3081
+  _globals['_DEVICEADDBROWSERRESPONSE']._serialized_end=3107
+  _globals['_DEVICEGETBROWSERREQUEST']._serialized_start=3109
+  _globals['_DEVICEGETBROWSERREQUEST']._serialized_end=3174
+  _globals['_DEVICEGETBROWSERRESPONSE']._serialized_start=3176
+  _globals['_DEVICEGETBROWSERRESPONSE']._serialized_end=3222
+  _globals['_APPLYSTARTUPCONFIGREQUEST']._serialized_start=3224
+  _globals['_APPLYSTARTUPCONFIGREQUEST']._serialized_end=3289
+  _globals['_APPLYSTARTUPCONFIGRESPONSE']._serialized_start=3291
+  _globals['_APPLYSTARTUPCONFIGRESPONSE']._serialized_end=3319
+  _globals['_STATSREQUEST']._serialized_start=3321
+  _globals['_STATSREQUEST']._serialized_end=3350
+  _globals['_STATSRESPONSE']._serialized_start=3353
+  _globals['_STATSRESPONSE']._serialized_end=3752
+  _globals['_CALLSTAT']._serialized_start=3754
+  _globals['_CALLSTAT']._serialized_end=3874
+  _globals['_JSONRDRREQUEST']._serialized_start=3876
+  _globals['_JSONRDRREQUEST']._serialized_end=3911
+  _globals['_JSONRDRRESPONSE']._serialized_start=3913
+  _globals['_JSONRDRRESPONSE']._serialized_end=3947
+  _globals['_JSONWTRREQUEST']._serialized_start=3949
+  _globals['_JSONWTRREQUEST']._serialized_end=3984
+  _globals['_JSONWTRRESPONSE']._serialized_start=3986
+  _globals['_JSONWTRRESPONSE']._serialized_end=4020
+  _globals['_RESTCONFSERVERREQUEST']._serialized_start=4022
+  _globals['_RESTCONFSERVERREQUEST']._serialized_end=4111
+  _globals['_RESTCONFSERVERRESPONSE']._serialized_start=4113
+  _globals['_RESTCONFSERVERRESPONSE']._serialized_end=4156
+  _globals['_GNMISERVERREQUEST']._serialized_start=4158
+  _globals['_GNMISERVERREQUEST']._serialized_end=4196
+  _globals['_GNMISERVERRESPONSE']._serialized_start=4198
+  _globals['_GNMISERVERRESPONSE']._serialized_end=4237
+  _globals['_PARSER']._serialized_start=4571
+  _globals['_PARSER']._serialized_end=4693
+  _globals['_HANDLES']._serialized_start=4695
+  _globals['_HANDLES']._serialized_end=4818
+  _globals['_NODE']._serialized_start=4821
+  _globals['_NODE']._serialized_end=5777
+  _globals['_DEVICE']._serialized_start=5780
+  _globals['_DEVICE']._serialized_end=6148
+  _globals['_STATS']._serialized_start=6150
+  _globals['_STATS']._serialized_end=6205
+  _globals['_NODEUTIL']._serialized_start=6207
+  _globals['_NODEUTIL']._serialized_end=6325
+  _globals['_PROTO']._serialized_start=6328
+  _globals['_PROTO']._serialized_end=6473
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,575 @@
+from freeconf.pb import meta_pb2 as _meta_pb2
+from freeconf.pb import common_pb2 as _common_pb2
+from freeconf.pb import val_pb2 as _val_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class SelectionEditOp(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    UPSERT_INTO: _ClassVar[SelectionEditOp]
+    UPSERT_FROM: _ClassVar[SelectionEditOp]
+    INSERT_INTO: _ClassVar[SelectionEditOp]
+    INSERT_FROM: _ClassVar[SelectionEditOp]
+    UPSERT_INTO_SET_DEFAULTS: _ClassVar[SelectionEditOp]
+    UPSERT_FROM_SET_DEFAULTS: _ClassVar[SelectionEditOp]
+    UPDATE_INTO: _ClassVar[SelectionEditOp]
+    UPDATE_FROM: _ClassVar[SelectionEditOp]
+    REPLACE_FROM: _ClassVar[SelectionEditOp]
+    DELETE: _ClassVar[SelectionEditOp]
+    CLEAR_FIELD: _ClassVar[SelectionEditOp]
+
+class NodeHook(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    HOOK_NONE: _ClassVar[NodeHook]
+    HOOK_CONTEXT: _ClassVar[NodeHook]
+    HOOK_RELEASE: _ClassVar[NodeHook]
+    HOOK_BEGIN_EDIT: _ClassVar[NodeHook]
+    HOOK_END_EDIT: _ClassVar[NodeHook]
+UPSERT_INTO: SelectionEditOp
+UPSERT_FROM: SelectionEditOp
+INSERT_INTO: SelectionEditOp
+INSERT_FROM: SelectionEditOp
+UPSERT_INTO_SET_DEFAULTS: SelectionEditOp
+UPSERT_FROM_SET_DEFAULTS: SelectionEditOp
+UPDATE_INTO: SelectionEditOp
+UPDATE_FROM: SelectionEditOp
+REPLACE_FROM: SelectionEditOp
+DELETE: SelectionEditOp
+CLEAR_FIELD: SelectionEditOp
+HOOK_NONE: NodeHook
+HOOK_CONTEXT: NodeHook
+HOOK_RELEASE: NodeHook
+HOOK_BEGIN_EDIT: NodeHook
+HOOK_END_EDIT: NodeHook
+
+class SourceRequest(_message.Message):
+    __slots__ = ("path", "yangInternalYpath", "restconfInternalYpath", "any")
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    YANGINTERNALYPATH_FIELD_NUMBER: _ClassVar[int]
+    RESTCONFINTERNALYPATH_FIELD_NUMBER: _ClassVar[int]
+    ANY_FIELD_NUMBER: _ClassVar[int]
+    path: str
+    yangInternalYpath: bool
+    restconfInternalYpath: bool
+    any: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, path: _Optional[str] = ..., yangInternalYpath: _Optional[bool] = ..., restconfInternalYpath: _Optional[bool] = ..., any: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class SourceResponse(_message.Message):
+    __slots__ = ("sourceHnd",)
+    SOURCEHND_FIELD_NUMBER: _ClassVar[int]
+    sourceHnd: int
+    def __init__(self, sourceHnd: _Optional[int] = ...) -> None: ...
+
+class LoadModuleRequest(_message.Message):
+    __slots__ = ("sourceHnd", "name", "streamHnd")
+    SOURCEHND_FIELD_NUMBER: _ClassVar[int]
+    NAME_FIELD_NUMBER: _ClassVar[int]
+    STREAMHND_FIELD_NUMBER: _ClassVar[int]
+    sourceHnd: int
+    name: str
+    streamHnd: int
+    def __init__(self, sourceHnd: _Optional[int] = ..., name: _Optional[str] = ..., streamHnd: _Optional[int] = ...) -> None: ...
+
+class LoadModuleResponse(_message.Message):
+    __slots__ = ("module", "moduleHnd")
+    MODULE_FIELD_NUMBER: _ClassVar[int]
+    MODULEHND_FIELD_NUMBER: _ClassVar[int]
+    module: _meta_pb2.Module
+    moduleHnd: int
+    def __init__(self, module: _Optional[_Union[_meta_pb2.Module, _Mapping]] = ..., moduleHnd: _Optional[int] = ...) -> None: ...
+
+class ReleaseResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class ReleaseRequest(_message.Message):
+    __slots__ = ("hnd",)
+    HND_FIELD_NUMBER: _ClassVar[int]
+    hnd: int
+    def __init__(self, hnd: _Optional[int] = ...) -> None: ...
+
+class HandleAuditRequest(_message.Message):
+    __slots__ = ("trackSites",)
+    TRACKSITES_FIELD_NUMBER: _ClassVar[int]
+    trackSites: bool
+    def __init__(self, trackSites: _Optional[bool] = ...) -> None: ...
+
+class HandleAuditResponse(_message.Message):
+    __slots__ = ("handles", "heapAlloc", "heapObjects", "goroutines")
+    HANDLES_FIELD_NUMBER: _ClassVar[int]
+    HEAPALLOC_FIELD_NUMBER: _ClassVar[int]
+    HEAPOBJECTS_FIELD_NUMBER: _ClassVar[int]
+    GOROUTINES_FIELD_NUMBER: _ClassVar[int]
+    handles: _containers.RepeatedCompositeFieldContainer[HandleCount]
+    heapAlloc: int
+    heapObjects: int
+    goroutines: int
+    def __init__(self, handles: _Optional[_Iterable[_Union[HandleCount, _Mapping]]] = ..., heapAlloc: _Optional[int] = ..., heapObjects: _Optional[int] = ..., goroutines: _Optional[int] = ...) -> None: ...
+
+class HandleCount(_message.Message):
+    __slots__ = ("type", "site", "count")
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    SITE_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    type: str
+    site: str
+    count: int
+    def __init__(self, type: _Optional[str] = ..., site: _Optional[str] = ..., count: _Optional[int] = ...) -> None: ...
+
+class NewBrowserRequest(_message.Message):
+    __slots__ = ("moduleHnd", "nodeHnd")
+    MODULEHND_FIELD_NUMBER: _ClassVar[int]
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    moduleHnd: int
+    nodeHnd: int
+    def __init__(self, moduleHnd: _Optional[int] = ..., nodeHnd: _Optional[int] = ...) -> None: ...
+
+class NewBrowserResponse(_message.Message):
+    __slots__ = ("browserHnd",)
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    browserHnd: int
+    def __init__(self, browserHnd: _Optional[int] = ...) -> None: ...
+
+class ReleaseSelectionRequest(_message.Message):
+    __slots__ = ("selHnd",)
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    def __init__(self, selHnd: _Optional[int] = ...) -> None: ...
+
+class ReleaseSelectionResponse(_message.Message):
+    __slots__ = ("releasedHnds",)
+    RELEASEDHNDS_FIELD_NUMBER: _ClassVar[int]
+    releasedHnds: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, releasedHnds: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class SelectionEditRequest(_message.Message):
+    __slots__ = ("op", "selHnd", "nodeHnd", "tree", "field")
+    OP_FIELD_NUMBER: _ClassVar[int]
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    TREE_FIELD_NUMBER: _ClassVar[int]
+    FIELD_FIELD_NUMBER: _ClassVar[int]
+    op: SelectionEditOp
+    selHnd: int
+    nodeHnd: int
+    tree: Tree
+    field: str
+    def __init__(self, op: _Optional[_Union[SelectionEditOp, str]] = ..., selHnd: _Optional[int] = ..., nodeHnd: _Optional[int] = ..., tree: _Optional[_Union[Tree, _Mapping]] = ..., field: _Optional[str] = ...) -> None: ...
+
+class SelectionEditResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class BrowserReadCacheRequest(_message.Message):
+    __slots__ = ("browserHnd", "paths", "maxAgeMs")
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    PATHS_FIELD_NUMBER: _ClassVar[int]
+    MAXAGEMS_FIELD_NUMBER: _ClassVar[int]
+    browserHnd: int
+    paths: _containers.RepeatedScalarFieldContainer[str]
+    maxAgeMs: int
+    def __init__(self, browserHnd: _Optional[int] = ..., paths: _Optional[_Iterable[str]] = ..., maxAgeMs: _Optional[int] = ...) -> None: ...
+
+class BrowserReadCacheResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class BrowserInvalidateRequest(_message.Message):
+    __slots__ = ("browserHnd", "path")
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    browserHnd: int
+    path: str
+    def __init__(self, browserHnd: _Optional[int] = ..., path: _Optional[str] = ...) -> None: ...
+
+class BrowserInvalidateResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class BrowserRootRequest(_message.Message):
+    __slots__ = ("browserHnd",)
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    browserHnd: int
+    def __init__(self, browserHnd: _Optional[int] = ...) -> None: ...
+
+class BrowserRootResponse(_message.Message):
+    __slots__ = ("selHnd",)
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    def __init__(self, selHnd: _Optional[int] = ...) -> None: ...
+
+class NewNodeRequest(_message.Message):
+    __slots__ = ("noopHooks",)
+    NOOPHOOKS_FIELD_NUMBER: _ClassVar[int]
+    noopHooks: int
+    def __init__(self, noopHooks: _Optional[int] = ...) -> None: ...
+
+class NewNodeResponse(_message.Message):
+    __slots__ = ("nodeHnd",)
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    nodeHnd: int
+    def __init__(self, nodeHnd: _Optional[int] = ...) -> None: ...
+
+class FindRequest(_message.Message):
+    __slots__ = ("selHnd", "path")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    path: str
+    def __init__(self, selHnd: _Optional[int] = ..., path: _Optional[str] = ...) -> None: ...
+
+class FindResponse(_message.Message):
+    __slots__ = ("selHnd",)
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    def __init__(self, selHnd: _Optional[int] = ...) -> None: ...
+
+class GetRequest(_message.Message):
+    __slots__ = ("selHnd", "path", "depth", "fields")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    DEPTH_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    path: str
+    depth: int
+    fields: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, selHnd: _Optional[int] = ..., path: _Optional[str] = ..., depth: _Optional[int] = ..., fields: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class GetResponse(_message.Message):
+    __slots__ = ("tree",)
+    TREE_FIELD_NUMBER: _ClassVar[int]
+    tree: Tree
+    def __init__(self, tree: _Optional[_Union[Tree, _Mapping]] = ...) -> None: ...
+
+class BatchRequest(_message.Message):
+    __slots__ = ("steps", "stopOnError")
+    STEPS_FIELD_NUMBER: _ClassVar[int]
+    STOPONERROR_FIELD_NUMBER: _ClassVar[int]
+    steps: _containers.RepeatedCompositeFieldContainer[BatchStep]
+    stopOnError: bool
+    def __init__(self, steps: _Optional[_Iterable[_Union[BatchStep, _Mapping]]] = ..., stopOnError: _Optional[bool] = ...) -> None: ...
+
+class BatchStep(_message.Message):
+    __slots__ = ("selStep", "find", "edit", "action", "get", "release")
+    SELSTEP_FIELD_NUMBER: _ClassVar[int]
+    FIND_FIELD_NUMBER: _ClassVar[int]
+    EDIT_FIELD_NUMBER: _ClassVar[int]
+    ACTION_FIELD_NUMBER: _ClassVar[int]
+    GET_FIELD_NUMBER: _ClassVar[int]
+    RELEASE_FIELD_NUMBER: _ClassVar[int]
+    selStep: int
+    find: FindRequest
+    edit: SelectionEditRequest
+    action: ActionRequest
+    get: GetRequest
+    release: ReleaseSelectionRequest
+    def __init__(self, selStep: _Optional[int] = ..., find: _Optional[_Union[FindRequest, _Mapping]] = ..., edit: _Optional[_Union[SelectionEditRequest, _Mapping]] = ..., action: _Optional[_Union[ActionRequest, _Mapping]] = ..., get: _Optional[_Union[GetRequest, _Mapping]] = ..., release: _Optional[_Union[ReleaseSelectionRequest, _Mapping]] = ...) -> None: ...
+
+class BatchResponse(_message.Message):
+    __slots__ = ("results",)
+    RESULTS_FIELD_NUMBER: _ClassVar[int]
+    results: _containers.RepeatedCompositeFieldContainer[BatchResult]
+    def __init__(self, results: _Optional[_Iterable[_Union[BatchResult, _Mapping]]] = ...) -> None: ...
+
+class BatchResult(_message.Message):
+    __slots__ = ("selHnd", "tree", "releasedHnds", "error", "skipped")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    TREE_FIELD_NUMBER: _ClassVar[int]
+    RELEASEDHNDS_FIELD_NUMBER: _ClassVar[int]
+    ERROR_FIELD_NUMBER: _ClassVar[int]
+    SKIPPED_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    tree: Tree
+    releasedHnds: _containers.RepeatedScalarFieldContainer[int]
+    error: str
+    skipped: bool
+    def __init__(self, selHnd: _Optional[int] = ..., tree: _Optional[_Union[Tree, _Mapping]] = ..., releasedHnds: _Optional[_Iterable[int]] = ..., error: _Optional[str] = ..., skipped: _Optional[bool] = ...) -> None: ...
+
+class Tree(_message.Message):
+    __slots__ = ("val", "fields", "isList", "items")
+    VAL_FIELD_NUMBER: _ClassVar[int]
+    FIELDS_FIELD_NUMBER: _ClassVar[int]
+    ISLIST_FIELD_NUMBER: _ClassVar[int]
+    ITEMS_FIELD_NUMBER: _ClassVar[int]
+    val: _val_pb2.Val
+    fields: _containers.RepeatedCompositeFieldContainer[TreeField]
+    isList: bool
+    items: _containers.RepeatedCompositeFieldContainer[Tree]
+    def __init__(self, val: _Optional[_Union[_val_pb2.Val, _Mapping]] = ..., fields: _Optional[_Iterable[_Union[TreeField, _Mapping]]] = ..., isList: _Optional[bool] = ..., items: _Optional[_Iterable[_Union[Tree, _Mapping]]] = ...) -> None: ...
+
+class TreeField(_message.Message):
+    __slots__ = ("ident", "tree")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    TREE_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    tree: Tree
+    def __init__(self, ident: _Optional[str] = ..., tree: _Optional[_Union[Tree, _Mapping]] = ...) -> None: ...
+
+class ActionRequest(_message.Message):
+    __slots__ = ("selHnd", "inputNodeHnd")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    INPUTNODEHND_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    inputNodeHnd: int
+    def __init__(self, selHnd: _Optional[int] = ..., inputNodeHnd: _Optional[int] = ...) -> None: ...
+
+class ActionResponse(_message.Message):
+    __slots__ = ("outputSelHnd",)
+    OUTPUTSELHND_FIELD_NUMBER: _ClassVar[int]
+    outputSelHnd: int
+    def __init__(self, outputSelHnd: _Optional[int] = ...) -> None: ...
+
+class GetBrowserRequest(_message.Message):
+    __slots__ = ("browserHnd",)
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    browserHnd: int
+    def __init__(self, browserHnd: _Optional[int] = ...) -> None: ...
+
+class GetBrowserResponse(_message.Message):
+    __slots__ = ("moduleHnd",)
+    MODULEHND_FIELD_NUMBER: _ClassVar[int]
+    moduleHnd: int
+    def __init__(self, moduleHnd: _Optional[int] = ...) -> None: ...
+
+class GetModuleRequest(_message.Message):
+    __slots__ = ("moduleHnd",)
+    MODULEHND_FIELD_NUMBER: _ClassVar[int]
+    moduleHnd: int
+    def __init__(self, moduleHnd: _Optional[int] = ...) -> None: ...
+
+class GetModuleResponse(_message.Message):
+    __slots__ = ("module",)
+    MODULE_FIELD_NUMBER: _ClassVar[int]
+    module: _meta_pb2.Module
+    def __init__(self, module: _Optional[_Union[_meta_pb2.Module, _Mapping]] = ...) -> None: ...
+
+class GetSelectionRequest(_message.Message):
+    __slots__ = ("selHnd",)
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    def __init__(self, selHnd: _Optional[int] = ...) -> None: ...
+
+class GetSelectionResponse(_message.Message):
+    __slots__ = ("nodeHnd", "remoteNode", "browserHnd", "insideList", "path")
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    REMOTENODE_FIELD_NUMBER: _ClassVar[int]
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    INSIDELIST_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    nodeHnd: int
+    remoteNode: bool
+    browserHnd: int
+    insideList: bool
+    path: _common_pb2.Path
+    def __init__(self, nodeHnd: _Optional[int] = ..., remoteNode: _Optional[bool] = ..., browserHnd: _Optional[int] = ..., insideList: _Optional[bool] = ..., path: _Optional[_Union[_common_pb2.Path, _Mapping]] = ...) -> None: ...
+
+class NotificationRequest(_message.Message):
+    __slots__ = ("selHnd", "filter")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    FILTER_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    filter: str
+    def __init__(self, selHnd: _Optional[int] = ..., filter: _Optional[str] = ...) -> None: ...
+
+class NotificationResponse(_message.Message):
+    __slots__ = ("selHnd", "when")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    WHEN_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    when: int
+    def __init__(self, selHnd: _Optional[int] = ..., when: _Optional[int] = ...) -> None: ...
+
+class ClientRequest(_message.Message):
+    __slots__ = ("ypathHnd", "address", "poolSize", "idleTimeoutMs", "noKeepAlive", "cache")
+    YPATHHND_FIELD_NUMBER: _ClassVar[int]
+    ADDRESS_FIELD_NUMBER: _ClassVar[int]
+    POOLSIZE_FIELD_NUMBER: _ClassVar[int]
+    IDLETIMEOUTMS_FIELD_NUMBER: _ClassVar[int]
+    NOKEEPALIVE_FIELD_NUMBER: _ClassVar[int]
+    CACHE_FIELD_NUMBER: _ClassVar[int]
+    ypathHnd: int
+    address: str
+    poolSize: int
+    idleTimeoutMs: int
+    noKeepAlive: bool
+    cache: _containers.RepeatedCompositeFieldContainer[ClientCache]
+    def __init__(self, ypathHnd: _Optional[int] = ..., address: _Optional[str] = ..., poolSize: _Optional[int] = ..., idleTimeoutMs: _Optional[int] = ..., noKeepAlive: _Optional[bool] = ..., cache: _Optional[_Iterable[_Union[ClientCache, _Mapping]]] = ...) -> None: ...
+
+class ClientCache(_message.Message):
+    __slots__ = ("path", "ttlMs")
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    TTLMS_FIELD_NUMBER: _ClassVar[int]
+    path: str
+    ttlMs: int
+    def __init__(self, path: _Optional[str] = ..., ttlMs: _Optional[int] = ...) -> None: ...
+
+class ClientResponse(_message.Message):
+    __slots__ = ("deviceHnd",)
+    DEVICEHND_FIELD_NUMBER: _ClassVar[int]
+    deviceHnd: int
+    def __init__(self, deviceHnd: _Optional[int] = ...) -> None: ...
+
+class NewDeviceRequest(_message.Message):
+    __slots__ = ("yangPathSourceHnd",)
+    YANGPATHSOURCEHND_FIELD_NUMBER: _ClassVar[int]
+    yangPathSourceHnd: int
+    def __init__(self, yangPathSourceHnd: _Optional[int] = ...) -> None: ...
+
+class NewDeviceResponse(_message.Message):
+    __slots__ = ("deviceHnd",)
+    DEVICEHND_FIELD_NUMBER: _ClassVar[int]
+    deviceHnd: int
+    def __init__(self, deviceHnd: _Optional[int] = ...) -> None: ...
+
+class DeviceAddBrowserRequest(_message.Message):
+    __slots__ = ("deviceHnd", "browserHnd")
+    DEVICEHND_FIELD_NUMBER: _ClassVar[int]
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    deviceHnd: int
+    browserHnd: int
+    def __init__(self, deviceHnd: _Optional[int] = ..., browserHnd: _Optional[int] = ...) -> None: ...
+
+class DeviceAddBrowserResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class DeviceGetBrowserRequest(_message.Message):
+    __slots__ = ("deviceHnd", "moduleIdent")
+    DEVICEHND_FIELD_NUMBER: _ClassVar[int]
+    MODULEIDENT_FIELD_NUMBER: _ClassVar[int]
+    deviceHnd: int
+    moduleIdent: str
+    def __init__(self, deviceHnd: _Optional[int] = ..., moduleIdent: _Optional[str] = ...) -> None: ...
+
+class DeviceGetBrowserResponse(_message.Message):
+    __slots__ = ("browserHnd",)
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    browserHnd: int
+    def __init__(self, browserHnd: _Optional[int] = ...) -> None: ...
+
+class ApplyStartupConfigRequest(_message.Message):
+    __slots__ = ("deviceHnd", "streamHnd")
+    DEVICEHND_FIELD_NUMBER: _ClassVar[int]
+    STREAMHND_FIELD_NUMBER: _ClassVar[int]
+    deviceHnd: int
+    streamHnd: int
+    def __init__(self, deviceHnd: _Optional[int] = ..., streamHnd: _Optional[int] = ...) -> None: ...
+
+class ApplyStartupConfigResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class StatsRequest(_message.Message):
+    __slots__ = ("reset",)
+    RESET_FIELD_NUMBER: _ClassVar[int]
+    reset: bool
+    def __init__(self, reset: _Optional[bool] = ...) -> None: ...
+
+class StatsResponse(_message.Message):
+    __slots__ = ("calls", "xCalls", "handles", "openNotifications", "notificationSubscribers", "readCacheHits", "readCacheMisses", "clientCacheHits", "clientCacheRevalidated", "clientCacheMisses", "responseCacheHits", "responseCacheNotModified", "responseCacheMisses", "latencyBucketsNs")
+    CALLS_FIELD_NUMBER: _ClassVar[int]
+    XCALLS_FIELD_NUMBER: _ClassVar[int]
+    HANDLES_FIELD_NUMBER: _ClassVar[int]
+    OPENNOTIFICATIONS_FIELD_NUMBER: _ClassVar[int]
+    NOTIFICATIONSUBSCRIBERS_FIELD_NUMBER: _ClassVar[int]
+    READCACHEHITS_FIELD_NUMBER: _ClassVar[int]
+    READCACHEMISSES_FIELD_NUMBER: _ClassVar[int]
+    CLIENTCACHEHITS_FIELD_NUMBER: _ClassVar[int]
+    CLIENTCACHEREVALIDATED_FIELD_NUMBER: _ClassVar[int]
+    CLIENTCACHEMISSES_FIELD_NUMBER: _ClassVar[int]
+    RESPONSECACHEHITS_FIELD_NUMBER: _ClassVar[int]
+    RESPONSECACHENOTMODIFIED_FIELD_NUMBER: _ClassVar[int]
+    RESPONSECACHEMISSES_FIELD_NUMBER: _ClassVar[int]
+    LATENCYBUCKETSNS_FIELD_NUMBER: _ClassVar[int]
+    calls: _containers.RepeatedCompositeFieldContainer[CallStat]
+    xCalls: _containers.RepeatedCompositeFieldContainer[CallStat]
+    handles: int
+    openNotifications: int
+    notificationSubscribers: int
+    readCacheHits: int
+    readCacheMisses: int
+    clientCacheHits: int
+    clientCacheRevalidated: int
+    clientCacheMisses: int
+    responseCacheHits: int
+    responseCacheNotModified: int
+    responseCacheMisses: int
+    latencyBucketsNs: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, calls: _Optional[_Iterable[_Union[CallStat, _Mapping]]] = ..., xCalls: _Optional[_Iterable[_Union[CallStat, _Mapping]]] = ..., handles: _Optional[int] = ..., openNotifications: _Optional[int] = ..., notificationSubscribers: _Optional[int] = ..., readCacheHits: _Optional[int] = ..., readCacheMisses: _Optional[int] = ..., clientCacheHits: _Optional[int] = ..., clientCacheRevalidated: _Optional[int] = ..., clientCacheMisses: _Optional[int] = ..., responseCacheHits: _Optional[int] = ..., responseCacheNotModified: _Optional[int] = ..., responseCacheMisses: _Optional[int] = ..., latencyBucketsNs: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class CallStat(_message.Message):
+    __slots__ = ("method", "count", "meanNs", "p50Ns", "p99Ns", "opened", "buckets")
+    METHOD_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    MEANNS_FIELD_NUMBER: _ClassVar[int]
+    P50NS_FIELD_NUMBER: _ClassVar[int]
+    P99NS_FIELD_NUMBER: _ClassVar[int]
+    OPENED_FIELD_NUMBER: _ClassVar[int]
+    BUCKETS_FIELD_NUMBER: _ClassVar[int]
+    method: str
+    count: int
+    meanNs: int
+    p50Ns: int
+    p99Ns: int
+    opened: int
+    buckets: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, method: _Optional[str] = ..., count: _Optional[int] = ..., meanNs: _Optional[int] = ..., p50Ns: _Optional[int] = ..., p99Ns: _Optional[int] = ..., opened: _Optional[int] = ..., buckets: _Optional[_Iterable[int]] = ...) -> None: ...
+
+class JSONRdrRequest(_message.Message):
+    __slots__ = ("streamHnd",)
+    STREAMHND_FIELD_NUMBER: _ClassVar[int]
+    streamHnd: int
+    def __init__(self, streamHnd: _Optional[int] = ...) -> None: ...
+
+class JSONRdrResponse(_message.Message):
+    __slots__ = ("nodeHnd",)
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    nodeHnd: int
+    def __init__(self, nodeHnd: _Optional[int] = ...) -> None: ...
+
+class JSONWtrRequest(_message.Message):
+    __slots__ = ("streamHnd",)
+    STREAMHND_FIELD_NUMBER: _ClassVar[int]
+    streamHnd: int
+    def __init__(self, streamHnd: _Optional[int] = ...) -> None: ...
+
+class JSONWtrResponse(_message.Message):
+    __slots__ = ("nodeHnd",)
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    nodeHnd: int
+    def __init__(self, nodeHnd: _Optional[int] = ...) -> None: ...
+
+class RestconfServerRequest(_message.Message):
+    __slots__ = ("deviceHnd", "cacheResponses", "cacheMaxAgeMs")
+    DEVICEHND_FIELD_NUMBER: _ClassVar[int]
+    CACHERESPONSES_FIELD_NUMBER: _ClassVar[int]
+    CACHEMAXAGEMS_FIELD_NUMBER: _ClassVar[int]
+    deviceHnd: int
+    cacheResponses: bool
+    cacheMaxAgeMs: int
+    def __init__(self, deviceHnd: _Optional[int] = ..., cacheResponses: _Optional[bool] = ..., cacheMaxAgeMs: _Optional[int] = ...) -> None: ...
+
+class RestconfServerResponse(_message.Message):
+    __slots__ = ("serverHnd",)
+    SERVERHND_FIELD_NUMBER: _ClassVar[int]
+    serverHnd: int
+    def __init__(self, serverHnd: _Optional[int] = ...) -> None: ...
+
+class GnmiServerRequest(_message.Message):
+    __slots__ = ("deviceHnd",)
+    DEVICEHND_FIELD_NUMBER: _ClassVar[int]
+    deviceHnd: int
+    def __init__(self, deviceHnd: _Optional[int] = ...) -> None: ...
+
+class GnmiServerResponse(_message.Message):
+    __slots__ = ("serverHnd",)
+    SERVERHND_FIELD_NUMBER: _ClassVar[int]
+    serverHnd: int
+    def __init__(self, serverHnd: _Optional[int] = ...) -> None: ...
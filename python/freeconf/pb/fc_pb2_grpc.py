@@ -0,0 +1,1520 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from freeconf.pb import fc_pb2 as freeconf_dot_pb_dot_fc__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in freeconf/pb/fc_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class ParserStub:
+    """
+    FreeCONF full developer API made available thru gRPC.  Services are roughly broken
+    up by package.
+
+    //////////
+    Parser
+
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Source = channel.unary_unary(
+                '/pb.Parser/Source',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.SourceRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.SourceResponse.FromString,
+                _registered_method=True)
+        self.LoadModule = channel.unary_unary(
+                '/pb.Parser/LoadModule',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.LoadModuleRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.LoadModuleResponse.FromString,
+                _registered_method=True)
+
+
+class ParserServicer:
+    """
+    FreeCONF full developer API made available thru gRPC.  Services are roughly broken
+    up by package.
+
+    //////////
+    Parser
+
+    """
+
+    def Source(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def LoadModule(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ParserServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Source': grpc.unary_unary_rpc_method_handler(
+                    servicer.Source,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.SourceRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.SourceResponse.SerializeToString,
+            ),
+            'LoadModule': grpc.unary_unary_rpc_method_handler(
+                    servicer.LoadModule,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.LoadModuleRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.LoadModuleResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.Parser', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.Parser', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Parser:
+    """
+    FreeCONF full developer API made available thru gRPC.  Services are roughly broken
+    up by package.
+
+    //////////
+    Parser
+
+    """
+
+    @staticmethod
+    def Source(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Parser/Source',
+            freeconf_dot_pb_dot_fc__pb2.SourceRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.SourceResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def LoadModule(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Parser/LoadModule',
+            freeconf_dot_pb_dot_fc__pb2.LoadModuleRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.LoadModuleResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class HandlesStub:
+    """//////////
+    Handles
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Release = channel.unary_unary(
+                '/pb.Handles/Release',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.ReleaseRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.ReleaseResponse.FromString,
+                _registered_method=True)
+        self.Audit = channel.unary_unary(
+                '/pb.Handles/Audit',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.HandleAuditRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.HandleAuditResponse.FromString,
+                _registered_method=True)
+
+
+class HandlesServicer:
+    """//////////
+    Handles
+    """
+
+    def Release(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Audit(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_HandlesServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Release': grpc.unary_unary_rpc_method_handler(
+                    servicer.Release,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.ReleaseRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.ReleaseResponse.SerializeToString,
+            ),
+            'Audit': grpc.unary_unary_rpc_method_handler(
+                    servicer.Audit,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.HandleAuditRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.HandleAuditResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.Handles', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.Handles', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Handles:
+    """//////////
+    Handles
+    """
+
+    @staticmethod
+    def Release(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Handles/Release',
+            freeconf_dot_pb_dot_fc__pb2.ReleaseRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.ReleaseResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Audit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Handles/Audit',
+            freeconf_dot_pb_dot_fc__pb2.HandleAuditRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.HandleAuditResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class NodeStub:
+    """//////////
+
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.NewBrowser = channel.unary_unary(
+                '/pb.Node/NewBrowser',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.NewBrowserRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.NewBrowserResponse.FromString,
+                _registered_method=True)
+        self.BrowserRoot = channel.unary_unary(
+                '/pb.Node/BrowserRoot',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.BrowserRootRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.BrowserRootResponse.FromString,
+                _registered_method=True)
+        self.SelectionEdit = channel.unary_unary(
+                '/pb.Node/SelectionEdit',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.SelectionEditRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.SelectionEditResponse.FromString,
+                _registered_method=True)
+        self.Action = channel.unary_unary(
+                '/pb.Node/Action',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.ActionRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.ActionResponse.FromString,
+                _registered_method=True)
+        self.Notification = channel.unary_stream(
+                '/pb.Node/Notification',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.NotificationRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.NotificationResponse.FromString,
+                _registered_method=True)
+        self.Find = channel.unary_unary(
+                '/pb.Node/Find',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.FindRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.FindResponse.FromString,
+                _registered_method=True)
+        self.Get = channel.unary_unary(
+                '/pb.Node/Get',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.GetRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.GetResponse.FromString,
+                _registered_method=True)
+        self.Batch = channel.unary_unary(
+                '/pb.Node/Batch',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.BatchRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.BatchResponse.FromString,
+                _registered_method=True)
+        self.NewNode = channel.unary_unary(
+                '/pb.Node/NewNode',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.NewNodeRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.NewNodeResponse.FromString,
+                _registered_method=True)
+        self.GetBrowser = channel.unary_unary(
+                '/pb.Node/GetBrowser',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.GetBrowserRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.GetBrowserResponse.FromString,
+                _registered_method=True)
+        self.GetModule = channel.unary_unary(
+                '/pb.Node/GetModule',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.GetModuleRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.GetModuleResponse.FromString,
+                _registered_method=True)
+        self.GetSelection = channel.unary_unary(
+                '/pb.Node/GetSelection',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.GetSelectionRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.GetSelectionResponse.FromString,
+                _registered_method=True)
+        self.ReleaseSelection = channel.unary_unary(
+                '/pb.Node/ReleaseSelection',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.ReleaseSelectionRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.ReleaseSelectionResponse.FromString,
+                _registered_method=True)
+        self.BrowserReadCache = channel.unary_unary(
+                '/pb.Node/BrowserReadCache',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.BrowserReadCacheRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.BrowserReadCacheResponse.FromString,
+                _registered_method=True)
+        self.BrowserInvalidate = channel.unary_unary(
+                '/pb.Node/BrowserInvalidate',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.BrowserInvalidateRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.BrowserInvalidateResponse.FromString,
+                _registered_method=True)
+
+
+class NodeServicer:
+    """//////////
+
+    """
+
+    def NewBrowser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BrowserRoot(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SelectionEdit(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Action(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Notification(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Find(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Get(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Batch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def NewNode(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetBrowser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetModule(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetSelection(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReleaseSelection(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BrowserReadCache(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BrowserInvalidate(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_NodeServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'NewBrowser': grpc.unary_unary_rpc_method_handler(
+                    servicer.NewBrowser,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.NewBrowserRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.NewBrowserResponse.SerializeToString,
+            ),
+            'BrowserRoot': grpc.unary_unary_rpc_method_handler(
+                    servicer.BrowserRoot,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.BrowserRootRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.BrowserRootResponse.SerializeToString,
+            ),
+            'SelectionEdit': grpc.unary_unary_rpc_method_handler(
+                    servicer.SelectionEdit,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.SelectionEditRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.SelectionEditResponse.SerializeToString,
+            ),
+            'Action': grpc.unary_unary_rpc_method_handler(
+                    servicer.Action,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.ActionRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.ActionResponse.SerializeToString,
+            ),
+            'Notification': grpc.unary_stream_rpc_method_handler(
+                    servicer.Notification,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.NotificationRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.NotificationResponse.SerializeToString,
+            ),
+            'Find': grpc.unary_unary_rpc_method_handler(
+                    servicer.Find,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.FindRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.FindResponse.SerializeToString,
+            ),
+            'Get': grpc.unary_unary_rpc_method_handler(
+                    servicer.Get,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.GetRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.GetResponse.SerializeToString,
+            ),
+            'Batch': grpc.unary_unary_rpc_method_handler(
+                    servicer.Batch,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.BatchRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.BatchResponse.SerializeToString,
+            ),
+            'NewNode': grpc.unary_unary_rpc_method_handler(
+                    servicer.NewNode,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.NewNodeRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.NewNodeResponse.SerializeToString,
+            ),
+            'GetBrowser': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBrowser,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.GetBrowserRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.GetBrowserResponse.SerializeToString,
+            ),
+            'GetModule': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetModule,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.GetModuleRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.GetModuleResponse.SerializeToString,
+            ),
+            'GetSelection': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetSelection,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.GetSelectionRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.GetSelectionResponse.SerializeToString,
+            ),
+            'ReleaseSelection': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReleaseSelection,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.ReleaseSelectionRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.ReleaseSelectionResponse.SerializeToString,
+            ),
+            'BrowserReadCache': grpc.unary_unary_rpc_method_handler(
+                    servicer.BrowserReadCache,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.BrowserReadCacheRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.BrowserReadCacheResponse.SerializeToString,
+            ),
+            'BrowserInvalidate': grpc.unary_unary_rpc_method_handler(
+                    servicer.BrowserInvalidate,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.BrowserInvalidateRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.BrowserInvalidateResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.Node', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.Node', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Node:
+    """//////////
+
+    """
+
+    @staticmethod
+    def NewBrowser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/NewBrowser',
+            freeconf_dot_pb_dot_fc__pb2.NewBrowserRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.NewBrowserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BrowserRoot(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/BrowserRoot',
+            freeconf_dot_pb_dot_fc__pb2.BrowserRootRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.BrowserRootResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SelectionEdit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/SelectionEdit',
+            freeconf_dot_pb_dot_fc__pb2.SelectionEditRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.SelectionEditResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Action(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/Action',
+            freeconf_dot_pb_dot_fc__pb2.ActionRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.ActionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Notification(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/pb.Node/Notification',
+            freeconf_dot_pb_dot_fc__pb2.NotificationRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.NotificationResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Find(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/Find',
+            freeconf_dot_pb_dot_fc__pb2.FindRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.FindResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Get(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/Get',
+            freeconf_dot_pb_dot_fc__pb2.GetRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.GetResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Batch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/Batch',
+            freeconf_dot_pb_dot_fc__pb2.BatchRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.BatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def NewNode(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/NewNode',
+            freeconf_dot_pb_dot_fc__pb2.NewNodeRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.NewNodeResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetBrowser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/GetBrowser',
+            freeconf_dot_pb_dot_fc__pb2.GetBrowserRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.GetBrowserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetModule(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/GetModule',
+            freeconf_dot_pb_dot_fc__pb2.GetModuleRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.GetModuleResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetSelection(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/GetSelection',
+            freeconf_dot_pb_dot_fc__pb2.GetSelectionRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.GetSelectionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReleaseSelection(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/ReleaseSelection',
+            freeconf_dot_pb_dot_fc__pb2.ReleaseSelectionRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.ReleaseSelectionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BrowserReadCache(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/BrowserReadCache',
+            freeconf_dot_pb_dot_fc__pb2.BrowserReadCacheRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.BrowserReadCacheResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BrowserInvalidate(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Node/BrowserInvalidate',
+            freeconf_dot_pb_dot_fc__pb2.BrowserInvalidateRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.BrowserInvalidateResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class DeviceStub:
+    """//////////
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.NewDevice = channel.unary_unary(
+                '/pb.Device/NewDevice',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.NewDeviceRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.NewDeviceResponse.FromString,
+                _registered_method=True)
+        self.DeviceAddBrowser = channel.unary_unary(
+                '/pb.Device/DeviceAddBrowser',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.DeviceAddBrowserRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.DeviceAddBrowserResponse.FromString,
+                _registered_method=True)
+        self.DeviceGetBrowser = channel.unary_unary(
+                '/pb.Device/DeviceGetBrowser',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.DeviceGetBrowserRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.DeviceGetBrowserResponse.FromString,
+                _registered_method=True)
+        self.ApplyStartupConfig = channel.unary_unary(
+                '/pb.Device/ApplyStartupConfig',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.ApplyStartupConfigRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.ApplyStartupConfigResponse.FromString,
+                _registered_method=True)
+        self.Client = channel.unary_unary(
+                '/pb.Device/Client',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.ClientRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.ClientResponse.FromString,
+                _registered_method=True)
+
+
+class DeviceServicer:
+    """//////////
+    """
+
+    def NewDevice(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeviceAddBrowser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeviceGetBrowser(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ApplyStartupConfig(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Client(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_DeviceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'NewDevice': grpc.unary_unary_rpc_method_handler(
+                    servicer.NewDevice,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.NewDeviceRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.NewDeviceResponse.SerializeToString,
+            ),
+            'DeviceAddBrowser': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeviceAddBrowser,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.DeviceAddBrowserRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.DeviceAddBrowserResponse.SerializeToString,
+            ),
+            'DeviceGetBrowser': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeviceGetBrowser,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.DeviceGetBrowserRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.DeviceGetBrowserResponse.SerializeToString,
+            ),
+            'ApplyStartupConfig': grpc.unary_unary_rpc_method_handler(
+                    servicer.ApplyStartupConfig,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.ApplyStartupConfigRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.ApplyStartupConfigResponse.SerializeToString,
+            ),
+            'Client': grpc.unary_unary_rpc_method_handler(
+                    servicer.Client,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.ClientRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.ClientResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.Device', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.Device', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Device:
+    """//////////
+    """
+
+    @staticmethod
+    def NewDevice(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Device/NewDevice',
+            freeconf_dot_pb_dot_fc__pb2.NewDeviceRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.NewDeviceResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeviceAddBrowser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Device/DeviceAddBrowser',
+            freeconf_dot_pb_dot_fc__pb2.DeviceAddBrowserRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.DeviceAddBrowserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeviceGetBrowser(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Device/DeviceGetBrowser',
+            freeconf_dot_pb_dot_fc__pb2.DeviceGetBrowserRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.DeviceGetBrowserResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ApplyStartupConfig(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Device/ApplyStartupConfig',
+            freeconf_dot_pb_dot_fc__pb2.ApplyStartupConfigRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.ApplyStartupConfigResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Client(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Device/Client',
+            freeconf_dot_pb_dot_fc__pb2.ClientRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.ClientResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class StatsStub:
+    """//////////
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.Stats = channel.unary_unary(
+                '/pb.Stats/Stats',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.StatsRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.StatsResponse.FromString,
+                _registered_method=True)
+
+
+class StatsServicer:
+    """//////////
+    """
+
+    def Stats(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_StatsServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'Stats': grpc.unary_unary_rpc_method_handler(
+                    servicer.Stats,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.StatsRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.StatsResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.Stats', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.Stats', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Stats:
+    """//////////
+    """
+
+    @staticmethod
+    def Stats(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Stats/Stats',
+            freeconf_dot_pb_dot_fc__pb2.StatsRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.StatsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class NodeUtilStub:
+    """//////////
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.JSONRdr = channel.unary_unary(
+                '/pb.NodeUtil/JSONRdr',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.JSONRdrRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.JSONRdrResponse.FromString,
+                _registered_method=True)
+        self.JSONWtr = channel.unary_unary(
+                '/pb.NodeUtil/JSONWtr',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.JSONWtrRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.JSONWtrResponse.FromString,
+                _registered_method=True)
+
+
+class NodeUtilServicer:
+    """//////////
+    """
+
+    def JSONRdr(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def JSONWtr(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_NodeUtilServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'JSONRdr': grpc.unary_unary_rpc_method_handler(
+                    servicer.JSONRdr,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.JSONRdrRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.JSONRdrResponse.SerializeToString,
+            ),
+            'JSONWtr': grpc.unary_unary_rpc_method_handler(
+                    servicer.JSONWtr,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.JSONWtrRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.JSONWtrResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.NodeUtil', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.NodeUtil', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class NodeUtil:
+    """//////////
+    """
+
+    @staticmethod
+    def JSONRdr(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.NodeUtil/JSONRdr',
+            freeconf_dot_pb_dot_fc__pb2.JSONRdrRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.JSONRdrResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def JSONWtr(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.NodeUtil/JSONWtr',
+            freeconf_dot_pb_dot_fc__pb2.JSONWtrRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.JSONWtrResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class ProtoStub:
+    """//////////
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.RestconfServer = channel.unary_unary(
+                '/pb.Proto/RestconfServer',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.RestconfServerRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.RestconfServerResponse.FromString,
+                _registered_method=True)
+        self.GnmiServer = channel.unary_unary(
+                '/pb.Proto/GnmiServer',
+                request_serializer=freeconf_dot_pb_dot_fc__pb2.GnmiServerRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__pb2.GnmiServerResponse.FromString,
+                _registered_method=True)
+
+
+class ProtoServicer:
+    """//////////
+    """
+
+    def RestconfServer(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GnmiServer(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_ProtoServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'RestconfServer': grpc.unary_unary_rpc_method_handler(
+                    servicer.RestconfServer,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.RestconfServerRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.RestconfServerResponse.SerializeToString,
+            ),
+            'GnmiServer': grpc.unary_unary_rpc_method_handler(
+                    servicer.GnmiServer,
+                    request_deserializer=freeconf_dot_pb_dot_fc__pb2.GnmiServerRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__pb2.GnmiServerResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.Proto', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.Proto', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class Proto:
+    """//////////
+    """
+
+    @staticmethod
+    def RestconfServer(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Proto/RestconfServer',
+            freeconf_dot_pb_dot_fc__pb2.RestconfServerRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.RestconfServerResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GnmiServer(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.Proto/GnmiServer',
+            freeconf_dot_pb_dot_fc__pb2.GnmiServerRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__pb2.GnmiServerResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: freeconf/pb/fc-test.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'freeconf/pb/fc-test.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x19\x66reeconf/pb/fc-test.proto\x12\x02pb\"\x19\n\x17\x46inalizeTestCaseRequest\"\x1a\n\x18\x46inalizeTestCaseResponse\"J\n\x15\x43reateTestCaseRequest\x12\x1e\n\x08testCase\x18\x02 \x01(\x0e\x32\x0c.pb.TestCase\x12\x11\n\ttraceFile\x18\x03 \x01(\t\")\n\x16\x43reateTestCaseResponse\x12\x0f\n\x07nodeHnd\x18\x01 \x01(\x04\"6\n\x12ParseModuleRequest\x12\x0b\n\x03\x64ir\x18\x01 \x01(\t\x12\x13\n\x0bmoduleIdent\x18\x02 \x01(\t\",\n\x13ParseModuleResponse\x12\x15\n\rschemaNodeHnd\x18\x01 \x01(\x04\"^\n\x11ThroughputRequest\x12\x1e\n\x08testCase\x18\x01 \x01(\x0e\x32\x0c.pb.TestCase\x12\r\n\x05\x63ount\x18\x02 \x01(\x03\x12\x0b\n\x03\x64ir\x18\x03 \x01(\t\x12\r\n\x05input\x18\x04 \x01(\t\"\'\n\x12ThroughputResponse\x12\x11\n\telapsedNs\x18\x01 \x01(\x03*<\n\x08TestCase\x12\t\n\x05\x42\x41SIC\x10\x00\x12\x08\n\x04\x45\x43HO\x10\x01\x12\x0c\n\x08\x41\x44VANCED\x10\x02\x12\r\n\tVAL_TYPES\x10\x03\x32\xaa\x02\n\x0bTestHarness\x12I\n\x0e\x43reateTestCase\x12\x19.pb.CreateTestCaseRequest\x1a\x1a.pb.CreateTestCaseResponse\"\x00\x12O\n\x10\x46inalizeTestCase\x12\x1b.pb.FinalizeTestCaseRequest\x1a\x1c.pb.FinalizeTestCaseResponse\"\x00\x12@\n\x0bParseModule\x12\x16.pb.ParseModuleRequest\x1a\x17.pb.ParseModuleResponse\"\x00\x12=\n\nThroughput\x12\x15.pb.ThroughputRequest\x1a\x16.pb.ThroughputResponse\"\x00\x42\x06Z\x04./pbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'freeconf.pb.fc_test_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z\004./pb'
+  _globals['_TESTCASE']._serialized_start=446
+  _globals['_TESTCASE']._serialized_end=506
+  _globals['_FINALIZETESTCASEREQUEST']._serialized_start=33
+  _globals['_FINALIZETESTCASEREQUEST']._serialized_end=58
+  _globals['_FINALIZETESTCASERESPONSE']._serialized_start=60
+  _globals['_FINALIZETESTCASERESPONSE']._serialized_end=86
+  _globals['_CREATETESTCASEREQUEST']._serialized_start=88
+  _globals['_CREATETESTCASEREQUEST']._serialized_end=162
+  _globals['_CREATETESTCASERESPONSE']._serialized_start=164
+  _globals['_CREATETESTCASERESPONSE']._serialized_end=205
+  _globals['_PARSEMODULEREQUEST']._serialized_start=207
+  _globals['_PARSEMODULEREQUEST']._serialized_end=261
+  _globals['_PARSEMODULERESPONSE']._serialized_start=263
+  _globals['_PARSEMODULERESPONSE']._serialized_end=307
+  _globals['_THROUGHPUTREQUEST']._serialized_start=309
+  _globals['_THROUGHPUTREQUEST']._serialized_end=403
+  _globals['_THROUGHPUTRESPONSE']._serialized_start=405
+  _globals['_THROUGHPUTRESPONSE']._serialized_end=444
+  _globals['_TESTHARNESS']._serialized_start=509
+  _globals['_TESTHARNESS']._serialized_end=807
+# @@protoc_insertion_point(module_scope)
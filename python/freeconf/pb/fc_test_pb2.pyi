@@ -0,0 +1,71 @@
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class TestCase(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    BASIC: _ClassVar[TestCase]
+    ECHO: _ClassVar[TestCase]
+    ADVANCED: _ClassVar[TestCase]
+    VAL_TYPES: _ClassVar[TestCase]
+BASIC: TestCase
+ECHO: TestCase
+ADVANCED: TestCase
+VAL_TYPES: TestCase
+
+class FinalizeTestCaseRequest(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class FinalizeTestCaseResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class CreateTestCaseRequest(_message.Message):
+    __slots__ = ("testCase", "traceFile")
+    TESTCASE_FIELD_NUMBER: _ClassVar[int]
+    TRACEFILE_FIELD_NUMBER: _ClassVar[int]
+    testCase: TestCase
+    traceFile: str
+    def __init__(self, testCase: _Optional[_Union[TestCase, str]] = ..., traceFile: _Optional[str] = ...) -> None: ...
+
+class CreateTestCaseResponse(_message.Message):
+    __slots__ = ("nodeHnd",)
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    nodeHnd: int
+    def __init__(self, nodeHnd: _Optional[int] = ...) -> None: ...
+
+class ParseModuleRequest(_message.Message):
+    __slots__ = ("dir", "moduleIdent")
+    DIR_FIELD_NUMBER: _ClassVar[int]
+    MODULEIDENT_FIELD_NUMBER: _ClassVar[int]
+    dir: str
+    moduleIdent: str
+    def __init__(self, dir: _Optional[str] = ..., moduleIdent: _Optional[str] = ...) -> None: ...
+
+class ParseModuleResponse(_message.Message):
+    __slots__ = ("schemaNodeHnd",)
+    SCHEMANODEHND_FIELD_NUMBER: _ClassVar[int]
+    schemaNodeHnd: int
+    def __init__(self, schemaNodeHnd: _Optional[int] = ...) -> None: ...
+
+class ThroughputRequest(_message.Message):
+    __slots__ = ("testCase", "count", "dir", "input")
+    TESTCASE_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    DIR_FIELD_NUMBER: _ClassVar[int]
+    INPUT_FIELD_NUMBER: _ClassVar[int]
+    testCase: TestCase
+    count: int
+    dir: str
+    input: str
+    def __init__(self, testCase: _Optional[_Union[TestCase, str]] = ..., count: _Optional[int] = ..., dir: _Optional[str] = ..., input: _Optional[str] = ...) -> None: ...
+
+class ThroughputResponse(_message.Message):
+    __slots__ = ("elapsedNs",)
+    ELAPSEDNS_FIELD_NUMBER: _ClassVar[int]
+    elapsedNs: int
+    def __init__(self, elapsedNs: _Optional[int] = ...) -> None: ...
@@ -0,0 +1,233 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from freeconf.pb import fc_test_pb2 as freeconf_dot_pb_dot_fc__test__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in freeconf/pb/fc_test_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class TestHarnessStub:
+    """Each language implements this to drive compatiblity tests from Go
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateTestCase = channel.unary_unary(
+                '/pb.TestHarness/CreateTestCase',
+                request_serializer=freeconf_dot_pb_dot_fc__test__pb2.CreateTestCaseRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__test__pb2.CreateTestCaseResponse.FromString,
+                _registered_method=True)
+        self.FinalizeTestCase = channel.unary_unary(
+                '/pb.TestHarness/FinalizeTestCase',
+                request_serializer=freeconf_dot_pb_dot_fc__test__pb2.FinalizeTestCaseRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__test__pb2.FinalizeTestCaseResponse.FromString,
+                _registered_method=True)
+        self.ParseModule = channel.unary_unary(
+                '/pb.TestHarness/ParseModule',
+                request_serializer=freeconf_dot_pb_dot_fc__test__pb2.ParseModuleRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__test__pb2.ParseModuleResponse.FromString,
+                _registered_method=True)
+        self.Throughput = channel.unary_unary(
+                '/pb.TestHarness/Throughput',
+                request_serializer=freeconf_dot_pb_dot_fc__test__pb2.ThroughputRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__test__pb2.ThroughputResponse.FromString,
+                _registered_method=True)
+
+
+class TestHarnessServicer:
+    """Each language implements this to drive compatiblity tests from Go
+    """
+
+    def CreateTestCase(self, request, context):
+        """Create a node that implements a specific test case and test harness in Go
+        will excersise the node accordingly
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def FinalizeTestCase(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ParseModule(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def Throughput(self, request, context):
+        """Repeat a test case without tracing.  X drives the test case itself so
+        only callbacks into X cross over and Go can report latency of each one.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_TestHarnessServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateTestCase': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateTestCase,
+                    request_deserializer=freeconf_dot_pb_dot_fc__test__pb2.CreateTestCaseRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__test__pb2.CreateTestCaseResponse.SerializeToString,
+            ),
+            'FinalizeTestCase': grpc.unary_unary_rpc_method_handler(
+                    servicer.FinalizeTestCase,
+                    request_deserializer=freeconf_dot_pb_dot_fc__test__pb2.FinalizeTestCaseRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__test__pb2.FinalizeTestCaseResponse.SerializeToString,
+            ),
+            'ParseModule': grpc.unary_unary_rpc_method_handler(
+                    servicer.ParseModule,
+                    request_deserializer=freeconf_dot_pb_dot_fc__test__pb2.ParseModuleRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__test__pb2.ParseModuleResponse.SerializeToString,
+            ),
+            'Throughput': grpc.unary_unary_rpc_method_handler(
+                    servicer.Throughput,
+                    request_deserializer=freeconf_dot_pb_dot_fc__test__pb2.ThroughputRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__test__pb2.ThroughputResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.TestHarness', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.TestHarness', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class TestHarness:
+    """Each language implements this to drive compatiblity tests from Go
+    """
+
+    @staticmethod
+    def CreateTestCase(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.TestHarness/CreateTestCase',
+            freeconf_dot_pb_dot_fc__test__pb2.CreateTestCaseRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__test__pb2.CreateTestCaseResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def FinalizeTestCase(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.TestHarness/FinalizeTestCase',
+            freeconf_dot_pb_dot_fc__test__pb2.FinalizeTestCaseRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__test__pb2.FinalizeTestCaseResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ParseModule(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.TestHarness/ParseModule',
+            freeconf_dot_pb_dot_fc__test__pb2.ParseModuleRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__test__pb2.ParseModuleResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def Throughput(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.TestHarness/Throughput',
+            freeconf_dot_pb_dot_fc__test__pb2.ThroughputRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__test__pb2.ThroughputResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: freeconf/pb/fc-x.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'freeconf/pb/fc-x.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from freeconf.pb import val_pb2 as freeconf_dot_pb_dot_val__pb2
+from freeconf.pb import common_pb2 as freeconf_dot_pb_dot_common__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16\x66reeconf/pb/fc-x.proto\x12\x02pb\x1a\x15\x66reeconf/pb/val.proto\x1a\x18\x66reeconf/pb/common.proto\"E\n%XNotificationCancelBackchannelRequest\x12\x1c\n\x14\x63\x61ncelBackchannelHnd\x18\x03 \x01(\x04\"(\n&XNotificationCancelBackchannelResponse\"!\n\x0fXContextRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\"\x12\n\x10XContextResponse\"B\n\x0fXReleaseRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x11\n\tscopeHnds\x18\x02 \x03(\x04\x12\x0c\n\x04root\x18\x03 \x01(\x08\"\x12\n\x10XReleaseResponse\"5\n\x0eXChooseRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x13\n\x0b\x63hoiceIdent\x18\x02 \x01(\t\"$\n\x0fXChooseResponse\x12\x11\n\tcaseIdent\x18\x01 \x01(\t\"\x80\x01\n\x0cXNextRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x11\n\tmetaIdent\x18\x03 \x01(\t\x12\x0b\n\x03new\x18\x04 \x01(\x08\x12\x0e\n\x06\x64\x65lete\x18\x05 \x01(\x08\x12\x0b\n\x03row\x18\x06 \x01(\x03\x12\r\n\x05\x66irst\x18\x07 \x01(\x08\x12\x14\n\x03key\x18\x08 \x03(\x0b\x32\x07.pb.Val\"6\n\rXNextResponse\x12\x0f\n\x07nodeHnd\x18\x01 \x01(\x04\x12\x14\n\x03key\x18\x02 \x03(\x0b\x32\x07.pb.Val\"R\n\x11XBeginEditRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x0b\n\x03new\x18\x02 \x01(\x08\x12\x0e\n\x06\x64\x65lete\x18\x03 \x01(\x08\x12\x10\n\x08\x65\x64itRoot\x18\x04 \x01(\x08\"\x14\n\x12XBeginEditResponse\"P\n\x0fXEndEditRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x0b\n\x03new\x18\x02 \x01(\x08\x12\x0e\n\x06\x64\x65lete\x18\x03 \x01(\x08\x12\x10\n\x08\x65\x64itRoot\x18\x04 \x01(\x08\"\x12\n\x10XEndEditResponse\"O\n\rXChildRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x11\n\tmetaIdent\x18\x03 \x01(\t\x12\x0b\n\x03new\x18\x04 \x01(\x08\x12\x0e\n\x06\x64\x65lete\x18\x05 \x01(\x08\"j\n\rXFieldRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x11\n\tmetaIdent\x18\x02 \x01(\t\x12\r\n\x05write\x18\x03 \x01(\x08\x12\r\n\x05\x63lear\x18\x04 \x01(\x08\x12\x18\n\x07toWrite\x18\x05 \x01(\x0b\x32\x07.pb.Val\"+\n\x0eXFieldResponse\x12\x19\n\x08\x66romRead\x18\x01 \x01(\x0b\x32\x07.pb.Val\"!\n\x0eXChildResponse\x12\x0f\n\x07nodeHnd\x18\x01 \x01(\x04\"(\n\x12XNodeSourceRequest\x12\x12\n\nbrowserHnd\x18\x01 \x01(\x04\"&\n\x13XNodeSourceResponse\x12\x0f\n\x07nodeHnd\x18\x01 \x01(\x04\";\n\x15XRootSelectionRequest\x12\x12\n\nbrowserHnd\x18\x01 \x01(\x04\x12\x0e\n\x06selHnd\x18\x02 \x01(\x04\"(\n\x16XRootSelectionResponse\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\"j\n\x0eXSelectRequest\x12\x14\n\x0cparentSelHnd\x18\x01 \x01(\x04\x12\x0f\n\x07nodeHnd\x18\x03 \x01(\x04\x12\x12\n\nbrowserHnd\x18\x04 \x01(\x04\x12\x1d\n\x04path\x18\x05 \x01(\x0b\x32\x0f.pb.PathSegment\"!\n\x0fXSelectResponse\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\"H\n\x0eXActionRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x13\n\x0binputSelHnd\x18\x02 \x01(\x04\x12\x11\n\tmetaIdent\x18\x03 \x01(\t\"(\n\x0fXActionResponse\x12\x15\n\routputNodeHnd\x18\x01 \x01(\x04\"g\n\x14XNotificationRequest\x12\x0e\n\x06selHnd\x18\x01 \x01(\x04\x12\x11\n\tmetaIdent\x18\x02 \x01(\t\x12\x1c\n\x14\x63\x61ncelBackchannelHnd\x18\x03 \x01(\x04\x12\x0e\n\x06\x66ilter\x18\x04 \x01(\t\"6\n\x15XNotificationResponse\x12\x0f\n\x07nodeHnd\x18\x01 \x01(\x04\x12\x0c\n\x04when\x18\x02 \x01(\x03\"%\n\x15XReleaseHandleRequest\x12\x0c\n\x04xHnd\x18\x01 \x01(\x04\"\x18\n\x16XReleaseHandleResponse2\xfb\x06\n\x05XNode\x12I\n\x0eXRootSelection\x12\x19.pb.XRootSelectionRequest\x1a\x1a.pb.XRootSelectionResponse\"\x00\x12@\n\x0bXNodeSource\x12\x16.pb.XNodeSourceRequest\x1a\x17.pb.XNodeSourceResponse\"\x00\x12\x34\n\x07XSelect\x12\x12.pb.XSelectRequest\x1a\x13.pb.XSelectResponse\"\x00\x12\x31\n\x06XChild\x12\x11.pb.XChildRequest\x1a\x12.pb.XChildResponse\"\x00\x12\x31\n\x06XField\x12\x11.pb.XFieldRequest\x1a\x12.pb.XFieldResponse\"\x00\x12\x34\n\x07XAction\x12\x12.pb.XActionRequest\x1a\x13.pb.XActionResponse\"\x00\x12H\n\rXNotification\x12\x18.pb.XNotificationRequest\x1a\x19.pb.XNotificationResponse\"\x00\x30\x01\x12y\n\x1eXNotificationCancelBackchannel\x12).pb.XNotificationCancelBackchannelRequest\x1a*.pb.XNotificationCancelBackchannelResponse\"\x00\x12\x34\n\x07XChoose\x12\x12.pb.XChooseRequest\x1a\x13.pb.XChooseResponse\"\x00\x12.\n\x05XNext\x12\x10.pb.XNextRequest\x1a\x11.pb.XNextResponse\"\x00\x12=\n\nXBeginEdit\x12\x15.pb.XBeginEditRequest\x1a\x16.pb.XBeginEditResponse\"\x00\x12\x37\n\x08XEndEdit\x12\x13.pb.XEndEditRequest\x1a\x14.pb.XEndEditResponse\"\x00\x12\x37\n\x08XContext\x12\x13.pb.XContextRequest\x1a\x14.pb.XContextResponse\"\x00\x12\x37\n\x08XRelease\x12\x13.pb.XReleaseRequest\x1a\x14.pb.XReleaseResponse\"\x00\x32T\n\x08XHandles\x12H\n\rReleaseHandle\x12\x19.pb.XReleaseHandleRequest\x1a\x1a.pb.XReleaseHandleResponse\"\x00\x42\x06Z\x04./pbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'freeconf.pb.fc_x_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z\004./pb'
+  _globals['_XNOTIFICATIONCANCELBACKCHANNELREQUEST']._serialized_start=79
+  _globals['_XNOTIFICATIONCANCELBACKCHANNELREQUEST']._serialized_end=148
+  _globals['_XNOTIFICATIONCANCELBACKCHANNELRESPONSE']._serialized_start=150
+  _globals['_XNOTIFICATIONCANCELBACKCHANNELRESPONSE']._serialized_end=190
+  _globals['_XCONTEXTREQUEST']._serialized_start=192
+  _globals['_XCONTEXTREQUEST']._serialized_end=225
+  _globals['_XCONTEXTRESPONSE']._serialized_start=227
+  _globals['_XCONTEXTRESPONSE']._serialized_end=245
+  _globals['_XRELEASEREQUEST']._serialized_start=247
+  _globals['_XRELEASEREQUEST']._serialized_end=313
+  _globals['_XRELEASERESPONSE']._serialized_start=315
+  _globals['_XRELEASERESPONSE']._serialized_end=333
+  _globals['_XCHOOSEREQUEST']._serialized_start=335
+  _globals['_XCHOOSEREQUEST']._serialized_end=388
+  _globals['_XCHOOSERESPONSE']._serialized_start=390
+  _globals['_XCHOOSERESPONSE']._serialized_end=426
+  _globals['_XNEXTREQUEST']._serialized_start=429
+  _globals['_XNEXTREQUEST']._serialized_end=557
+  _globals['_XNEXTRESPONSE']._serialized_start=559
+  _globals['_XNEXTRESPONSE']._serialized_end=613
+  _globals['_XBEGINEDITREQUEST']._serialized_start=615
+  _globals['_XBEGINEDITREQUEST']._serialized_end=697
+  _globals['_XBEGINEDITRESPONSE']._serialized_start=699
+  _globals['_XBEGINEDITRESPONSE']._serialized_end=719
+  _globals['_XENDEDITREQUEST']._serialized_start=721
+  _globals['_XENDEDITREQUEST']._serialized_end=801
+  _globals['_XENDEDITRESPONSE']._serialized_start=803
+  _globals['_XENDEDITRESPONSE']._serialized_end=821
+  _globals['_XCHILDREQUEST']._serialized_start=823
+  _globals['_XCHILDREQUEST']._serialized_end=902
+  _globals['_XFIELDREQUEST']._serialized_start=904
+  _globals['_XFIELDREQUEST']._serialized_end=1010
+  _globals['_XFIELDRESPONSE']._serialized_start=1012
+  _globals['_XFIELDRESPONSE']._serialized_end=1055
+  _globals['_XCHILDRESPONSE']._serialized_start=1057
+  _globals['_XCHILDRESPONSE']._serialized_end=1090
+  _globals['_XNODESOURCEREQUEST']._serialized_start=1092
+  _globals['_XNODESOURCEREQUEST']._serialized_end=1132
+  _globals['_XNODESOURCERESPONSE']._serialized_start=1134
+  _globals['_XNODESOURCERESPONSE']._serialized_end=1172
+  _globals['_XROOTSELECTIONREQUEST']._serialized_start=1174
+  _globals['_XROOTSELECTIONREQUEST']._serialized_end=1233
+  _globals['_XROOTSELECTIONRESPONSE']._serialized_start=1235
+  _globals['_XROOTSELECTIONRESPONSE']._serialized_end=1275
+  _globals['_XSELECTREQUEST']._serialized_start=1277
+  _globals['_XSELECTREQUEST']._serialized_end=1383
+  _globals['_XSELECTRESPONSE']._serialized_start=1385
+  _globals['_XSELECTRESPONSE']._serialized_end=1418
+  _globals['_XACTIONREQUEST']._serialized_start=1420
+  _globals['_XACTIONREQUEST']._serialized_end=1492
+  _globals['_XACTIONRESPONSE']._serialized_start=1494
+  _globals['_XACTIONRESPONSE']._serialized_end=1534
+  _globals['_XNOTIFICATIONREQUEST']._serialized_start=1536
+  _globals['_XNOTIFICATIONREQUEST']._serialized_end=1639
+  _globals['_XNOTIFICATIONRESPONSE']._serialized_start=1641
+  _globals['_XNOTIFICATIONRESPONSE']._serialized_end=1695
+  _globals['_XRELEASEHANDLEREQUEST']._serialized_start=1697
+  _globals['_XRELEASEHANDLEREQUEST']._serialized_end=1734
+  _globals['_XRELEASEHANDLERESPONSE']._serialized_start=1736
+  _globals['_XRELEASEHANDLERESPONSE']._serialized_end=1760
+  _globals['_XNODE']._serialized_start=1763
+  _globals['_XNODE']._serialized_end=2654
+  _globals['_XHANDLES']._serialized_start=2656
+  _globals['_XHANDLES']._serialized_end=2740
+# @@protoc_insertion_point(module_scope)
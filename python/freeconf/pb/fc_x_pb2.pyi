@@ -0,0 +1,243 @@
+from freeconf.pb import val_pb2 as _val_pb2
+from freeconf.pb import common_pb2 as _common_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class XNotificationCancelBackchannelRequest(_message.Message):
+    __slots__ = ("cancelBackchannelHnd",)
+    CANCELBACKCHANNELHND_FIELD_NUMBER: _ClassVar[int]
+    cancelBackchannelHnd: int
+    def __init__(self, cancelBackchannelHnd: _Optional[int] = ...) -> None: ...
+
+class XNotificationCancelBackchannelResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class XContextRequest(_message.Message):
+    __slots__ = ("selHnd",)
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    def __init__(self, selHnd: _Optional[int] = ...) -> None: ...
+
+class XContextResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class XReleaseRequest(_message.Message):
+    __slots__ = ("selHnd", "scopeHnds", "root")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    SCOPEHNDS_FIELD_NUMBER: _ClassVar[int]
+    ROOT_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    scopeHnds: _containers.RepeatedScalarFieldContainer[int]
+    root: bool
+    def __init__(self, selHnd: _Optional[int] = ..., scopeHnds: _Optional[_Iterable[int]] = ..., root: _Optional[bool] = ...) -> None: ...
+
+class XReleaseResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class XChooseRequest(_message.Message):
+    __slots__ = ("selHnd", "choiceIdent")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    CHOICEIDENT_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    choiceIdent: str
+    def __init__(self, selHnd: _Optional[int] = ..., choiceIdent: _Optional[str] = ...) -> None: ...
+
+class XChooseResponse(_message.Message):
+    __slots__ = ("caseIdent",)
+    CASEIDENT_FIELD_NUMBER: _ClassVar[int]
+    caseIdent: str
+    def __init__(self, caseIdent: _Optional[str] = ...) -> None: ...
+
+class XNextRequest(_message.Message):
+    __slots__ = ("selHnd", "metaIdent", "new", "delete", "row", "first", "key")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    METAIDENT_FIELD_NUMBER: _ClassVar[int]
+    NEW_FIELD_NUMBER: _ClassVar[int]
+    DELETE_FIELD_NUMBER: _ClassVar[int]
+    ROW_FIELD_NUMBER: _ClassVar[int]
+    FIRST_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    metaIdent: str
+    new: bool
+    delete: bool
+    row: int
+    first: bool
+    key: _containers.RepeatedCompositeFieldContainer[_val_pb2.Val]
+    def __init__(self, selHnd: _Optional[int] = ..., metaIdent: _Optional[str] = ..., new: _Optional[bool] = ..., delete: _Optional[bool] = ..., row: _Optional[int] = ..., first: _Optional[bool] = ..., key: _Optional[_Iterable[_Union[_val_pb2.Val, _Mapping]]] = ...) -> None: ...
+
+class XNextResponse(_message.Message):
+    __slots__ = ("nodeHnd", "key")
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    nodeHnd: int
+    key: _containers.RepeatedCompositeFieldContainer[_val_pb2.Val]
+    def __init__(self, nodeHnd: _Optional[int] = ..., key: _Optional[_Iterable[_Union[_val_pb2.Val, _Mapping]]] = ...) -> None: ...
+
+class XBeginEditRequest(_message.Message):
+    __slots__ = ("selHnd", "new", "delete", "editRoot")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    NEW_FIELD_NUMBER: _ClassVar[int]
+    DELETE_FIELD_NUMBER: _ClassVar[int]
+    EDITROOT_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    new: bool
+    delete: bool
+    editRoot: bool
+    def __init__(self, selHnd: _Optional[int] = ..., new: _Optional[bool] = ..., delete: _Optional[bool] = ..., editRoot: _Optional[bool] = ...) -> None: ...
+
+class XBeginEditResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class XEndEditRequest(_message.Message):
+    __slots__ = ("selHnd", "new", "delete", "editRoot")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    NEW_FIELD_NUMBER: _ClassVar[int]
+    DELETE_FIELD_NUMBER: _ClassVar[int]
+    EDITROOT_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    new: bool
+    delete: bool
+    editRoot: bool
+    def __init__(self, selHnd: _Optional[int] = ..., new: _Optional[bool] = ..., delete: _Optional[bool] = ..., editRoot: _Optional[bool] = ...) -> None: ...
+
+class XEndEditResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class XChildRequest(_message.Message):
+    __slots__ = ("selHnd", "metaIdent", "new", "delete")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    METAIDENT_FIELD_NUMBER: _ClassVar[int]
+    NEW_FIELD_NUMBER: _ClassVar[int]
+    DELETE_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    metaIdent: str
+    new: bool
+    delete: bool
+    def __init__(self, selHnd: _Optional[int] = ..., metaIdent: _Optional[str] = ..., new: _Optional[bool] = ..., delete: _Optional[bool] = ...) -> None: ...
+
+class XFieldRequest(_message.Message):
+    __slots__ = ("selHnd", "metaIdent", "write", "clear", "toWrite")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    METAIDENT_FIELD_NUMBER: _ClassVar[int]
+    WRITE_FIELD_NUMBER: _ClassVar[int]
+    CLEAR_FIELD_NUMBER: _ClassVar[int]
+    TOWRITE_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    metaIdent: str
+    write: bool
+    clear: bool
+    toWrite: _val_pb2.Val
+    def __init__(self, selHnd: _Optional[int] = ..., metaIdent: _Optional[str] = ..., write: _Optional[bool] = ..., clear: _Optional[bool] = ..., toWrite: _Optional[_Union[_val_pb2.Val, _Mapping]] = ...) -> None: ...
+
+class XFieldResponse(_message.Message):
+    __slots__ = ("fromRead",)
+    FROMREAD_FIELD_NUMBER: _ClassVar[int]
+    fromRead: _val_pb2.Val
+    def __init__(self, fromRead: _Optional[_Union[_val_pb2.Val, _Mapping]] = ...) -> None: ...
+
+class XChildResponse(_message.Message):
+    __slots__ = ("nodeHnd",)
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    nodeHnd: int
+    def __init__(self, nodeHnd: _Optional[int] = ...) -> None: ...
+
+class XNodeSourceRequest(_message.Message):
+    __slots__ = ("browserHnd",)
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    browserHnd: int
+    def __init__(self, browserHnd: _Optional[int] = ...) -> None: ...
+
+class XNodeSourceResponse(_message.Message):
+    __slots__ = ("nodeHnd",)
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    nodeHnd: int
+    def __init__(self, nodeHnd: _Optional[int] = ...) -> None: ...
+
+class XRootSelectionRequest(_message.Message):
+    __slots__ = ("browserHnd", "selHnd")
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    browserHnd: int
+    selHnd: int
+    def __init__(self, browserHnd: _Optional[int] = ..., selHnd: _Optional[int] = ...) -> None: ...
+
+class XRootSelectionResponse(_message.Message):
+    __slots__ = ("selHnd",)
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    def __init__(self, selHnd: _Optional[int] = ...) -> None: ...
+
+class XSelectRequest(_message.Message):
+    __slots__ = ("parentSelHnd", "nodeHnd", "browserHnd", "path")
+    PARENTSELHND_FIELD_NUMBER: _ClassVar[int]
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    BROWSERHND_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    parentSelHnd: int
+    nodeHnd: int
+    browserHnd: int
+    path: _common_pb2.PathSegment
+    def __init__(self, parentSelHnd: _Optional[int] = ..., nodeHnd: _Optional[int] = ..., browserHnd: _Optional[int] = ..., path: _Optional[_Union[_common_pb2.PathSegment, _Mapping]] = ...) -> None: ...
+
+class XSelectResponse(_message.Message):
+    __slots__ = ("selHnd",)
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    def __init__(self, selHnd: _Optional[int] = ...) -> None: ...
+
+class XActionRequest(_message.Message):
+    __slots__ = ("selHnd", "inputSelHnd", "metaIdent")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    INPUTSELHND_FIELD_NUMBER: _ClassVar[int]
+    METAIDENT_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    inputSelHnd: int
+    metaIdent: str
+    def __init__(self, selHnd: _Optional[int] = ..., inputSelHnd: _Optional[int] = ..., metaIdent: _Optional[str] = ...) -> None: ...
+
+class XActionResponse(_message.Message):
+    __slots__ = ("outputNodeHnd",)
+    OUTPUTNODEHND_FIELD_NUMBER: _ClassVar[int]
+    outputNodeHnd: int
+    def __init__(self, outputNodeHnd: _Optional[int] = ...) -> None: ...
+
+class XNotificationRequest(_message.Message):
+    __slots__ = ("selHnd", "metaIdent", "cancelBackchannelHnd", "filter")
+    SELHND_FIELD_NUMBER: _ClassVar[int]
+    METAIDENT_FIELD_NUMBER: _ClassVar[int]
+    CANCELBACKCHANNELHND_FIELD_NUMBER: _ClassVar[int]
+    FILTER_FIELD_NUMBER: _ClassVar[int]
+    selHnd: int
+    metaIdent: str
+    cancelBackchannelHnd: int
+    filter: str
+    def __init__(self, selHnd: _Optional[int] = ..., metaIdent: _Optional[str] = ..., cancelBackchannelHnd: _Optional[int] = ..., filter: _Optional[str] = ...) -> None: ...
+
+class XNotificationResponse(_message.Message):
+    __slots__ = ("nodeHnd", "when")
+    NODEHND_FIELD_NUMBER: _ClassVar[int]
+    WHEN_FIELD_NUMBER: _ClassVar[int]
+    nodeHnd: int
+    when: int
+    def __init__(self, nodeHnd: _Optional[int] = ..., when: _Optional[int] = ...) -> None: ...
+
+class XReleaseHandleRequest(_message.Message):
+    __slots__ = ("xHnd",)
+    XHND_FIELD_NUMBER: _ClassVar[int]
+    xHnd: int
+    def __init__(self, xHnd: _Optional[int] = ...) -> None: ...
+
+class XReleaseHandleResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
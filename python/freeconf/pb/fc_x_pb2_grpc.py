@@ -0,0 +1,744 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from freeconf.pb import fc_x_pb2 as freeconf_dot_pb_dot_fc__x__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in freeconf/pb/fc_x_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class XNodeStub:
+    """
+    This is used when Go calls into whatever language it is talking to which we
+    refer to as "X" here. It is predominately around the node API then Go needs
+    navigate management APIs in the "X" language.
+
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.XRootSelection = channel.unary_unary(
+                '/pb.XNode/XRootSelection',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XRootSelectionRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XRootSelectionResponse.FromString,
+                _registered_method=True)
+        self.XNodeSource = channel.unary_unary(
+                '/pb.XNode/XNodeSource',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XNodeSourceRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XNodeSourceResponse.FromString,
+                _registered_method=True)
+        self.XSelect = channel.unary_unary(
+                '/pb.XNode/XSelect',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XSelectRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XSelectResponse.FromString,
+                _registered_method=True)
+        self.XChild = channel.unary_unary(
+                '/pb.XNode/XChild',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XChildRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XChildResponse.FromString,
+                _registered_method=True)
+        self.XField = channel.unary_unary(
+                '/pb.XNode/XField',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XFieldRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XFieldResponse.FromString,
+                _registered_method=True)
+        self.XAction = channel.unary_unary(
+                '/pb.XNode/XAction',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XActionRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XActionResponse.FromString,
+                _registered_method=True)
+        self.XNotification = channel.unary_stream(
+                '/pb.XNode/XNotification',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XNotificationRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XNotificationResponse.FromString,
+                _registered_method=True)
+        self.XNotificationCancelBackchannel = channel.unary_unary(
+                '/pb.XNode/XNotificationCancelBackchannel',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XNotificationCancelBackchannelRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XNotificationCancelBackchannelResponse.FromString,
+                _registered_method=True)
+        self.XChoose = channel.unary_unary(
+                '/pb.XNode/XChoose',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XChooseRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XChooseResponse.FromString,
+                _registered_method=True)
+        self.XNext = channel.unary_unary(
+                '/pb.XNode/XNext',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XNextRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XNextResponse.FromString,
+                _registered_method=True)
+        self.XBeginEdit = channel.unary_unary(
+                '/pb.XNode/XBeginEdit',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XBeginEditRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XBeginEditResponse.FromString,
+                _registered_method=True)
+        self.XEndEdit = channel.unary_unary(
+                '/pb.XNode/XEndEdit',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XEndEditRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XEndEditResponse.FromString,
+                _registered_method=True)
+        self.XContext = channel.unary_unary(
+                '/pb.XNode/XContext',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XContextRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XContextResponse.FromString,
+                _registered_method=True)
+        self.XRelease = channel.unary_unary(
+                '/pb.XNode/XRelease',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XReleaseRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XReleaseResponse.FromString,
+                _registered_method=True)
+
+
+class XNodeServicer:
+    """
+    This is used when Go calls into whatever language it is talking to which we
+    refer to as "X" here. It is predominately around the node API then Go needs
+    navigate management APIs in the "X" language.
+
+    """
+
+    def XRootSelection(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XNodeSource(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XSelect(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XChild(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XField(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XAction(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XNotification(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XNotificationCancelBackchannel(self, request, context):
+        """
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XChoose(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XNext(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XBeginEdit(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XEndEdit(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XContext(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def XRelease(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_XNodeServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'XRootSelection': grpc.unary_unary_rpc_method_handler(
+                    servicer.XRootSelection,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XRootSelectionRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XRootSelectionResponse.SerializeToString,
+            ),
+            'XNodeSource': grpc.unary_unary_rpc_method_handler(
+                    servicer.XNodeSource,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XNodeSourceRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XNodeSourceResponse.SerializeToString,
+            ),
+            'XSelect': grpc.unary_unary_rpc_method_handler(
+                    servicer.XSelect,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XSelectRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XSelectResponse.SerializeToString,
+            ),
+            'XChild': grpc.unary_unary_rpc_method_handler(
+                    servicer.XChild,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XChildRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XChildResponse.SerializeToString,
+            ),
+            'XField': grpc.unary_unary_rpc_method_handler(
+                    servicer.XField,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XFieldRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XFieldResponse.SerializeToString,
+            ),
+            'XAction': grpc.unary_unary_rpc_method_handler(
+                    servicer.XAction,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XActionRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XActionResponse.SerializeToString,
+            ),
+            'XNotification': grpc.unary_stream_rpc_method_handler(
+                    servicer.XNotification,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XNotificationRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XNotificationResponse.SerializeToString,
+            ),
+            'XNotificationCancelBackchannel': grpc.unary_unary_rpc_method_handler(
+                    servicer.XNotificationCancelBackchannel,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XNotificationCancelBackchannelRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XNotificationCancelBackchannelResponse.SerializeToString,
+            ),
+            'XChoose': grpc.unary_unary_rpc_method_handler(
+                    servicer.XChoose,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XChooseRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XChooseResponse.SerializeToString,
+            ),
+            'XNext': grpc.unary_unary_rpc_method_handler(
+                    servicer.XNext,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XNextRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XNextResponse.SerializeToString,
+            ),
+            'XBeginEdit': grpc.unary_unary_rpc_method_handler(
+                    servicer.XBeginEdit,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XBeginEditRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XBeginEditResponse.SerializeToString,
+            ),
+            'XEndEdit': grpc.unary_unary_rpc_method_handler(
+                    servicer.XEndEdit,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XEndEditRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XEndEditResponse.SerializeToString,
+            ),
+            'XContext': grpc.unary_unary_rpc_method_handler(
+                    servicer.XContext,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XContextRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XContextResponse.SerializeToString,
+            ),
+            'XRelease': grpc.unary_unary_rpc_method_handler(
+                    servicer.XRelease,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XReleaseRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XReleaseResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.XNode', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.XNode', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class XNode:
+    """
+    This is used when Go calls into whatever language it is talking to which we
+    refer to as "X" here. It is predominately around the node API then Go needs
+    navigate management APIs in the "X" language.
+
+    """
+
+    @staticmethod
+    def XRootSelection(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XRootSelection',
+            freeconf_dot_pb_dot_fc__x__pb2.XRootSelectionRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XRootSelectionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XNodeSource(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XNodeSource',
+            freeconf_dot_pb_dot_fc__x__pb2.XNodeSourceRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XNodeSourceResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XSelect(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XSelect',
+            freeconf_dot_pb_dot_fc__x__pb2.XSelectRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XSelectResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XChild(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XChild',
+            freeconf_dot_pb_dot_fc__x__pb2.XChildRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XChildResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XField(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XField',
+            freeconf_dot_pb_dot_fc__x__pb2.XFieldRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XFieldResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XAction(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XAction',
+            freeconf_dot_pb_dot_fc__x__pb2.XActionRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XActionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XNotification(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/pb.XNode/XNotification',
+            freeconf_dot_pb_dot_fc__x__pb2.XNotificationRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XNotificationResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XNotificationCancelBackchannel(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XNotificationCancelBackchannel',
+            freeconf_dot_pb_dot_fc__x__pb2.XNotificationCancelBackchannelRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XNotificationCancelBackchannelResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XChoose(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XChoose',
+            freeconf_dot_pb_dot_fc__x__pb2.XChooseRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XChooseResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XNext(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XNext',
+            freeconf_dot_pb_dot_fc__x__pb2.XNextRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XNextResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XBeginEdit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XBeginEdit',
+            freeconf_dot_pb_dot_fc__x__pb2.XBeginEditRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XBeginEditResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XEndEdit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XEndEdit',
+            freeconf_dot_pb_dot_fc__x__pb2.XEndEditRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XEndEditResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XContext(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XContext',
+            freeconf_dot_pb_dot_fc__x__pb2.XContextRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XContextResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def XRelease(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XNode/XRelease',
+            freeconf_dot_pb_dot_fc__x__pb2.XReleaseRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XReleaseResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+
+class XHandlesStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.ReleaseHandle = channel.unary_unary(
+                '/pb.XHandles/ReleaseHandle',
+                request_serializer=freeconf_dot_pb_dot_fc__x__pb2.XReleaseHandleRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XReleaseHandleResponse.FromString,
+                _registered_method=True)
+
+
+class XHandlesServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def ReleaseHandle(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_XHandlesServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'ReleaseHandle': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReleaseHandle,
+                    request_deserializer=freeconf_dot_pb_dot_fc__x__pb2.XReleaseHandleRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fc__x__pb2.XReleaseHandleResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.XHandles', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.XHandles', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class XHandles:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def ReleaseHandle(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.XHandles/ReleaseHandle',
+            freeconf_dot_pb_dot_fc__x__pb2.XReleaseHandleRequest.SerializeToString,
+            freeconf_dot_pb_dot_fc__x__pb2.XReleaseHandleResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: freeconf/pb/fs.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'freeconf/pb/fs.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x66reeconf/pb/fs.proto\x12\x02pb\"W\n\x11ReaderInitRequest\x12\x10\n\x06stream\x18\x01 \x01(\x08H\x00\x12\x0f\n\x05\x66name\x18\x02 \x01(\tH\x00\x12\x17\n\rinlineContent\x18\x03 \x01(\x0cH\x00\x42\x06\n\x04\x64\x61ta\"\'\n\x12ReaderInitResponse\x12\x11\n\tstreamHnd\x18\x01 \x01(\x04\"\x16\n\x14ReaderStreamResponse\"4\n\x10ReaderStreamData\x12\x11\n\tstreamHnd\x18\x01 \x01(\x04\x12\r\n\x05\x63hunk\x18\x02 \x01(\x0c\">\n\x11WriterInitRequest\x12\x10\n\x06stream\x18\x01 \x01(\x08H\x00\x12\x0f\n\x05\x66name\x18\x02 \x01(\tH\x00\x42\x06\n\x04\x64\x61ta\"\'\n\x12WriterInitResponse\x12\x11\n\tstreamHnd\x18\x01 \x01(\x04\"(\n\x13WriterStreamRequest\x12\x11\n\tstreamHnd\x18\x01 \x01(\x04\"!\n\x10WriterStreamData\x12\r\n\x05\x63hunk\x18\x01 \x01(\x0c\"\'\n\x12\x43loseStreamRequest\x12\x11\n\tstreamHnd\x18\x01 \x01(\x04\"\x15\n\x13\x43loseStreamResponse2\xd3\x02\n\nFileSystem\x12@\n\x0b\x43loseStream\x12\x16.pb.CloseStreamRequest\x1a\x17.pb.CloseStreamResponse\"\x00\x12=\n\nWriterInit\x12\x15.pb.WriterInitRequest\x1a\x16.pb.WriterInitResponse\"\x00\x12\x41\n\x0cWriterStream\x12\x17.pb.WriterStreamRequest\x1a\x14.pb.WriterStreamData\"\x00\x30\x01\x12=\n\nReaderInit\x12\x15.pb.ReaderInitRequest\x1a\x16.pb.ReaderInitResponse\"\x00\x12\x42\n\x0cReaderStream\x12\x14.pb.ReaderStreamData\x1a\x18.pb.ReaderStreamResponse\"\x00(\x01\x42\x06Z\x04./pbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'freeconf.pb.fs_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z\004./pb'
+  _globals['_READERINITREQUEST']._serialized_start=28
+  _globals['_READERINITREQUEST']._serialized_end=115
+  _globals['_READERINITRESPONSE']._serialized_start=117
+  _globals['_READERINITRESPONSE']._serialized_end=156
+  _globals['_READERSTREAMRESPONSE']._serialized_start=158
+  _globals['_READERSTREAMRESPONSE']._serialized_end=180
+  _globals['_READERSTREAMDATA']._serialized_start=182
+  _globals['_READERSTREAMDATA']._serialized_end=234
+  _globals['_WRITERINITREQUEST']._serialized_start=236
+  _globals['_WRITERINITREQUEST']._serialized_end=298
+  _globals['_WRITERINITRESPONSE']._serialized_start=300
+  _globals['_WRITERINITRESPONSE']._serialized_end=339
+  _globals['_WRITERSTREAMREQUEST']._serialized_start=341
+  _globals['_WRITERSTREAMREQUEST']._serialized_end=381
+  _globals['_WRITERSTREAMDATA']._serialized_start=383
+  _globals['_WRITERSTREAMDATA']._serialized_end=416
+  _globals['_CLOSESTREAMREQUEST']._serialized_start=418
+  _globals['_CLOSESTREAMREQUEST']._serialized_end=457
+  _globals['_CLOSESTREAMRESPONSE']._serialized_start=459
+  _globals['_CLOSESTREAMRESPONSE']._serialized_end=480
+  _globals['_FILESYSTEM']._serialized_start=483
+  _globals['_FILESYSTEM']._serialized_end=822
+# @@protoc_insertion_point(module_scope)
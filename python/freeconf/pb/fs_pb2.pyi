@@ -0,0 +1,69 @@
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class ReaderInitRequest(_message.Message):
+    __slots__ = ("stream", "fname", "inlineContent")
+    STREAM_FIELD_NUMBER: _ClassVar[int]
+    FNAME_FIELD_NUMBER: _ClassVar[int]
+    INLINECONTENT_FIELD_NUMBER: _ClassVar[int]
+    stream: bool
+    fname: str
+    inlineContent: bytes
+    def __init__(self, stream: _Optional[bool] = ..., fname: _Optional[str] = ..., inlineContent: _Optional[bytes] = ...) -> None: ...
+
+class ReaderInitResponse(_message.Message):
+    __slots__ = ("streamHnd",)
+    STREAMHND_FIELD_NUMBER: _ClassVar[int]
+    streamHnd: int
+    def __init__(self, streamHnd: _Optional[int] = ...) -> None: ...
+
+class ReaderStreamResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
+
+class ReaderStreamData(_message.Message):
+    __slots__ = ("streamHnd", "chunk")
+    STREAMHND_FIELD_NUMBER: _ClassVar[int]
+    CHUNK_FIELD_NUMBER: _ClassVar[int]
+    streamHnd: int
+    chunk: bytes
+    def __init__(self, streamHnd: _Optional[int] = ..., chunk: _Optional[bytes] = ...) -> None: ...
+
+class WriterInitRequest(_message.Message):
+    __slots__ = ("stream", "fname")
+    STREAM_FIELD_NUMBER: _ClassVar[int]
+    FNAME_FIELD_NUMBER: _ClassVar[int]
+    stream: bool
+    fname: str
+    def __init__(self, stream: _Optional[bool] = ..., fname: _Optional[str] = ...) -> None: ...
+
+class WriterInitResponse(_message.Message):
+    __slots__ = ("streamHnd",)
+    STREAMHND_FIELD_NUMBER: _ClassVar[int]
+    streamHnd: int
+    def __init__(self, streamHnd: _Optional[int] = ...) -> None: ...
+
+class WriterStreamRequest(_message.Message):
+    __slots__ = ("streamHnd",)
+    STREAMHND_FIELD_NUMBER: _ClassVar[int]
+    streamHnd: int
+    def __init__(self, streamHnd: _Optional[int] = ...) -> None: ...
+
+class WriterStreamData(_message.Message):
+    __slots__ = ("chunk",)
+    CHUNK_FIELD_NUMBER: _ClassVar[int]
+    chunk: bytes
+    def __init__(self, chunk: _Optional[bytes] = ...) -> None: ...
+
+class CloseStreamRequest(_message.Message):
+    __slots__ = ("streamHnd",)
+    STREAMHND_FIELD_NUMBER: _ClassVar[int]
+    streamHnd: int
+    def __init__(self, streamHnd: _Optional[int] = ...) -> None: ...
+
+class CloseStreamResponse(_message.Message):
+    __slots__ = ()
+    def __init__(self) -> None: ...
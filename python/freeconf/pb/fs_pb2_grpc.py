@@ -0,0 +1,282 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from freeconf.pb import fs_pb2 as freeconf_dot_pb_dot_fs__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in freeconf/pb/fs_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class FileSystemStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CloseStream = channel.unary_unary(
+                '/pb.FileSystem/CloseStream',
+                request_serializer=freeconf_dot_pb_dot_fs__pb2.CloseStreamRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fs__pb2.CloseStreamResponse.FromString,
+                _registered_method=True)
+        self.WriterInit = channel.unary_unary(
+                '/pb.FileSystem/WriterInit',
+                request_serializer=freeconf_dot_pb_dot_fs__pb2.WriterInitRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fs__pb2.WriterInitResponse.FromString,
+                _registered_method=True)
+        self.WriterStream = channel.unary_stream(
+                '/pb.FileSystem/WriterStream',
+                request_serializer=freeconf_dot_pb_dot_fs__pb2.WriterStreamRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fs__pb2.WriterStreamData.FromString,
+                _registered_method=True)
+        self.ReaderInit = channel.unary_unary(
+                '/pb.FileSystem/ReaderInit',
+                request_serializer=freeconf_dot_pb_dot_fs__pb2.ReaderInitRequest.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fs__pb2.ReaderInitResponse.FromString,
+                _registered_method=True)
+        self.ReaderStream = channel.stream_unary(
+                '/pb.FileSystem/ReaderStream',
+                request_serializer=freeconf_dot_pb_dot_fs__pb2.ReaderStreamData.SerializeToString,
+                response_deserializer=freeconf_dot_pb_dot_fs__pb2.ReaderStreamResponse.FromString,
+                _registered_method=True)
+
+
+class FileSystemServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def CloseStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WriterInit(self, request, context):
+        """Write stream to X and appears as io.Writer in Go.  The first response is always
+        the streamHnd that should be used for futher reference.  There are additional
+        responses that contain the chunked data or there is no more response if Go is
+        using a Go file to write data and X doesn't need to coordinate anything.
+
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def WriterStream(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReaderInit(self, request, context):
+        """Read stream from X and appears as io.Reader in Go. 
+
+        Because server is implemented in Go
+        each request contains either a series of chunked data from X or a single request that
+        is a filename Go can open as a reader or a single request that is entire contents of
+        stream in one shot.
+
+        We need a stream on the response because we need to send back
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ReaderStream(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_FileSystemServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CloseStream': grpc.unary_unary_rpc_method_handler(
+                    servicer.CloseStream,
+                    request_deserializer=freeconf_dot_pb_dot_fs__pb2.CloseStreamRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fs__pb2.CloseStreamResponse.SerializeToString,
+            ),
+            'WriterInit': grpc.unary_unary_rpc_method_handler(
+                    servicer.WriterInit,
+                    request_deserializer=freeconf_dot_pb_dot_fs__pb2.WriterInitRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fs__pb2.WriterInitResponse.SerializeToString,
+            ),
+            'WriterStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.WriterStream,
+                    request_deserializer=freeconf_dot_pb_dot_fs__pb2.WriterStreamRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fs__pb2.WriterStreamData.SerializeToString,
+            ),
+            'ReaderInit': grpc.unary_unary_rpc_method_handler(
+                    servicer.ReaderInit,
+                    request_deserializer=freeconf_dot_pb_dot_fs__pb2.ReaderInitRequest.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fs__pb2.ReaderInitResponse.SerializeToString,
+            ),
+            'ReaderStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.ReaderStream,
+                    request_deserializer=freeconf_dot_pb_dot_fs__pb2.ReaderStreamData.FromString,
+                    response_serializer=freeconf_dot_pb_dot_fs__pb2.ReaderStreamResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'pb.FileSystem', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('pb.FileSystem', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class FileSystem:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def CloseStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.FileSystem/CloseStream',
+            freeconf_dot_pb_dot_fs__pb2.CloseStreamRequest.SerializeToString,
+            freeconf_dot_pb_dot_fs__pb2.CloseStreamResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WriterInit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.FileSystem/WriterInit',
+            freeconf_dot_pb_dot_fs__pb2.WriterInitRequest.SerializeToString,
+            freeconf_dot_pb_dot_fs__pb2.WriterInitResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def WriterStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/pb.FileSystem/WriterStream',
+            freeconf_dot_pb_dot_fs__pb2.WriterStreamRequest.SerializeToString,
+            freeconf_dot_pb_dot_fs__pb2.WriterStreamData.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReaderInit(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/pb.FileSystem/ReaderInit',
+            freeconf_dot_pb_dot_fs__pb2.ReaderInitRequest.SerializeToString,
+            freeconf_dot_pb_dot_fs__pb2.ReaderInitResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ReaderStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/pb.FileSystem/ReaderStream',
+            freeconf_dot_pb_dot_fs__pb2.ReaderStreamData.SerializeToString,
+            freeconf_dot_pb_dot_fs__pb2.ReaderStreamResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
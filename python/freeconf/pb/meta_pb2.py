@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: freeconf/pb/meta.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'freeconf/pb/meta.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from freeconf.pb import val_pb2 as freeconf_dot_pb_dot_val__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16\x66reeconf/pb/meta.proto\x12\x02pb\x1a\x15\x66reeconf/pb/val.proto\"\'\n\x0bOptionalInt\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\t\n\x01i\x18\x02 \x01(\x05\"\xad\x03\n\x06Module\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x11\n\tnamespace\x18\x02 \x01(\t\x12\x0e\n\x06prefix\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0f\n\x07\x63ontact\x18\x05 \x01(\t\x12\x14\n\x0corganization\x18\x06 \x01(\t\x12\x11\n\treference\x18\x07 \x01(\t\x12\x0f\n\x07version\x18\x08 \x01(\t\x12\x1f\n\trevisions\x18\t \x03(\x0b\x32\x0c.pb.Revision\x12 \n\x0b\x64\x65\x66initions\x18\n \x03(\x0b\x32\x0b.pb.DataDef\x12\'\n\rnotifications\x18\x0b \x03(\x0b\x32\x10.pb.Notification\x12\x18\n\x07\x61\x63tions\x18\x0c \x03(\x0b\x32\x07.pb.Rpc\x12 \n\nidentities\x18\r \x03(\x0b\x32\x0c.pb.Identity\x12\x1d\n\x08\x66\x65\x61tures\x18\x0e \x03(\x0b\x32\x0b.pb.Feature\x12!\n\nextensions\x18\x10 \x03(\x0b\x32\r.pb.Extension\x12\'\n\rextensionDefs\x18\x11 \x03(\x0b\x32\x10.pb.ExtensionDef\"\x9e\x01\n\x08RpcInput\x12\x11\n\treference\x18\x01 \x01(\t\x12 \n\x0b\x64\x65\x66initions\x18\x03 \x03(\x0b\x32\x0b.pb.DataDef\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12\x17\n\x05musts\x18\x15 \x03(\x0b\x32\x08.pb.Must\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\x9f\x01\n\tRpcOutput\x12\x11\n\treference\x18\x01 \x01(\t\x12 \n\x0b\x64\x65\x66initions\x18\x03 \x03(\x0b\x32\x0b.pb.DataDef\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12\x17\n\x05musts\x18\x15 \x03(\x0b\x32\x08.pb.Must\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\xda\x01\n\x03Rpc\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x04 \x01(\t\x12\x1b\n\x05input\x18\x05 \x01(\x0b\x32\x0c.pb.RpcInput\x12\x1d\n\x06output\x18\x06 \x01(\x0b\x32\r.pb.RpcOutput\x12\x1a\n\x06status\x18\x13 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\xc9\x01\n\x0cNotification\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x04 \x01(\t\x12 \n\x0b\x64\x65\x66initions\x18\x05 \x03(\x0b\x32\x0b.pb.DataDef\x12\x1a\n\x06status\x18\x13 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\x7f\n\x0f\x45xtensionDefArg\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x12\n\nyinElement\x18\x05 \x01(\x08\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\xab\x01\n\x0c\x45xtensionDef\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x1a\n\x06status\x18\x04 \x01(\x0e\x32\n.pb.Status\x12%\n\x08\x61rgument\x18\x05 \x01(\x0b\x32\x13.pb.ExtensionDefArg\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"M\n\tExtension\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x0e\n\x06prefix\x18\x02 \x01(\t\x12\x0f\n\x07keyword\x18\x03 \x01(\t\x12\x10\n\x08\x61rgument\x18\x05 \x01(\t\"B\n\tIfFeature\x12\x12\n\nexpression\x18\x01 \x01(\t\x12!\n\nextensions\x18\x02 \x03(\x0b\x32\r.pb.Extension\"\x90\x01\n\x04Must\x12\x12\n\nexpression\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x14\n\x0c\x65rrorMessage\x18\x04 \x01(\t\x12\x13\n\x0b\x65rrorAppTag\x18\x05 \x01(\t\x12!\n\nextensions\x18\x06 \x03(\x0b\x32\r.pb.Extension\"e\n\x04When\x12\x12\n\nexpression\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12!\n\nextensions\x18\x04 \x03(\x0b\x32\r.pb.Extension\"\x93\x03\n\tContainer\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x10\n\x08presence\x18\x04 \x01(\t\x12 \n\x0b\x64\x65\x66initions\x18\x07 \x03(\x0b\x32\x0b.pb.DataDef\x12 \n\x06\x63onfig\x18\x0e \x01(\x0e\x32\x10.pb.OptionalBool\x12#\n\tmandatory\x18\x0f \x01(\x0e\x32\x10.pb.OptionalBool\x12\x18\n\x07\x61\x63tions\x18\x10 \x03(\x0b\x32\x07.pb.Rpc\x12\'\n\rnotifications\x18\x11 \x03(\x0b\x32\x10.pb.Notification\x12\x16\n\x04when\x18\x12 \x01(\x0b\x32\x08.pb.When\x12\x1a\n\x06status\x18\x13 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12\x17\n\x05musts\x18\x15 \x03(\x0b\x32\x08.pb.Must\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"o\n\x04\x45num\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\r\n\x05value\x18\x04 \x01(\x05\x12!\n\nextensions\x18\x05 \x03(\x0b\x32\r.pb.Extension\"N\n\x03\x42it\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x10\n\x08position\x18\x04 \x01(\x05\"\xa5\x01\n\x0bRangeNumber\x12\x0b\n\x03str\x18\x01 \x01(\t\x12\r\n\x05isMax\x18\x02 \x01(\x08\x12\r\n\x05isMin\x18\x03 \x01(\x08\x12\x0f\n\x07integer\x18\x04 \x01(\x03\x12\x12\n\nintegerSet\x18\x05 \x01(\x08\x12\x10\n\x08unsigned\x18\x06 \x01(\x04\x12\x13\n\x0bunsignedSet\x18\x07 \x01(\x08\x12\r\n\x05\x66loat\x18\x08 \x01(\x01\x12\x10\n\x08\x66loatSet\x18\t \x01(\x08\"h\n\nRangeEntry\x12\x1c\n\x03min\x18\x01 \x01(\x0b\x32\x0f.pb.RangeNumber\x12\x1c\n\x03max\x18\x02 \x01(\x0b\x32\x0f.pb.RangeNumber\x12\x1e\n\x05\x65xact\x18\x03 \x01(\x0b\x32\x0f.pb.RangeNumber\"}\n\x05Range\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x14\n\x0c\x65rrorMessage\x18\x04 \x01(\t\x12\x13\n\x0b\x65rrorAppTag\x18\x05 \x01(\t\x12!\n\nextensions\x18\x06 \x03(\x0b\x32\r.pb.Extension\"\xa2\x01\n\x07Pattern\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x0f\n\x07pattern\x18\x04 \x01(\t\x12\x14\n\x0c\x65rrorMessage\x18\x05 \x01(\t\x12\x13\n\x0b\x65rrorAppTag\x18\x06 \x01(\t\x12\x10\n\x08inverted\x18\x07 \x01(\x08\x12!\n\nextensions\x18\x08 \x03(\x0b\x32\r.pb.Extension\"\xe6\x02\n\x04Type\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x1a\n\x06\x66ormat\x18\x04 \x01(\x0e\x32\n.pb.Format\x12\x17\n\x05\x65nums\x18\x05 \x03(\x0b\x32\x08.pb.Enum\x12\x15\n\x04\x62its\x18\x06 \x03(\x0b\x32\x07.pb.Bit\x12\x18\n\x05range\x18\x07 \x03(\x0b\x32\t.pb.Range\x12\x19\n\x06length\x18\x08 \x03(\x0b\x32\t.pb.Range\x12\x1d\n\x08patterns\x18\t \x03(\x0b\x32\x0b.pb.Pattern\x12\x0c\n\x04path\x18\n \x01(\t\x12\x16\n\x0e\x66ractionDigits\x18\x0b \x01(\x05\x12\x0c\n\x04\x62\x61se\x18\r \x03(\t\x12\x17\n\x0frequireInstance\x18\x0f \x01(\x08\x12\x17\n\x05union\x18\x10 \x03(\x0b\x32\x08.pb.Type\x12!\n\nextensions\x18\x14 \x03(\x0b\x32\r.pb.Extension\"\xd2\x02\n\x04Leaf\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x16\n\x04type\x18\x05 \x01(\x0b\x32\x08.pb.Type\x12 \n\x06\x63onfig\x18\x0e \x01(\x0e\x32\x10.pb.OptionalBool\x12#\n\tmandatory\x18\x0f \x01(\x0e\x32\x10.pb.OptionalBool\x12\x12\n\ndefaultVal\x18\x10 \x01(\t\x12\r\n\x05units\x18\x11 \x01(\t\x12\x16\n\x04when\x18\x12 \x01(\x0b\x32\x08.pb.When\x12\x1a\n\x06status\x18\x13 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12\x17\n\x05musts\x18\x15 \x03(\x0b\x32\x08.pb.Must\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\xd7\x02\n\x08LeafList\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x16\n\x04type\x18\x05 \x01(\x0b\x32\x08.pb.Type\x12 \n\x06\x63onfig\x18\x0e \x01(\x0e\x32\x10.pb.OptionalBool\x12#\n\tmandatory\x18\x0f \x01(\x0e\x32\x10.pb.OptionalBool\x12\x13\n\x0b\x64\x65\x66\x61ultVals\x18\x10 \x03(\t\x12\r\n\x05units\x18\x11 \x01(\t\x12\x16\n\x04when\x18\x12 \x01(\x0b\x32\x08.pb.When\x12\x1a\n\x06status\x18\x13 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12\x17\n\x05musts\x18\x15 \x03(\x0b\x32\x08.pb.Must\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\x17\n\x06Unique\x12\r\n\x05leafs\x18\x01 \x03(\t\"\xb8\x04\n\x04List\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12 \n\x0b\x64\x65\x66initions\x18\x07 \x03(\x0b\x32\x0b.pb.DataDef\x12\'\n\rnotifications\x18\x0c \x03(\x0b\x32\x10.pb.Notification\x12\x0b\n\x03key\x18\r \x03(\t\x12 \n\x06\x63onfig\x18\x0e \x01(\x0e\x32\x10.pb.OptionalBool\x12#\n\tmandatory\x18\x0f \x01(\x0e\x32\x10.pb.OptionalBool\x12\x18\n\x07\x61\x63tions\x18\x11 \x03(\x0b\x32\x07.pb.Rpc\x12\x16\n\x04when\x18\x12 \x01(\x0b\x32\x08.pb.When\x12\x1a\n\x06status\x18\x13 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12\x17\n\x05musts\x18\x15 \x03(\x0b\x32\x08.pb.Must\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\x12\x1a\n\x06unique\x18\x17 \x03(\x0b\x32\n.pb.Unique\x12 \n\torderedBy\x18\x18 \x01(\x0e\x32\r.pb.OrderedBy\x12$\n\x0bminElements\x18\x19 \x01(\x0b\x32\x0f.pb.OptionalInt\x12$\n\x0bmaxElements\x18\x1a \x01(\x0b\x32\x0f.pb.OptionalInt\x12#\n\tunbounded\x18\x1b \x01(\x0e\x32\x10.pb.OptionalBool\"\x1b\n\x0bMetaPointer\x12\x0c\n\x04path\x18\x01 \x01(\t\"\xe6\x01\n\x07\x44\x61taDef\x12\"\n\tcontainer\x18\x01 \x01(\x0b\x32\r.pb.ContainerH\x00\x12\x18\n\x04leaf\x18\x02 \x01(\x0b\x32\x08.pb.LeafH\x00\x12 \n\x08leafList\x18\x03 \x01(\x0b\x32\x0c.pb.LeafListH\x00\x12\x18\n\x04list\x18\x04 \x01(\x0b\x32\x08.pb.ListH\x00\x12\x1c\n\x06\x63hoice\x18\x05 \x01(\x0b\x32\n.pb.ChoiceH\x00\x12\x16\n\x03\x61ny\x18\x06 \x01(\x0b\x32\x07.pb.AnyH\x00\x12\x1e\n\x03ptr\x18\x07 \x01(\x0b\x32\x0f.pb.MetaPointerH\x00\x42\x0b\n\tdef_oneof\"\x96\x02\n\x03\x41ny\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12 \n\x06\x63onfig\x18\x0e \x01(\x0e\x32\x10.pb.OptionalBool\x12#\n\tmandatory\x18\x0f \x01(\x0e\x32\x10.pb.OptionalBool\x12\x16\n\x04when\x18\x12 \x01(\x0b\x32\x08.pb.When\x12\x1a\n\x06status\x18\x13 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12\x17\n\x05musts\x18\x15 \x03(\x0b\x32\x08.pb.Must\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\xce\x01\n\x08Identity\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x1a\n\x06status\x18\x04 \x01(\x0e\x32\n.pb.Status\x12\x0f\n\x07\x62\x61seIds\x18\x05 \x03(\t\x12\x18\n\x10\x64\x65rivedDirectIds\x18\x06 \x03(\t\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\xa2\x01\n\x07\x46\x65\x61ture\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12\x1a\n\x06status\x18\x04 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"d\n\x08Revision\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12!\n\nextensions\x18\x07 \x03(\x0b\x32\r.pb.Extension\"\xb3\x02\n\x06\x43hoice\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12 \n\x06\x63onfig\x18\x0e \x01(\x0e\x32\x10.pb.OptionalBool\x12#\n\tmandatory\x18\x0f \x01(\x0e\x32\x10.pb.OptionalBool\x12\x12\n\ndefaultVal\x18\x10 \x01(\t\x12\x1d\n\x05\x63\x61ses\x18\t \x03(\x0b\x32\x0e.pb.ChoiceCase\x12\x16\n\x04when\x18\x12 \x01(\x0b\x32\x08.pb.When\x12\x1a\n\x06status\x18\x13 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension\"\xdf\x01\n\nChoiceCase\x12\r\n\x05ident\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\x12\x11\n\treference\x18\x03 \x01(\t\x12 \n\x0b\x64\x65\x66initions\x18\x07 \x03(\x0b\x32\x0b.pb.DataDef\x12\x16\n\x04when\x18\x12 \x01(\x0b\x32\x08.pb.When\x12\x1a\n\x06status\x18\x13 \x01(\x0e\x32\n.pb.Status\x12!\n\nifFeatures\x18\x14 \x03(\x0b\x32\r.pb.IfFeature\x12!\n\nextensions\x18\x16 \x03(\x0b\x32\r.pb.Extension*6\n\x0cOptionalBool\x12\x11\n\rNOT_SPECIFIED\x10\x00\x12\x08\n\x04TRUE\x10\x01\x12\t\n\x05\x46\x41LSE\x10\x02*3\n\x06Status\x12\x0b\n\x07\x43URRENT\x10\x00\x12\x0e\n\nDEPRECATED\x10\x01\x12\x0c\n\x08OBSOLETE\x10\x02*!\n\tOrderedBy\x12\n\n\x06SYSTEM\x10\x00\x12\x08\n\x04USER\x10\x01\x42\x06Z\x04./pbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'freeconf.pb.meta_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z\004./pb'
+  _globals['_OPTIONALBOOL']._serialized_start=6338
+  _globals['_OPTIONALBOOL']._serialized_end=6392
+  _globals['_STATUS']._serialized_start=6394
+  _globals['_STATUS']._serialized_end=6445
+  _globals['_ORDEREDBY']._serialized_start=6447
+  _globals['_ORDEREDBY']._serialized_end=6480
+  _globals['_OPTIONALINT']._serialized_start=53
+  _globals['_OPTIONALINT']._serialized_end=92
+  _globals['_MODULE']._serialized_start=95
+  _globals['_MODULE']._serialized_end=524
+  _globals['_RPCINPUT']._serialized_start=527
+  _globals['_RPCINPUT']._serialized_end=685
+  _globals['_RPCOUTPUT']._serialized_start=688
+  _globals['_RPCOUTPUT']._serialized_end=847
+  _globals['_RPC']._serialized_start=850
+  _globals['_RPC']._serialized_end=1068
+  _globals['_NOTIFICATION']._serialized_start=1071
+  _globals['_NOTIFICATION']._serialized_end=1272
+  _globals['_EXTENSIONDEFARG']._serialized_start=1274
+  _globals['_EXTENSIONDEFARG']._serialized_end=1401
+  _globals['_EXTENSIONDEF']._serialized_start=1404
+  _globals['_EXTENSIONDEF']._serialized_end=1575
+  _globals['_EXTENSION']._serialized_start=1577
+  _globals['_EXTENSION']._serialized_end=1654
+  _globals['_IFFEATURE']._serialized_start=1656
+  _globals['_IFFEATURE']._serialized_end=1722
+  _globals['_MUST']._serialized_start=1725
+  _globals['_MUST']._serialized_end=1869
+  _globals['_WHEN']._serialized_start=1871
+  _globals['_WHEN']._serialized_end=1972
+  _globals['_CONTAINER']._serialized_start=1975
+  _globals['_CONTAINER']._serialized_end=2378
+  _globals['_ENUM']._serialized_start=2380
+  _globals['_ENUM']._serialized_end=2491
+  _globals['_BIT']._serialized_start=2493
+  _globals['_BIT']._serialized_end=2571
+  _globals['_RANGENUMBER']._serialized_start=2574
+  _globals['_RANGENUMBER']._serialized_end=2739
+  _globals['_RANGEENTRY']._serialized_start=2741
+  _globals['_RANGEENTRY']._serialized_end=2845
+  _globals['_RANGE']._serialized_start=2847
+  _globals['_RANGE']._serialized_end=2972
+  _globals['_PATTERN']._serialized_start=2975
+  _globals['_PATTERN']._serialized_end=3137
+  _globals['_TYPE']._serialized_start=3140
+  _globals['_TYPE']._serialized_end=3498
+  _globals['_LEAF']._serialized_start=3501
+  _globals['_LEAF']._serialized_end=3839
+  _globals['_LEAFLIST']._serialized_start=3842
+  _globals['_LEAFLIST']._serialized_end=4185
+  _globals['_UNIQUE']._serialized_start=4187
+  _globals['_UNIQUE']._serialized_end=4210
+  _globals['_LIST']._serialized_start=4213
+  _globals['_LIST']._serialized_end=4781
+  _globals['_METAPOINTER']._serialized_start=4783
+  _globals['_METAPOINTER']._serialized_end=4810
+  _globals['_DATADEF']._serialized_start=4813
+  _globals['_DATADEF']._serialized_end=5043
+  _globals['_ANY']._serialized_start=5046
+  _globals['_ANY']._serialized_end=5324
+  _globals['_IDENTITY']._serialized_start=5327
+  _globals['_IDENTITY']._serialized_end=5533
+  _globals['_FEATURE']._serialized_start=5536
+  _globals['_FEATURE']._serialized_end=5698
+  _globals['_REVISION']._serialized_start=5700
+  _globals['_REVISION']._serialized_end=5800
+  _globals['_CHOICE']._serialized_start=5803
+  _globals['_CHOICE']._serialized_end=6110
+  _globals['_CHOICECASE']._serialized_start=6113
+  _globals['_CHOICECASE']._serialized_end=6336
+# @@protoc_insertion_point(module_scope)
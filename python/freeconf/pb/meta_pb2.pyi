@@ -0,0 +1,628 @@
+from freeconf.pb import val_pb2 as _val_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class OptionalBool(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    NOT_SPECIFIED: _ClassVar[OptionalBool]
+    TRUE: _ClassVar[OptionalBool]
+    FALSE: _ClassVar[OptionalBool]
+
+class Status(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    CURRENT: _ClassVar[Status]
+    DEPRECATED: _ClassVar[Status]
+    OBSOLETE: _ClassVar[Status]
+
+class OrderedBy(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    SYSTEM: _ClassVar[OrderedBy]
+    USER: _ClassVar[OrderedBy]
+NOT_SPECIFIED: OptionalBool
+TRUE: OptionalBool
+FALSE: OptionalBool
+CURRENT: Status
+DEPRECATED: Status
+OBSOLETE: Status
+SYSTEM: OrderedBy
+USER: OrderedBy
+
+class OptionalInt(_message.Message):
+    __slots__ = ("valid", "i")
+    VALID_FIELD_NUMBER: _ClassVar[int]
+    I_FIELD_NUMBER: _ClassVar[int]
+    valid: bool
+    i: int
+    def __init__(self, valid: _Optional[bool] = ..., i: _Optional[int] = ...) -> None: ...
+
+class Module(_message.Message):
+    __slots__ = ("ident", "namespace", "prefix", "description", "contact", "organization", "reference", "version", "revisions", "definitions", "notifications", "actions", "identities", "features", "extensions", "extensionDefs")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    NAMESPACE_FIELD_NUMBER: _ClassVar[int]
+    PREFIX_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    CONTACT_FIELD_NUMBER: _ClassVar[int]
+    ORGANIZATION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    VERSION_FIELD_NUMBER: _ClassVar[int]
+    REVISIONS_FIELD_NUMBER: _ClassVar[int]
+    DEFINITIONS_FIELD_NUMBER: _ClassVar[int]
+    NOTIFICATIONS_FIELD_NUMBER: _ClassVar[int]
+    ACTIONS_FIELD_NUMBER: _ClassVar[int]
+    IDENTITIES_FIELD_NUMBER: _ClassVar[int]
+    FEATURES_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONDEFS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    namespace: str
+    prefix: str
+    description: str
+    contact: str
+    organization: str
+    reference: str
+    version: str
+    revisions: _containers.RepeatedCompositeFieldContainer[Revision]
+    definitions: _containers.RepeatedCompositeFieldContainer[DataDef]
+    notifications: _containers.RepeatedCompositeFieldContainer[Notification]
+    actions: _containers.RepeatedCompositeFieldContainer[Rpc]
+    identities: _containers.RepeatedCompositeFieldContainer[Identity]
+    features: _containers.RepeatedCompositeFieldContainer[Feature]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    extensionDefs: _containers.RepeatedCompositeFieldContainer[ExtensionDef]
+    def __init__(self, ident: _Optional[str] = ..., namespace: _Optional[str] = ..., prefix: _Optional[str] = ..., description: _Optional[str] = ..., contact: _Optional[str] = ..., organization: _Optional[str] = ..., reference: _Optional[str] = ..., version: _Optional[str] = ..., revisions: _Optional[_Iterable[_Union[Revision, _Mapping]]] = ..., definitions: _Optional[_Iterable[_Union[DataDef, _Mapping]]] = ..., notifications: _Optional[_Iterable[_Union[Notification, _Mapping]]] = ..., actions: _Optional[_Iterable[_Union[Rpc, _Mapping]]] = ..., identities: _Optional[_Iterable[_Union[Identity, _Mapping]]] = ..., features: _Optional[_Iterable[_Union[Feature, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ..., extensionDefs: _Optional[_Iterable[_Union[ExtensionDef, _Mapping]]] = ...) -> None: ...
+
+class RpcInput(_message.Message):
+    __slots__ = ("reference", "definitions", "ifFeatures", "musts", "extensions")
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    DEFINITIONS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    MUSTS_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    reference: str
+    definitions: _containers.RepeatedCompositeFieldContainer[DataDef]
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    musts: _containers.RepeatedCompositeFieldContainer[Must]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, reference: _Optional[str] = ..., definitions: _Optional[_Iterable[_Union[DataDef, _Mapping]]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., musts: _Optional[_Iterable[_Union[Must, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class RpcOutput(_message.Message):
+    __slots__ = ("reference", "definitions", "ifFeatures", "musts", "extensions")
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    DEFINITIONS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    MUSTS_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    reference: str
+    definitions: _containers.RepeatedCompositeFieldContainer[DataDef]
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    musts: _containers.RepeatedCompositeFieldContainer[Must]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, reference: _Optional[str] = ..., definitions: _Optional[_Iterable[_Union[DataDef, _Mapping]]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., musts: _Optional[_Iterable[_Union[Must, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Rpc(_message.Message):
+    __slots__ = ("ident", "description", "reference", "input", "output", "status", "ifFeatures", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    INPUT_FIELD_NUMBER: _ClassVar[int]
+    OUTPUT_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    input: RpcInput
+    output: RpcOutput
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., input: _Optional[_Union[RpcInput, _Mapping]] = ..., output: _Optional[_Union[RpcOutput, _Mapping]] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Notification(_message.Message):
+    __slots__ = ("ident", "description", "reference", "definitions", "status", "ifFeatures", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    DEFINITIONS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    definitions: _containers.RepeatedCompositeFieldContainer[DataDef]
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., definitions: _Optional[_Iterable[_Union[DataDef, _Mapping]]] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class ExtensionDefArg(_message.Message):
+    __slots__ = ("ident", "description", "reference", "yinElement", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    YINELEMENT_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    yinElement: bool
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., yinElement: _Optional[bool] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class ExtensionDef(_message.Message):
+    __slots__ = ("ident", "description", "reference", "status", "argument", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    ARGUMENT_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    status: Status
+    argument: ExtensionDefArg
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., status: _Optional[_Union[Status, str]] = ..., argument: _Optional[_Union[ExtensionDefArg, _Mapping]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Extension(_message.Message):
+    __slots__ = ("ident", "prefix", "keyword", "argument")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    PREFIX_FIELD_NUMBER: _ClassVar[int]
+    KEYWORD_FIELD_NUMBER: _ClassVar[int]
+    ARGUMENT_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    prefix: str
+    keyword: str
+    argument: str
+    def __init__(self, ident: _Optional[str] = ..., prefix: _Optional[str] = ..., keyword: _Optional[str] = ..., argument: _Optional[str] = ...) -> None: ...
+
+class IfFeature(_message.Message):
+    __slots__ = ("expression", "extensions")
+    EXPRESSION_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    expression: str
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, expression: _Optional[str] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Must(_message.Message):
+    __slots__ = ("expression", "description", "reference", "errorMessage", "errorAppTag", "extensions")
+    EXPRESSION_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    ERRORMESSAGE_FIELD_NUMBER: _ClassVar[int]
+    ERRORAPPTAG_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    expression: str
+    description: str
+    reference: str
+    errorMessage: str
+    errorAppTag: str
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, expression: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., errorMessage: _Optional[str] = ..., errorAppTag: _Optional[str] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class When(_message.Message):
+    __slots__ = ("expression", "description", "reference", "extensions")
+    EXPRESSION_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    expression: str
+    description: str
+    reference: str
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, expression: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Container(_message.Message):
+    __slots__ = ("ident", "description", "reference", "presence", "definitions", "config", "mandatory", "actions", "notifications", "when", "status", "ifFeatures", "musts", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    PRESENCE_FIELD_NUMBER: _ClassVar[int]
+    DEFINITIONS_FIELD_NUMBER: _ClassVar[int]
+    CONFIG_FIELD_NUMBER: _ClassVar[int]
+    MANDATORY_FIELD_NUMBER: _ClassVar[int]
+    ACTIONS_FIELD_NUMBER: _ClassVar[int]
+    NOTIFICATIONS_FIELD_NUMBER: _ClassVar[int]
+    WHEN_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    MUSTS_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    presence: str
+    definitions: _containers.RepeatedCompositeFieldContainer[DataDef]
+    config: OptionalBool
+    mandatory: OptionalBool
+    actions: _containers.RepeatedCompositeFieldContainer[Rpc]
+    notifications: _containers.RepeatedCompositeFieldContainer[Notification]
+    when: When
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    musts: _containers.RepeatedCompositeFieldContainer[Must]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., presence: _Optional[str] = ..., definitions: _Optional[_Iterable[_Union[DataDef, _Mapping]]] = ..., config: _Optional[_Union[OptionalBool, str]] = ..., mandatory: _Optional[_Union[OptionalBool, str]] = ..., actions: _Optional[_Iterable[_Union[Rpc, _Mapping]]] = ..., notifications: _Optional[_Iterable[_Union[Notification, _Mapping]]] = ..., when: _Optional[_Union[When, _Mapping]] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., musts: _Optional[_Iterable[_Union[Must, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Enum(_message.Message):
+    __slots__ = ("ident", "description", "reference", "value", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    value: int
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., value: _Optional[int] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Bit(_message.Message):
+    __slots__ = ("ident", "description", "reference", "position")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    POSITION_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    position: int
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., position: _Optional[int] = ...) -> None: ...
+
+class RangeNumber(_message.Message):
+    __slots__ = ("str", "isMax", "isMin", "integer", "integerSet", "unsigned", "unsignedSet", "float", "floatSet")
+    STR_FIELD_NUMBER: _ClassVar[int]
+    ISMAX_FIELD_NUMBER: _ClassVar[int]
+    ISMIN_FIELD_NUMBER: _ClassVar[int]
+    INTEGER_FIELD_NUMBER: _ClassVar[int]
+    INTEGERSET_FIELD_NUMBER: _ClassVar[int]
+    UNSIGNED_FIELD_NUMBER: _ClassVar[int]
+    UNSIGNEDSET_FIELD_NUMBER: _ClassVar[int]
+    FLOAT_FIELD_NUMBER: _ClassVar[int]
+    FLOATSET_FIELD_NUMBER: _ClassVar[int]
+    str: str
+    isMax: bool
+    isMin: bool
+    integer: int
+    integerSet: bool
+    unsigned: int
+    unsignedSet: bool
+    float: float
+    floatSet: bool
+    def __init__(self, str: _Optional[str] = ..., isMax: _Optional[bool] = ..., isMin: _Optional[bool] = ..., integer: _Optional[int] = ..., integerSet: _Optional[bool] = ..., unsigned: _Optional[int] = ..., unsignedSet: _Optional[bool] = ..., float: _Optional[float] = ..., floatSet: _Optional[bool] = ...) -> None: ...
+
+class RangeEntry(_message.Message):
+    __slots__ = ("min", "max", "exact")
+    MIN_FIELD_NUMBER: _ClassVar[int]
+    MAX_FIELD_NUMBER: _ClassVar[int]
+    EXACT_FIELD_NUMBER: _ClassVar[int]
+    min: RangeNumber
+    max: RangeNumber
+    exact: RangeNumber
+    def __init__(self, min: _Optional[_Union[RangeNumber, _Mapping]] = ..., max: _Optional[_Union[RangeNumber, _Mapping]] = ..., exact: _Optional[_Union[RangeNumber, _Mapping]] = ...) -> None: ...
+
+class Range(_message.Message):
+    __slots__ = ("description", "reference", "errorMessage", "errorAppTag", "extensions")
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    ERRORMESSAGE_FIELD_NUMBER: _ClassVar[int]
+    ERRORAPPTAG_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    description: str
+    reference: str
+    errorMessage: str
+    errorAppTag: str
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, description: _Optional[str] = ..., reference: _Optional[str] = ..., errorMessage: _Optional[str] = ..., errorAppTag: _Optional[str] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Pattern(_message.Message):
+    __slots__ = ("description", "reference", "pattern", "errorMessage", "errorAppTag", "inverted", "extensions")
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    PATTERN_FIELD_NUMBER: _ClassVar[int]
+    ERRORMESSAGE_FIELD_NUMBER: _ClassVar[int]
+    ERRORAPPTAG_FIELD_NUMBER: _ClassVar[int]
+    INVERTED_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    description: str
+    reference: str
+    pattern: str
+    errorMessage: str
+    errorAppTag: str
+    inverted: bool
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, description: _Optional[str] = ..., reference: _Optional[str] = ..., pattern: _Optional[str] = ..., errorMessage: _Optional[str] = ..., errorAppTag: _Optional[str] = ..., inverted: _Optional[bool] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Type(_message.Message):
+    __slots__ = ("ident", "description", "reference", "format", "enums", "bits", "range", "length", "patterns", "path", "fractionDigits", "base", "requireInstance", "union", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    ENUMS_FIELD_NUMBER: _ClassVar[int]
+    BITS_FIELD_NUMBER: _ClassVar[int]
+    RANGE_FIELD_NUMBER: _ClassVar[int]
+    LENGTH_FIELD_NUMBER: _ClassVar[int]
+    PATTERNS_FIELD_NUMBER: _ClassVar[int]
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    FRACTIONDIGITS_FIELD_NUMBER: _ClassVar[int]
+    BASE_FIELD_NUMBER: _ClassVar[int]
+    REQUIREINSTANCE_FIELD_NUMBER: _ClassVar[int]
+    UNION_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    format: _val_pb2.Format
+    enums: _containers.RepeatedCompositeFieldContainer[Enum]
+    bits: _containers.RepeatedCompositeFieldContainer[Bit]
+    range: _containers.RepeatedCompositeFieldContainer[Range]
+    length: _containers.RepeatedCompositeFieldContainer[Range]
+    patterns: _containers.RepeatedCompositeFieldContainer[Pattern]
+    path: str
+    fractionDigits: int
+    base: _containers.RepeatedScalarFieldContainer[str]
+    requireInstance: bool
+    union: _containers.RepeatedCompositeFieldContainer[Type]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., format: _Optional[_Union[_val_pb2.Format, str]] = ..., enums: _Optional[_Iterable[_Union[Enum, _Mapping]]] = ..., bits: _Optional[_Iterable[_Union[Bit, _Mapping]]] = ..., range: _Optional[_Iterable[_Union[Range, _Mapping]]] = ..., length: _Optional[_Iterable[_Union[Range, _Mapping]]] = ..., patterns: _Optional[_Iterable[_Union[Pattern, _Mapping]]] = ..., path: _Optional[str] = ..., fractionDigits: _Optional[int] = ..., base: _Optional[_Iterable[str]] = ..., requireInstance: _Optional[bool] = ..., union: _Optional[_Iterable[_Union[Type, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Leaf(_message.Message):
+    __slots__ = ("ident", "description", "reference", "type", "config", "mandatory", "defaultVal", "units", "when", "status", "ifFeatures", "musts", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    CONFIG_FIELD_NUMBER: _ClassVar[int]
+    MANDATORY_FIELD_NUMBER: _ClassVar[int]
+    DEFAULTVAL_FIELD_NUMBER: _ClassVar[int]
+    UNITS_FIELD_NUMBER: _ClassVar[int]
+    WHEN_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    MUSTS_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    type: Type
+    config: OptionalBool
+    mandatory: OptionalBool
+    defaultVal: str
+    units: str
+    when: When
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    musts: _containers.RepeatedCompositeFieldContainer[Must]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., type: _Optional[_Union[Type, _Mapping]] = ..., config: _Optional[_Union[OptionalBool, str]] = ..., mandatory: _Optional[_Union[OptionalBool, str]] = ..., defaultVal: _Optional[str] = ..., units: _Optional[str] = ..., when: _Optional[_Union[When, _Mapping]] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., musts: _Optional[_Iterable[_Union[Must, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class LeafList(_message.Message):
+    __slots__ = ("ident", "description", "reference", "type", "config", "mandatory", "defaultVals", "units", "when", "status", "ifFeatures", "musts", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    CONFIG_FIELD_NUMBER: _ClassVar[int]
+    MANDATORY_FIELD_NUMBER: _ClassVar[int]
+    DEFAULTVALS_FIELD_NUMBER: _ClassVar[int]
+    UNITS_FIELD_NUMBER: _ClassVar[int]
+    WHEN_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    MUSTS_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    type: Type
+    config: OptionalBool
+    mandatory: OptionalBool
+    defaultVals: _containers.RepeatedScalarFieldContainer[str]
+    units: str
+    when: When
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    musts: _containers.RepeatedCompositeFieldContainer[Must]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., type: _Optional[_Union[Type, _Mapping]] = ..., config: _Optional[_Union[OptionalBool, str]] = ..., mandatory: _Optional[_Union[OptionalBool, str]] = ..., defaultVals: _Optional[_Iterable[str]] = ..., units: _Optional[str] = ..., when: _Optional[_Union[When, _Mapping]] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., musts: _Optional[_Iterable[_Union[Must, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Unique(_message.Message):
+    __slots__ = ("leafs",)
+    LEAFS_FIELD_NUMBER: _ClassVar[int]
+    leafs: _containers.RepeatedScalarFieldContainer[str]
+    def __init__(self, leafs: _Optional[_Iterable[str]] = ...) -> None: ...
+
+class List(_message.Message):
+    __slots__ = ("ident", "description", "reference", "definitions", "notifications", "key", "config", "mandatory", "actions", "when", "status", "ifFeatures", "musts", "extensions", "unique", "orderedBy", "minElements", "maxElements", "unbounded")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    DEFINITIONS_FIELD_NUMBER: _ClassVar[int]
+    NOTIFICATIONS_FIELD_NUMBER: _ClassVar[int]
+    KEY_FIELD_NUMBER: _ClassVar[int]
+    CONFIG_FIELD_NUMBER: _ClassVar[int]
+    MANDATORY_FIELD_NUMBER: _ClassVar[int]
+    ACTIONS_FIELD_NUMBER: _ClassVar[int]
+    WHEN_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    MUSTS_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    UNIQUE_FIELD_NUMBER: _ClassVar[int]
+    ORDEREDBY_FIELD_NUMBER: _ClassVar[int]
+    MINELEMENTS_FIELD_NUMBER: _ClassVar[int]
+    MAXELEMENTS_FIELD_NUMBER: _ClassVar[int]
+    UNBOUNDED_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    definitions: _containers.RepeatedCompositeFieldContainer[DataDef]
+    notifications: _containers.RepeatedCompositeFieldContainer[Notification]
+    key: _containers.RepeatedScalarFieldContainer[str]
+    config: OptionalBool
+    mandatory: OptionalBool
+    actions: _containers.RepeatedCompositeFieldContainer[Rpc]
+    when: When
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    musts: _containers.RepeatedCompositeFieldContainer[Must]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    unique: _containers.RepeatedCompositeFieldContainer[Unique]
+    orderedBy: OrderedBy
+    minElements: OptionalInt
+    maxElements: OptionalInt
+    unbounded: OptionalBool
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., definitions: _Optional[_Iterable[_Union[DataDef, _Mapping]]] = ..., notifications: _Optional[_Iterable[_Union[Notification, _Mapping]]] = ..., key: _Optional[_Iterable[str]] = ..., config: _Optional[_Union[OptionalBool, str]] = ..., mandatory: _Optional[_Union[OptionalBool, str]] = ..., actions: _Optional[_Iterable[_Union[Rpc, _Mapping]]] = ..., when: _Optional[_Union[When, _Mapping]] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., musts: _Optional[_Iterable[_Union[Must, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ..., unique: _Optional[_Iterable[_Union[Unique, _Mapping]]] = ..., orderedBy: _Optional[_Union[OrderedBy, str]] = ..., minElements: _Optional[_Union[OptionalInt, _Mapping]] = ..., maxElements: _Optional[_Union[OptionalInt, _Mapping]] = ..., unbounded: _Optional[_Union[OptionalBool, str]] = ...) -> None: ...
+
+class MetaPointer(_message.Message):
+    __slots__ = ("path",)
+    PATH_FIELD_NUMBER: _ClassVar[int]
+    path: str
+    def __init__(self, path: _Optional[str] = ...) -> None: ...
+
+class DataDef(_message.Message):
+    __slots__ = ("container", "leaf", "leafList", "list", "choice", "any", "ptr")
+    CONTAINER_FIELD_NUMBER: _ClassVar[int]
+    LEAF_FIELD_NUMBER: _ClassVar[int]
+    LEAFLIST_FIELD_NUMBER: _ClassVar[int]
+    LIST_FIELD_NUMBER: _ClassVar[int]
+    CHOICE_FIELD_NUMBER: _ClassVar[int]
+    ANY_FIELD_NUMBER: _ClassVar[int]
+    PTR_FIELD_NUMBER: _ClassVar[int]
+    container: Container
+    leaf: Leaf
+    leafList: LeafList
+    list: List
+    choice: Choice
+    any: Any
+    ptr: MetaPointer
+    def __init__(self, container: _Optional[_Union[Container, _Mapping]] = ..., leaf: _Optional[_Union[Leaf, _Mapping]] = ..., leafList: _Optional[_Union[LeafList, _Mapping]] = ..., list: _Optional[_Union[List, _Mapping]] = ..., choice: _Optional[_Union[Choice, _Mapping]] = ..., any: _Optional[_Union[Any, _Mapping]] = ..., ptr: _Optional[_Union[MetaPointer, _Mapping]] = ...) -> None: ...
+
+class Any(_message.Message):
+    __slots__ = ("ident", "description", "reference", "config", "mandatory", "when", "status", "ifFeatures", "musts", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    CONFIG_FIELD_NUMBER: _ClassVar[int]
+    MANDATORY_FIELD_NUMBER: _ClassVar[int]
+    WHEN_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    MUSTS_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    config: OptionalBool
+    mandatory: OptionalBool
+    when: When
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    musts: _containers.RepeatedCompositeFieldContainer[Must]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., config: _Optional[_Union[OptionalBool, str]] = ..., mandatory: _Optional[_Union[OptionalBool, str]] = ..., when: _Optional[_Union[When, _Mapping]] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., musts: _Optional[_Iterable[_Union[Must, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Identity(_message.Message):
+    __slots__ = ("ident", "description", "reference", "status", "baseIds", "derivedDirectIds", "ifFeatures", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    BASEIDS_FIELD_NUMBER: _ClassVar[int]
+    DERIVEDDIRECTIDS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    status: Status
+    baseIds: _containers.RepeatedScalarFieldContainer[str]
+    derivedDirectIds: _containers.RepeatedScalarFieldContainer[str]
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., status: _Optional[_Union[Status, str]] = ..., baseIds: _Optional[_Iterable[str]] = ..., derivedDirectIds: _Optional[_Iterable[str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Feature(_message.Message):
+    __slots__ = ("ident", "description", "reference", "status", "ifFeatures", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Revision(_message.Message):
+    __slots__ = ("ident", "description", "reference", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class Choice(_message.Message):
+    __slots__ = ("ident", "description", "reference", "config", "mandatory", "defaultVal", "cases", "when", "status", "ifFeatures", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    CONFIG_FIELD_NUMBER: _ClassVar[int]
+    MANDATORY_FIELD_NUMBER: _ClassVar[int]
+    DEFAULTVAL_FIELD_NUMBER: _ClassVar[int]
+    CASES_FIELD_NUMBER: _ClassVar[int]
+    WHEN_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    config: OptionalBool
+    mandatory: OptionalBool
+    defaultVal: str
+    cases: _containers.RepeatedCompositeFieldContainer[ChoiceCase]
+    when: When
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., config: _Optional[_Union[OptionalBool, str]] = ..., mandatory: _Optional[_Union[OptionalBool, str]] = ..., defaultVal: _Optional[str] = ..., cases: _Optional[_Iterable[_Union[ChoiceCase, _Mapping]]] = ..., when: _Optional[_Union[When, _Mapping]] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
+
+class ChoiceCase(_message.Message):
+    __slots__ = ("ident", "description", "reference", "definitions", "when", "status", "ifFeatures", "extensions")
+    IDENT_FIELD_NUMBER: _ClassVar[int]
+    DESCRIPTION_FIELD_NUMBER: _ClassVar[int]
+    REFERENCE_FIELD_NUMBER: _ClassVar[int]
+    DEFINITIONS_FIELD_NUMBER: _ClassVar[int]
+    WHEN_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    IFFEATURES_FIELD_NUMBER: _ClassVar[int]
+    EXTENSIONS_FIELD_NUMBER: _ClassVar[int]
+    ident: str
+    description: str
+    reference: str
+    definitions: _containers.RepeatedCompositeFieldContainer[DataDef]
+    when: When
+    status: Status
+    ifFeatures: _containers.RepeatedCompositeFieldContainer[IfFeature]
+    extensions: _containers.RepeatedCompositeFieldContainer[Extension]
+    def __init__(self, ident: _Optional[str] = ..., description: _Optional[str] = ..., reference: _Optional[str] = ..., definitions: _Optional[_Iterable[_Union[DataDef, _Mapping]]] = ..., when: _Optional[_Union[When, _Mapping]] = ..., status: _Optional[_Union[Status, str]] = ..., ifFeatures: _Optional[_Iterable[_Union[IfFeature, _Mapping]]] = ..., extensions: _Optional[_Iterable[_Union[Extension, _Mapping]]] = ...) -> None: ...
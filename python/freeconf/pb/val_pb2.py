@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: freeconf/pb/val.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'freeconf/pb/val.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x15\x66reeconf/pb/val.proto\x12\x02pb\"$\n\x07\x45numVal\x12\n\n\x02id\x18\x01 \x01(\x05\x12\r\n\x05label\x18\x02 \x01(\t\"\'\n\x08IdentRef\x12\x0c\n\x04\x62\x61se\x18\x01 \x01(\t\x12\r\n\x05label\x18\x02 \x01(\t\"\xcb\x03\n\x08ValUnion\x12\x14\n\nbinary_val\x18\x01 \x01(\x0cH\x00\x12\x12\n\x08\x62its_val\x18\x02 \x01(\x0cH\x00\x12\x12\n\x08\x62ool_val\x18\x03 \x01(\x08H\x00\x12\x17\n\rdecimal64_val\x18\x04 \x01(\x01H\x00\x12\x13\n\tempty_val\x18\x05 \x01(\tH\x00\x12\x1f\n\x08\x65num_val\x18\x06 \x01(\x0b\x32\x0b.pb.EnumValH\x00\x12%\n\rident_ref_val\x18\x07 \x01(\x0b\x32\x0c.pb.IdentRefH\x00\x12\x1a\n\x10instance_ref_val\x18\x08 \x01(\tH\x00\x12\x12\n\x08int8_val\x18\t \x01(\x05H\x00\x12\x13\n\tint16_val\x18\n \x01(\x05H\x00\x12\x13\n\tint32_val\x18\x0b \x01(\x05H\x00\x12\x13\n\tint64_val\x18\x0c \x01(\x03H\x00\x12\x14\n\nstring_val\x18\x0e \x01(\tH\x00\x12\x13\n\tuint8_val\x18\x0f \x01(\rH\x00\x12\x14\n\nuint16_val\x18\x10 \x01(\rH\x00\x12\x14\n\nuint32_val\x18\x11 \x01(\rH\x00\x12\x14\n\nuint64_val\x18\x12 \x01(\x04H\x00\x12\x13\n\tunion_val\x18\x13 \x01(\x0cH\x00\x12\x11\n\x07\x61ny_val\x18\x14 \x01(\x0cH\x00\x42\x07\n\x05value\"`\n\x03Val\x12\x1a\n\x06\x66ormat\x18\x01 \x01(\x0e\x32\n.pb.Format\x12\x1b\n\x05value\x18\x02 \x01(\x0b\x32\x0c.pb.ValUnion\x12 \n\nlist_value\x18\x03 \x03(\x0b\x32\x0c.pb.ValUnion*\x91\x04\n\x06\x46ormat\x12\r\n\tUNDEFINED\x10\x00\x12\n\n\x06\x42INARY\x10\x01\x12\x08\n\x04\x42ITS\x10\x02\x12\x08\n\x04\x42OOL\x10\x03\x12\r\n\tDECIMAL64\x10\x04\x12\t\n\x05\x45MPTY\x10\x05\x12\x08\n\x04\x45NUM\x10\x06\x12\x10\n\x0cIDENTITY_REF\x10\x07\x12\x08\n\x04INT8\x10\t\x12\t\n\x05INT16\x10\n\x12\t\n\x05INT32\x10\x0b\x12\t\n\x05INT64\x10\x0c\x12\x0c\n\x08LEAF_REF\x10\r\x12\n\n\x06STRING\x10\x0e\x12\t\n\x05UINT8\x10\x0f\x12\n\n\x06UINT16\x10\x10\x12\n\n\x06UINT32\x10\x11\x12\n\n\x06UINT64\x10\x12\x12\x10\n\x0b\x42INARY_LIST\x10\x81\x08\x12\x0e\n\tBITS_LIST\x10\x82\x08\x12\x0e\n\tBOOL_LIST\x10\x83\x08\x12\x13\n\x0e\x44\x45\x43IMAL64_LIST\x10\x84\x08\x12\x0f\n\nEMPTY_LIST\x10\x85\x08\x12\x0e\n\tENUM_LIST\x10\x86\x08\x12\x16\n\x11IDENTITY_REF_LIST\x10\x87\x08\x12\x0e\n\tINT8_LIST\x10\x89\x08\x12\x0f\n\nINT16_LIST\x10\x8a\x08\x12\x0f\n\nINT32_LIST\x10\x8b\x08\x12\x0f\n\nINT64_LIST\x10\x8c\x08\x12\x12\n\rLEAF_REF_LIST\x10\x8d\x08\x12\x10\n\x0bSTRING_LIST\x10\x8e\x08\x12\x0f\n\nUINT8_LIST\x10\x8f\x08\x12\x10\n\x0bUINT16_LIST\x10\x90\x08\x12\x10\n\x0bUINT32_LIST\x10\x91\x08\x12\x10\n\x0bUINT64_LIST\x10\x92\x08\x42\x06Z\x04./pbb\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'freeconf.pb.val_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'Z\004./pb'
+  _globals['_FORMAT']._serialized_start=669
+  _globals['_FORMAT']._serialized_end=1198
+  _globals['_ENUMVAL']._serialized_start=29
+  _globals['_ENUMVAL']._serialized_end=65
+  _globals['_IDENTREF']._serialized_start=67
+  _globals['_IDENTREF']._serialized_end=106
+  _globals['_VALUNION']._serialized_start=109
+  _globals['_VALUNION']._serialized_end=568
+  _globals['_VAL']._serialized_start=570
+  _globals['_VAL']._serialized_end=666
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,149 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Format(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+    __slots__ = ()
+    UNDEFINED: _ClassVar[Format]
+    BINARY: _ClassVar[Format]
+    BITS: _ClassVar[Format]
+    BOOL: _ClassVar[Format]
+    DECIMAL64: _ClassVar[Format]
+    EMPTY: _ClassVar[Format]
+    ENUM: _ClassVar[Format]
+    IDENTITY_REF: _ClassVar[Format]
+    INT8: _ClassVar[Format]
+    INT16: _ClassVar[Format]
+    INT32: _ClassVar[Format]
+    INT64: _ClassVar[Format]
+    LEAF_REF: _ClassVar[Format]
+    STRING: _ClassVar[Format]
+    UINT8: _ClassVar[Format]
+    UINT16: _ClassVar[Format]
+    UINT32: _ClassVar[Format]
+    UINT64: _ClassVar[Format]
+    BINARY_LIST: _ClassVar[Format]
+    BITS_LIST: _ClassVar[Format]
+    BOOL_LIST: _ClassVar[Format]
+    DECIMAL64_LIST: _ClassVar[Format]
+    EMPTY_LIST: _ClassVar[Format]
+    ENUM_LIST: _ClassVar[Format]
+    IDENTITY_REF_LIST: _ClassVar[Format]
+    INT8_LIST: _ClassVar[Format]
+    INT16_LIST: _ClassVar[Format]
+    INT32_LIST: _ClassVar[Format]
+    INT64_LIST: _ClassVar[Format]
+    LEAF_REF_LIST: _ClassVar[Format]
+    STRING_LIST: _ClassVar[Format]
+    UINT8_LIST: _ClassVar[Format]
+    UINT16_LIST: _ClassVar[Format]
+    UINT32_LIST: _ClassVar[Format]
+    UINT64_LIST: _ClassVar[Format]
+UNDEFINED: Format
+BINARY: Format
+BITS: Format
+BOOL: Format
+DECIMAL64: Format
+EMPTY: Format
+ENUM: Format
+IDENTITY_REF: Format
+INT8: Format
+INT16: Format
+INT32: Format
+INT64: Format
+LEAF_REF: Format
+STRING: Format
+UINT8: Format
+UINT16: Format
+UINT32: Format
+UINT64: Format
+BINARY_LIST: Format
+BITS_LIST: Format
+BOOL_LIST: Format
+DECIMAL64_LIST: Format
+EMPTY_LIST: Format
+ENUM_LIST: Format
+IDENTITY_REF_LIST: Format
+INT8_LIST: Format
+INT16_LIST: Format
+INT32_LIST: Format
+INT64_LIST: Format
+LEAF_REF_LIST: Format
+STRING_LIST: Format
+UINT8_LIST: Format
+UINT16_LIST: Format
+UINT32_LIST: Format
+UINT64_LIST: Format
+
+class EnumVal(_message.Message):
+    __slots__ = ("id", "label")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    LABEL_FIELD_NUMBER: _ClassVar[int]
+    id: int
+    label: str
+    def __init__(self, id: _Optional[int] = ..., label: _Optional[str] = ...) -> None: ...
+
+class IdentRef(_message.Message):
+    __slots__ = ("base", "label")
+    BASE_FIELD_NUMBER: _ClassVar[int]
+    LABEL_FIELD_NUMBER: _ClassVar[int]
+    base: str
+    label: str
+    def __init__(self, base: _Optional[str] = ..., label: _Optional[str] = ...) -> None: ...
+
+class ValUnion(_message.Message):
+    __slots__ = ("binary_val", "bits_val", "bool_val", "decimal64_val", "empty_val", "enum_val", "ident_ref_val", "instance_ref_val", "int8_val", "int16_val", "int32_val", "int64_val", "string_val", "uint8_val", "uint16_val", "uint32_val", "uint64_val", "union_val", "any_val")
+    BINARY_VAL_FIELD_NUMBER: _ClassVar[int]
+    BITS_VAL_FIELD_NUMBER: _ClassVar[int]
+    BOOL_VAL_FIELD_NUMBER: _ClassVar[int]
+    DECIMAL64_VAL_FIELD_NUMBER: _ClassVar[int]
+    EMPTY_VAL_FIELD_NUMBER: _ClassVar[int]
+    ENUM_VAL_FIELD_NUMBER: _ClassVar[int]
+    IDENT_REF_VAL_FIELD_NUMBER: _ClassVar[int]
+    INSTANCE_REF_VAL_FIELD_NUMBER: _ClassVar[int]
+    INT8_VAL_FIELD_NUMBER: _ClassVar[int]
+    INT16_VAL_FIELD_NUMBER: _ClassVar[int]
+    INT32_VAL_FIELD_NUMBER: _ClassVar[int]
+    INT64_VAL_FIELD_NUMBER: _ClassVar[int]
+    STRING_VAL_FIELD_NUMBER: _ClassVar[int]
+    UINT8_VAL_FIELD_NUMBER: _ClassVar[int]
+    UINT16_VAL_FIELD_NUMBER: _ClassVar[int]
+    UINT32_VAL_FIELD_NUMBER: _ClassVar[int]
+    UINT64_VAL_FIELD_NUMBER: _ClassVar[int]
+    UNION_VAL_FIELD_NUMBER: _ClassVar[int]
+    ANY_VAL_FIELD_NUMBER: _ClassVar[int]
+    binary_val: bytes
+    bits_val: bytes
+    bool_val: bool
+    decimal64_val: float
+    empty_val: str
+    enum_val: EnumVal
+    ident_ref_val: IdentRef
+    instance_ref_val: str
+    int8_val: int
+    int16_val: int
+    int32_val: int
+    int64_val: int
+    string_val: str
+    uint8_val: int
+    uint16_val: int
+    uint32_val: int
+    uint64_val: int
+    union_val: bytes
+    any_val: bytes
+    def __init__(self, binary_val: _Optional[bytes] = ..., bits_val: _Optional[bytes] = ..., bool_val: _Optional[bool] = ..., decimal64_val: _Optional[float] = ..., empty_val: _Optional[str] = ..., enum_val: _Optional[_Union[EnumVal, _Mapping]] = ..., ident_ref_val: _Optional[_Union[IdentRef, _Mapping]] = ..., instance_ref_val: _Optional[str] = ..., int8_val: _Optional[int] = ..., int16_val: _Optional[int] = ..., int32_val: _Optional[int] = ..., int64_val: _Optional[int] = ..., string_val: _Optional[str] = ..., uint8_val: _Optional[int] = ..., uint16_val: _Optional[int] = ..., uint32_val: _Optional[int] = ..., uint64_val: _Optional[int] = ..., union_val: _Optional[bytes] = ..., any_val: _Optional[bytes] = ...) -> None: ...
+
+class Val(_message.Message):
+    __slots__ = ("format", "value", "list_value")
+    FORMAT_FIELD_NUMBER: _ClassVar[int]
+    VALUE_FIELD_NUMBER: _ClassVar[int]
+    LIST_VALUE_FIELD_NUMBER: _ClassVar[int]
+    format: Format
+    value: ValUnion
+    list_value: _containers.RepeatedCompositeFieldContainer[ValUnion]
+    def __init__(self, format: _Optional[_Union[Format, str]] = ..., value: _Optional[_Union[ValUnion, _Mapping]] = ..., list_value: _Optional[_Iterable[_Union[ValUnion, _Mapping]]] = ...) -> None: ...
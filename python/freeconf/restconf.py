@@ -4,8 +4,17 @@ import freeconf.driver
 
 class Server():
 
-    def __init__(self, device, driver=None):
+    def __init__(self, device, driver=None, cache=False, cache_max_age=None):
+        """
+        :param cache: keep encoded GET responses in Go, with an ETag so clients
+            can get 304 Not Modified, until an edit thru Go ends or a browser's
+            invalidate is called.  Changes made directly to python objects are
+            not seen until then.
+        :param cache_max_age: optional seconds a cached response is used
+        """
         self.driver = driver if driver else freeconf.driver.shared_instance()
-        req = freeconf.pb.fc_pb2.RestconfServerRequest(deviceHnd=device.hnd)
+        max_age_ms = int(cache_max_age * 1000) if cache_max_age else 0
+        req = freeconf.pb.fc_pb2.RestconfServerRequest(deviceHnd=device.hnd,
+            cacheResponses=cache, cacheMaxAgeMs=max_age_ms)
         resp = self.driver.g_proto.RestconfServer(req)
         self.hnd = self.driver.obj_weak.store_hnd(resp.serverHnd, self)
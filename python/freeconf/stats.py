@@ -0,0 +1,329 @@
+import bisect
+import inspect
+import threading
+import time
+import freeconf.pb.fc_pb2
+import freeconf.parser
+import freeconf.node
+import freeconf.nodeutil
+
+# upper bound in seconds of each latency bucket, same as Go so numbers from
+# both sides compare
+LATENCY_BUCKETS = [
+    10e-6, 25e-6, 50e-6, 100e-6, 250e-6, 500e-6,
+    1e-3, 2.5e-3, 5e-3, 10e-3, 25e-3, 50e-3, 100e-3, 1.0,
+]
+
+class Histogram():
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        # streams opened, count is streams that ended
+        self.opened = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, secs):
+        self.count += 1
+        self.total += secs
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, secs)] += 1
+
+    def mean(self):
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, p):
+        """ upper bound of the bucket p percent of calls fall in """
+        want = int(self.count * p / 100)
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen > want:
+                return LATENCY_BUCKETS[min(i, len(LATENCY_BUCKETS) - 1)]
+        return 0
+
+
+class CallStats():
+    """ latency histogram for each method """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.methods = {}
+
+    def record(self, method, secs):
+        with self.lock:
+            self.histogram(method).record(secs)
+
+    def open(self, method):
+        with self.lock:
+            self.histogram(method).opened += 1
+
+    def histogram(self, method):
+        h = self.methods.get(method)
+        if h == None:
+            h = Histogram()
+            self.methods[method] = h
+        return h
+
+    def reset(self):
+        with self.lock:
+            self.methods = {}
+
+    def snapshot(self):
+        """
+        :return: dict of method to dict of count, mean_us, p50_us, p99_us,
+            opened and buckets, the count of calls in each LATENCY_BUCKETS
+            plus one for slower
+        """
+        with self.lock:
+            return {m: call_stat(h.count, h.mean(), h.percentile(50), h.percentile(99), h.opened, h.buckets)
+                    for m, h in sorted(self.methods.items())}
+
+
+def call_stat(count, mean, p50, p99, opened, buckets):
+    return {
+        "count": count,
+        "mean_us": int(mean * 1e6),
+        "p50_us": int(p50 * 1e6),
+        "p99_us": int(p99 * 1e6),
+        "opened": opened,
+        "buckets": list(buckets),
+    }
+
+
+def time_calls(servicer, service, stats):
+    """
+    Record latency of each gRPC method servicer implements.  Must be called
+    before servicer is added to server.  Streaming methods are counted when
+    opened and timed from open to close.
+    """
+    for name, f in unary_methods(servicer):
+        setattr(servicer, name, _timed(f, f"{service}/{name}", stats))
+    for name, f in stream_methods(servicer):
+        setattr(servicer, name, _timed_stream(f, f"{service}/{name}", stats))
+
+def unary_methods(servicer):
+    """
+    (name, callable) of each non-streaming gRPC method on servicer including
+    ones already wrapped
+    """
+    methods = []
+    for name, f in inspect.getmembers(type(servicer), inspect.isfunction):
+        if not name[0].isupper():
+            continue
+        if inspect.iscoroutinefunction(f) or inspect.isasyncgenfunction(f):
+            continue
+        methods.append((name, getattr(servicer, name)))
+    return methods
+
+def stream_methods(servicer):
+    """ (name, callable) of each gRPC method on servicer that streams responses """
+    return [(name, getattr(servicer, name))
+        for name, f in inspect.getmembers(type(servicer), inspect.isasyncgenfunction)
+        if name[0].isupper()]
+
+def _timed_stream(f, method, stats):
+    async def timed(req, context):
+        stats.open(method)
+        t0 = time.perf_counter()
+        try:
+            async for resp in f(req, context):
+                yield resp
+        finally:
+            stats.record(method, time.perf_counter() - t0)
+    return timed
+
+def _timed(f, method, stats):
+    def timed(req, context):
+        t0 = time.perf_counter()
+        try:
+            return f(req, context)
+        finally:
+            stats.record(method, time.perf_counter() - t0)
+    return timed
+
+
+def driver_stats(driver, reset=False):
+    resp = driver.g_stats.Stats(freeconf.pb.fc_pb2.StatsRequest(reset=reset))
+    def calls(stats):
+        return {c.method: call_stat(c.count, c.meanNs / 1e9, c.p50Ns / 1e9, c.p99Ns / 1e9, c.opened, c.buckets)
+            for c in stats}
+    py_calls = driver.x_calls.snapshot()
+    if reset:
+        driver.x_calls.reset()
+    return {
+        "go": {
+            "calls": calls(resp.calls),
+            "x_calls": calls(resp.xCalls),
+            "latency_buckets_us": [ns // 1000 for ns in resp.latencyBucketsNs],
+            "handles": resp.handles,
+            "open_notifications": resp.openNotifications,
+            "notification_subscribers": resp.notificationSubscribers,
+            "read_cache_hits": resp.readCacheHits,
+            "read_cache_misses": resp.readCacheMisses,
+            "client_cache_hits": resp.clientCacheHits,
+            "client_cache_revalidated": resp.clientCacheRevalidated,
+            "client_cache_misses": resp.clientCacheMisses,
+            "response_cache_hits": resp.responseCacheHits,
+            "response_cache_not_modified": resp.responseCacheNotModified,
+            "response_cache_misses": resp.responseCacheMisses,
+        },
+        "python": {
+            "callbacks": py_calls,
+            "latency_buckets_us": [int(b * 1e6) for b in LATENCY_BUCKETS],
+            "strong_handles": len(driver.obj_strong.handles),
+            "weak_handles": len(driver.obj_weak.handles),
+        },
+    }
+
+
+def audit_handles(driver, track_sites=False):
+    if track_sites:
+        driver.obj_strong.track_sites = True
+        driver.obj_weak.track_sites = True
+    resp = driver.g_handles.Audit(freeconf.pb.fc_pb2.HandleAuditRequest(trackSites=track_sites))
+    py_handles = {}
+    for pool in (driver.obj_strong, driver.obj_weak):
+        for k, count in pool.audit().items():
+            py_handles[k] = py_handles.get(k, 0) + count
+    return {
+        "go": {
+            "handles": [(c.type, c.site, c.count) for c in resp.handles],
+            "heap_alloc": resp.heapAlloc,
+            "heap_objects": resp.heapObjects,
+            "goroutines": resp.goroutines,
+        },
+        "python": {
+            "handles": sorted([(t, site, count) for (t, site), count in py_handles.items()],
+                key=lambda c: c[2], reverse=True),
+        },
+    }
+YANG = """
+module fc-lang-stats {
+    namespace "freeconf.org/fc-lang-stats";
+    prefix "stats";
+    revision 2026-10-19;
+    description "overhead of the python/Go bridge itself";
+
+    grouping calls {
+        leaf method {
+            type string;
+        }
+        leaf count {
+            type int64;
+        }
+        leaf mean-us {
+            type int64;
+        }
+        leaf p50-us {
+            type int64;
+        }
+        leaf p99-us {
+            type int64;
+        }
+        leaf opened {
+            description "streams opened, count is streams that ended";
+            type int64;
+        }
+        leaf-list buckets {
+            description "calls in each of latency-buckets-us plus one for slower";
+            type int64;
+        }
+    }
+
+    container go {
+        config false;
+        list calls {
+            description "python calling Go";
+            key method;
+            uses calls;
+        }
+        list x-calls {
+            description "Go calling python as seen from Go";
+            key method;
+            uses calls;
+        }
+        leaf-list latency-buckets-us {
+            type int64;
+        }
+        leaf handles {
+            type int64;
+        }
+        leaf open-notifications {
+            type int64;
+        }
+        leaf notification-subscribers {
+            type int64;
+        }
+        leaf read-cache-hits {
+            type int64;
+        }
+        leaf read-cache-misses {
+            type int64;
+        }
+        leaf client-cache-hits {
+            type int64;
+        }
+        leaf client-cache-revalidated {
+            type int64;
+        }
+        leaf client-cache-misses {
+            type int64;
+        }
+        leaf response-cache-hits {
+            type int64;
+        }
+        leaf response-cache-not-modified {
+            type int64;
+        }
+        leaf response-cache-misses {
+            type int64;
+        }
+    }
+
+    container python {
+        config false;
+        list callbacks {
+            description "python serving calls from Go";
+            key method;
+            uses calls;
+        }
+        leaf-list latency-buckets-us {
+            type int64;
+        }
+        leaf strong-handles {
+            type int64;
+        }
+        leaf weak-handles {
+            type int64;
+        }
+    }
+}
+"""
+
+CALL_LISTS = ("calls", "x_calls", "callbacks")
+
+def _yang_data(stats):
+    """ stats from driver_stats keyed by YANG identifiers """
+    data = {}
+    for k, v in stats.items():
+        ident = k.replace("_", "-")
+        if k in CALL_LISTS:
+            data[ident] = [dict(_yang_data(c), method=m) for m, c in v.items()]
+        elif isinstance(v, dict):
+            data[ident] = _yang_data(v)
+        else:
+            data[ident] = v
+    return data
+
+
+def browser(driver):
+    """
+    Browser on fc-lang-stats module to add to a device so bridge overhead can
+    be read over RESTCONF or gNMI like any other data
+
+        dev.add_browser(freeconf.stats.browser(drv))
+    """
+    m = freeconf.parser.load_module_str(None, YANG, driver=driver)
+    def node_src():
+        return freeconf.nodeutil.Node(_yang_data(driver_stats(driver)))
+    return freeconf.node.Browser(m, None, driver=driver, node_src=node_src)
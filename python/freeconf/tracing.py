@@ -0,0 +1,161 @@
+import collections
+import contextlib
+import json
+import os
+import random
+import threading
+import time
+import grpc
+import freeconf.stats
+
+# same env var Go reads so both sides write one file with whole timeline
+TRACE_FILE_ENV = "FC_LANG_TRACE_FILE"
+
+# metadata keys spans are propagated in on calls in each direction
+TRACE_ID_KEY = "fc-trace-id"
+SPAN_ID_KEY = "fc-span-id"
+
+
+class Span():
+
+    def __init__(self, name, trace_id=None, parent_id=None):
+        self.name = name
+        self.trace_id = trace_id if trace_id else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.start = time.time_ns()
+        self.end = None
+
+    def to_dict(self):
+        d = {
+            "trace": self.trace_id,
+            "span": self.span_id,
+            "name": self.name,
+            "process": "python",
+            "start": self.start,
+            "end": self.end,
+        }
+        if self.parent_id:
+            d["parent"] = self.parent_id
+        return d
+
+
+class FileExporter():
+    """
+    Append spans as JSON lines, one write per span so lines from Go writing
+    the same file do not interleave.
+    """
+
+    def __init__(self, fname):
+        self.fd = os.open(fname, os.O_CREAT | os.O_APPEND | os.O_WRONLY, 0o644)
+
+    def export(self, span):
+        os.write(self.fd, (json.dumps(span.to_dict(), separators=(",", ":")) + "\n").encode())
+
+    def close(self):
+        os.close(self.fd)
+
+
+def exporter_from_env():
+    fname = os.environ.get(TRACE_FILE_ENV)
+    if not fname:
+        return None
+    return FileExporter(fname)
+
+
+class Tracer():
+    """
+    Records spans of calls between python and Go.  Spans on the same thread
+    nest so a call into Go made while serving a callback from Go is on the
+    same timeline.
+
+    :param exporter: any object with export(span) method. None records nothing.
+    """
+
+    def __init__(self, exporter=None):
+        self.exporter = exporter
+        self.local = threading.local()
+
+    def current(self):
+        return getattr(self.local, "span", None)
+
+    @contextlib.contextmanager
+    def span(self, name, trace_id=None, parent_id=None):
+        """
+        Time a block of application code, calls made to Go inside the block
+        are children of this span.
+
+            with drv.tracer.span("reconcile"):
+                ...
+        """
+        if self.exporter == None:
+            yield None
+            return
+        parent = self.current()
+        if trace_id == None and parent != None:
+            trace_id = parent.trace_id
+            parent_id = parent.span_id
+        s = Span(name, trace_id, parent_id)
+        self.local.span = s
+        try:
+            yield s
+        finally:
+            self.local.span = parent
+            s.end = time.time_ns()
+            self.exporter.export(s)
+
+
+class _CallDetails(collections.namedtuple("_CallDetails",
+        ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression")),
+        grpc.ClientCallDetails):
+    pass
+
+
+class ClientInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """ span around each call python makes to Go, sent along so Go spans are children """
+
+    def __init__(self, tracer):
+        self.tracer = tracer
+
+    def intercept_unary_unary(self, continuation, details, request):
+        if self.tracer.exporter == None:
+            return continuation(details, request)
+        with self.tracer.span(method_name(details.method)) as s:
+            metadata = list(details.metadata) if details.metadata else []
+            metadata.append((TRACE_ID_KEY, s.trace_id))
+            metadata.append((SPAN_ID_KEY, s.span_id))
+            details = _CallDetails(details.method, details.timeout, metadata,
+                details.credentials, details.wait_for_ready, details.compression)
+            return continuation(details, request)
+
+
+def method_name(full_method):
+    """ "/pb.Node/Find" is "Node/Find" same as Go """
+    name = full_method.lstrip("/")
+    service, _, method = name.partition("/")
+    return f"{service.rpartition('.')[2]}/{method}"
+
+
+def trace_calls(servicer, service, tracer):
+    """
+    Span around each gRPC method servicer implements continuing trace Go sent.
+    Must be called before servicer is added to server.  Streaming methods
+    are not traced.
+    """
+    for name, f in freeconf.stats.unary_methods(servicer):
+        setattr(servicer, name, _traced(f, f"{service}/{name}", tracer))
+
+def _traced(f, method, tracer):
+    def traced(req, context):
+        if tracer.exporter == None:
+            return f(req, context)
+        trace_id = None
+        parent_id = None
+        for k, v in context.invocation_metadata() or []:
+            if k == TRACE_ID_KEY:
+                trace_id = v
+            elif k == SPAN_ID_KEY:
+                parent_id = v
+        with tracer.span(method, trace_id, parent_id):
+            return f(req, context)
+    return traced
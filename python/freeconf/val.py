@@ -359,3 +359,21 @@ def proto_decode(proto_val):
             vals.append(p_val.uint64_val)
         return Val(vals, Format.UINT64_LIST)
     raise Exception(f'unimplemented list value decoder {pprint(proto_val)}')
+
+
+def proto_native(proto_val):
+    """
+    Plain python value of a proto val as would be read from JSON. Enums and
+    identities are their labels.
+    """
+    if proto_val.format in (val_pb2.ENUM, val_pb2.IDENTITY_REF):
+        return _label(proto_val.value)
+    if proto_val.format in (val_pb2.ENUM_LIST, val_pb2.IDENTITY_REF_LIST):
+        return [_label(x) for x in proto_val.list_value]
+    return proto_decode(proto_val).v
+
+
+def _label(union):
+    if union.HasField('enum_val'):
+        return union.enum_val.label
+    return union.ident_ref_val.label
@@ -2,6 +2,7 @@
 import sys
 import enum
 import signal
+import time
 import logging
 from freeconf import node, driver, nodeutil, parser, source, meta, val
 import freeconf.pb.fc_test_pb2
@@ -40,19 +41,12 @@ class TestHarnessServicer(freeconf.pb.fc_test_pb2_grpc.TestHarnessServicer):
 
 
     def CreateTestCase(self, req, context):
-        out = open(req.traceFile, "w")
-        if req.testCase == freeconf.pb.fc_test_pb2.ECHO:
-            e = Echo()
-            n = e.node()
-        elif req.testCase == freeconf.pb.fc_test_pb2.BASIC or req.testCase == freeconf.pb.fc_test_pb2.ADVANCED:
-            n = nodeutil.Node({})
-        elif req.testCase == freeconf.pb.fc_test_pb2.VAL_TYPES:
-            n = valTypes()
-        else:
-            raise Exception("unimplemented test case")
-        self.trace_node = nodeutil.Trace(n, out)
-        node_hnd = node.ensure_node_hnd(self.driver, self.trace_node)
-        self.trace_file = out
+        n = test_case_node(req.testCase)
+        if req.traceFile != "":
+            self.trace_file = open(req.traceFile, "w")
+            n = nodeutil.Trace(n, self.trace_file)
+        self.trace_node = n
+        node_hnd = node.ensure_node_hnd(self.driver, n)
         return freeconf.pb.fc_test_pb2.CreateTestCaseResponse(nodeHnd=node_hnd)
     
 
@@ -73,6 +67,54 @@ class TestHarnessServicer(freeconf.pb.fc_test_pb2_grpc.TestHarnessServicer):
         return freeconf.pb.fc_test_pb2.ParseModuleResponse(schemaNodeHnd=node_hnd)
 
 
+    def Throughput(self, req, context):
+        """
+        Run test case req.count times without tracing.  Each run releases all
+        the selections it made so nothing builds up between runs.
+        """
+        module_ident = THROUGHPUT_MODULES.get(req.testCase)
+        if module_ident == None:
+            raise Exception("no throughput for test case")
+        ypath = source.path(req.dir, driver=self.driver)
+        m = parser.load_module_file(ypath, module_ident, driver=self.driver)
+        b = node.Browser(m, test_case_node(req.testCase), driver=self.driver)
+        input = nodeutil.json_read_str(req.input, driver=self.driver)
+        t0 = time.perf_counter_ns()
+        for _ in range(req.count):
+            root = b.root()
+            try:
+                if req.testCase == freeconf.pb.fc_test_pb2.ECHO:
+                    sel = root.find("echo")
+                    try:
+                        output = sel.action(input)
+                        if output != None:
+                            output.release()
+                    finally:
+                        sel.release()
+                else:
+                    root.upsert_from(input)
+            finally:
+                root.release()
+        elapsed = time.perf_counter_ns() - t0
+        return freeconf.pb.fc_test_pb2.ThroughputResponse(elapsedNs=elapsed)
+
+
+THROUGHPUT_MODULES = {
+    freeconf.pb.fc_test_pb2.BASIC: "basic",
+    freeconf.pb.fc_test_pb2.ECHO: "echo",
+}
+
+
+def test_case_node(test_case):
+    if test_case == freeconf.pb.fc_test_pb2.ECHO:
+        return Echo().node()
+    if test_case == freeconf.pb.fc_test_pb2.BASIC or test_case == freeconf.pb.fc_test_pb2.ADVANCED:
+        return nodeutil.Node({})
+    if test_case == freeconf.pb.fc_test_pb2.VAL_TYPES:
+        return valTypes()
+    raise Exception("unimplemented test case")
+
+
 def valTypes():
     obj = {
         "a": "hello"
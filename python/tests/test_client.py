@@ -31,6 +31,14 @@ class TestClient(unittest.TestCase):
         actual =  nodeutil.json.json_write_str(root, driver=drv)
         root.release()
         self.assertEqual('{"message":"hello"}', actual)
+
+        cached_dev = device.Device.client(ypath, "http://localhost:9998/restconf", driver=drv,
+            pool_size=4, cache={"data/x:": 60})
+        self.assertEqual(['{"message":"hello"}'] * 2, device.read_all([client_dev, cached_dev], "x"))
+
+        # served from cache so change is not seen
+        app["message"] = "bye"
+        self.assertEqual(['{"message":"bye"}', '{"message":"hello"}'], device.read_all([client_dev, cached_dev], "x"))
         drv.unload()
 
 if __name__ == '__main__':
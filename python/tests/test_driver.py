@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
+import asyncio
 import unittest 
 import freeconf.driver
 import freeconf.parser
 import freeconf.pb.fc_pb2
+import freeconf.node
+import freeconf.nodeutil
+import freeconf.stats
 
 class TestDriver(unittest.TestCase):
 
@@ -17,6 +21,106 @@ class TestDriver(unittest.TestCase):
         d.g_handles.Release(freeconf.pb.fc_pb2.ReleaseRequest(hnd=6))
         d.unload()
 
+    def test_stats(self):
+        d = freeconf.driver.Driver()
+        d.load()
+        m = freeconf.parser.load_module_str(None, "module x { leaf a { type int32; } }", driver=d)
+        b = freeconf.node.Browser(m, freeconf.nodeutil.Node({"a": 1}), driver=d)
+        self.assertEqual('{"a":1}', freeconf.nodeutil.json_write_str(b.root(), driver=d))
+
+        stats = d.stats(reset=True)
+        self.assertEqual(1, stats["go"]["calls"]["Parser/LoadModule"]["count"])
+        self.assertGreater(stats["go"]["x_calls"]["XNode/XField"]["count"], 0)
+        self.assertGreater(stats["python"]["callbacks"]["XNode/XField"]["count"], 0)
+        self.assertGreater(stats["go"]["handles"], 0)
+        self.assertGreater(stats["python"]["strong_handles"], 0)
+        x_field = stats["go"]["x_calls"]["XNode/XField"]
+        self.assertEqual(len(stats["go"]["latency_buckets_us"]) + 1, len(x_field["buckets"]))
+        self.assertEqual(x_field["count"], sum(x_field["buckets"]))
+        self.assertNotIn("Parser/LoadModule", d.stats()["go"]["calls"])
+
+        # stats as YANG data
+        stats_root = freeconf.stats.browser(d).root()
+        py = stats_root.find("python")
+        self.assertIn('"strong-handles"', freeconf.nodeutil.json_write_str(py, driver=d))
+        py.release()
+        stats_root.release()
+        d.unload()
+
+    def test_time_streams(self):
+        class Servicer:
+            async def Stream(self, req, context):
+                for i in range(req):
+                    yield i
+        calls = freeconf.stats.CallStats()
+        s = Servicer()
+        freeconf.stats.time_calls(s, "X", calls)
+        async def read():
+            return [i async for i in s.Stream(3, None)]
+        self.assertEqual([0, 1, 2], asyncio.run(read()))
+        stream = calls.snapshot()["X/Stream"]
+        self.assertEqual(1, stream["opened"])
+        self.assertEqual(1, stream["count"])
+
+    def test_audit_handles(self):
+        d = freeconf.driver.Driver()
+        d.load()
+        d.audit_handles(track_sites=True)
+        m = freeconf.parser.load_module_str(None, "module x { leaf a { type int32; } }", driver=d)
+        b = freeconf.node.Browser(m, freeconf.nodeutil.Node({"a": 1}), driver=d)
+        before = d.audit_handles()
+        root = b.root()
+        sels = [(t, site, count) for t, site, count in d.audit_handles()["python"]["handles"] if t == "Selection"]
+        self.assertEqual(1, len(sels))
+        self.assertIn("test_driver.py", sels[0][1])
+        go_sels = [c for c in d.audit_handles()["go"]["handles"] if c[0] == "*node.Selection"]
+        self.assertEqual(1, len(go_sels))
+
+        # released selections are gone on both sides
+        root.release()
+        after = d.audit_handles()
+        self.assertEqual(before["python"]["handles"], after["python"]["handles"])
+        self.assertEqual(before["go"]["handles"], after["go"]["handles"])
+        self.assertGreater(after["go"]["heap_alloc"], 0)
+        d.unload()
+
+    def test_release_root_twice(self):
+        d = freeconf.driver.Driver()
+        d.load()
+        m = freeconf.parser.load_module_str(None, "module x { leaf a { type int32; } }", driver=d)
+        b = freeconf.node.Browser(m, freeconf.nodeutil.Node({"a": 1}), driver=d)
+        # roots with no child selections still keep browser's node
+        for _ in range(2):
+            root = b.root()
+            root.upsert_from(freeconf.nodeutil.Node({"a": 2}))
+            root.release()
+        root = b.root()
+        self.assertEqual('{"a":2}', freeconf.nodeutil.json_write_str(root, driver=d))
+        root.release()
+        d.unload()
+
+    def test_strong_refs(self):
+        d = freeconf.driver.Driver()
+        d.load()
+        m = freeconf.parser.load_module_str(None, "module x { leaf a { type int32; } }", driver=d)
+        def count(t):
+            return sum(c[2] for c in d.audit_handles()["python"]["handles"] if c[0] == t)
+        self.assertEqual(0, count("StreamRef"))
+        b = freeconf.node.Browser(m, freeconf.nodeutil.Node({}), driver=d)
+        go_before = sum(c[2] for c in d.audit_handles()["go"]["handles"])
+
+        n = freeconf.nodeutil.json_read_str('{"a":1}', driver=d)
+        n.retain()
+        n.release()
+        self.assertEqual(1, count("RemoteRef"))
+        with n:
+            root = b.root()
+            root.upsert_from(n)
+            root.release()
+        self.assertEqual(0, count("RemoteRef"))
+        self.assertEqual(go_before, sum(c[2] for c in d.audit_handles()["go"]["handles"]))
+        self.assertEqual('{"a":1}', freeconf.nodeutil.json_write_str(b.root(), driver=d))
+        d.unload()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
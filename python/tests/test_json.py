@@ -1,12 +1,24 @@
 #!/usr/bin/env python3
 import sys
+import io
+import time
 import unittest 
-from freeconf import driver, parser, node, source, nodeutil
+from concurrent import futures
+from freeconf import driver, parser, node, source, nodeutil, fs
 
 sys.path.append(".")
 import car
 
 
+def wait_for(condition, timeout=5):
+    start = time.time()
+    while not condition():
+        if time.time() - start > timeout:
+            return False
+        time.sleep(0.01)
+    return True
+
+
 class TestJson(unittest.TestCase):
 
     def test_read_car_json(self):
@@ -30,5 +42,48 @@ class TestJson(unittest.TestCase):
         # useful if test won't exit
         # dump_threads()
 
+    def test_iter(self):
+        drv = driver.Driver()
+        drv.load()
+
+        ypath = source.path("testdata", driver=drv)
+        schema = parser.load_module_file(ypath, 'car', driver=drv)
+        b = node.Browser(schema, car.manage(car.Car()), driver=drv)
+        root = b.root()
+        cfg = root.find("?content=config")
+        chunks = list(nodeutil.json_iter(cfg, chunk_size=4, driver=drv))
+        self.assertEqual([b'{"sp', b'eed"', b':0}'], chunks)
+
+        # stopping early is fine
+        for chunk in nodeutil.json_iter(cfg, chunk_size=1, driver=drv):
+            break
+
+        totals = []
+        out = io.BytesIO()
+        n = nodeutil.json_write_io(out, driver=drv, progress=totals.append)
+        cfg.upsert_into(n)
+        self.assertTrue(wait_for(lambda: len(totals) > 0 and totals[-1] == 11))
+        cfg.release()
+        root.release()
+        drv.unload()
+
+    def test_streams_release_handles(self):
+        drv = driver.Driver()
+        drv.load()
+
+        ypath = source.path("testdata", driver=drv)
+        schema = parser.load_module_file(ypath, 'car', driver=drv)
+        b = node.Browser(schema, car.manage(car.Car()), driver=drv)
+        root = b.root()
+        cfg = root.find("?content=config")
+        with futures.ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: nodeutil.json_write_str(cfg, driver=drv), range(32)))
+        self.assertEqual(['{"speed":0}'] * 32, results)
+        cfg.release()
+        root.release()
+        streams = [o for o in drv.obj_strong.handles.values() if isinstance(o, fs.StreamWriter)]
+        self.assertEqual([], streams)
+        drv.unload()
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+import sys
+import time
+import threading
+import asyncio
+import unittest
+from freeconf import nodeutil, driver, node, parser, source, notify
+
+sys.path.append(".")
+import car
+
+def wait_for(condition, timeout=5):
+    start = time.time()
+    while not condition():
+        if time.time() - start > timeout:
+            return False
+        time.sleep(0.01)
+    return True
+
+class TestNotify(unittest.TestCase):
+
+    def test_more_subscribers_than_workers(self):
+        drv = driver.Driver(max_workers=2)
+        drv.load()
+
+        ypath = source.path('testdata', driver=drv)
+        schema = parser.load_module_file(ypath, 'car', driver=drv)
+        app = car.Car()
+        b = node.Browser(schema, car.manage(app), driver=drv)
+        root = b.root()
+
+        lock = threading.Lock()
+        received = []
+        def listener(msg):
+            with lock:
+                received.append(msg)
+
+        n_subs = 12
+        closers = []
+        for _ in range(n_subs):
+            sel = root.find('update')
+            closers.append(sel.notification(listener))
+            sel.release()
+        self.assertTrue(wait_for(lambda: len(app.listeners) == n_subs))
+
+        # open subscriptions must not starve regular callbacks
+        cfg = root.find("?content=config")
+        self.assertEqual('{"speed":0}', nodeutil.json_write_str(cfg, driver=drv))
+        cfg.release()
+
+        app.update_listeners("ping")
+        self.assertTrue(wait_for(lambda: len(received) == n_subs))
+
+        for closer in closers:
+            closer()
+        self.assertTrue(wait_for(lambda: len(app.listeners) == 0))
+        root.release()
+        drv.unload()
+
+    def test_filter(self):
+        drv = driver.Driver()
+        drv.load()
+        ypath = source.path('testdata', driver=drv)
+        schema = parser.load_module_file(ypath, 'car', driver=drv)
+        app = car.Car()
+        b = node.Browser(schema, car.manage(app), driver=drv)
+        root = b.root()
+
+        received = []
+        sel = root.find('update')
+        closer = sel.notification(received.append, filter="event='ping'")
+        self.assertTrue(wait_for(lambda: len(app.listeners) == 1))
+        app.update_listeners("pong")
+        app.update_listeners("ping")
+        self.assertTrue(wait_for(lambda: len(received) == 1))
+        time.sleep(0.1)
+        self.assertEqual(1, len(received))
+
+        closer()
+        sel.release()
+        root.release()
+        drv.unload()
+
+
+class TestSubscriptionQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+    def drain(self, sub):
+        sub.close()
+        events = []
+        while True:
+            e = self.loop.run_until_complete(sub.get())
+            if e == None:
+                return events
+            events.append(e)
+
+    def test_drop_oldest(self):
+        sub = notify.Subscription(self.loop, notify.NotificationOptions(max_queue=2, policy=notify.DROP_OLDEST))
+        for e in ["a", "b", "c"]:
+            sub.put(e)
+        self.assertEqual(["b", "c"], self.drain(sub))
+        self.assertEqual(1, sub.metrics.dropped)
+        self.assertEqual(2, sub.metrics.max_depth)
+        self.assertEqual(2, sub.metrics.delivered)
+
+    def test_coalesce(self):
+        opts = notify.NotificationOptions(policy=notify.COALESCE, coalesce_key=lambda e: e["name"])
+        sub = notify.Subscription(self.loop, opts)
+        sub.put({"name": "eth0", "v": 1})
+        sub.put({"name": "eth1", "v": 1})
+        sub.put({"name": "eth0", "v": 2})
+        self.assertEqual([{"name": "eth0", "v": 2}, {"name": "eth1", "v": 1}], self.drain(sub))
+        self.assertEqual(1, sub.metrics.coalesced)
+
+    def test_block(self):
+        sub = notify.Subscription(self.loop, notify.NotificationOptions(max_queue=1))
+        sub.put("a")
+        t = threading.Thread(target=sub.put, args=("b",))
+        t.start()
+        t.join(0.1)
+        self.assertTrue(t.is_alive())
+        self.assertEqual("a", self.loop.run_until_complete(sub.get()))
+        t.join(1)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(["b"], self.drain(sub))
+
+    def test_block_timeout(self):
+        sub = notify.Subscription(self.loop, notify.NotificationOptions(max_queue=1, block_timeout=0.01))
+        sub.put("a")
+        sub.put("b")
+        self.assertEqual(["a"], self.drain(sub))
+        self.assertEqual(1, sub.metrics.dropped)
+
+    def test_send_from_notify(self):
+        sub = notify.Subscription(self.loop, notify.NotificationOptions(max_queue=1, block_timeout=None))
+        def producer(req):
+            for e in ["a", "b", "c"]:
+                sub.put(e)
+        sub.call_notify(producer, None)
+        self.assertEqual(["a"], self.drain(sub))
+        self.assertEqual(2, sub.metrics.dropped)
+
+    def test_block_default_timeout(self):
+        sub = notify.Subscription(self.loop, notify.NotificationOptions(max_queue=1))
+        sub.put("a")
+        t = threading.Thread(target=sub.put, args=("b",))
+        t.start()
+        t.join(5)
+        self.assertFalse(t.is_alive())
+        self.assertEqual(1, sub.metrics.dropped)
+
+
+class TestFilter(unittest.TestCase):
+
+    def test_compare(self):
+        f = notify.compile_filter("interface='eth0' and (stats/drops>10 or up!='true')")
+        self.assertEqual([['interface'], ['stats', 'drops'], ['up']], f.paths)
+        self.assertTrue(f.matches({"interface": "eth0", "stats": {"drops": 11}}))
+        self.assertTrue(f.matches({"if:interface": "eth0", "up": False}))
+        self.assertFalse(f.matches({"interface": "eth0", "up": True, "stats": {"drops": 1}}))
+        self.assertFalse(f.matches({"interface": "eth1", "up": False}))
+
+    def test_lists_and_presence(self):
+        self.assertTrue(notify.compile_filter("a/b=3").matches({"a": [{"b": 1}, {"b": 3}]}))
+        self.assertFalse(notify.compile_filter("x").matches({}))
+        self.assertTrue(notify.compile_filter("x").matches({"x": "y"}))
+
+    def test_path_predicates(self):
+        f = notify.compile_filter("/if:interface[name=eth0]/stats/drops>10")
+        self.assertEqual([['interface', 'name'], ['interface', 'stats', 'drops']], f.paths)
+        eth0 = {"name": "eth0", "stats": {"drops": 11}}
+        eth1 = {"name": "eth1", "stats": {"drops": 50}}
+        self.assertTrue(f.matches({"interface": [eth1, eth0]}))
+        self.assertFalse(f.matches({"interface": [eth1]}))
+        both = notify.compile_filter("interface[name='eth0'][up='true']")
+        self.assertTrue(both.matches({"interface": [{"name": "eth0", "up": True}]}))
+        self.assertFalse(both.matches({"interface": [{"name": "eth0", "up": False}]}))
+
+    def test_no_filter(self):
+        self.assertIsNone(notify.compile_filter(""))
+        self.assertIsNone(notify.compile_filter(None))
+
+    def test_invalid(self):
+        with self.assertRaises(Exception):
+            notify.compile_filter("a = ")
+        with self.assertRaises(Exception):
+            notify.compile_filter("(a='b'")
+        with self.assertRaises(Exception):
+            notify.compile_filter("a[b='c'")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ import freeconf.node
 import freeconf.device
 import freeconf.restconf
 import freeconf.source
+import freeconf.stats
 import requests
 
 sys.path.append(".")
@@ -45,5 +46,38 @@ class TestRestconf(unittest.TestCase):
         drv.unload()
 
 
+    def test_server_cache(self):
+        drv = freeconf.driver.Driver()
+        drv.load()
+
+        ypath = freeconf.source.any(
+            freeconf.source.restconf_internal_ypath(driver=drv),
+            freeconf.source.path("testdata")
+        )
+        b, _ = new_car_app(drv, ypath)
+        dev = freeconf.device.Device(ypath, driver=drv)
+        dev.add_browser(b)
+
+        _ = freeconf.restconf.Server(dev, driver=drv, cache=True)
+        dev.apply_startup_config_file("testdata/server-startup.json")
+
+        url = "http://localhost:9999/restconf/data/car:"
+        resp = requests.get(url)
+        self.assertEqual(200, resp.status_code)
+        etag = resp.headers["ETag"]
+        resp = requests.get(url, headers={"If-None-Match": etag})
+        self.assertEqual(304, resp.status_code)
+        stats = freeconf.stats.driver_stats(drv)["go"]
+        self.assertEqual(1, stats["response_cache_hits"])
+        self.assertEqual(1, stats["response_cache_not_modified"])
+
+        b.invalidate()
+        resp = requests.get(url)
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual(2, freeconf.stats.driver_stats(drv)["go"]["response_cache_misses"])
+
+        drv.unload()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+import json
+import os
+import tempfile
+import unittest
+from freeconf import tracing
+
+
+class Spans():
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+
+class Context():
+    def __init__(self, metadata):
+        self.metadata = metadata
+
+    def invocation_metadata(self):
+        return self.metadata
+
+
+class Details():
+    method = "/pb.Node/Find"
+    timeout = None
+    metadata = None
+    credentials = None
+    wait_for_ready = None
+    compression = None
+
+
+class Servicer():
+    def __init__(self, t):
+        self.tracer = t
+
+    def XField(self, req, context):
+        # python calling back into Go while serving Go
+        def continuation(details, req):
+            return dict(details.metadata or [])
+        return tracing.ClientInterceptor(self.tracer).intercept_unary_unary(continuation, Details(), req)
+
+
+class TestTracing(unittest.TestCase):
+
+    def test_propagate(self):
+        spans = Spans()
+        t = tracing.Tracer(spans)
+        s = Servicer(t)
+        tracing.trace_calls(s, "XNode", t)
+        sent = s.XField(None, Context([(tracing.TRACE_ID_KEY, "t1"), (tracing.SPAN_ID_KEY, "g1")]))
+        find, xfield = spans.spans
+        self.assertEqual("XNode/XField", xfield.name)
+        self.assertEqual("t1", xfield.trace_id)
+        self.assertEqual("g1", xfield.parent_id)
+        self.assertEqual("Node/Find", find.name)
+        self.assertEqual("t1", find.trace_id)
+        self.assertEqual(xfield.span_id, find.parent_id)
+        self.assertEqual({tracing.TRACE_ID_KEY: "t1", tracing.SPAN_ID_KEY: find.span_id}, sent)
+        self.assertIsNone(t.current())
+
+        # off costs nothing and sends nothing
+        t.exporter = None
+        self.assertEqual({}, s.XField(None, Context([])))
+
+    def test_file_exporter(self):
+        with tempfile.TemporaryDirectory() as d:
+            fname = os.path.join(d, "trace.jsonl")
+            e = tracing.FileExporter(fname)
+            t = tracing.Tracer(e)
+            with t.span("outer"):
+                with t.span("inner"):
+                    pass
+            e.close()
+            with open(fname) as f:
+                inner, outer = [json.loads(line) for line in f]
+        self.assertEqual("outer", outer["name"])
+        self.assertEqual("python", outer["process"])
+        self.assertEqual(outer["span"], inner["parent"])
+        self.assertEqual(outer["trace"], inner["trace"])
+        self.assertNotIn("parent", outer)
+
+    def test_method_name(self):
+        self.assertEqual("Node/Find", tracing.method_name("/pb.Node/Find"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
+import io
+import random
 import unittest 
-from freeconf import nodeutil, node, parser
+from freeconf import nodeutil, node, parser, batch, device, source
 
 
 mstr = """
@@ -84,6 +86,141 @@ class TestUtilNode(unittest.TestCase):
         t_two = nodeutil.json_write_str(b.root().find("t=TWO"))
         self.assertEqual('{"f":"TWO","b":2}', t_two)
 
+    def test_found_outlives_root(self):
+        b = node.Browser(self.m, nodeutil.Node({"y": {"q": "yo"}}))
+        root = b.root()
+        y = root.find("y")
+        root.release()
+        self.assertEqual('{"q":"yo"}', nodeutil.json_write_str(y))
+        y.release()
+
+    def test_get(self):
+        obj = {
+            "z":100,
+            "y" : {"q": "yo"},
+            "p":[{"f":"ONE", "b":1},{"f":"TWO", "b":2}],
+        }
+        b = node.Browser(self.m, nodeutil.Node(obj))
+        root = b.root()
+        self.assertEqual({"z":100, "y":{"q":"yo"}, "p":[{"f":"ONE","b":1},{"f":"TWO","b":2}]}, root.get())
+        self.assertEqual({"f":"TWO","b":2}, root.get("p=TWO"))
+        self.assertEqual({"z":100, "y":{"q":"yo"}}, root.get(fields=["z", "y"]))
+        self.assertIsNone(root.get("g"))
+        root.release()
+
+    def test_write_local(self):
+        obj = {
+            "z":100,
+            "y" : {"q": "say \"hi\"\n\u00e9"},
+            "g": G(),
+            "p":[{"f":"ONE", "b":1},{"f":"TWO", "b":2}],
+            "t":{"ONE":{"f":"ONE", "b":1},"TWO":{"f":"TWO", "b":2}},
+        }
+        n = nodeutil.Node(obj)
+        b = node.Browser(self.m, n)
+        root = b.root()
+        self.assertEqual(nodeutil.json_write_str(root), nodeutil.json_write_local(root))
+        p_two = root.find("p=TWO")
+        self.assertEqual(nodeutil.json_write_str(p_two), nodeutil.json_write_local(p_two))
+        p = root.find("p")
+        self.assertEqual(nodeutil.json_write_str(p), nodeutil.json_write_local(p))
+
+        # no Go involved at all
+        local = nodeutil.LocalSelection.root(self.m, nodeutil.Node(obj))
+        self.assertEqual(nodeutil.json_write_str(root), nodeutil.json_write_local(local))
+        root.release()
+
+    def test_read_cache(self):
+        obj = {"z":100, "y" : {"q": "yo"}}
+        b = node.Browser(self.m, nodeutil.Node(obj))
+        b.read_cache(["y"])
+        root = b.root()
+        self.assertEqual('{"z":100,"y":{"q":"yo"}}', nodeutil.json_write_str(root))
+
+        # direct changes to python objects are not seen until invalidated
+        obj["z"] = 101
+        obj["y"]["q"] = "hi"
+        self.assertEqual('{"z":101,"y":{"q":"yo"}}', nodeutil.json_write_str(root))
+        b.invalidate("y")
+        self.assertEqual('{"z":101,"y":{"q":"hi"}}', nodeutil.json_write_str(root))
+
+        # edits thru Go are written to python and drop copy
+        root.upsert_from(nodeutil.Node({"y":{"q":"bye"}}))
+        self.assertEqual("bye", obj["y"]["q"])
+        self.assertEqual('{"z":101,"y":{"q":"bye"}}', nodeutil.json_write_str(root))
+        y = root.find("y")
+        y.upsert_from(nodeutil.Node({"q":"again"}))
+        self.assertEqual("again", obj["y"]["q"])
+        y.release()
+        root.release()
+
+    def test_profile(self):
+        obj = {"z":1, "y":{"q":"a"}, "p":[{"f":"ONE","b":1},{"f":"TWO","b":2}]}
+        ticks = [0]
+        def clock():
+            ticks[0] += 1000
+            return ticks[0]
+        p = nodeutil.Profile(nodeutil.Node(obj), profiler=nodeutil.Profiler("x", clock=clock))
+        sel = nodeutil.LocalSelection.root(self.m, p)
+        self.assertEqual('{"z":1,"y":{"q":"a"},"p":[{"f":"ONE","b":1},{"f":"TWO","b":2}]}', nodeutil.json_write_local(sel))
+        self.assertEqual(('x/p', 'next', 3, 3000, 3000), p.profiler.report()[0])
+        out = io.StringIO()
+        p.profiler.write_collapsed(out)
+        self.assertIn("x;p;b;field 2\n", out.getvalue())
+        self.assertIn("x;y;q;field 1\n", out.getvalue())
+
+    def test_trace_buffer(self):
+        obj = {"z":1, "y":{"q":"a"}, "p":[{"f":"ONE","b":1}]}
+        text = io.StringIO()
+        nodeutil.json_write_local(nodeutil.LocalSelection.root(self.m, nodeutil.Trace(nodeutil.Node(obj), text)))
+
+        buf = nodeutil.TraceBuffer()
+        nodeutil.json_write_local(nodeutil.LocalSelection.root(self.m, nodeutil.Trace(nodeutil.Node(obj), buffer=buf)))
+        decoded = io.StringIO()
+        nodeutil.decode_trace(buf.drain(), decoded)
+        self.assertEqual(text.getvalue(), decoded.getvalue())
+        self.assertIn("    next.read[0]: p\n", decoded.getvalue())
+        self.assertEqual([], buf.drain())
+
+        nodeutil.json_write_local(nodeutil.LocalSelection.root(self.m, nodeutil.Trace(nodeutil.Node(obj), buffer=buf, sample=0)))
+        self.assertEqual([], buf.drain())
+
+        # each operation is traced in full or not at all
+        full = len(decoded.getvalue().splitlines())
+        random.seed(1)
+        sampled = nodeutil.Trace(nodeutil.Node(obj), buffer=buf, sample=0.5)
+        lines = set()
+        for _ in range(20):
+            nodeutil.json_write_local(nodeutil.LocalSelection.root(self.m, sampled))
+            traced = io.StringIO()
+            nodeutil.decode_trace(buf.drain(), traced)
+            lines.add(len(traced.getvalue().splitlines()))
+        self.assertEqual({0, full}, lines)
+
+        small = nodeutil.TraceBuffer(4)
+        for i in range(10):
+            small.add(i)
+        self.assertEqual([6, 7, 8, 9], small.drain())
+        self.assertEqual(6, small.dropped)
+
+    def test_noop_hooks(self):
+        all_hooks = node.HOOK_CONTEXT | node.HOOK_RELEASE | node.HOOK_BEGIN_EDIT | node.HOOK_END_EDIT
+        self.assertEqual(all_hooks, nodeutil.Node({}).noop_hooks())
+        n = nodeutil.Node({}, on_begin_edit=lambda n, r: None)
+        self.assertEqual(all_hooks & ~node.HOOK_BEGIN_EDIT, n.noop_hooks())
+        self.assertEqual(all_hooks & ~node.HOOK_END_EDIT, nodeutil.Extend(n, on_end_edit=lambda p, r: None).noop_hooks())
+        self.assertEqual(all_hooks & ~node.HOOK_RELEASE, nodeutil.Basic(on_release=lambda s: None).noop_hooks())
+
+        # overriding a hook in a subclass means it is not a no-op
+        class EditingBasic(nodeutil.Basic):
+            def begin_edit(self, r):
+                pass
+        self.assertEqual(all_hooks & ~node.HOOK_BEGIN_EDIT, EditingBasic().noop_hooks())
+        class ReleasingExtend(nodeutil.Extend):
+            def release(self, sel):
+                pass
+        self.assertEqual(all_hooks & ~node.HOOK_RELEASE, ReleasingExtend(nodeutil.Node({})).noop_hooks())
+
     def test_read_empty(self):
         obj = {}
         n = nodeutil.Node(obj)
@@ -129,6 +266,127 @@ class TestUtilNode(unittest.TestCase):
 
         root.release()
 
+    def test_write_value(self):
+        obj = {"p":[], "t":{}}
+        b = node.Browser(self.m, nodeutil.Node(obj))
+        root = b.root()
+        root.upsert_from_value({"z":888, "y":{"q":"boo!"}, "p":[{"f":"ONE","b":1},{"f":"TWO","b":2}]})
+        self.assertEqual(888, obj["z"])
+        self.assertEqual("boo!", obj["y"]["q"])
+        self.assertEqual(2, len(obj["p"]))
+
+        root.find("y").replace_from_value({"q":"again"})
+        self.assertEqual("again", obj["y"]["q"])
+        with self.assertRaises(Exception):
+            root.insert_from_value({"p":[{"f":"ONE"}]})
+        root.release()
+
+    def test_batch(self):
+        obj = {"p":[{"f":"ONE", "b":1}]}
+        root = node.Browser(self.m, nodeutil.Node(obj)).root()
+        b = batch.Batch()
+        one = b.find(root, "p=ONE")
+        b.upsert_from_value(one, {"b":10})
+        got = b.get(one)
+        b.release(one)
+        missing = b.find(root, "p=TWO")
+        bad_get = b.get(missing)
+        top = b.get(root, depth=1)
+        after_release = b.get(one)
+        b.run()
+        self.assertEqual(10, obj["p"][0]["b"])
+        self.assertEqual({"f":"ONE", "b":10}, got.value)
+        self.assertIsNone(missing.sel)
+        self.assertIsNotNone(bad_get.error)
+        self.assertIsNone(top.error)
+        self.assertIn("released", after_release.error)
+        root.release()
+
+    def test_edit_local(self):
+        cfg = """{
+          "x:z": 888,
+          "y":{"q":"boo!"},
+          "g": {"b":444,"h":"Haytch"},
+          "p":[{"f":"ONE","b":1},{"f":"TWO","b":2}],
+          "t":[{"f":"ONE","b":1},{"f":"TWO","b":2}]
+        }
+        """
+        obj = {
+            "g": G(),
+            "p":[{"f":"TWO","b":0}],
+            "t":{},
+        }
+        edits = []
+        n = nodeutil.Node(obj,
+            on_begin_edit=lambda n, r: edits.append(r.edit_root),
+            on_end_edit=lambda n, r: None)
+        sel = nodeutil.LocalSelection.root(self.m, n)
+        nodeutil.upsert_local(sel, nodeutil.json_read_local(cfg))
+
+        self.assertEqual(888, obj["z"])
+        self.assertEqual("boo!", obj["y"]["q"])
+        self.assertEqual(444, obj["g"].b)
+        self.assertEqual("Haytch", obj["g"].get_h())
+        self.assertEqual([{"f":"TWO","b":2},{"f":"ONE","b":1}], obj["p"])
+        self.assertEqual(2, len(obj["t"]))
+        self.assertEqual([True, False, False, False, False, False, False], edits)
+
+        with self.assertRaises(Exception):
+            nodeutil.insert_local(sel, nodeutil.json_read_local('{"p":[{"f":"ONE"}]}'))
+        with self.assertRaises(Exception):
+            nodeutil.update_local(sel, nodeutil.json_read_local('{"p":[{"f":"THREE"}]}'))
+
+    def test_diff(self):
+        old = {"z":1, "g":{"b":1,"h":"a"}, "p":[{"f":"ONE","b":1},{"f":"TWO","b":2}]}
+        new = {"z":1, "g":{"b":1}, "p":[{"f":"TWO","b":3},{"f":"THREE","b":3}]}
+        d = nodeutil.diff(self.m, old, new)
+        self.assertEqual([
+            nodeutil.Change(nodeutil.DELETED, "g/h"),
+            nodeutil.Change(nodeutil.UPDATED, "p=TWO/b"),
+            nodeutil.Change(nodeutil.CREATED, "p=THREE"),
+            nodeutil.Change(nodeutil.DELETED, "p=ONE"),
+        ], d.changes)
+        self.assertEqual({"p":[{"b":3,"f":"TWO"},{"f":"THREE","b":3}]}, d.patch)
+        self.assertEqual(["p=ONE"], d.deletes)
+        self.assertEqual([("g", {"b":1})], d.replaces)
+
+        d = nodeutil.diff(self.m, old, old)
+        self.assertEqual([], d.changes)
+        self.assertEqual({}, d.patch)
+
+        # replaced container or row is not also upserted
+        d = nodeutil.diff(self.m, {"g":{"b":1,"h":"a"}, "p":[{"f":"ONE","b":1}]}, {"g":{"b":2}, "p":[{"f":"ONE"}]})
+        self.assertEqual({}, d.patch)
+        self.assertEqual([("g", {"b":2}), ("p=ONE", {"f":"ONE"})], d.replaces)
+
+        # leaf removed from top is cleared, not whole module replaced
+        d = nodeutil.diff(self.m, {"z":1, "g":{"b":1}}, {"g":{"b":1}})
+        self.assertEqual([], d.replaces)
+        self.assertEqual([("", "z")], d.clears)
+
+        # keys are escaped in paths
+        d = nodeutil.diff(self.m, {"p":[{"f":"a,b/c=d","b":1}]}, {"p":[]})
+        self.assertEqual(["p=a%2Cb%2Fc%3Dd"], d.deletes)
+
+    def test_apply_startup_config_changes(self):
+        dev = device.Device(source.path("./testdata"))
+        b = node.Browser(self.m, nodeutil.Node({}))
+        dev.add_browser(b)
+        dev.apply_startup_config_changes({"x":{"z":1, "g":{"b":1,"h":"a"}}})
+        changes = dev.apply_startup_config_changes({"x":{"g":{"b":2}}})
+        self.assertEqual([
+            nodeutil.Change(nodeutil.DELETED, "x:z"),
+            nodeutil.Change(nodeutil.UPDATED, "x:g/b"),
+            nodeutil.Change(nodeutil.DELETED, "x:g/h"),
+        ], changes)
+        self.assertEqual('{"g":{"b":2}}', nodeutil.json_write_str(b.root()))
+
+        # full apply means next incremental apply cannot trust last config
+        dev.apply_startup_config_str('{"x":{"z":5}}')
+        self.assertEqual(None, dev.last_startup_config)
+        changes = dev.apply_startup_config_changes({"x":{"z":5}})
+        self.assertEqual([nodeutil.Change(nodeutil.CREATED, "x")], changes)
+
     def test_options(self):
         class X:
             def __init__(self):
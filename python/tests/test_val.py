@@ -24,6 +24,12 @@ class TestVal(unittest.TestCase):
         self.assertEqual(v.format, rt.format)
         self.assertEqual(v.v, rt.v)        
 
+    def test_proto_native(self):
+        x = freeconf.val.proto_encode(freeconf.val.Val([10, 12], freeconf.val.Format.INT32_LIST))
+        self.assertEqual([10, 12], freeconf.val.proto_native(x))
+        x = freeconf.val.proto_encode(freeconf.val.Val(1, freeconf.val.Format.ENUM, label="blue"))
+        self.assertEqual("blue", freeconf.val.proto_native(x))
+
     def test_auto_pick(self):
         v = freeconf.val.Val(10)
         self.assertEqual(freeconf.val.Format.INT32, v.format)
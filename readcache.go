@@ -0,0 +1,395 @@
+package lang
+
+import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"time"
+
+	"github.com/freeconf/yang/meta"
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/nodeutil"
+	"github.com/freeconf/yang/val"
+)
+
+// readCache keeps a copy of read-mostly subtrees of an X node tree in Go so
+// repeated reads, like monitoring collectors polling RESTCONF every few seconds,
+// are served without walking the X nodes over the bridge each time.  Copies are
+// dropped when an edit ends anywhere that overlaps them, when X calls invalidate
+// or when they are older than maxAge.
+//
+// Reads served from cache return a cachedNode.  Edits, actions and
+// notifications on a cachedNode are sent to the live X node.
+type readCache struct {
+	browser *node.Browser
+	stats   *DriverStats
+	lock    sync.Mutex
+
+	// schema paths relative to module that are cacheable e.g. "engine" or "p/stats"
+	paths  map[string]bool
+	maxAge time.Duration
+
+	// data paths relative to module e.g. "p=1/stats"
+	entries map[string]*cacheEntry
+
+	// number of edits in progress, nothing is cached while editing
+	editing int
+
+	// bumped on each invalidate so copies taken while something changed
+	// are not kept
+	gen int64
+}
+
+// cacheEntry is decoded once so each hit only wraps it in a new node
+type cacheEntry struct {
+	values map[string]interface{}
+	when   time.Time
+}
+
+type readCaches struct {
+	lock   sync.Mutex
+	caches map[*node.Browser]*readCache
+	stats  *DriverStats
+
+	// bumped on every edit and invalidate of any X data so responses cached
+	// outside a browser know when they may be stale
+	changes int64
+}
+
+func newReadCaches(stats *DriverStats) *readCaches {
+	return &readCaches{
+		caches: make(map[*node.Browser]*readCache),
+		stats:  stats,
+	}
+}
+
+func (all *readCaches) get(b *node.Browser) *readCache {
+	all.lock.Lock()
+	defer all.lock.Unlock()
+	return all.caches[b]
+}
+
+// enable cache for given schema paths or disable when there are no paths
+func (all *readCaches) enable(b *node.Browser, paths []string, maxAge time.Duration) {
+	all.lock.Lock()
+	defer all.lock.Unlock()
+	if len(paths) == 0 {
+		delete(all.caches, b)
+		return
+	}
+	c := &readCache{
+		browser: b,
+		stats:   all.stats,
+		paths:   make(map[string]bool),
+		maxAge:  maxAge,
+		entries: make(map[string]*cacheEntry),
+	}
+	for _, p := range paths {
+		c.paths[strings.Trim(p, "/")] = true
+	}
+	all.caches[b] = c
+}
+
+// changed is called when any X data may have changed
+func (all *readCaches) changed() {
+	atomic.AddInt64(&all.changes, 1)
+}
+
+// generation changes each time any X data may have changed
+func (all *readCaches) generation() int64 {
+	return atomic.LoadInt64(&all.changes)
+}
+
+// remove cache of browser that is no longer used
+func (all *readCaches) remove(b *node.Browser) {
+	all.lock.Lock()
+	defer all.lock.Unlock()
+	delete(all.caches, b)
+}
+
+type noReadCacheKey struct{}
+
+// reads that have to see live X nodes, like resolving the target of an edit on
+// a cached copy
+func withoutReadCache(ctx context.Context) context.Context {
+	if ctx == nil {
+		ctx = context.Background()
+	}
+	return context.WithValue(ctx, noReadCacheKey{}, true)
+}
+
+func readCacheDisabled(ctx context.Context) bool {
+	if ctx == nil {
+		return false
+	}
+	disabled, _ := ctx.Value(noReadCacheKey{}).(bool)
+	return disabled
+}
+
+// relativePath drops module name from a selection path
+func relativePath(sel *node.Selection) string {
+	p := sel.Path.String()
+	if slash := strings.IndexRune(p, '/'); slash >= 0 {
+		return p[slash+1:]
+	}
+	return ""
+}
+
+func joinPath(parent string, ident string) string {
+	if parent == "" {
+		return ident
+	}
+	return parent + "/" + ident
+}
+
+func schemaPath(sel *node.Selection, ident string) string {
+	segs := sel.Path.Segments()
+	idents := make([]string, 0, len(segs))
+	for _, seg := range segs[1:] {
+		idents = append(idents, seg.Meta.Ident())
+	}
+	return joinPath(strings.Join(idents, "/"), ident)
+}
+
+// child returns a copy of container when it is cacheable otherwise the live
+// X node from read
+func (c *readCache) child(r node.ChildRequest, read func(node.ChildRequest) (node.Node, error)) (node.Node, error) {
+	if r.New || r.Delete {
+		return read(r)
+	}
+	if _, isContainer := r.Meta.(*meta.Container); !isContainer {
+		return read(r)
+	}
+	dataPath := joinPath(relativePath(r.Selection), r.Meta.Ident())
+	c.lock.Lock()
+	if c.editing > 0 || !c.paths[schemaPath(r.Selection, r.Meta.Ident())] {
+		c.lock.Unlock()
+		return read(r)
+	}
+	e := c.entries[dataPath]
+	if e != nil && c.maxAge > 0 && time.Since(e.when) > c.maxAge {
+		delete(c.entries, dataPath)
+		e = nil
+	}
+	gen := c.gen
+	c.lock.Unlock()
+
+	if e != nil {
+		atomic.AddInt64(&c.stats.ReadCacheHits, 1)
+		return &cachedNode{cache: c, snap: nodeutil.ReadJSONValues(e.values)}, nil
+	}
+	atomic.AddInt64(&c.stats.ReadCacheMisses, 1)
+	values, found, err := c.copy(r.Selection.Context, dataPath)
+	if err != nil || !found {
+		return nil, err
+	}
+	c.lock.Lock()
+	if c.gen == gen && c.editing == 0 {
+		c.entries[dataPath] = &cacheEntry{values: values, when: time.Now()}
+	}
+	c.lock.Unlock()
+	return &cachedNode{cache: c, snap: nodeutil.ReadJSONValues(values)}, nil
+}
+
+// copy reads container from live X nodes.  Values are only ever read after
+// this so hits can share them.
+func (c *readCache) copy(ctx context.Context, path string) (values map[string]interface{}, found bool, err error) {
+	err = c.findLive(ctx, path, func(live *node.Selection) error {
+		if live == nil {
+			return nil
+		}
+		found = true
+		snapshot, err := nodeutil.WriteJSON(live)
+		if err != nil {
+			return err
+		}
+		return json.Unmarshal([]byte(snapshot), &values)
+	})
+	return
+}
+
+// findLive calls fn with selection on live X nodes at path or nil if there is
+// nothing there
+func (c *readCache) findLive(ctx context.Context, path string, fn func(live *node.Selection) error) error {
+	root := c.browser.Root()
+	defer root.Release()
+	root.Context = withoutReadCache(ctx)
+	if path == "" {
+		return fn(root)
+	}
+	found, err := root.Find(path)
+	if err != nil {
+		return err
+	}
+	if found != nil {
+		defer found.Release()
+	}
+	return fn(found)
+}
+
+// onLive calls fn with the live X selection that a selection on a cached copy is
+// a copy of
+func (c *readCache) onLive(sel *node.Selection, fn func(live *node.Selection) error) error {
+	return c.findLive(sel.Context, relativePath(sel), func(live *node.Selection) error {
+		if live == nil {
+			return fmt.Errorf("%s not found", sel.Path.String())
+		}
+		return fn(live)
+	})
+}
+
+func (c *readCache) isEditing() bool {
+	c.lock.Lock()
+	defer c.lock.Unlock()
+	return c.editing > 0
+}
+
+func (c *readCache) beginEdit() {
+	c.lock.Lock()
+	c.editing++
+	c.lock.Unlock()
+}
+
+func (c *readCache) endEdit(sel *node.Selection) {
+	c.lock.Lock()
+	c.editing--
+	c.lock.Unlock()
+	c.invalidate(relativePath(sel))
+}
+
+// invalidate drops copies of data at, under or containing path. "" drops all
+func (c *readCache) invalidate(path string) {
+	path = strings.Trim(path, "/")
+	c.lock.Lock()
+	defer c.lock.Unlock()
+	c.gen++
+	for p := range c.entries {
+		if path == "" || overlaps(p, path) {
+			delete(c.entries, p)
+		}
+	}
+}
+
+func overlaps(a string, b string) bool {
+	if len(a) > len(b) {
+		a, b = b, a
+	}
+	return a == b || strings.HasPrefix(b, a+"/")
+}
+
+// cachedNode serves reads from a copy of X data and sends everything else to
+// the live X node
+type cachedNode struct {
+	cache *readCache
+	snap  node.Node
+}
+
+func (n *cachedNode) Context(s *node.Selection) context.Context {
+	return s.Context
+}
+
+func (n *cachedNode) Release(s *node.Selection) {
+}
+
+func (n *cachedNode) Child(r node.ChildRequest) (child node.Node, err error) {
+	if r.New || r.Delete || n.cache.isEditing() {
+		err = n.cache.onLive(r.Selection, func(live *node.Selection) error {
+			r.Selection = live
+			child, err = live.Node.Child(r)
+			return err
+		})
+		return
+	}
+	if child, err = n.snap.Child(r); err != nil || child == nil {
+		return nil, err
+	}
+	return &cachedNode{cache: n.cache, snap: child}, nil
+}
+
+func (n *cachedNode) Next(r node.ListRequest) (child node.Node, key []val.Value, err error) {
+	if r.New || r.Delete || n.cache.isEditing() {
+		err = n.cache.onLive(r.Selection, func(live *node.Selection) error {
+			r.Selection = live
+			child, key, err = live.Node.Next(r)
+			return err
+		})
+		return
+	}
+	if child, key, err = n.snap.Next(r); err != nil || child == nil {
+		return nil, nil, err
+	}
+	return &cachedNode{cache: n.cache, snap: child}, key, nil
+}
+
+func (n *cachedNode) Field(r node.FieldRequest, hnd *node.ValueHandle) error {
+	if r.Write || r.Clear {
+		return n.cache.onLive(r.Selection, func(live *node.Selection) error {
+			r.Selection = live
+			return live.Node.Field(r, hnd)
+		})
+	}
+	return n.snap.Field(r, hnd)
+}
+
+func (n *cachedNode) Choose(sel *node.Selection, choice *meta.Choice) (*meta.ChoiceCase, error) {
+	return n.snap.Choose(sel, choice)
+}
+
+func (n *cachedNode) BeginEdit(r node.NodeRequest) error {
+	return n.cache.onLive(r.Selection, func(live *node.Selection) error {
+		r.Selection = live
+		return live.Node.BeginEdit(r)
+	})
+}
+
+func (n *cachedNode) EndEdit(r node.NodeRequest) error {
+	return n.cache.onLive(r.Selection, func(live *node.Selection) error {
+		r.Selection = live
+		return live.Node.EndEdit(r)
+	})
+}
+
+func (n *cachedNode) Action(r node.ActionRequest) (output node.Node, err error) {
+	err = n.cache.onLive(r.Selection, func(live *node.Selection) error {
+		r.Selection = live
+		output, err = live.Node.Action(r)
+		return err
+	})
+	return
+}
+
+func (n *cachedNode) Notify(r node.NotifyRequest) (node.NotifyCloser, error) {
+	// subscription outlives this call so live selections are released when
+	// it is closed
+	root := n.cache.browser.Root()
+	root.Context = withoutReadCache(r.Selection.Context)
+	live, err := root.Find(relativePath(r.Selection))
+	if err != nil || live == nil {
+		root.Release()
+		if err == nil {
+			err = fmt.Errorf("%s not found", r.Selection.Path.String())
+		}
+		return nil, err
+	}
+	release := func() {
+		live.Release()
+		root.Release()
+	}
+	r.Selection = live
+	closer, err := live.Node.Notify(r)
+	if err != nil || closer == nil {
+		release()
+		return closer, err
+	}
+	return func() error {
+		defer release()
+		return closer()
+	}, nil
+}
+
+func (n *cachedNode) Peek(sel *node.Selection, consumer interface{}) interface{} {
+	return nil
+}
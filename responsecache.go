@@ -0,0 +1,180 @@
+package lang
+
+import (
+	"bytes"
+	"crypto/sha1"
+	"encoding/hex"
+	"net/http"
+	"strings"
+	"sync"
+	"sync/atomic"
+	"time"
+)
+
+// responseCache sits in front of a RESTCONF server and keeps encoded GET
+// responses keyed by path, query and Accept header so collectors polling the
+// same subtrees get the same bytes back without the request reaching X.  Each
+// cached response has an ETag so a collector sending If-None-Match gets a 304
+// and no body at all.
+//
+// Everything cached is dropped when anything may have changed: any request
+// other than GET thru this server, an edit ending on any X node or X calling
+// invalidate.  Changes X makes to its own objects without calling invalidate
+// are only seen after maxAge.
+type responseCache struct {
+	next    http.Handler
+	changes *readCaches
+	stats   *DriverStats
+	maxAge  time.Duration
+	lock    sync.Mutex
+	entries map[string]*responseEntry
+}
+
+type responseEntry struct {
+	status int
+	header http.Header
+	body   []byte
+	etag   string
+	gen    int64
+	when   time.Time
+}
+
+func newResponseCache(next http.Handler, changes *readCaches, stats *DriverStats, maxAge time.Duration) *responseCache {
+	return &responseCache{
+		next:    next,
+		changes: changes,
+		stats:   stats,
+		maxAge:  maxAge,
+		entries: make(map[string]*responseEntry),
+	}
+}
+
+func (c *responseCache) ServeHTTP(w http.ResponseWriter, r *http.Request) {
+	if r.Method != "GET" {
+		c.next.ServeHTTP(w, r)
+		// whatever was written could be in any cached response
+		c.changes.changed()
+		return
+	}
+	if strings.Contains(r.Header.Get("Accept"), "text/event-stream") {
+		c.next.ServeHTTP(w, r)
+		return
+	}
+	key := r.URL.Path + "?" + r.URL.RawQuery + " " + r.Header.Get("Accept")
+	gen := c.changes.generation()
+	c.lock.Lock()
+	e := c.entries[key]
+	if e != nil && (e.gen != gen || (c.maxAge > 0 && time.Since(e.when) > c.maxAge)) {
+		delete(c.entries, key)
+		e = nil
+	}
+	c.lock.Unlock()
+	if e != nil {
+		atomic.AddInt64(&c.stats.ResponseCacheHits, 1)
+		c.reply(w, r, e)
+		return
+	}
+
+	atomic.AddInt64(&c.stats.ResponseCacheMisses, 1)
+	rec := &responseRecorder{w: w}
+	c.next.ServeHTTP(rec, r)
+	if rec.streaming {
+		return
+	}
+	fresh := &responseEntry{
+		status: rec.statusOrOK(),
+		header: w.Header().Clone(),
+		body:   rec.body.Bytes(),
+		gen:    gen,
+		when:   time.Now(),
+	}
+	if fresh.status == http.StatusOK {
+		sum := sha1.Sum(fresh.body)
+		fresh.etag = `"` + hex.EncodeToString(sum[:]) + `"`
+		c.lock.Lock()
+		// something changed while reading, this copy may already be stale
+		if c.changes.generation() == gen {
+			c.entries[key] = fresh
+		}
+		c.lock.Unlock()
+	}
+	c.reply(w, r, fresh)
+}
+
+func (c *responseCache) reply(w http.ResponseWriter, r *http.Request, e *responseEntry) {
+	h := w.Header()
+	for k, v := range e.header {
+		h[k] = v
+	}
+	if e.etag != "" {
+		h.Set("ETag", e.etag)
+		if etagMatches(r.Header.Get("If-None-Match"), e.etag) {
+			atomic.AddInt64(&c.stats.ResponseCacheNotModified, 1)
+			h.Del("Content-Length")
+			w.WriteHeader(http.StatusNotModified)
+			return
+		}
+	}
+	w.WriteHeader(e.status)
+	w.Write(e.body)
+}
+
+func etagMatches(ifNoneMatch string, etag string) bool {
+	for _, candidate := range strings.Split(ifNoneMatch, ",") {
+		candidate = strings.TrimPrefix(strings.TrimSpace(candidate), "W/")
+		if candidate == etag || candidate == "*" {
+			return true
+		}
+	}
+	return false
+}
+
+// responseRecorder holds on to response so it can be cached unless handler
+// flushes, like notification streams do, then everything is passed thru
+type responseRecorder struct {
+	w         http.ResponseWriter
+	status    int
+	body      bytes.Buffer
+	streaming bool
+}
+
+func (r *responseRecorder) Header() http.Header {
+	return r.w.Header()
+}
+
+func (r *responseRecorder) WriteHeader(status int) {
+	if r.streaming {
+		r.w.WriteHeader(status)
+		return
+	}
+	if r.status == 0 {
+		r.status = status
+	}
+}
+
+func (r *responseRecorder) Write(p []byte) (int, error) {
+	if r.streaming {
+		return r.w.Write(p)
+	}
+	return r.body.Write(p)
+}
+
+func (r *responseRecorder) Flush() {
+	if !r.streaming {
+		r.streaming = true
+		r.w.WriteHeader(r.statusOrOK())
+		if _, err := r.w.Write(r.body.Bytes()); err != nil {
+			return
+		}
+	}
+	if f, canFlush := r.w.(http.Flusher); canFlush {
+		f.Flush()
+	}
+}
+
+func (r *responseRecorder) statusOrOK() int {
+	if r.status == 0 {
+		return http.StatusOK
+	}
+	return r.status
+}
@@ -0,0 +1,86 @@
+package lang
+
+import (
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"sync/atomic"
+	"testing"
+
+	"github.com/freeconf/yang/fc"
+)
+
+func TestResponseCache(t *testing.T) {
+	requests := 0
+	next := http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		requests++
+		w.Header().Set("Content-Type", "application/yang-data+json")
+		w.Write([]byte(`{"x":1}`))
+	})
+	var stats DriverStats
+	changes := newReadCaches(&stats)
+	srv := httptest.NewServer(newResponseCache(next, changes, &stats, 0))
+	defer srv.Close()
+	get := func(path string, etag string) (*http.Response, string) {
+		req, err := http.NewRequest("GET", srv.URL+path, nil)
+		fc.RequireEqual(t, nil, err)
+		if etag != "" {
+			req.Header.Set("If-None-Match", etag)
+		}
+		resp, err := http.DefaultClient.Do(req)
+		fc.RequireEqual(t, nil, err)
+		defer resp.Body.Close()
+		body, _ := io.ReadAll(resp.Body)
+		return resp, string(body)
+	}
+
+	resp, body := get("/restconf/data/x:", "")
+	fc.AssertEqual(t, 200, resp.StatusCode)
+	fc.AssertEqual(t, `{"x":1}`, body)
+	etag := resp.Header.Get("ETag")
+	fc.AssertEqual(t, true, etag != "")
+	resp, body = get("/restconf/data/x:", "")
+	fc.AssertEqual(t, `{"x":1}`, body)
+	fc.AssertEqual(t, "application/yang-data+json", resp.Header.Get("Content-Type"))
+	fc.AssertEqual(t, 1, requests)
+	fc.AssertEqual(t, int64(1), atomic.LoadInt64(&stats.ResponseCacheHits))
+
+	// unchanged data is not sent again
+	resp, body = get("/restconf/data/x:", etag)
+	fc.AssertEqual(t, 304, resp.StatusCode)
+	fc.AssertEqual(t, "", body)
+	fc.AssertEqual(t, int64(1), atomic.LoadInt64(&stats.ResponseCacheNotModified))
+
+	// query is part of key
+	get("/restconf/data/x:?depth=1", "")
+	fc.AssertEqual(t, 2, requests)
+
+	// X data may have changed, read again but same data has same ETag
+	changes.changed()
+	resp, _ = get("/restconf/data/x:", etag)
+	fc.AssertEqual(t, 304, resp.StatusCode)
+	fc.AssertEqual(t, 3, requests)
+
+	// edits thru server
+	req, _ := http.NewRequest("PUT", srv.URL+"/restconf/data/x:", nil)
+	resp, err := http.DefaultClient.Do(req)
+	fc.RequireEqual(t, nil, err)
+	resp.Body.Close()
+	get("/restconf/data/x:", "")
+	fc.AssertEqual(t, 5, requests)
+}
+
+func TestResponseCacheStream(t *testing.T) {
+	next := http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		w.Write([]byte("data: a\n\n"))
+		w.(http.Flusher).Flush()
+		w.Write([]byte("data: b\n\n"))
+	})
+	var stats DriverStats
+	c := newResponseCache(next, newReadCaches(&stats), &stats, 0)
+	rec := httptest.NewRecorder()
+	c.ServeHTTP(rec, httptest.NewRequest("GET", "/restconf/data/x:recv", nil))
+	fc.AssertEqual(t, "data: a\n\ndata: b\n\n", rec.Body.String())
+	fc.AssertEqual(t, true, rec.Flushed)
+	fc.AssertEqual(t, 0, len(c.entries))
+}
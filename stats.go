@@ -0,0 +1,63 @@
+package lang
+
+import (
+	"context"
+	"sort"
+	"sync/atomic"
+
+	"github.com/freeconf/lang/pb"
+)
+
+// StatsService reports the overhead of the bridge itself: calls in each
+// direction, handles held and counters from DriverStats
+type StatsService struct {
+	pb.UnimplementedStatsServer
+	d *Driver
+}
+
+func (s *StatsService) Stats(ctx context.Context, in *pb.StatsRequest) (*pb.StatsResponse, error) {
+	stats := &s.d.Stats
+	resp := pb.StatsResponse{
+		Calls:                    encodeCallStats(s.d.GCalls),
+		XCalls:                   encodeCallStats(s.d.XCalls),
+		Handles:                  int64(s.d.handles.Count()),
+		OpenNotifications:        atomic.LoadInt64(&stats.OpenNotifications),
+		NotificationSubscribers:  atomic.LoadInt64(&stats.NotificationSubscribers),
+		ReadCacheHits:            atomic.LoadInt64(&stats.ReadCacheHits),
+		ReadCacheMisses:          atomic.LoadInt64(&stats.ReadCacheMisses),
+		ClientCacheHits:          atomic.LoadInt64(&stats.ClientCacheHits),
+		ClientCacheRevalidated:   atomic.LoadInt64(&stats.ClientCacheRevalidated),
+		ClientCacheMisses:        atomic.LoadInt64(&stats.ClientCacheMisses),
+		ResponseCacheHits:        atomic.LoadInt64(&stats.ResponseCacheHits),
+		ResponseCacheNotModified: atomic.LoadInt64(&stats.ResponseCacheNotModified),
+		ResponseCacheMisses:      atomic.LoadInt64(&stats.ResponseCacheMisses),
+	}
+	for _, b := range LatencyBuckets() {
+		resp.LatencyBucketsNs = append(resp.LatencyBucketsNs, int64(b))
+	}
+	if in.Reset_ {
+		s.d.GCalls.Reset()
+		s.d.XCalls.Reset()
+	}
+	return &resp, nil
+}
+
+func encodeCallStats(s *CallStats) []*pb.CallStat {
+	methods := s.Methods()
+	calls := make([]*pb.CallStat, 0, len(methods))
+	for method, h := range methods {
+		calls = append(calls, &pb.CallStat{
+			Method:  method,
+			Count:   h.Count(),
+			MeanNs:  int64(h.Mean()),
+			P50Ns:   int64(h.Percentile(50)),
+			P99Ns:   int64(h.Percentile(99)),
+			Opened:  h.Opened(),
+			Buckets: h.Buckets(),
+		})
+	}
+	sort.Slice(calls, func(i, j int) bool {
+		return calls[i].Method < calls[j].Method
+	})
+	return calls
+}
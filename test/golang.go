@@ -2,8 +2,11 @@ package test
 
 import (
 	"container/list"
+	"fmt"
 	"os"
+	"time"
 
+	"github.com/freeconf/lang"
 	"github.com/freeconf/lang/pb"
 	"github.com/freeconf/yang/meta"
 	"github.com/freeconf/yang/node"
@@ -53,6 +56,9 @@ func (d *golang) createTestCase(c pb.TestCase, tracefile string) (node.Node, err
 	default:
 		panic("test case not implemented")
 	}
+	if tracefile == "" {
+		return n, nil
+	}
 	f, err := os.Create(tracefile)
 	if err != nil {
 		return nil, err
@@ -128,10 +134,64 @@ func (d *golang) subscribe(r reciever) nodeutil.Subscription {
 func (d *golang) finalizeTestCase() error {
 	if d.traceFile != nil {
 		d.traceFile.Close()
+		d.traceFile = nil
 	}
 	return nil
 }
 
+func (d *golang) throughput(tc pb.TestCase, count int, dir string, input string) (time.Duration, error) {
+	var ident string
+	switch tc {
+	case pb.TestCase_BASIC:
+		ident = "basic"
+	case pb.TestCase_ECHO:
+		ident = "echo"
+	default:
+		return 0, fmt.Errorf("no throughput for test case %s", tc)
+	}
+	m, err := parser.LoadModule(source.Dir(dir), ident)
+	if err != nil {
+		return 0, err
+	}
+	n, err := d.createTestCase(tc, "")
+	if err != nil {
+		return 0, err
+	}
+	b := node.NewBrowser(m, n)
+	in := nodeutil.ReadJSON(input)
+	t0 := time.Now()
+	for i := 0; i < count; i++ {
+		if err := runThroughputCase(b, tc, in); err != nil {
+			return 0, err
+		}
+	}
+	return time.Since(t0), nil
+}
+
+// runThroughputCase runs test case once and releases every selection it
+// made so nothing is held from one iteration to the next
+func runThroughputCase(b *node.Browser, tc pb.TestCase, in node.Node) error {
+	root := b.Root()
+	defer root.Release()
+	if tc != pb.TestCase_ECHO {
+		return root.UpsertFrom(in)
+	}
+	sel, err := root.Find("echo")
+	if err != nil || sel == nil {
+		return err
+	}
+	defer sel.Release()
+	out, err := sel.Action(in)
+	if out != nil {
+		out.Release()
+	}
+	return err
+}
+
+func (d *golang) xCalls() *lang.CallStats {
+	return nil
+}
+
 func (d *golang) loadYangModule() *meta.Module {
 	if d.yangModule == nil {
 		var err error
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"net"
 	"os"
+	"sync/atomic"
 	"time"
 
 	"github.com/freeconf/lang"
@@ -122,8 +123,8 @@ func (h *Harness) createTestCase(tc pb.TestCase, traceFile string) (node.Node, e
 }
 
 func (h *Harness) finalizeTestCase() error {
-	if h.driver.Stats.OpenNotifications > 0 {
-		fc.Err.Printf("%d open notifications.  proper etiquette is that tests are designed to unsub of every sub", h.driver.Stats.OpenNotifications)
+	if open := atomic.LoadInt64(&h.driver.Stats.OpenNotifications); open > 0 {
+		fc.Err.Printf("%d open notifications.  proper etiquette is that tests are designed to unsub of every sub", open)
 	}
 
 	req := pb.FinalizeTestCaseRequest{}
@@ -141,6 +142,20 @@ func (h *Harness) parseModule(dir string, moduleIdent string) (node.Node, error)
 	return dumper, err
 }
 
+func (h *Harness) throughput(tc pb.TestCase, count int, dir string, input string) (time.Duration, error) {
+	h.driver.XCalls.Reset()
+	req := pb.ThroughputRequest{TestCase: tc, Count: int64(count), Dir: dir, Input: input}
+	resp, err := h.client.Throughput(context.Background(), &req)
+	if err != nil {
+		return 0, err
+	}
+	return time.Duration(resp.ElapsedNs), nil
+}
+
+func (h *Harness) xCalls() *lang.CallStats {
+	return h.driver.XCalls
+}
+
 func (h *Harness) handleCount() int {
 	return h.access.HandleCount()
 }
@@ -8,6 +8,7 @@ import (
 	"os"
 	"strings"
 	"testing"
+	"time"
 
 	"github.com/freeconf/restconf"
 	"github.com/freeconf/yang"
@@ -17,10 +18,12 @@ import (
 	"github.com/freeconf/yang/parser"
 	"github.com/freeconf/yang/source"
 
+	"github.com/freeconf/lang"
 	"github.com/freeconf/lang/pb"
 )
 
 var update = flag.Bool("update", false, "update gold files instead of testing against them")
+var throughput = flag.Int("throughput", 0, "have each harness repeat test cases this many times without tracing and report call latencies")
 
 type nodeTestHarness interface {
 	createTestCase(tc pb.TestCase, tracefile string) (node.Node, error)
@@ -28,10 +31,16 @@ type nodeTestHarness interface {
 
 	parseModule(dir string, module string) (node.Node, error)
 
+	// repeat test case count times without tracing and return time it took
+	throughput(tc pb.TestCase, count int, dir string, input string) (time.Duration, error)
+
 	Name() string
 
 	handleCount() int
 
+	// latency of calls from Go into X, nil when there is no X
+	xCalls() *lang.CallStats
+
 	Close() error
 	Connect() error
 }
@@ -71,6 +80,38 @@ func TestBasic(t *testing.T) {
 	}
 }
 
+// go test ./test -run TestThroughput -throughput 1000
+func TestThroughput(t *testing.T) {
+	if *throughput == 0 {
+		t.Skip("use -throughput N to run")
+	}
+	seed, err := ioutil.ReadFile("testdata/seed/basic.json")
+	fc.RequireEqual(t, nil, err)
+	for _, h := range Langs() {
+		fc.RequireEqual(t, nil, h.Connect())
+		t.Run(h.Name(), func(t *testing.T) {
+			defer func() {
+				fc.RequireEqual(t, nil, h.Close())
+			}()
+			cases := []struct {
+				tc    pb.TestCase
+				input string
+			}{
+				{tc: pb.TestCase_BASIC, input: string(seed)},
+				{tc: pb.TestCase_ECHO, input: `{"f":99,"g":{"s":"coffee"}}`},
+			}
+			for _, c := range cases {
+				elapsed, err := h.throughput(c.tc, *throughput, "testdata/yang", c.input)
+				fc.RequireEqual(t, nil, err)
+				fmt.Printf("%s %s x %d: %s (%s each)\n", h.Name(), c.tc, *throughput, elapsed, elapsed/time.Duration(*throughput))
+				if calls := h.xCalls(); calls != nil {
+					calls.Dump(os.Stdout)
+				}
+			}
+		})
+	}
+}
+
 func TestEcho(t *testing.T) {
 	ypath := source.Dir("testdata/yang")
 	m := parser.RequireModule(ypath, "echo")
@@ -168,6 +209,51 @@ func TestNotify(t *testing.T) {
 	}
 }
 
+func TestNotifyFanout(t *testing.T) {
+	ypath := source.Dir("testdata/yang")
+	m := parser.RequireModule(ypath, "echo")
+	for _, h := range Langs() {
+		fc.RequireEqual(t, nil, h.Connect())
+		t.Run(h.Name(), func(t *testing.T) {
+			defer func() {
+				fc.RequireEqual(t, nil, h.Close())
+			}()
+			traceFile := tempFileName()
+			n, err := h.createTestCase(pb.TestCase_ECHO, traceFile)
+			fc.RequireEqual(t, nil, err)
+			b := node.NewBrowser(m, n)
+
+			// two subscribers to same notification share one stream but each
+			// gets every event
+			msgs := make(chan string, 2)
+			var unsubs []node.NotifyCloser
+			for i := 0; i < 2; i++ {
+				sel, err := b.Root().Find("recv")
+				fc.RequireEqual(t, nil, err)
+				unsub, err := sel.Notifications(func(n node.Notification) {
+					if msg, err := nodeutil.WriteJSON(n.Event); err == nil {
+						msgs <- msg
+					}
+				})
+				fc.RequireEqual(t, nil, err)
+				unsubs = append(unsubs, unsub)
+			}
+
+			sendSel, err := b.Root().Find("send")
+			fc.RequireEqual(t, nil, err)
+			_, err = sendSel.Action(nodeutil.ReadJSON(`{"f":99}`))
+			fc.RequireEqual(t, nil, err)
+			fc.AssertEqual(t, <-msgs, <-msgs)
+
+			for _, unsub := range unsubs {
+				fc.AssertEqual(t, nil, unsub())
+			}
+			fc.AssertEqual(t, nil, h.finalizeTestCase())
+			os.Remove(traceFile)
+		})
+	}
+}
+
 var yangFiles = []string{
 	"basic",
 	"advanced",
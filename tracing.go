@@ -0,0 +1,237 @@
+package lang
+
+import (
+	"context"
+	"encoding/json"
+	"fmt"
+	"math/rand"
+	"os"
+	"sync"
+	"time"
+
+	"github.com/freeconf/yang/fc"
+	"github.com/freeconf/yang/node"
+	"google.golang.org/grpc"
+	"google.golang.org/grpc/metadata"
+)
+
+// Span is one timed call.  Spans with the same trace id make up one timeline of
+// a management operation across Go and X.
+type Span struct {
+	TraceId  string `json:"trace"`
+	SpanId   string `json:"span"`
+	ParentId string `json:"parent,omitempty"`
+	Name     string `json:"name"`
+	Process  string `json:"process"`
+	Start    int64  `json:"start"`
+	End      int64  `json:"end"`
+}
+
+// SpanExporter gets each span when it ends.  Must be safe to call from many
+// goroutines.
+type SpanExporter interface {
+	Export(s *Span)
+}
+
+// environment variable both Go and X read to export spans to the same file
+const TraceFileEnv = "FC_LANG_TRACE_FILE"
+
+// metadata keys spans are propagated in on calls in each direction
+const (
+	traceIdKey = "fc-trace-id"
+	spanIdKey  = "fc-span-id"
+)
+
+type spanKey struct{}
+
+type tracer struct {
+	exporter SpanExporter
+
+	// span of the X request a root selection is being made for
+	parents sync.Map // *node.Browser -> *Span
+}
+
+// SetSpanExporter starts recording spans of calls between Go and X, nil stops.
+// Should be called before serving.
+func (d *Driver) SetSpanExporter(e SpanExporter) {
+	d.tracer.exporter = e
+}
+
+func newTracer() *tracer {
+	t := &tracer{}
+	if fname := os.Getenv(TraceFileEnv); fname != "" {
+		exporter, err := NewFileSpanExporter(fname)
+		if err != nil {
+			fc.Err.Printf("not tracing. %s", err)
+		} else {
+			t.exporter = exporter
+		}
+	}
+	return t
+}
+
+func newSpanId(bytes int) string {
+	b := make([]byte, bytes)
+	rand.Read(b)
+	return fmt.Sprintf("%x", b)
+}
+
+func spanFromContext(ctx context.Context) *Span {
+	if ctx == nil {
+		return nil
+	}
+	s, _ := ctx.Value(spanKey{}).(*Span)
+	return s
+}
+
+func (t *tracer) start(ctx context.Context, name string, traceId string, parentId string) (context.Context, *Span) {
+	if traceId == "" {
+		traceId = newSpanId(16)
+	}
+	s := &Span{
+		TraceId:  traceId,
+		SpanId:   newSpanId(8),
+		ParentId: parentId,
+		Name:     name,
+		Process:  "go",
+		Start:    time.Now().UnixNano(),
+	}
+	return context.WithValue(ctx, spanKey{}, s), s
+}
+
+func (t *tracer) startChild(ctx context.Context, name string) (context.Context, *Span) {
+	if parent := spanFromContext(ctx); parent != nil {
+		return t.start(ctx, name, parent.TraceId, parent.SpanId)
+	}
+	return t.start(ctx, name, "", "")
+}
+
+func (t *tracer) finish(s *Span) {
+	s.End = time.Now().UnixNano()
+	t.exporter.Export(s)
+}
+
+// span around X calling Go, continuing the trace X sent if any
+func (t *tracer) serverIntercept(ctx context.Context, req interface{}, info *grpc.UnaryServerInfo, handler grpc.UnaryHandler) (interface{}, error) {
+	if t.exporter == nil {
+		return handler(ctx, req)
+	}
+	var traceId, parentId string
+	if md, found := metadata.FromIncomingContext(ctx); found {
+		if vals := md.Get(traceIdKey); len(vals) > 0 {
+			traceId = vals[0]
+		}
+		if vals := md.Get(spanIdKey); len(vals) > 0 {
+			parentId = vals[0]
+		}
+	}
+	ctx, s := t.start(ctx, methodName(info.FullMethod), traceId, parentId)
+	defer t.finish(s)
+	return handler(ctx, req)
+}
+
+// span around Go calling X, sending trace so X spans are children of this one
+func (t *tracer) clientIntercept(ctx context.Context, method string, req, reply interface{}, cc *grpc.ClientConn, invoker grpc.UnaryInvoker, opts ...grpc.CallOption) error {
+	if t.exporter == nil {
+		return invoker(ctx, method, req, reply, cc, opts...)
+	}
+	ctx, s := t.startChild(ctx, methodName(method))
+	defer t.finish(s)
+	ctx = metadata.AppendToOutgoingContext(ctx, traceIdKey, s.TraceId, spanIdKey, s.SpanId)
+	return invoker(ctx, method, req, reply, cc, opts...)
+}
+
+// selectSpan starts a span on a new root selection of an X node so all calls
+// made thru that selection, e.g. one RESTCONF request, are on one timeline.
+// Ended by endSelectSpan when selection is released.  Roots X asks for are
+// part of the trace of X's request.
+func (t *tracer) selectSpan(s *node.Selection) context.Context {
+	if t.exporter == nil || s.Parent != nil || spanFromContext(s.Context) != nil {
+		return s.Context
+	}
+	ctx := s.Context
+	if ctx == nil {
+		ctx = context.Background()
+	}
+	var traceId, parentId string
+	if parent, found := t.parents.Load(s.Browser); found {
+		traceId, parentId = parent.(*Span).TraceId, parent.(*Span).SpanId
+	}
+	ctx, span := t.start(ctx, "select "+s.Path.String(), traceId, parentId)
+	return context.WithValue(ctx, selectSpanKey{}, span)
+}
+
+// root selection for X's request.  Selection's span is a child of the
+// request's span instead of the start of a new trace.
+func (t *tracer) root(ctx context.Context, b *node.Browser) *node.Selection {
+	span := spanFromContext(ctx)
+	if t.exporter == nil || span == nil {
+		return b.Root()
+	}
+	t.parents.Store(b, span)
+	defer t.parents.Delete(b)
+	return b.Root()
+}
+
+// traceSelection has calls made thru selection while handling X's request be
+// part of the request's trace.  Call returned func when request is done.
+func (t *tracer) traceSelection(ctx context.Context, sel *node.Selection) func() {
+	span := spanFromContext(ctx)
+	if t.exporter == nil || span == nil {
+		return func() {}
+	}
+	prev := sel.Context
+	selCtx := prev
+	if selCtx == nil {
+		selCtx = context.Background()
+	}
+	sel.Context = context.WithValue(selCtx, spanKey{}, span)
+	return func() {
+		sel.Context = prev
+	}
+}
+
+type selectSpanKey struct{}
+
+func (t *tracer) endSelectSpan(s *node.Selection) {
+	if t.exporter == nil || s.Context == nil {
+		return
+	}
+	if span, valid := s.Context.Value(selectSpanKey{}).(*Span); valid && s.Parent == nil {
+		t.finish(span)
+	}
+}
+
+// FileSpanExporter appends spans as JSON lines.  X writes to the same file
+// when given the same name so there is one file with both sides of each trace.
+type FileSpanExporter struct {
+	lock sync.Mutex
+	f    *os.File
+}
+
+func NewFileSpanExporter(fname string) (*FileSpanExporter, error) {
+	f, err := os.OpenFile(fname, os.O_CREATE|os.O_APPEND|os.O_WRONLY, 0644)
+	if err != nil {
+		return nil, err
+	}
+	return &FileSpanExporter{f: f}, nil
+}
+
+func (e *FileSpanExporter) Export(s *Span) {
+	line, err := json.Marshal(s)
+	if err != nil {
+		fc.Err.Printf("could not encode span. %s", err)
+		return
+	}
+	line = append(line, '\n')
+	e.lock.Lock()
+	defer e.lock.Unlock()
+	// one write per span so lines from Go and X do not interleave
+	if _, err := e.f.Write(line); err != nil {
+		fc.Err.Printf("could not write span. %s", err)
+	}
+}
+
+func (e *FileSpanExporter) Close() error {
+	return e.f.Close()
+}
@@ -0,0 +1,85 @@
+package lang
+
+import (
+	"context"
+	"sync"
+	"testing"
+
+	"github.com/freeconf/yang/fc"
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/nodeutil"
+	"github.com/freeconf/yang/parser"
+	"google.golang.org/grpc"
+	"google.golang.org/grpc/metadata"
+)
+
+type memSpans struct {
+	lock  sync.Mutex
+	spans []*Span
+}
+
+func (m *memSpans) Export(s *Span) {
+	m.lock.Lock()
+	defer m.lock.Unlock()
+	m.spans = append(m.spans, s)
+}
+
+func TestTracing(t *testing.T) {
+	spans := &memSpans{}
+	tr := &tracer{exporter: spans}
+
+	// X calls Go which calls back into X
+	incoming := metadata.NewIncomingContext(context.Background(),
+		metadata.Pairs(traceIdKey, "t1", spanIdKey, "x1"))
+	info := &grpc.UnaryServerInfo{FullMethod: "/pb.Node/Find"}
+	var sent metadata.MD
+	_, err := tr.serverIntercept(incoming, nil, info, func(ctx context.Context, req interface{}) (interface{}, error) {
+		invoker := func(ctx context.Context, method string, req, reply interface{}, cc *grpc.ClientConn, opts ...grpc.CallOption) error {
+			sent, _ = metadata.FromOutgoingContext(ctx)
+			return nil
+		}
+		return nil, tr.clientIntercept(ctx, "/pb.XNode/XField", nil, nil, nil, invoker)
+	})
+	fc.RequireEqual(t, nil, err)
+	fc.RequireEqual(t, 2, len(spans.spans))
+	xfield, find := spans.spans[0], spans.spans[1]
+	fc.AssertEqual(t, "Node/Find", find.Name)
+	fc.AssertEqual(t, "t1", find.TraceId)
+	fc.AssertEqual(t, "x1", find.ParentId)
+	fc.AssertEqual(t, "XNode/XField", xfield.Name)
+	fc.AssertEqual(t, "t1", xfield.TraceId)
+	fc.AssertEqual(t, find.SpanId, xfield.ParentId)
+	fc.AssertEqual(t, []string{xfield.SpanId}, sent.Get(spanIdKey))
+	fc.AssertEqual(t, true, find.End >= find.Start)
+
+	// no exporter, nothing recorded or sent
+	tr.exporter = nil
+	invoker := func(ctx context.Context, method string, req, reply interface{}, cc *grpc.ClientConn, opts ...grpc.CallOption) error {
+		_, found := metadata.FromOutgoingContext(ctx)
+		fc.AssertEqual(t, false, found)
+		return nil
+	}
+	fc.RequireEqual(t, nil, tr.clientIntercept(context.Background(), "/pb.XNode/XField", nil, nil, nil, invoker))
+}
+
+func TestTraceSelection(t *testing.T) {
+	m, err := parser.LoadModuleFromString(nil, `module x { leaf a { type string; } }`)
+	fc.RequireEqual(t, nil, err)
+	b := node.NewBrowser(m, nodeutil.ReadJSON(`{"a":"hi"}`))
+	tr := &tracer{exporter: &memSpans{}}
+	reqCtx, req := tr.start(context.Background(), "Node/BrowserRoot", "t1", "x1")
+
+	// root X asks for continues X's trace
+	sel := b.Root()
+	tr.parents.Store(b, req)
+	selSpan := spanFromContext(tr.selectSpan(sel))
+	tr.parents.Delete(b)
+	fc.AssertEqual(t, "t1", selSpan.TraceId)
+	fc.AssertEqual(t, req.SpanId, selSpan.ParentId)
+
+	// calls thru selection while handling X's request are in its trace
+	done := tr.traceSelection(reqCtx, sel)
+	fc.AssertEqual(t, req, spanFromContext(sel.Context))
+	done()
+	fc.AssertEqual(t, true, spanFromContext(sel.Context) == nil)
+}
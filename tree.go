@@ -0,0 +1,249 @@
+package lang
+
+import (
+	"context"
+	"fmt"
+	"net/url"
+	"strconv"
+	"strings"
+
+	"github.com/freeconf/lang/pb"
+	"github.com/freeconf/yang/meta"
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/val"
+)
+
+// readTree copies everything under selection into a Tree so X can read a whole
+// subtree in one call
+func readTree(sel *node.Selection) (*pb.Tree, error) {
+	t := &pb.Tree{}
+	if err := sel.UpsertInto(&treeNode{tree: t}); err != nil {
+		return nil, err
+	}
+	return t, nil
+}
+
+// treeUrl is path with depth and fields as query parameters understood by
+// Selection.Find
+func treeUrl(path string, depth int32, fields []string) string {
+	params := make(url.Values)
+	if depth > 0 {
+		params.Set("depth", strconv.Itoa(int(depth)))
+	}
+	if len(fields) > 0 {
+		params.Set("fields", strings.Join(fields, ";"))
+	}
+	if len(params) == 0 {
+		return path
+	}
+	return path + "?" + params.Encode()
+}
+
+// treeNode is written into while reading and builds a Tree of what is written
+type treeNode struct {
+	tree *pb.Tree
+}
+
+func (n *treeNode) Context(s *node.Selection) context.Context {
+	return s.Context
+}
+
+func (n *treeNode) Release(s *node.Selection) {
+}
+
+func (n *treeNode) Child(r node.ChildRequest) (node.Node, error) {
+	if !r.New {
+		return nil, nil
+	}
+	_, isList := r.Meta.(*meta.List)
+	child := &pb.Tree{IsList: isList}
+	n.tree.Fields = append(n.tree.Fields, &pb.TreeField{Ident: r.Meta.Ident(), Tree: child})
+	return &treeNode{tree: child}, nil
+}
+
+func (n *treeNode) Next(r node.ListRequest) (node.Node, []val.Value, error) {
+	if !r.New {
+		return nil, nil, nil
+	}
+	item := &pb.Tree{}
+	n.tree.Items = append(n.tree.Items, item)
+	return &treeNode{tree: item}, r.Key, nil
+}
+
+func (n *treeNode) Field(r node.FieldRequest, hnd *node.ValueHandle) error {
+	if !r.Write {
+		return nil
+	}
+	if r.Clear || hnd.Val == nil {
+		return nil
+	}
+	leaf := &pb.Tree{Val: encodeVal(hnd.Val)}
+	n.tree.Fields = append(n.tree.Fields, &pb.TreeField{Ident: r.Meta.Ident(), Tree: leaf})
+	return nil
+}
+
+func (n *treeNode) Choose(sel *node.Selection, choice *meta.Choice) (*meta.ChoiceCase, error) {
+	return nil, fmt.Errorf("choose not supported on tree, %s", sel.Path.String())
+}
+
+func (n *treeNode) BeginEdit(r node.NodeRequest) error {
+	return nil
+}
+
+func (n *treeNode) EndEdit(r node.NodeRequest) error {
+	return nil
+}
+
+func (n *treeNode) Action(r node.ActionRequest) (node.Node, error) {
+	return nil, fmt.Errorf("action not supported on tree, %s", r.Selection.Path.String())
+}
+
+func (n *treeNode) Notify(r node.NotifyRequest) (node.NotifyCloser, error) {
+	return nil, fmt.Errorf("notify not supported on tree, %s", r.Selection.Path.String())
+}
+
+func (n *treeNode) Peek(sel *node.Selection, consumer interface{}) interface{} {
+	return nil
+}
+
+// treeReader reads from a Tree X sent with an edit so Go does not have to
+// call X for data X already had.  X does not know the schema so values are
+// converted to each leaf's type here.
+type treeReader struct {
+	tree *pb.Tree
+}
+
+func (n *treeReader) field(ident string) *pb.Tree {
+	for _, f := range n.tree.Fields {
+		if f.Ident == ident {
+			return f.Tree
+		}
+	}
+	return nil
+}
+
+func (n *treeReader) value(m meta.Leafable, t *pb.Tree) (val.Value, error) {
+	if t == nil || t.Val == nil {
+		return nil, nil
+	}
+	return node.NewValue(m.Type(), decodeVal(t.Val).Value())
+}
+
+func (n *treeReader) key(m *meta.List) ([]val.Value, error) {
+	keyMeta := m.KeyMeta()
+	if len(keyMeta) == 0 {
+		return nil, nil
+	}
+	key := make([]val.Value, len(keyMeta))
+	for i, k := range keyMeta {
+		v, err := n.value(k, n.field(k.Ident()))
+		if err != nil {
+			return nil, err
+		}
+		if v == nil {
+			return nil, fmt.Errorf("%s missing key %s", m.Ident(), k.Ident())
+		}
+		key[i] = v
+	}
+	return key, nil
+}
+
+func (n *treeReader) Context(s *node.Selection) context.Context {
+	return s.Context
+}
+
+func (n *treeReader) Release(s *node.Selection) {
+}
+
+func (n *treeReader) Child(r node.ChildRequest) (node.Node, error) {
+	if r.New || r.Delete {
+		return nil, fmt.Errorf("tree is read only, %s", r.Selection.Path.String())
+	}
+	if child := n.field(r.Meta.Ident()); child != nil {
+		return &treeReader{tree: child}, nil
+	}
+	return nil, nil
+}
+
+func (n *treeReader) Next(r node.ListRequest) (node.Node, []val.Value, error) {
+	if r.New || r.Delete {
+		return nil, nil, fmt.Errorf("tree is read only, %s", r.Selection.Path.String())
+	}
+	if r.Key != nil {
+		for _, item := range n.tree.Items {
+			found := &treeReader{tree: item}
+			key, err := found.key(r.Meta)
+			if err != nil {
+				return nil, nil, err
+			}
+			if keyEqual(key, r.Key) {
+				return found, key, nil
+			}
+		}
+		return nil, nil, nil
+	}
+	if int(r.Row) >= len(n.tree.Items) {
+		return nil, nil, nil
+	}
+	found := &treeReader{tree: n.tree.Items[r.Row]}
+	key, err := found.key(r.Meta)
+	if err != nil {
+		return nil, nil, err
+	}
+	return found, key, nil
+}
+
+func keyEqual(a []val.Value, b []val.Value) bool {
+	if len(a) != len(b) {
+		return false
+	}
+	for i := range a {
+		if !val.Equal(a[i], b[i]) {
+			return false
+		}
+	}
+	return true
+}
+
+func (n *treeReader) Field(r node.FieldRequest, hnd *node.ValueHandle) error {
+	if r.Write || r.Clear {
+		return fmt.Errorf("tree is read only, %s", r.Selection.Path.String())
+	}
+	v, err := n.value(r.Meta, n.field(r.Meta.Ident()))
+	if err != nil {
+		return err
+	}
+	hnd.Val = v
+	return nil
+}
+
+func (n *treeReader) Choose(sel *node.Selection, choice *meta.Choice) (*meta.ChoiceCase, error) {
+	for _, c := range choice.Cases() {
+		for _, def := range c.DataDefinitions() {
+			if n.field(def.Ident()) != nil {
+				return c, nil
+			}
+		}
+	}
+	return nil, nil
+}
+
+func (n *treeReader) BeginEdit(r node.NodeRequest) error {
+	return nil
+}
+
+func (n *treeReader) EndEdit(r node.NodeRequest) error {
+	return nil
+}
+
+func (n *treeReader) Action(r node.ActionRequest) (node.Node, error) {
+	return nil, fmt.Errorf("action not supported on tree, %s", r.Selection.Path.String())
+}
+
+func (n *treeReader) Notify(r node.NotifyRequest) (node.NotifyCloser, error) {
+	return nil, fmt.Errorf("notify not supported on tree, %s", r.Selection.Path.String())
+}
+
+func (n *treeReader) Peek(sel *node.Selection, consumer interface{}) interface{} {
+	return nil
+}
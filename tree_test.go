@@ -0,0 +1,54 @@
+package lang
+
+import (
+	"testing"
+
+	"github.com/freeconf/lang/pb"
+	"github.com/freeconf/yang/fc"
+	"github.com/freeconf/yang/node"
+	"github.com/freeconf/yang/nodeutil"
+	"github.com/freeconf/yang/parser"
+)
+
+func TestReadTree(t *testing.T) {
+	mstr := `module x {
+		leaf a {
+			type int32;
+		}
+		container b {
+			leaf c {
+				type string;
+			}
+		}
+		list d {
+			key e;
+			leaf e {
+				type string;
+			}
+		}
+	}`
+	m, err := parser.LoadModuleFromString(nil, mstr)
+	fc.RequireEqual(t, nil, err)
+	data := nodeutil.ReadJSON(`{"a":1,"b":{"c":"hi"},"d":[{"e":"one"},{"e":"two"}]}`)
+	root := node.NewBrowser(m, data).Root()
+	tree, err := readTree(root)
+	fc.RequireEqual(t, nil, err)
+	fc.AssertEqual(t, 3, len(tree.Fields))
+	fc.AssertEqual(t, "a", tree.Fields[0].Ident)
+	fc.AssertEqual(t, int32(1), tree.Fields[0].Tree.Val.Value.GetInt32Val())
+	fc.AssertEqual(t, "hi", tree.Fields[1].Tree.Fields[0].Tree.Val.Value.GetStringVal())
+	d := tree.Fields[2].Tree
+	fc.AssertEqual(t, true, d.IsList)
+	fc.AssertEqual(t, 2, len(d.Items))
+	fc.AssertEqual(t, "two", d.Items[1].Fields[0].Tree.Val.Value.GetStringVal())
+
+	// values from X are converted to leaf types
+	a := &pb.Tree{Val: &pb.Val{Format: pb.Format_INT64, Value: &pb.ValUnion{Value: &pb.ValUnion_Int64Val{Int64Val: 2}}}}
+	tree.Fields[0].Tree = a
+	actual, err := nodeutil.WriteJSON(node.NewBrowser(m, &treeReader{tree: tree}).Root())
+	fc.RequireEqual(t, nil, err)
+	fc.AssertEqual(t, `{"a":2,"b":{"c":"hi"},"d":[{"e":"one"},{"e":"two"}]}`, actual)
+
+	fc.AssertEqual(t, "b", treeUrl("b", 0, nil))
+	fc.AssertEqual(t, "?depth=1&fields=a%3Bb%2Fc", treeUrl("", 1, []string{"a", "b/c"}))
+}
@@ -2,6 +2,7 @@ package lang
 
 import (
 	"context"
+	"sync/atomic"
 	"time"
 
 	"github.com/freeconf/lang/pb"
@@ -16,6 +17,13 @@ import (
 type xnode struct {
 	d       *Driver
 	nodeHnd uint64
+
+	// hooks X said do nothing so calling them is a wasted round trip
+	noopHooks pb.NodeHook
+}
+
+func (n *xnode) noop(hook pb.NodeHook) bool {
+	return n.noopHooks&hook != 0
 }
 
 func (n *xnode) GetRemoteHandle() uint64 {
@@ -23,29 +31,57 @@ func (n *xnode) GetRemoteHandle() uint64 {
 }
 
 func (n *xnode) Context(s *node.Selection) context.Context {
+	ctx := n.d.tracer.selectSpan(s)
+	if n.noop(pb.NodeHook_HOOK_CONTEXT) {
+		return ctx
+	}
 	req := pb.XContextRequest{
 		SelHnd: resolveSelection(n.d, s),
 	}
-	_, err := n.d.xnodes.XContext(s.Context, &req)
+	_, err := n.d.xnodes.XContext(ctx, &req)
 	if err != nil {
 		// probably should have API so context can return an err
 		panic(err)
 	}
-	return s.Context
+	return ctx
 }
 
 func (n *xnode) Release(s *node.Selection) {
+	if s.Parent != nil && n.noop(pb.NodeHook_HOOK_RELEASE) {
+		// X only needs to forget node and it will with the rest of the
+		// handles in the selection's scope
+		n.d.handles.AddToScope(s, selectionParent, n.nodeHnd)
+		return
+	}
 	req := pb.XReleaseRequest{
 		SelHnd: resolveSelection(n.d, s),
 	}
+	if s.Parent == nil {
+		// end of operation, X can forget all selections from it
+		req.Root = true
+		req.ScopeHnds = n.d.handles.ScopeHnds(s)
+	}
 	_, err := n.d.xnodes.XRelease(s.Context, &req)
 	if err != nil {
 		// probably should have API so context can return an err
 		panic(err)
 	}
+	if s.Parent == nil {
+		n.d.handles.ReleaseScope(s)
+	}
+	n.d.tracer.endSelectSpan(s)
 }
 
 func (n *xnode) Child(r node.ChildRequest) (node.Node, error) {
+	if !readCacheDisabled(r.Selection.Context) {
+		if c := n.d.readCaches.get(r.Selection.Browser); c != nil {
+			return c.child(r, n.child)
+		}
+	}
+	return n.child(r)
+}
+
+func (n *xnode) child(r node.ChildRequest) (node.Node, error) {
 	req := pb.XChildRequest{
 		SelHnd:    resolveSelection(n.d, r.Selection),
 		MetaIdent: r.Meta.Ident(),
@@ -121,22 +157,37 @@ func (n *xnode) Choose(sel *node.Selection, choice *meta.Choice) (m *meta.Choice
 }
 
 func (n *xnode) BeginEdit(r node.NodeRequest) error {
-	req := pb.XBeginEditRequest{
-		SelHnd: resolveSelection(n.d, r.Selection),
-		New:    r.New,
-		Delete: r.Delete,
+	var err error
+	if !n.noop(pb.NodeHook_HOOK_BEGIN_EDIT) {
+		req := pb.XBeginEditRequest{
+			SelHnd: resolveSelection(n.d, r.Selection),
+			New:    r.New,
+			Delete: r.Delete,
+		}
+		_, err = n.d.xnodes.XBeginEdit(r.Selection.Context, &req)
+	}
+	if err == nil {
+		if c := n.d.readCaches.get(r.Selection.Browser); c != nil {
+			c.beginEdit()
+		}
 	}
-	_, err := n.d.xnodes.XBeginEdit(r.Selection.Context, &req)
 	return err
 }
 
 func (n *xnode) EndEdit(r node.NodeRequest) error {
-	req := pb.XEndEditRequest{
-		SelHnd: resolveSelection(n.d, r.Selection),
-		New:    r.New,
-		Delete: r.Delete,
+	var err error
+	if !n.noop(pb.NodeHook_HOOK_END_EDIT) {
+		req := pb.XEndEditRequest{
+			SelHnd: resolveSelection(n.d, r.Selection),
+			New:    r.New,
+			Delete: r.Delete,
+		}
+		_, err = n.d.xnodes.XEndEdit(r.Selection.Context, &req)
 	}
-	_, err := n.d.xnodes.XEndEdit(r.Selection.Context, &req)
+	if c := n.d.readCaches.get(r.Selection.Browser); c != nil {
+		c.endEdit(r.Selection)
+	}
+	n.d.readCaches.changed()
 	return err
 }
 
@@ -156,14 +207,25 @@ func (n *xnode) Action(r node.ActionRequest) (output node.Node, err error) {
 }
 
 func (n *xnode) Notify(r node.NotifyRequest) (node.NotifyCloser, error) {
+	return n.d.notifications.subscribe(r, n.openNotify)
+}
+
+// openNotify opens the single stream from X that is shared among all Go
+// subscribers to the same notification
+func (n *xnode) openNotify(r node.NotifyRequest, t *notifyTopic) (node.NotifyCloser, error) {
 	cancelBackchannelHnd := n.d.handles.NextHnd()
 	req := pb.XNotificationRequest{
 		SelHnd:               resolveSelection(n.d, r.Selection),
 		MetaIdent:            r.Meta.Ident(),
 		CancelBackchannelHnd: cancelBackchannelHnd,
+		Filter:               notifyFilter(r.Selection.Context),
 	}
 	var recvErr error
-	client, err := n.d.xnodes.XNotification(r.Selection.Context, &req)
+
+	// stream outlives the subscriber that happened to open it so it cannot use
+	// that subscriber's context
+	ctx := context.Background()
+	client, err := n.d.xnodes.XNotification(ctx, &req)
 	if err != nil {
 		return nil, err
 	}
@@ -175,17 +237,14 @@ func (n *xnode) Notify(r node.NotifyRequest) (node.NotifyCloser, error) {
 				return err
 			}
 
-			// Suspected bugin python/grpc: client.CloseSend() does not unblock
-			// client.Recv call below.  In addition python-side is never
-			// unblocked and subscription closer in python is never called.
-			//
-			// Python grpc is switching to an async io that make fix this, might
-			// make things worse, but it is stall a WIP.  We might have to create
-			// a backchannel to break that sender in python
+			// client.CloseSend() does not unblock client.Recv call below on its
+			// own. X implementations serve notifications on an async stream that
+			// ends when this backchannel is called or when the stream is cancelled,
+			// whichever comes first, and that unblocks the Recv.
 			cancelReq := pb.XNotificationCancelBackchannelRequest{
 				CancelBackchannelHnd: cancelBackchannelHnd,
 			}
-			if _, err := n.d.xnodes.XNotificationCancelBackchannel(r.Selection.Context, &cancelReq); err != nil {
+			if _, err := n.d.xnodes.XNotificationCancelBackchannel(ctx, &cancelReq); err != nil {
 				return err
 			}
 
@@ -194,9 +253,9 @@ func (n *xnode) Notify(r node.NotifyRequest) (node.NotifyCloser, error) {
 		return err
 	}
 	go func() {
-		n.d.Stats.OpenNotifications++
+		atomic.AddInt64(&n.d.Stats.OpenNotifications, 1)
 		defer func() {
-			n.d.Stats.OpenNotifications--
+			atomic.AddInt64(&n.d.Stats.OpenNotifications, -1)
 		}()
 		var resp *pb.XNotificationResponse
 		for client != nil {
@@ -204,7 +263,7 @@ func (n *xnode) Notify(r node.NotifyRequest) (node.NotifyCloser, error) {
 			if recvErr != nil {
 				if !closed {
 					err = recvErr
-					r.Send(node.ErrorNode{Err: recvErr})
+					t.dead(recvErr)
 					break
 				}
 			}
@@ -213,7 +272,7 @@ func (n *xnode) Notify(r node.NotifyRequest) (node.NotifyCloser, error) {
 			}
 			n := n.d.handles.Get(resp.NodeHnd).(node.Node)
 			when := time.Unix(0, resp.When)
-			r.SendWhen(n, when)
+			t.publish(n, when)
 		}
 	}()
 	return closer, nil